@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark MCP server cold start: time to the first tools/list response.
+
+Spawns ``kagura mcp serve`` over stdio (as an MCP client would), performs
+the initialize handshake and one ``tools/list`` request, and reports the
+wall time from spawn to the response. Lazy mode advertises the builtin
+tools from the manifest; eager mode imports every builtin tool module at
+startup.
+
+Usage:
+    python scripts/benchmark_mcp_startup.py
+    python scripts/benchmark_mcp_startup.py --runs 10 --mode lazy
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from mcp import ClientSession, StdioServerParameters  # type: ignore
+from mcp.client.stdio import stdio_client  # type: ignore
+
+
+async def time_to_tools_list(mode: str) -> tuple[float, int]:
+    """Spawn a server and return (seconds to tools/list, tool count)."""
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "kagura.cli.main", "mcp", "serve", f"--{mode}"],
+    )
+    start = time.perf_counter()
+    async with stdio_client(params) as (read_stream, write_stream):
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+            result = await session.list_tools()
+            elapsed = time.perf_counter() - start
+    return elapsed, len(result.tools)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per mode")
+    parser.add_argument(
+        "--mode",
+        choices=["lazy", "eager", "both"],
+        default="both",
+        help="Server startup mode",
+    )
+    args = parser.parse_args()
+
+    modes = ["lazy", "eager"] if args.mode == "both" else [args.mode]
+    print(f"{'mode':<8} {'tools':>6} {'p50 (s)':>9} {'min (s)':>9} {'max (s)':>9}")
+    for mode in modes:
+        timings = []
+        tool_count = 0
+        for _ in range(args.runs):
+            elapsed, tool_count = asyncio.run(time_to_tools_list(mode))
+            timings.append(elapsed)
+        print(
+            f"{mode:<8} {tool_count:>6} {statistics.median(timings):>9.2f} "
+            f"{min(timings):>9.2f} {max(timings):>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,17 @@ Measures:
 - Precision: MRR (Mean Reciprocal Rank), nDCG@10
 - Latency: Average reranking time for 100 candidates
 - Model comparison: BGE vs ms-marco
+- Backend comparison: PyTorch vs ONNX Runtime (int8 quantized)
 
 Usage:
     python scripts/benchmark_reranker.py
+    python scripts/benchmark_reranker.py --backend onnx --threads 4
+    python scripts/benchmark_reranker.py --compare-backends cross-encoder/ms-marco-MiniLM-L-6-v2
 """
 
 from __future__ import annotations
 
+import argparse
 import time
 from typing import Any
 
@@ -205,28 +209,48 @@ def calculate_ndcg(rankings: list[list[int]], k: int = 10) -> float:
     return sum(ndcg_scores) / len(ndcg_scores) if ndcg_scores else 0.0
 
 
-def benchmark_model(model_name: str) -> dict[str, Any]:
+def benchmark_model(
+    model_name: str,
+    backend: str = "torch",
+    quantize: bool = True,
+    threads: int | None = None,
+) -> dict[str, Any]:
     """Benchmark a single reranker model.
 
     Args:
         model_name: Model identifier (e.g., "BAAI/bge-reranker-v2-m3")
+        backend: Inference backend ("torch" or "onnx")
+        quantize: Use int8 quantized weights (onnx backend)
+        threads: onnxruntime intra-op threads (onnx backend)
 
     Returns:
-        Dict with metrics: MRR, nDCG@10, avg_latency_ms
+        Dict with metrics: MRR, nDCG@10, avg_latency_ms, load_seconds and
+        the raw scores of every (query, document) pair
     """
     from kagura.config.memory_config import RerankConfig
     from kagura.core.memory.reranker import MemoryReranker
 
     print(f"\n{'='*70}")
-    print(f"Benchmarking: {model_name}")
+    print(f"Benchmarking: {model_name} [{backend}]")
     print(f"{'='*70}")
 
-    # Initialize reranker
-    config = RerankConfig(model=model_name, candidates_k=100, top_k=10)
+    # Initialize reranker (no score cache: every query hits the model)
+    config = RerankConfig(
+        model=model_name,
+        candidates_k=100,
+        top_k=10,
+        cache_size=0,
+        backend=backend,
+        quantize=quantize,
+        intra_op_threads=threads,
+    )
+    load_start = time.perf_counter()
     reranker = MemoryReranker(config)
+    load_seconds = time.perf_counter() - load_start
 
     rankings_list = []
     latencies = []
+    scores = []
 
     for i, (query, relevant_docs, irrelevant_docs) in enumerate(GOLDEN_DATASET, 1):
         # Prepare candidates (mix relevant and irrelevant)
@@ -239,6 +263,9 @@ def benchmark_model(model_name: str) -> dict[str, Any]:
         reranked = reranker.rerank(query, candidates, top_k=10)
         latency_ms = (time.perf_counter() - start_time) * 1000
         latencies.append(latency_ms)
+        scores.extend(
+            reranker.score_pair(query, doc) for doc in relevant_docs + irrelevant_docs
+        )
 
         # Calculate rankings for relevant documents
         rankings = []
@@ -269,28 +296,103 @@ def benchmark_model(model_name: str) -> dict[str, Any]:
     print(f"  nDCG@10:        {ndcg_10:.4f}")
     print(f"  Avg Latency:    {avg_latency:.1f} ms")
     print(f"  Total Latency:  {sum(latencies):.1f} ms")
+    print(f"  Load Time:      {load_seconds:.1f} s")
 
     return {
         "model": model_name,
+        "backend": backend,
         "mrr": mrr,
         "ndcg_10": ndcg_10,
         "avg_latency_ms": avg_latency,
         "total_latency_ms": sum(latencies),
+        "load_seconds": load_seconds,
+        "scores": scores,
     }
 
 
+def compare_backends(
+    model_name: str, quantize: bool = True, threads: int | None = None
+) -> None:
+    """Compare PyTorch and ONNX Runtime inference of one reranker model.
+
+    Args:
+        model_name: Model identifier
+        quantize: Use int8 quantized weights for the ONNX run
+        threads: onnxruntime intra-op threads
+    """
+    import numpy as np
+
+    torch_results = benchmark_model(model_name, backend="torch")
+    onnx_results = benchmark_model(
+        model_name, backend="onnx", quantize=quantize, threads=threads
+    )
+
+    torch_scores = np.array(torch_results["scores"])
+    onnx_scores = np.array(onnx_results["scores"])
+    speedup = torch_results["avg_latency_ms"] / max(onnx_results["avg_latency_ms"], 1e-9)
+
+    print(f"\n{'='*70}")
+    label = "int8" if quantize else "fp32"
+    print(f"📈 COMPARISON: PyTorch vs ONNX Runtime ({label})")
+    print(f"{'='*70}")
+    for key, name in (("mrr", "MRR"), ("ndcg_10", "nDCG@10")):
+        print(f"\n{name}:")
+        print(f"  PyTorch:     {torch_results[key]:.4f}")
+        print(f"  ONNX:        {onnx_results[key]:.4f}")
+    print("\nLatency:")
+    print(f"  PyTorch:     {torch_results['avg_latency_ms']:.1f} ms")
+    print(f"  ONNX:        {onnx_results['avg_latency_ms']:.1f} ms")
+    print(f"  Speedup:     {speedup:.2f}x")
+    print("\nScore agreement:")
+    print(f"  Max |diff|:  {np.abs(torch_scores - onnx_scores).max():.4f}")
+    print(f"  Pearson r:   {np.corrcoef(torch_scores, onnx_scores)[0, 1]:.4f}")
+
+
 def main() -> None:
     """Run benchmark comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--backend",
+        choices=["torch", "onnx"],
+        default="torch",
+        help="Inference backend for the BGE vs MS-MARCO comparison",
+    )
+    parser.add_argument(
+        "--compare-backends",
+        metavar="MODEL",
+        help="Compare PyTorch and ONNX Runtime inference of MODEL instead",
+    )
+    parser.add_argument(
+        "--threads", type=int, default=None, help="onnxruntime intra-op threads"
+    )
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Run ONNX models with float weights instead of int8",
+    )
+    args = parser.parse_args()
+    quantize = not args.no_quantize
+
+    if args.compare_backends:
+        print(f"🚀 Reranker Benchmark: PyTorch vs ONNX ({args.compare_backends})")
+        print(f"Dataset size: {len(GOLDEN_DATASET)} queries")
+        compare_backends(args.compare_backends, quantize=quantize, threads=args.threads)
+        return
+
     print("🚀 Reranker Benchmark: BGE vs MS-MARCO")
     print(f"Dataset size: {len(GOLDEN_DATASET)} queries")
     print("Metrics: MRR, nDCG@10, Latency")
 
     try:
         # Benchmark BGE reranker
-        bge_results = benchmark_model("BAAI/bge-reranker-v2-m3")
+        bge_results = benchmark_model(
+            "BAAI/bge-reranker-v2-m3", args.backend, quantize, args.threads
+        )
 
         # Benchmark ms-marco for comparison
-        msmarco_results = benchmark_model("cross-encoder/ms-marco-MiniLM-L-6-v2")
+        msmarco_results = benchmark_model(
+            "cross-encoder/ms-marco-MiniLM-L-6-v2", args.backend, quantize, args.threads
+        )
 
         # Print comparison
         print(f"\n{'='*70}")
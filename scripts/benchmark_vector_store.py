@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark vector store backends: flat (float16/int8) vs ChromaDB.
+
+Measures:
+- Recall@k against exact float32 cosine search
+- Latency: p50/p95 query time for a user-scoped top-k query
+- Build time: bulk insert of all vectors
+
+The dataset is synthetic (clustered Gaussian vectors spread across users)
+so that the benchmark needs no embedding model. ChromaDB is skipped if it
+is not installed.
+
+Usage:
+    python scripts/benchmark_vector_store.py
+    python scripts/benchmark_vector_store.py --vectors 20000 --users 4 --dim 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+
+def make_dataset(
+    n_vectors: int, n_users: int, dim: int, n_queries: int, seed: int = 0
+) -> dict[str, Any]:
+    """Generate clustered vectors, their owners and perturbed queries."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(8, n_vectors // 100), dim)).astype(np.float32)
+    labels = rng.integers(0, len(centers), n_vectors)
+    vectors = centers[labels] + 0.5 * rng.standard_normal((n_vectors, dim)).astype(
+        np.float32
+    )
+    users = [f"user{i % n_users}" for i in range(n_vectors)]
+
+    picks = rng.integers(0, n_vectors, n_queries)
+    queries = vectors[picks] + 0.3 * rng.standard_normal((n_queries, dim)).astype(
+        np.float32
+    )
+    return {
+        "ids": [f"doc{i}" for i in range(n_vectors)],
+        "vectors": vectors,
+        "users": users,
+        "queries": queries,
+        "query_users": [users[i] for i in picks],
+    }
+
+
+def exact_top_k(data: dict[str, Any], k: int) -> list[set[str]]:
+    """Ground truth: exact float32 cosine top-k within the query's user."""
+    vectors = data["vectors"] / np.linalg.norm(data["vectors"], axis=1, keepdims=True)
+    users = np.array(data["users"])
+    truth = []
+    for query, user in zip(data["queries"], data["query_users"]):
+        rows = np.flatnonzero(users == user)
+        scores = vectors[rows] @ (query / np.linalg.norm(query))
+        top = rows[np.argsort(-scores)[:k]]
+        truth.append({data["ids"][i] for i in top})
+    return truth
+
+
+def benchmark_collection(
+    name: str, collection: Any, data: dict[str, Any], truth: list[set[str]], k: int
+) -> dict[str, Any]:
+    """Insert the dataset into a collection and measure recall and latency."""
+    print(f"\n{'=' * 70}")
+    print(f"Benchmarking: {name}")
+    print(f"{'=' * 70}")
+
+    start = time.perf_counter()
+    batch = 2000
+    for i in range(0, len(data["ids"]), batch):
+        collection.add(
+            ids=data["ids"][i : i + batch],
+            embeddings=data["vectors"][i : i + batch].tolist(),
+            metadatas=[{"user_id": u} for u in data["users"][i : i + batch]],
+        )
+    build_s = time.perf_counter() - start
+
+    latencies = []
+    recalls = []
+    for query, user, expected in zip(data["queries"], data["query_users"], truth):
+        start = time.perf_counter()
+        results = collection.query(
+            query_embeddings=[query.tolist()],
+            n_results=k,
+            where={"user_id": user},
+            include=["distances"],
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        recalls.append(len(expected & set(results["ids"][0])) / len(expected))
+
+    result = {
+        "backend": name,
+        "recall": float(np.mean(recalls)),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "build_s": build_s,
+    }
+    print(f"  Recall@{k}:     {result['recall']:.4f}")
+    print(f"  p50 latency:   {result['p50_ms']:.2f} ms")
+    print(f"  p95 latency:   {result['p95_ms']:.2f} ms")
+    print(f"  Build time:    {result['build_s']:.2f} s")
+    return result
+
+
+def main() -> None:
+    """Run the backend comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--vectors", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=5)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    args = parser.parse_args()
+
+    from kagura.core.memory.vector_store import FlatVectorClient
+
+    print("🚀 Vector Store Benchmark: flat vs ChromaDB")
+    print(
+        f"Dataset: {args.vectors} vectors x {args.dim} dims, {args.users} users, "
+        f"{args.queries} queries"
+    )
+
+    data = make_dataset(args.vectors, args.users, args.dim, args.queries)
+    truth = exact_top_k(data, args.k)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for quantization in ("float16", "int8"):
+            client = FlatVectorClient(root / quantization, quantization=quantization)
+            results.append(
+                benchmark_collection(
+                    f"flat-{quantization}",
+                    client.create_collection("bench"),
+                    data,
+                    truth,
+                    args.k,
+                )
+            )
+
+        try:
+            import chromadb  # type: ignore
+            from chromadb.config import Settings  # type: ignore
+        except ImportError:
+            print("\n⚠️  ChromaDB not installed, skipping (pip install chromadb)")
+        else:
+            chroma = chromadb.PersistentClient(
+                path=str(root / "chromadb"),
+                settings=Settings(anonymized_telemetry=False),
+            )
+            collection = chroma.create_collection(
+                "bench", metadata={"hnsw:space": "cosine"}
+            )
+            results.append(
+                benchmark_collection("chromadb", collection, data, truth, args.k)
+            )
+
+    print(f"\n{'=' * 70}")
+    print("📈 COMPARISON")
+    print(f"{'=' * 70}")
+    print(f"{'Backend':<16}{'Recall@k':>10}{'p50 ms':>10}{'p95 ms':>10}{'Build s':>10}")
+    for r in results:
+        print(
+            f"{r['backend']:<16}{r['recall']:>10.4f}{r['p50_ms']:>10.2f}"
+            f"{r['p95_ms']:>10.2f}{r['build_s']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,7 @@ from pydantic import BaseModel
 
 from kagura import agent
 from kagura.core.executor import CodeExecutor
+from kagura.core.parallel import parallel_map
 
 
 class CodeResult(BaseModel):
@@ -73,6 +74,24 @@ class CodeExecutionAgent:
             execution_time=exec_result.execution_time,
         )
 
+    async def execute_many(
+        self, tasks: list[str], max_concurrent: int = 5
+    ) -> list[CodeResult]:
+        """
+        Generate and execute code for several tasks concurrently.
+
+        Generated snippets run in parallel worker processes, each with its
+        own stdout/stderr and timeout.
+
+        Args:
+            tasks: Natural language task descriptions
+            max_concurrent: Maximum tasks in flight at once
+
+        Returns:
+            CodeResults in the same order as tasks
+        """
+        return await parallel_map(self.execute, tasks, max_concurrent=max_concurrent)
+
     async def execute_with_retry(self, task: str) -> CodeResult:
         """
         Execute task with automatic retry on errors.
@@ -3,6 +3,7 @@
 Dependency injection for MemoryManager and other shared resources.
 """
 
+import threading
 import warnings
 from typing import Annotated
 
@@ -10,11 +11,18 @@ from fastapi import Depends, Header
 
 from kagura.config.paths import get_data_dir
 from kagura.core.memory import MemoryManager
+from kagura.core.memory.prewarm import memory_warming, start_memory_prewarm
 
 # Global MemoryManager instances (user_id -> MemoryManager)
 # Each user gets their own MemoryManager instance
 _memory_managers: dict[str, MemoryManager] = {}
 
+# Lexical-only views of the same storage, served while models are warming
+_lexical_managers: dict[str, MemoryManager] = {}
+
+# Creating a MemoryManager loads models; never create one twice concurrently
+_managers_lock = threading.Lock()
+
 
 def get_user_id(x_user_id: str | None = Header(None)) -> str:
     """[DEPRECATED] Extract user_id from X-User-ID header.
@@ -58,23 +66,79 @@ def get_memory_manager(user_id: str = Depends(get_user_id)) -> MemoryManager:
         Each user_id gets a separate MemoryManager instance with
         isolated storage to ensure data isolation.
     """
-    if user_id not in _memory_managers:
-        # Initialize MemoryManager for this user
-        # Each user gets their own persist directory in XDG data dir
+    if user_id in _memory_managers:
+        return _memory_managers[user_id]
+
+    with _managers_lock:
+        if user_id not in _memory_managers:
+            # Initialize MemoryManager for this user
+            # Each user gets their own persist directory in XDG data dir
+            persist_dir = get_data_dir() / "api" / user_id
+            persist_dir.mkdir(parents=True, exist_ok=True)
+
+            _memory_managers[user_id] = MemoryManager(
+                user_id=user_id,
+                agent_name="api",
+                persist_dir=persist_dir,
+                max_messages=100,
+                enable_rag=True,  # Enable semantic search
+                enable_compression=False,  # Disable for API (stateless)
+            )
+
+    return _memory_managers[user_id]
+
+
+def get_search_memory_manager(user_id: str = Depends(get_user_id)) -> MemoryManager:
+    """Get a MemoryManager for read-only search endpoints without waiting.
+
+    While the startup prewarm is still loading models (and the user's
+    MemoryManager does not exist yet), returns a lexical-only manager over
+    the same SQLite storage (no RAG, graph or reranker) so search requests
+    degrade instead of blocking. Check ``memory.rag`` to tell them apart.
+
+    Args:
+        user_id: User identifier (from get_user_id dependency)
+
+    Returns:
+        The user's MemoryManager, or its lexical-only view while warming
+    """
+    if user_id in _memory_managers or not memory_warming():
+        _lexical_managers.pop(user_id, None)
+        return get_memory_manager(user_id)
+
+    if user_id not in _lexical_managers:
         persist_dir = get_data_dir() / "api" / user_id
         persist_dir.mkdir(parents=True, exist_ok=True)
-
-        _memory_managers[user_id] = MemoryManager(
+        _lexical_managers[user_id] = MemoryManager(
             user_id=user_id,
             agent_name="api",
             persist_dir=persist_dir,
             max_messages=100,
-            enable_rag=True,  # Enable semantic search
-            enable_compression=False,  # Disable for API (stateless)
+            enable_rag=False,
+            enable_graph=False,
+            enable_compression=False,
         )
+    return _lexical_managers[user_id]
 
-    return _memory_managers[user_id]
+
+def start_prewarm(user_id: str = "default_user") -> None:
+    """Load memory models and open the user's stores in the background.
+
+    Called at API startup. Until it finishes, search endpoints use
+    get_search_memory_manager()'s lexical-only fallback and /health reports
+    the state of each stage.
+
+    Args:
+        user_id: User whose MemoryManager is opened (API keys map to
+            "default_user" today, see get_user_id)
+    """
+    start_memory_prewarm(
+        extra_stages=[("memory_store", lambda: get_memory_manager(user_id))]
+    )
 
 
 # Type alias for dependency injection
 MemoryManagerDep = Annotated[MemoryManager, Depends(get_memory_manager)]
+
+# Non-blocking variant for search/health endpoints (see get_search_memory_manager)
+SearchMemoryManagerDep = Annotated[MemoryManager, Depends(get_search_memory_manager)]
@@ -135,6 +135,10 @@ class RecallResponse(BaseModel):
     results: list[RecallResult]
     query: str
     k: int
+    degraded: bool = Field(
+        default=False,
+        description="Lexical results served while embedding models were loading",
+    )
 
 
 # System
@@ -144,7 +148,11 @@ class HealthResponse(BaseModel):
     status: Literal["healthy", "degraded", "unhealthy"]
     timestamp: datetime
     services: dict[str, str] = Field(
-        ..., description="Service statuses (api, database, cache, etc.)"
+        ...,
+        description=(
+            "Service statuses (api, database, cache, etc.; prewarm stages "
+            "report 'warming' until loaded)"
+        ),
     )
 
 
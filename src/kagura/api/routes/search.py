@@ -10,7 +10,9 @@ from typing import Any
 from fastapi import APIRouter
 
 from kagura.api import models
-from kagura.api.dependencies import MemoryManagerDep
+from kagura.api.dependencies import SearchMemoryManagerDep
+from kagura.core.memory import MemoryManager
+from kagura.core.memory.prewarm import memory_warming
 from kagura.utils.common.json_helpers import decode_chromadb_metadata
 
 router = APIRouter()
@@ -18,7 +20,7 @@ router = APIRouter()
 
 @router.post("/search", response_model=models.SearchResponse)
 async def search_memories(
-    request: models.SearchRequest, memory: MemoryManagerDep
+    request: models.SearchRequest, memory: SearchMemoryManagerDep
 ) -> dict[str, Any]:
     """Search memories with full-text + semantic search.
 
@@ -88,19 +90,24 @@ async def search_memories(
 
 @router.post("/recall", response_model=models.RecallResponse)
 async def recall_memories(
-    request: models.RecallRequest, memory: MemoryManagerDep
+    request: models.RecallRequest, memory: SearchMemoryManagerDep
 ) -> dict[str, Any]:
     """Recall memories by semantic similarity.
 
-    Uses vector embeddings to find semantically similar memories.
+    Uses vector embeddings to find semantically similar memories. While
+    models are still prewarming after startup, falls back to lexical (BM25)
+    search over persistent memory and sets ``degraded`` in the response.
 
     Args:
         request: Recall request
-        memory: MemoryManager dependency
+        memory: MemoryManager dependency (lexical-only view while warming)
 
     Returns:
         Recall results with similarity scores
     """
+    if not (memory.rag or memory.persistent_rag) and memory_warming():
+        return _recall_lexical(request, memory)
+
     # Use semantic search (RAG)
     try:
         rag_results = memory.recall_semantic(
@@ -158,3 +165,43 @@ async def recall_memories(
         "query": request.query,
         "k": request.k,
     }
+
+
+def _recall_lexical(
+    request: models.RecallRequest, memory: MemoryManager
+) -> dict[str, Any]:
+    """Degraded recall: keyword search while embedding models load."""
+    results = []
+    if request.scope in ("all", "persistent"):
+        results = memory.recall_lexical(request.query, top_k=request.k)
+
+    # BM25 scores are unbounded; scale to (0, 1] relative to the best match
+    top_score = max((r["score"] or 0.0 for r in results), default=0.0)
+
+    recall_results = []
+    for result in results:
+        metadata_dict = decode_chromadb_metadata(result.get("metadata") or {})
+        tags = metadata_dict.get("tags", [])
+        user_metadata = {
+            k: v
+            for k, v in metadata_dict.items()
+            if k not in ("tags", "importance", "created_at", "updated_at")
+        }
+        score = result["score"]
+        recall_results.append(
+            {
+                "key": result["key"],
+                "value": str(result["value"]),
+                "scope": "persistent",
+                "similarity": score / top_score if score and top_score else 0.0,
+                "tags": tags,
+                "metadata": user_metadata,
+            }
+        )
+
+    return {
+        "results": recall_results,
+        "query": request.query,
+        "k": request.k,
+        "degraded": True,
+    }
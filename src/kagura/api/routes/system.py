@@ -12,25 +12,40 @@ from typing import Any
 from fastapi import APIRouter
 
 from kagura.api import models
-from kagura.api.dependencies import MemoryManagerDep
+from kagura.api.dependencies import MemoryManagerDep, SearchMemoryManagerDep
+from kagura.core.memory.prewarm import get_prewarmer
 
 router = APIRouter()
 
+# Service status reported for each startup prewarm stage state
+_PREWARM_HEALTH = {
+    "pending": "warming",
+    "warming": "warming",
+    "ready": "healthy",
+    "failed": "degraded",
+}
+
 # Track API start time for uptime calculation
 _START_TIME = time.time()
 
 
 @router.get("/health", response_model=models.HealthResponse)
-async def health_check(memory: MemoryManagerDep) -> dict[str, Any]:
+async def health_check(memory: SearchMemoryManagerDep) -> dict[str, Any]:
     """Health check endpoint.
 
+    Answers immediately during startup: while models are prewarming,
+    vector_db and each prewarm stage ("vector_store", "embedding",
+    "reranker", "memory_store") report "warming" and the overall status is
+    "degraded".
+
     Args:
-        memory: MemoryManager dependency
+        memory: MemoryManager dependency (lexical-only view while warming)
 
     Returns:
         Health status and service statuses
     """
     services = {}
+    prewarmer = get_prewarmer()
 
     # API always healthy if we got here
     services["api"] = "healthy"
@@ -52,14 +67,21 @@ async def health_check(memory: MemoryManagerDep) -> dict[str, Any]:
             services["vector_db"] = "healthy"
         except Exception:
             services["vector_db"] = "unhealthy"
+    elif prewarmer.warming:
+        services["vector_db"] = "warming"
     else:
         services["vector_db"] = "disabled"
 
+    # Startup prewarm stages (models, stores)
+    if prewarmer.started:
+        for stage, state in prewarmer.status().items():
+            services[stage] = _PREWARM_HEALTH[state]
+
     # Overall status
     unhealthy_services = [k for k, v in services.items() if v == "unhealthy"]
     if unhealthy_services:
         status = "unhealthy"
-    elif any(v == "degraded" for v in services.values()):
+    elif any(v in ("degraded", "warming") for v in services.values()):
         status = "degraded"
     else:
         status = "healthy"
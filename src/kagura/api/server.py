@@ -5,16 +5,30 @@ FastAPI-based REST API for Universal AI Memory Management.
 v4.0.0+ - MCP-First Architecture
 """
 
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from kagura.api import models
+from kagura.api.dependencies import start_prewarm
 from kagura.api.routes import graph, memory, search, system
 from kagura.api.routes import models as models_routes
 from kagura.api.routes.mcp_transport import mcp_asgi_app
+from kagura.config.env import get_memory_prewarm_enabled
+from kagura.mcp.middleware import close_tool_call_journal
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prewarm memory models on startup; flush auto-logged calls on shutdown."""
+    if get_memory_prewarm_enabled():
+        start_prewarm()
+    yield
+    await close_tool_call_journal()
+
 
 # FastAPI app
 app = FastAPI(
@@ -23,6 +37,7 @@ app = FastAPI(
     version="4.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware (configure for production)
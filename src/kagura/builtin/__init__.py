@@ -3,10 +3,10 @@
 This module provides built-in agents for common tasks:
 - shell: Execute shell commands securely
 - git: Git operations (commit, push, status, PR)
-- file: File operations (search, grep)
+- file: File operations (search, grep, content search)
 """
 
-from kagura.builtin.file import file_search, grep_content
+from kagura.builtin.file import file_search, grep_content, search_content
 from kagura.builtin.git import git_commit, git_create_pr, git_push, git_status
 from kagura.builtin.shell import shell
 
@@ -18,4 +18,5 @@ __all__ = [
     "git_create_pr",
     "file_search",
     "grep_content",
+    "search_content",
 ]
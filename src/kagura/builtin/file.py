@@ -1,22 +1,29 @@
-"""Built-in file agents for file operations."""
+"""Built-in file agents for file operations.
 
-from kagura.core.shell import ShellExecutor
+Searches run in-process (see kagura.core.content_search) instead of
+spawning find/grep subprocesses.
+"""
 
-# File-operations-only executor for security
-_executor = ShellExecutor(allowed_commands=["find", "grep", "ls", "cat"])
+import re
+from typing import Iterable, Optional
+
+from kagura.core.content_search import ContentSearcher, walk_files
 
 
 async def file_search(
     pattern: str,
     directory: str = ".",
     file_type: str = "*",
+    respect_gitignore: bool = False,
 ) -> list[str]:
     """Search for files matching pattern.
 
     Args:
-        pattern: File name pattern to search for
+        pattern: Regular expression matched against file paths ("*" = all)
         directory: Directory to search in (default: current directory)
-        file_type: File extension filter (e.g., "*.py", "*.txt")
+        file_type: File name filter (e.g., "*.py", "*.txt")
+        respect_gitignore: Skip hidden files and .gitignore/.kaguraignore
+            matches (default: False, every file is listed like ``find``)
 
     Returns:
         List of matching file paths
@@ -25,56 +32,81 @@ async def file_search(
         >>> files = await file_search("test", directory="./tests", file_type="*.py")
         >>> files = await file_search("config", file_type="*.json")
     """
-    # Build find command
-    cmd = f'find {directory} -name "{file_type}" -type f'
-
-    # Add grep filter if pattern is not "*"
-    if pattern != "*":
-        cmd += f' | grep "{pattern}"'
-
-    result = await _executor.exec(cmd)
+    paths = walk_files(directory, file_type, respect_gitignore=respect_gitignore)
+    if pattern == "*":
+        return list(paths)
 
-    if not result.stdout.strip():
-        return []
+    regex = re.compile(pattern)
+    return [path for path in paths if regex.search(path)]
 
-    return [line.strip() for line in result.stdout.strip().split("\n") if line.strip()]
 
-
-async def grep_content(pattern: str, files: list[str]) -> dict[str, list[str]]:
+async def grep_content(
+    pattern: str,
+    files: Iterable[str],
+    literal: bool = False,
+    ignore_case: bool = False,
+    max_results: Optional[int] = None,
+) -> dict[str, list[str]]:
     """Search for content in files.
 
     Args:
-        pattern: Text pattern to search for
-        files: List of file paths to search in
+        pattern: Regular expression (or literal text) to search for
+        files: File paths to search in
+        literal: Treat pattern as literal text
+        ignore_case: Case-insensitive matching
+        max_results: Stop after this many matching lines (None = all)
 
     Returns:
-        Dictionary mapping file paths to matching lines
+        Dictionary mapping file paths to matching lines ("<line>:<text>")
 
     Example:
         >>> results = await grep_content("TODO", ["src/main.py", "src/utils.py"])
         >>> for file, lines in results.items():
         ...     print(f"{file}: {len(lines)} matches")
     """
+    searcher = ContentSearcher(
+        pattern, literal=literal, ignore_case=ignore_case, max_results=max_results
+    )
     results: dict[str, list[str]] = {}
+    for match in await searcher.search(files):
+        line = match.line.strip()
+        if line:
+            results.setdefault(match.path, []).append(f"{match.line_number}:{line}")
+    return results
 
-    for file in files:
-        # Use grep with line numbers
-        cmd = f'grep -n "{pattern}" {file}'
-
-        try:
-            result = await _executor.exec(cmd)
-
-            if result.stdout.strip():
-                lines = [
-                    line.strip()
-                    for line in result.stdout.strip().split("\n")
-                    if line.strip()
-                ]
-                if lines:
-                    results[file] = lines
-        except Exception:
-            # grep returns non-zero exit code if no matches found
-            # This is expected, so we skip this file
-            continue
 
-    return results
+async def search_content(
+    pattern: str,
+    directory: str = ".",
+    file_type: str = "*",
+    literal: bool = False,
+    ignore_case: bool = False,
+    max_results: Optional[int] = 1000,
+    respect_gitignore: bool = True,
+) -> dict[str, list[str]]:
+    """Search file contents under a directory (walk and grep in one pass).
+
+    Args:
+        pattern: Regular expression (or literal text) to search for
+        directory: Directory to search in (default: current directory)
+        file_type: File name filter (e.g., "*.py")
+        literal: Treat pattern as literal text
+        ignore_case: Case-insensitive matching
+        max_results: Stop after this many matching lines (None = all)
+        respect_gitignore: Skip hidden files and .gitignore/.kaguraignore
+            matches
+
+    Returns:
+        Dictionary mapping file paths to matching lines ("<line>:<text>")
+
+    Example:
+        >>> results = await search_content("TODO", directory="src", file_type="*.py")
+    """
+    files = walk_files(directory, file_type, respect_gitignore=respect_gitignore)
+    return await grep_content(
+        pattern,
+        files,
+        literal=literal,
+        ignore_case=ignore_case,
+        max_results=max_results,
+    )
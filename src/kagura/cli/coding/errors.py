@@ -55,10 +55,9 @@ def errors_command(
         # Create manager with lightweight config for fast CLI startup
         coding_mem = _get_lightweight_coding_memory(user_id=user, project_id=project)
 
-        # Search for all errors using LIKE pattern
-        pattern = f"project:{project}:error:"
-        results = coding_mem.persistent.search(
-            query=pattern, user_id=user, agent_name=None, limit=1000
+        # Fetch all errors through the project record index
+        results = coding_mem.persistent.fetch_project_records(
+            user_id=user, project_id=project, record_type="error"
         )
 
         if not results:
@@ -151,10 +151,9 @@ def sessions_command(
         # Create manager with lightweight config for fast CLI startup
         coding_mem = _get_lightweight_coding_memory(user_id=user, project_id=project)
 
-        # Search for all sessions using LIKE pattern
-        pattern = f"project:{project}:session:"
-        results = coding_mem.persistent.search(
-            query=pattern, user_id=user, agent_name=None, limit=1000
+        # Fetch all sessions through the project record index
+        results = coding_mem.persistent.fetch_project_records(
+            user_id=user, project_id=project, record_type="session"
         )
 
         if not results:
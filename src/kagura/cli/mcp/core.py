@@ -11,6 +11,7 @@ from typing import Any
 import click
 from mcp.server.stdio import stdio_server  # type: ignore
 
+from kagura.config.env import get_memory_prewarm_enabled
 from kagura.config.paths import get_cache_dir
 from kagura.mcp import create_mcp_server
 
@@ -27,8 +28,15 @@ from kagura.mcp import create_mcp_server
     default=None,
     help="Comma-separated list of categories to enable (e.g., 'coding,memory,github')",
 )
+@click.option(
+    "--lazy/--eager",
+    default=True,
+    help="Import builtin tool modules on first call (default) or at startup",
+)
 @click.pass_context
-def serve(ctx: click.Context, name: str, remote: bool, categories: str | None):
+def serve(
+    ctx: click.Context, name: str, remote: bool, categories: str | None, lazy: bool
+):
     """Start MCP server
 
     Starts the MCP server using stdio transport.
@@ -44,6 +52,9 @@ def serve(ctx: click.Context, name: str, remote: bool, categories: str | None):
         # Filter by categories (only coding and memory tools)
         kagura mcp serve --categories coding,memory,github
 
+        # Import all builtin tool modules at startup
+        kagura mcp serve --eager
+
     Configuration for Claude Code (~/.config/claude-code/mcp.json):
       {
         "mcpServers": {
@@ -140,13 +151,17 @@ def serve(ctx: click.Context, name: str, remote: bool, categories: str | None):
         click.echo(f"Starting Kagura MCP server: {name}", err=True)
         click.echo(f"Logging to: {log_file}", err=True)
 
-    # Auto-register built-in tools
+    # Auto-register built-in tools (lazily: advertised from the tool manifest,
+    # each module imported on first call, so tools/list is answered quickly)
     try:
-        import kagura.mcp.builtin  # noqa: F401
+        from kagura.mcp.manifest import register_builtin_tools
 
-        logger.info("Loaded built-in MCP tools")
+        tool_count = register_builtin_tools(lazy=lazy)
+
+        mode = "lazy" if lazy else "eager"
+        logger.info(f"Loaded {tool_count} built-in MCP tools ({mode})")
         if verbose:
-            click.echo("Loaded built-in MCP tools", err=True)
+            click.echo(f"Loaded {tool_count} built-in MCP tools ({mode})", err=True)
     except ImportError:
         logger.warning("Could not load built-in tools")
         if verbose:
@@ -175,6 +190,16 @@ def serve(ctx: click.Context, name: str, remote: bool, categories: str | None):
                     err=True,
                 )
 
+    # Load memory models in the background so the first memory tool call
+    # does not block the server (search tools degrade until ready)
+    if get_memory_prewarm_enabled() and (
+        enabled_categories is None or "memory" in enabled_categories
+    ):
+        from kagura.core.memory.prewarm import start_memory_prewarm
+
+        start_memory_prewarm()
+        logger.info("Prewarming memory models in the background")
+
     # Create MCP server with optional category filter
     server = create_mcp_server(
         name, context="local", categories=enabled_categories
@@ -188,10 +213,16 @@ def serve(ctx: click.Context, name: str, remote: bool, categories: str | None):
 
     # Run server with stdio transport
     async def run_server():
-        async with stdio_server() as (read_stream, write_stream):
-            await server.run(
-                read_stream, write_stream, server.create_initialization_options()
-            )
+        from kagura.mcp.middleware import close_tool_call_journal
+
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await server.run(
+                    read_stream, write_stream, server.create_initialization_options()
+                )
+        finally:
+            # Write auto-logged tool calls still queued at shutdown
+            await close_tool_call_journal()
 
     # Run async server
     try:
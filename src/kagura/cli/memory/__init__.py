@@ -14,7 +14,7 @@ from kagura.cli.memory import diagnostics, operations, query, setup
 def memory_group() -> None:
     """Memory management commands.
 
-    Manage memory export, import, and consolidation.
+    Manage memory export, import, consolidation and maintenance.
     """
     pass
 
@@ -25,6 +25,7 @@ memory_group.add_command(setup.install_reranking, name="install-reranking")
 memory_group.add_command(operations.export_memory, name="export")
 memory_group.add_command(operations.import_memory, name="import")
 memory_group.add_command(operations.reindex, name="reindex")
+memory_group.add_command(operations.maintain, name="maintain")
 memory_group.add_command(query.list_memories, name="list")
 memory_group.add_command(query.search_memory, name="search")
 memory_group.add_command(query.stats, name="stats")
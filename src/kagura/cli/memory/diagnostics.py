@@ -185,7 +185,7 @@ def index(
             console.print("Clearing existing index...")
             # Clear existing collection
             try:
-                manager.persistent_rag.collection.delete()
+                manager.persistent_rag.delete_all()
             except Exception:  # Ignore errors - operation is non-critical
                 pass
 
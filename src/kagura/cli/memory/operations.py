@@ -1,4 +1,4 @@
-"""Memory export, import and reindexing operations.
+"""Memory export, import, reindexing and maintenance operations.
 
 Provides commands for memory data portability and index management.
 """
@@ -6,11 +6,13 @@ Provides commands for memory data portability and index management.
 from __future__ import annotations
 
 import asyncio
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import click
 from rich.console import Console
+from rich.status import Status
 
 from kagura.config.project import get_default_user as _get_default_user_impl
 
@@ -71,6 +73,26 @@ def _get_lightweight_memory_manager(
     )
 
 
+def _throughput(count: int, elapsed: float) -> str:
+    """Format a count/elapsed-time pair as a rate."""
+    rate = count / elapsed if elapsed > 0 else 0.0
+    return f"{rate:,.0f}/s in {elapsed:.1f}s"
+
+
+def _progress_reporter(
+    status: Status, verb: str, started: float
+) -> Callable[[int], None]:
+    """Build a progress callback that updates a Rich status line."""
+
+    def report(count: int) -> None:
+        elapsed = time.perf_counter() - started
+        status.update(
+            f"[bold green]{verb}... {count:,} memories ({_throughput(count, elapsed)})"
+        )
+
+    return report
+
+
 @click.command(name="export")
 @click.option(
     "--output",
@@ -103,6 +125,23 @@ def _get_lightweight_memory_manager(
     default=True,
     help="Include graph data (default: yes)",
 )
+@click.option(
+    "--compress",
+    type=click.Choice(["gzip", "zstd"]),
+    default=None,
+    help="Compress JSONL files (zstd needs the zstandard package)",
+)
+@click.option(
+    "--batch-size",
+    default=1000,
+    type=int,
+    help="Rows read and written per batch (default: 1000)",
+)
+@click.option(
+    "--vectors/--no-vectors",
+    default=False,
+    help="Include embedding vectors so imports can skip re-embedding",
+)
 def export_memory(
     output: str,
     user_id: str,
@@ -110,6 +149,9 @@ def export_memory(
     working: bool,
     persistent: bool,
     graph: bool,
+    compress: str | None,
+    batch_size: int,
+    vectors: bool,
 ) -> None:
     """Export memory data to JSONL format.
 
@@ -125,6 +167,12 @@ def export_memory(
 
         # Export for specific user
         kagura memory export --output ./backup --user-id user_alice
+
+        # Compressed export
+        kagura memory export --output ./backup --compress gzip
+
+        # Keep vectors (import skips re-embedding with the same model)
+        kagura memory export --output ./backup --vectors
     """
     from kagura.core.memory.export import MemoryExporter
 
@@ -143,18 +191,23 @@ def export_memory(
         )
 
         # Create exporter
-        exporter = MemoryExporter(manager)
+        exporter = MemoryExporter(manager, batch_size=batch_size)
 
         # Run export
-        with console.status("[bold green]Exporting..."):
+        started = time.perf_counter()
+        with console.status("[bold green]Exporting...") as status:
             stats = asyncio.run(
                 exporter.export_all(
                     output_dir=output,
                     include_working=working,
                     include_persistent=persistent,
                     include_graph=graph,
+                    compression=compress,  # type: ignore[arg-type]
+                    progress=_progress_reporter(status, "Exporting", started),
+                    include_vectors=vectors,
                 )
             )
+        elapsed = time.perf_counter() - started
 
         # Display results
         console.print("[green]✓ Export completed successfully![/green]")
@@ -162,7 +215,12 @@ def export_memory(
         console.print(f"[dim]Output directory: {output}[/dim]")
         console.print()
         console.print("[cyan]Exported:[/cyan]")
-        console.print(f"  • Memories: {stats['memories']}")
+        console.print(
+            f"  • Memories: {stats['memories']} "
+            f"({_throughput(stats['memories'], elapsed)})"
+        )
+        if vectors:
+            console.print(f"  • Vectors: {stats.get('vectors', 0)}")
         if graph:
             console.print(f"  • Graph nodes: {stats['graph_nodes']}")
             console.print(f"  • Graph edges: {stats['graph_edges']}")
@@ -171,10 +229,10 @@ def export_memory(
         # Show files created
         output_path = Path(output)
         console.print("[cyan]Files created:[/cyan]")
-        if (output_path / "memories.jsonl").exists():
-            console.print("  • memories.jsonl")
-        if (output_path / "graph.jsonl").exists():
-            console.print("  • graph.jsonl")
+        for path in sorted(output_path.glob("*.jsonl*")) + sorted(
+            output_path.glob("*.npy")
+        ):
+            console.print(f"  • {path.name}")
         if (output_path / "metadata.json").exists():
             console.print("  • metadata.json")
         console.print()
@@ -206,15 +264,23 @@ def export_memory(
     is_flag=True,
     help="Clear existing data before import",
 )
+@click.option(
+    "--batch-size",
+    default=1000,
+    type=int,
+    help="Memories stored and embedded per batch (default: 1000)",
+)
 def import_memory(
     input: str,
     user_id: str,
     agent_name: str,
     clear: bool,
+    batch_size: int,
 ) -> None:
     """Import memory data from JSONL format.
 
-    Imports memories and graph data from a previously exported directory.
+    Imports memories and graph data from a previously exported directory
+    (plain or gzip/zstd-compressed JSONL).
 
     Examples:
         # Import from backup
@@ -247,16 +313,19 @@ def import_memory(
         )
 
         # Create importer
-        importer = MemoryImporter(manager)
+        importer = MemoryImporter(manager, batch_size=batch_size)
 
         # Run import
-        with console.status("[bold green]Importing..."):
+        started = time.perf_counter()
+        with console.status("[bold green]Importing...") as status:
             stats = asyncio.run(
                 importer.import_all(
                     input_dir=input,
                     clear_existing=clear,
+                    progress=_progress_reporter(status, "Importing", started),
                 )
             )
+        elapsed = time.perf_counter() - started
 
         # Display results
         console.print("[green]✓ Import completed successfully![/green]")
@@ -264,7 +333,14 @@ def import_memory(
         console.print(f"[dim]Import directory: {input}[/dim]")
         console.print()
         console.print("[cyan]Imported:[/cyan]")
-        console.print(f"  • Memories: {stats['memories']}")
+        console.print(
+            f"  • Memories: {stats['memories']} "
+            f"({_throughput(stats['memories'], elapsed)})"
+        )
+        if stats["vectors_reused"]:
+            console.print(
+                f"  • Vectors reused: {stats['vectors_reused']} (not re-embedded)"
+            )
         console.print(f"  • Graph nodes: {stats['graph_nodes']}")
         console.print(f"  • Graph edges: {stats['graph_edges']}")
         console.print()
@@ -466,3 +542,96 @@ def reindex(
     except Exception as e:
         console.print(f"\n[red]✗ Reindexing failed: {e}[/red]")
         raise click.Abort()
+
+
+@click.command(name="maintain")
+@click.option(
+    "--graph-path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Graph JSON file to maintain (default: <data dir>/graph.json)",
+)
+@click.option(
+    "--user-id",
+    "user_ids",
+    multiple=True,
+    help="Maintain only this user (repeatable; default: all users)",
+)
+@click.option(
+    "--prune-age-days",
+    type=float,
+    default=None,
+    help="Also prune low-importance nodes older than this many days",
+)
+@click.option(
+    "--importance-threshold",
+    type=float,
+    default=0.3,
+    help="Importance below which old nodes are pruned (default: 0.3)",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Run maintenance but do not save the graph",
+)
+def maintain(
+    graph_path: Path | None,
+    user_ids: tuple[str, ...],
+    prune_age_days: float | None,
+    importance_threshold: float,
+    dry_run: bool,
+) -> None:
+    """Run neural memory maintenance (decay, pruning, consolidation).
+
+    Decays association weights, removes edges that fell below the prune
+    threshold, promotes frequently used memories to long-term and
+    optionally prunes old, unimportant nodes - for every user in the graph.
+    Suitable for cron; NeuralMemoryEngine runs the same scheduler in-process.
+    Each edge decays by the time since it was last decayed (saved with the
+    graph), so any schedule applies the same total decay.
+
+    Examples:
+        # Maintain all users
+        kagura memory maintain
+
+        # One user, also pruning nodes older than 90 days
+        kagura memory maintain --user-id user_alice --prune-age-days 90
+    """
+    from kagura.config.paths import get_data_dir
+    from kagura.core.graph.memory import GraphMemory
+    from kagura.core.memory.neural import MaintenanceScheduler, NeuralMemoryConfig
+
+    graph_path = graph_path or get_data_dir() / "graph.json"
+    if not graph_path.exists():
+        console.print(f"[yellow]No graph found at {graph_path}[/yellow]")
+        return
+
+    try:
+        graph = GraphMemory(persist_path=graph_path)
+        scheduler = MaintenanceScheduler(
+            graph,
+            NeuralMemoryConfig(),
+            prune_node_age_days=prune_age_days,
+            prune_importance_threshold=importance_threshold,
+        )
+
+        with console.status("[bold green]Running maintenance..."):
+            stats = scheduler.run_once(user_ids or None)
+            if not dry_run:
+                graph.persist()
+
+        console.print("[green]✓ Maintenance completed[/green]")
+        console.print()
+        console.print(f"  • Users: {stats.users}")
+        console.print(f"  • Edges decayed: {stats.edges_decayed}")
+        console.print(f"  • Edges pruned: {stats.edges_pruned}")
+        console.print(f"  • Nodes pruned: {stats.nodes_pruned}")
+        console.print(f"  • Nodes consolidated: {stats.nodes_consolidated}")
+        console.print(f"  • CPU time: {stats.cpu_ms:.1f}ms")
+        if dry_run:
+            console.print("\n[dim]Dry run: graph not saved[/dim]")
+        console.print()
+
+    except Exception as e:
+        console.print(f"\n[red]✗ Maintenance failed: {e}[/red]")
+        raise click.Abort()
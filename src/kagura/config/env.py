@@ -196,6 +196,98 @@ def get_search_cache_ttl() -> int:
         return 3600
 
 
+# ============================================
+# Tool Result Cache Settings
+# ============================================
+
+
+def get_tool_cache_enabled() -> bool:
+    """
+    Get tool result cache enabled flag from environment.
+
+    Environment variable: ENABLE_TOOL_CACHE
+
+    Returns:
+        True if caching of idempotent tool results is enabled (default: True)
+
+    Note:
+        Set to "false", "0", or "no" to disable caching.
+    """
+    value = os.getenv("ENABLE_TOOL_CACHE", "true").lower()
+    return value not in ("false", "0", "no")
+
+
+def get_tool_cache_persist() -> bool:
+    """
+    Get tool result cache disk persistence flag from environment.
+
+    Environment variable: TOOL_CACHE_PERSIST
+
+    Returns:
+        True if cached tool results are persisted to disk (default: True)
+
+    Note:
+        Set to "false", "0", or "no" to keep the cache in memory only.
+    """
+    value = os.getenv("TOOL_CACHE_PERSIST", "true").lower()
+    return value not in ("false", "0", "no")
+
+
+# ============================================
+# Memory Vector Store Settings
+# ============================================
+
+
+def get_vector_backend() -> str:
+    """
+    Get the vector store backend used by MemoryRAG.
+
+    Environment variable: KAGURA_VECTOR_BACKEND
+
+    Returns:
+        "chromadb" (default) or "flat" (embedded exact-search store)
+
+    Note:
+        Unknown values fall back to "chromadb".
+    """
+    value = os.getenv("KAGURA_VECTOR_BACKEND", "chromadb").strip().lower()
+    return value if value in ("chromadb", "flat") else "chromadb"
+
+
+def get_vector_quantization() -> str:
+    """
+    Get the vector storage format of the flat vector backend.
+
+    Environment variable: KAGURA_VECTOR_QUANTIZATION
+
+    Returns:
+        "float16" (default) or "int8"
+
+    Note:
+        Only applies to newly created collections; unknown values fall
+        back to "float16".
+    """
+    value = os.getenv("KAGURA_VECTOR_QUANTIZATION", "float16").strip().lower()
+    return value if value in ("float16", "int8") else "float16"
+
+
+def get_memory_prewarm_enabled() -> bool:
+    """
+    Get the memory model prewarm flag from environment.
+
+    Environment variable: KAGURA_MEMORY_PREWARM
+
+    Returns:
+        True if the API and MCP servers load memory models in a background
+        thread at startup (default: True)
+
+    Note:
+        Set to "false", "0", or "no" to load models on first use instead.
+    """
+    value = os.getenv("KAGURA_MEMORY_PREWARM", "true").lower()
+    return value not in ("false", "0", "no")
+
+
 # ============================================
 # Default Settings
 # ============================================
@@ -365,6 +457,11 @@ def list_env_vars() -> dict[str, Optional[str]]:
         "BRAVE_SEARCH_API_KEY": "***" if get_brave_search_api_key() else None,
         "ENABLE_SEARCH_CACHE": str(get_search_cache_enabled()),
         "SEARCH_CACHE_TTL": str(get_search_cache_ttl()),
+        "ENABLE_TOOL_CACHE": str(get_tool_cache_enabled()),
+        "TOOL_CACHE_PERSIST": str(get_tool_cache_persist()),
+        "KAGURA_VECTOR_BACKEND": get_vector_backend(),
+        "KAGURA_VECTOR_QUANTIZATION": get_vector_quantization(),
+        "KAGURA_MEMORY_PREWARM": str(get_memory_prewarm_enabled()),
         "DEFAULT_MODEL": get_default_model(),
         "OPENAI_DEFAULT_MODEL": get_openai_default_model(),
         "ANTHROPIC_DEFAULT_MODEL": get_anthropic_default_model(),
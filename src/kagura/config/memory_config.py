@@ -4,6 +4,8 @@ Centralized configuration for memory components:
 - Embedding models (E5-series multilingual)
 - Reranking (Cross-Encoder)
 - Recall scoring weights
+- Vector store backend (ChromaDB or embedded flat index)
+- Write deduplication (content hash, SimHash near-duplicates)
 - Overall memory system settings
 
 Example:
@@ -14,7 +16,7 @@ Example:
     True
 """
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -28,6 +30,10 @@ class EmbeddingConfig(BaseModel):
         use_prefix: Use query:/passage: prefixes (required for E5-series)
         max_tokens: Maximum sequence length
         normalize: Normalize embeddings to unit vectors
+        max_batch_tokens: Padded tokens per model call (length-sorted batches)
+        backend: Inference backend ("torch" or "onnx")
+        quantize: Use int8 dynamically quantized weights (ONNX backend)
+        intra_op_threads: onnxruntime intra-op threads (ONNX backend)
     """
 
     model: str = Field(
@@ -43,6 +49,30 @@ class EmbeddingConfig(BaseModel):
     normalize: bool = Field(
         default=True, description="Normalize embeddings to unit vectors"
     )
+    max_batch_tokens: int = Field(
+        default=8192,
+        description=(
+            "Maximum padded tokens (texts x longest text) per model call; "
+            "texts are sorted by length so short ones are batched together"
+        ),
+        ge=1,
+    )
+    backend: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description=(
+            "Inference backend: 'torch' (sentence-transformers) or 'onnx' "
+            "(onnxruntime on CPU, requires: pip install onnxruntime)"
+        ),
+    )
+    quantize: bool = Field(
+        default=True,
+        description="ONNX backend: use dynamically int8-quantized weights",
+    )
+    intra_op_threads: Optional[int] = Field(
+        default=None,
+        description="ONNX backend: intra-op threads (None = onnxruntime default)",
+        ge=1,
+    )
 
 
 class RerankConfig(BaseModel):
@@ -54,6 +84,15 @@ class RerankConfig(BaseModel):
         candidates_k: Number of candidates to retrieve before reranking
         top_k: Number of final results after reranking
         batch_size: Batch size for reranking (memory vs speed tradeoff)
+        cache_size: Cached (query, document) scores kept in LRU order
+        max_candidates: Budget of candidates scored by the cross-encoder
+        adaptive: Skip or truncate reranking when first-stage scores are
+            well separated
+        adaptive_margin: Normalized first-stage score gap treated as "well
+            separated" by adaptive reranking
+        backend: Inference backend ("torch" or "onnx")
+        quantize: Use int8 dynamically quantized weights (ONNX backend)
+        intra_op_threads: onnxruntime intra-op threads (ONNX backend)
     """
 
     enabled: bool = Field(
@@ -83,6 +122,54 @@ class RerankConfig(BaseModel):
     batch_size: int = Field(
         default=32, description="Batch size for reranking", ge=1, le=256
     )
+    cache_size: int = Field(
+        default=4096,
+        description=(
+            "Cross-encoder scores cached per (query, document id, document "
+            "content) with LRU eviction (0 disables the cache)"
+        ),
+        ge=0,
+    )
+    max_candidates: Optional[int] = Field(
+        default=None,
+        description=(
+            "Rerank at most this many candidates (best first-stage scores); "
+            "the rest keep their first-stage order after them. None = all"
+        ),
+        ge=1,
+    )
+    adaptive: bool = Field(
+        default=False,
+        description=(
+            "Skip the cross-encoder when first-stage scores already separate "
+            "the results, and drop candidates that cannot reach the top-k"
+        ),
+    )
+    adaptive_margin: float = Field(
+        default=0.15,
+        description=(
+            "Gap in min-max normalized first-stage scores considered well "
+            "separated by adaptive reranking"
+        ),
+        ge=0.0,
+        le=1.0,
+    )
+    backend: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description=(
+            "Inference backend: 'torch' (sentence-transformers) or 'onnx' "
+            "(onnxruntime on CPU, requires: pip install onnxruntime)"
+        ),
+    )
+    quantize: bool = Field(
+        default=True,
+        description="ONNX backend: use dynamically int8-quantized weights",
+    )
+    intra_op_threads: Optional[int] = Field(
+        default=None,
+        description="ONNX backend: intra-op threads (None = onnxruntime default)",
+        ge=1,
+    )
 
 
 class ChunkingConfig(BaseModel):
@@ -96,6 +183,7 @@ class ChunkingConfig(BaseModel):
         max_chunk_size: Maximum characters per chunk
         overlap: Number of overlapping characters between chunks
         min_chunk_size: Minimum characters for chunking (shorter texts stored as-is)
+        write_batch_size: Chunks embedded and written per vector store call
     """
 
     enabled: bool = Field(
@@ -127,6 +215,14 @@ class ChunkingConfig(BaseModel):
         ge=50,
         le=1000,
     )
+    write_batch_size: int = Field(
+        default=64,
+        description=(
+            "Chunks of a long document embedded and written per vector store "
+            "call; chunks are streamed, so memory stays bounded by this window"
+        ),
+        ge=1,
+    )
 
 
 class RecallScorerConfig(BaseModel):
@@ -234,6 +330,76 @@ class HybridSearchConfig(BaseModel):
     )
 
 
+def _default_vector_backend() -> str:
+    from kagura.config.env import get_vector_backend
+
+    return get_vector_backend()
+
+
+def _default_vector_quantization() -> str:
+    from kagura.config.env import get_vector_quantization
+
+    return get_vector_quantization()
+
+
+class VectorStoreConfig(BaseModel):
+    """Vector store backend configuration for MemoryRAG.
+
+    Attributes:
+        backend: "chromadb" (HNSW index) or "flat" (embedded exact search
+            over memory-mapped per-user matrices; best for small stores)
+        quantization: Vector format of the flat backend ("float16" or
+            "int8"); ignored by ChromaDB
+    """
+
+    backend: Literal["chromadb", "flat"] = Field(
+        default_factory=_default_vector_backend,  # type: ignore[arg-type]
+        description="Vector store backend (env: KAGURA_VECTOR_BACKEND)",
+    )
+    quantization: Literal["float16", "int8"] = Field(
+        default_factory=_default_vector_quantization,  # type: ignore[arg-type]
+        description="Flat backend vector format (env: KAGURA_VECTOR_QUANTIZATION)",
+    )
+
+
+class DedupConfig(BaseModel):
+    """Write deduplication for MemoryRAG.store().
+
+    Attributes:
+        skip_unchanged: Skip embedding and writing content already stored
+            (full-content SHA-256 in metadata)
+        near_duplicates: What to do when a SimHash near-duplicate is stored:
+            "off" (no check), "flag" (store, recording near_duplicate_of)
+            or "skip" (return the existing document's ID without embedding)
+        near_duplicate_distance: Maximum SimHash Hamming distance (0-3)
+        near_duplicate_min_chars: Shorter texts are not checked (SimHash is
+            unreliable on short texts)
+    """
+
+    skip_unchanged: bool = Field(
+        default=True,
+        description="Skip re-embedding content whose full-content hash is stored",
+    )
+    near_duplicates: Literal["off", "flag", "skip"] = Field(
+        default="flag",
+        description=(
+            "Near-duplicate handling before embedding: off, flag "
+            "(record near_duplicate_of) or skip (reuse the existing document)"
+        ),
+    )
+    near_duplicate_distance: int = Field(
+        default=3,
+        description="Maximum SimHash Hamming distance treated as near-duplicate",
+        ge=0,
+        le=3,
+    )
+    near_duplicate_min_chars: int = Field(
+        default=200,
+        description="Minimum content length checked for near-duplicates",
+        ge=1,
+    )
+
+
 class MemorySystemConfig(BaseModel):
     """Overall memory system configuration.
 
@@ -268,6 +434,14 @@ class MemorySystemConfig(BaseModel):
         default_factory=ChunkingConfig,
         description="Semantic chunking configuration (Issue #527)",
     )
+    vector_store: VectorStoreConfig = Field(
+        default_factory=VectorStoreConfig,
+        description="Vector store backend configuration",
+    )
+    dedup: DedupConfig = Field(
+        default_factory=DedupConfig,
+        description="Unchanged and near-duplicate write detection",
+    )
 
     # Global settings
     enable_access_tracking: bool = Field(
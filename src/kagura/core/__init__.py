@@ -1,12 +1,14 @@
-"""Core functionality for Kagura AI"""
+"""Core functionality for Kagura AI
+
+The LLM-backed decorators (agent, tool, workflow) and LLM cache helpers are
+imported on first access: they pull in litellm, which would otherwise make
+every ``kagura.core.*`` import (e.g. the registries) take seconds.
+"""
 
 from typing import Awaitable, Callable, Optional, ParamSpec, TypeVar, overload
 
 from . import workflow as workflow_module
 from .cache import LLMCache
-from .decorators import agent, tool
-from .decorators import workflow as workflow_decorator
-from .llm import get_llm_cache, set_llm_cache
 from .model_selector import ModelConfig, ModelSelector, TaskType
 from .parallel import parallel_gather, parallel_map, parallel_map_unordered
 from .registry import AgentRegistry, agent_registry
@@ -37,6 +39,8 @@ class WorkflowNamespace:
 
     def __call__(self, *args, **kwargs):  # type: ignore
         """Basic workflow decorator (backward compatible)."""
+        from .decorators import workflow as workflow_decorator
+
         return workflow_decorator(*args, **kwargs)
 
     # Advanced workflow patterns
@@ -72,3 +76,22 @@ __all__ = [
     "parallel_map",
     "parallel_map_unordered",
 ]
+
+
+def __getattr__(name: str):
+    """Lazy import of the decorators and LLM cache helpers"""
+    if name in ("agent", "tool"):
+        from .decorators import agent, tool
+
+        globals().update({"agent": agent, "tool": tool})
+        return globals()[name]
+
+    if name in ("get_llm_cache", "set_llm_cache"):
+        from .llm import get_llm_cache, set_llm_cache
+
+        globals().update(
+            {"get_llm_cache": get_llm_cache, "set_llm_cache": set_llm_cache}
+        )
+        return globals()[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,272 @@
+"""In-process file and content search.
+
+Replaces ``find``/``grep`` subprocesses in the builtin file tools:
+
+- :func:`walk_files` walks a directory tree once, pruning ignored
+  directories (.gitignore/.kaguraignore rules shared with DirectoryScanner)
+- :class:`ContentSearcher` matches a regex or literal against files in a
+  thread pool. Files are read (or mmap'd when large) as bytes and decoded
+  only when bytes matching could differ from text matching; binary files
+  are skipped and matches are streamed in file order until ``max_results``
+
+Usage:
+    searcher = ContentSearcher("TODO", literal=True, max_results=100)
+    for match in searcher.iter_search(walk_files("src", "*.py")):
+        print(f"{match.path}:{match.line_number}: {match.line}")
+
+    # Files of an indexed project, without walking the tree
+    files = SourceIndexManifest(db_path).paths(user_id, project_id)
+    matches = await searcher.search(files)
+"""
+
+import asyncio
+import fnmatch
+import logging
+import mmap
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from kagura.loaders.ignore import IgnoreRules
+
+logger = logging.getLogger(__name__)
+
+# Files containing a NUL byte in their first block are treated as binary
+_BINARY_SNIFF_BYTES = 8192
+
+# Files at least this large are mmap'd instead of read
+_MMAP_THRESHOLD = 256 * 1024
+
+# Bytes checked per step when testing an mmap'd file for non-ASCII content
+_ASCII_CHECK_BLOCK = 1024 * 1024
+
+PathLike = Union[str, Path]
+
+
+@dataclass
+class SearchMatch:
+    """A matching line.
+
+    Attributes:
+        path: File path (as given to the searcher)
+        line_number: 1-based line number
+        line: Line content without the line terminator
+    """
+
+    path: str
+    line_number: int
+    line: str
+
+
+def walk_files(
+    directory: PathLike,
+    name_pattern: str = "*",
+    respect_gitignore: bool = True,
+) -> Iterator[str]:
+    """Yield files under a directory in sorted, depth-first order.
+
+    Args:
+        directory: Root directory
+        name_pattern: Shell-style file name filter (e.g. "*.py")
+        respect_gitignore: Skip hidden paths and paths matching the root's
+            .gitignore/.kaguraignore (ignored directories are not entered)
+
+    Yields:
+        File paths joined onto ``directory`` (like ``find`` output)
+    """
+    root = str(directory)
+    rules = IgnoreRules.load(Path(root)) if respect_gitignore else None
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        if rules is not None:
+            dirnames[:] = [
+                d for d in dirnames if not rules.is_ignored(os.path.join(rel_dir, d))
+            ]
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not fnmatch.fnmatch(name, name_pattern):
+                continue
+            if rules is not None and rules.is_ignored(os.path.join(rel_dir, name)):
+                continue
+            yield os.path.join(dirpath, name)
+
+
+def _is_ascii(data: mmap.mmap) -> bool:
+    """Whether an mmap'd file is pure ASCII (checked block by block)."""
+    return all(
+        data[start : start + _ASCII_CHECK_BLOCK].isascii()
+        for start in range(0, len(data), _ASCII_CHECK_BLOCK)
+    )
+
+
+class ContentSearcher:
+    """Line-oriented regex/literal search over many files.
+
+    Files are matched as raw bytes (UTF-8 encoded pattern) when that is
+    exactly equivalent to matching text: for case-sensitive literals, and
+    for ASCII patterns on pure-ASCII files. Otherwise the file is decoded,
+    so ``.``, ``\\w``, character classes and case folding see characters
+    rather than UTF-8 bytes. Like grep, each line is reported once and a
+    match is attributed to the line it starts on.
+
+    Example:
+        >>> searcher = ContentSearcher(r"def \\w+_test", max_results=50)
+        >>> matches = await searcher.search(walk_files("tests", "*.py"))
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        literal: bool = False,
+        ignore_case: bool = False,
+        max_results: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Compile the pattern.
+
+        Args:
+            pattern: Python regular expression (or literal text)
+            literal: Treat pattern as literal text
+            ignore_case: Case-insensitive matching
+            max_results: Stop after this many matching lines (None = all)
+            max_workers: Search threads (default: min(32, CPU count + 4))
+
+        Raises:
+            re.error: If pattern is not a valid regular expression
+        """
+        source = re.escape(pattern) if literal else pattern
+        flags = re.MULTILINE | (re.IGNORECASE if ignore_case else 0)
+        self._regex: re.Pattern[str] = re.compile(source, flags)
+        # UTF-8 substring search is exact for case-sensitive literals; any
+        # other pattern only matches bytes like text when both are ASCII
+        self._bytes_always = literal and not ignore_case
+        self._bytes_regex: Optional[re.Pattern[bytes]] = (
+            re.compile(source.encode("utf-8"), flags)
+            if self._bytes_always or pattern.isascii()
+            else None
+        )
+        self.max_results = max_results
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def search_file(self, path: PathLike) -> list[SearchMatch]:
+        """Search a single file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Matching lines (empty for unreadable or binary files)
+        """
+        try:
+            with open(path, "rb") as f:
+                head = f.read(_BINARY_SNIFF_BYTES)
+                if not head or b"\0" in head:
+                    return []
+                size = os.fstat(f.fileno()).st_size
+                if self._bytes_regex is not None and size >= _MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        if self._bytes_always or _is_ascii(mm):
+                            return self._scan(str(path), mm, self._bytes_regex)
+                        data = mm[:]
+                else:
+                    data = head + f.read()
+                if self._bytes_regex is not None and (
+                    self._bytes_always or data.isascii()
+                ):
+                    return self._scan(str(path), data, self._bytes_regex)
+                text = data.decode("utf-8", errors="replace")
+                return self._scan(str(path), text, self._regex)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Skipping {path}: {e}")
+            return []
+
+    def _scan(
+        self, path: str, data: Union[bytes, str, mmap.mmap], regex: re.Pattern
+    ) -> list[SearchMatch]:
+        newline: Union[bytes, str] = "\n" if isinstance(data, str) else b"\n"
+        matches: list[SearchMatch] = []
+        line_number = 1
+        counted = 0
+        pos = 0
+        end = len(data)
+
+        while pos < end:
+            match = regex.search(data, pos)  # type: ignore[arg-type]
+            if match is None:
+                break
+            start = match.start()
+            line_start = data.rfind(newline, 0, start) + 1  # type: ignore[arg-type]
+            line_end = data.find(newline, start)  # type: ignore[arg-type]
+            if line_end == -1:
+                line_end = end
+
+            if isinstance(data, mmap.mmap):
+                line_number += data[counted:line_start].count(b"\n")
+            else:
+                line_number += data.count(newline, counted, line_start)  # type: ignore[arg-type]
+            counted = line_start
+
+            line = data[line_start:line_end]
+            if not isinstance(line, str):
+                line = line.decode("utf-8", errors="replace")
+            matches.append(SearchMatch(path, line_number, line.rstrip("\r")))
+
+            if self.max_results is not None and len(matches) >= self.max_results:
+                break
+            pos = line_end + 1
+
+        return matches
+
+    def iter_search(self, paths: Iterable[PathLike]) -> Iterator[SearchMatch]:
+        """Search files in parallel, streaming matches in file order.
+
+        Only a bounded window of files is in flight, so ``paths`` may be a
+        lazy iterator (e.g. walk_files()) and stopping early (max_results
+        reached or the generator closed) skips the remaining files.
+
+        Args:
+            paths: Files to search
+
+        Yields:
+            SearchMatch for each matching line
+        """
+        path_iter = iter(paths)
+        window = self.max_workers * 4
+        returned = 0
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="kagura-search"
+        )
+        pending: deque[Future[list[SearchMatch]]] = deque()
+        try:
+            for path in path_iter:
+                pending.append(pool.submit(self.search_file, path))
+                if len(pending) >= window:
+                    break
+            while pending:
+                matches = pending.popleft().result()
+                path = next(path_iter, None)
+                if path is not None:
+                    pending.append(pool.submit(self.search_file, path))
+                for match in matches:
+                    yield match
+                    returned += 1
+                    if self.max_results is not None and returned >= self.max_results:
+                        return
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def search(self, paths: Iterable[PathLike]) -> list[SearchMatch]:
+        """Search files without blocking the event loop.
+
+        Args:
+            paths: Files to search
+
+        Returns:
+            Matches in file order (at most max_results)
+        """
+        return await asyncio.to_thread(lambda: list(self.iter_search(paths)))
@@ -15,6 +15,7 @@ from .memory import MemoryManager
 from .parser import parse_response
 from .prompt import extract_template, render_prompt
 from .registry import agent_registry
+from .tool_cache import get_tool_cache
 from .tool_registry import tool_registry
 from .workflow_registry import workflow_registry
 
@@ -798,11 +799,21 @@ def tool(fn: Callable[P, T]) -> Callable[P, T]: ...
 
 
 @overload
-def tool(fn: None = None) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+def tool(
+    fn: None = None,
+    *,
+    name: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
+    cache_scope: Optional[Callable[[], str]] = None,
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
 
 
 def tool(
-    fn: Callable[P, T] | None = None, *, name: Optional[str] = None
+    fn: Callable[P, T] | None = None,
+    *,
+    name: Optional[str] = None,
+    cache_ttl: Optional[int] = None,
+    cache_scope: Optional[Callable[[], str]] = None,
 ) -> Callable[P, T] | Callable[[Callable[P, T]], Callable[P, T]]:
     """
     Convert a function into a tool (non-LLM function).
@@ -813,6 +824,10 @@ def tool(
     Args:
         fn: Function to convert
         name: Optional tool name (defaults to function name)
+        cache_ttl: Cache results for this many seconds (idempotent tools only).
+            See kagura.core.tool_cache; disabled with ENABLE_TOOL_CACHE=false
+        cache_scope: Optional callable returning extra cache key context
+            (e.g. os.getcwd for tools that depend on the current repository)
 
     Returns:
         Decorated function with type validation
@@ -875,8 +890,18 @@ def tool(
 
                 start_time = time.time()
 
-                # Execute the tool function
-                result = await func(*bound.args, **bound.kwargs)  # type: ignore
+                # Execute the tool function (through the result cache if enabled)
+                cache = get_tool_cache() if cache_ttl else None
+                if cache is not None:
+                    result = await cache.get_or_call(
+                        tool_name,
+                        dict(bound.arguments),
+                        cache_ttl,  # type: ignore[arg-type]
+                        lambda: func(*bound.args, **bound.kwargs),  # type: ignore
+                        scope=cache_scope() if cache_scope else None,
+                    )
+                else:
+                    result = await func(*bound.args, **bound.kwargs)  # type: ignore
 
                 # Calculate duration
                 duration = time.time() - start_time
@@ -925,8 +950,18 @@ def tool(
 
                 start_time = time.time()
 
-                # Execute the tool function
-                result = func(*bound.args, **bound.kwargs)
+                # Execute the tool function (through the result cache if enabled)
+                cache = get_tool_cache() if cache_ttl else None
+                if cache is not None:
+                    result = cache.get_or_call_sync(
+                        tool_name,
+                        dict(bound.arguments),
+                        cache_ttl,  # type: ignore[arg-type]
+                        lambda: func(*bound.args, **bound.kwargs),
+                        scope=cache_scope() if cache_scope else None,
+                    )
+                else:
+                    result = func(*bound.args, **bound.kwargs)
 
                 # Calculate duration
                 duration = time.time() - start_time
@@ -952,6 +987,7 @@ def tool(
         wrapper._tool_name = tool_name  # type: ignore
         wrapper._tool_signature = sig  # type: ignore
         wrapper._tool_docstring = func.__doc__ or ""  # type: ignore
+        wrapper._tool_cache_ttl = cache_ttl  # type: ignore
 
         # Register in global tool registry
         try:
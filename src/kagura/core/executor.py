@@ -5,10 +5,13 @@ import asyncio
 import io
 import time
 from contextlib import redirect_stderr, redirect_stdout
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from kagura.core.executor_pool import WorkerPool
+
 # Security configuration
 ALLOWED_IMPORTS = {
     "math",
@@ -159,6 +162,8 @@ class CodeExecutor:
         timeout: float = 30.0,
         allowed_imports: Optional[set[str]] = None,
         memory_limit_mb: Optional[int] = None,
+        isolation: Literal["process", "thread"] = "process",
+        pool_size: Optional[int] = None,
     ):
         """
         Initialize code executor.
@@ -166,11 +171,33 @@ class CodeExecutor:
         Args:
             timeout: Maximum execution time in seconds
             allowed_imports: Set of allowed import modules
-            memory_limit_mb: Memory limit (not enforced on all platforms)
+            memory_limit_mb: Memory limit per execution (enforced in worker
+                processes on POSIX platforms)
+            isolation: "process" runs code in a shared pool of pre-forked
+                worker processes (killed and replaced on timeout, concurrent
+                runs do not share stdout); "thread" runs it in a thread of
+                this process (a timed-out run keeps running)
+            pool_size: Number of worker processes (default: CPU count, at
+                most 4); executors with the same settings share one pool
         """
+        if isolation not in ("process", "thread"):
+            raise ValueError(
+                f"isolation must be 'process' or 'thread', got {isolation}"
+            )
         self.timeout = timeout
         self.allowed_imports = allowed_imports or ALLOWED_IMPORTS
         self.memory_limit_mb = memory_limit_mb
+        self.isolation = isolation
+        self.pool_size = pool_size
+
+    @property
+    def pool(self) -> "WorkerPool":
+        """Shared worker pool for this executor's settings (started lazily)."""
+        from kagura.core.executor_pool import get_worker_pool
+
+        return get_worker_pool(
+            self.allowed_imports, self.memory_limit_mb, self.pool_size
+        )
 
     def validate_code(self, code: str) -> None:
         """
@@ -240,6 +267,11 @@ class CodeExecutor:
             # Validate code first
             self.validate_code(code)
 
+            if self.isolation == "process":
+                result = await self.pool.submit(code, self.timeout)
+                result.execution_time = time.time() - start_time
+                return result
+
             # Prepare execution environment
             # Use same dict for globals and locals to allow function definitions
             execution_namespace = self.create_safe_globals()
@@ -306,6 +338,21 @@ class CodeExecutor:
                 execution_time=execution_time,
             )
 
+    async def execute_many(self, codes: list[str]) -> list[ExecutionResult]:
+        """
+        Execute several snippets concurrently.
+
+        With process isolation up to pool_size snippets run in parallel and
+        each gets its own stdout/stderr.
+
+        Args:
+            codes: Python code snippets
+
+        Returns:
+            ExecutionResults in the same order as codes
+        """
+        return list(await asyncio.gather(*(self.execute(code) for code in codes)))
+
     async def _execute_in_thread(
         self, code: str, globals_dict: dict[str, Any], locals_dict: dict[str, Any]
     ) -> None:
@@ -0,0 +1,404 @@
+"""Pre-forked worker processes for CodeExecutor.
+
+Running snippets with ``exec`` in a thread of the host process has three
+problems: a timed-out thread cannot be stopped (an infinite loop keeps
+burning a core until the process exits), stdout/stderr redirection is
+process-global (concurrent runs interleave their output) and the memory
+limit cannot be enforced.
+
+:class:`WorkerPool` keeps ``size`` warm worker processes instead:
+
+- workers are started once and pre-import the allowed modules, so a task
+  costs one pipe round trip instead of a process start
+- each worker captures stdout/stderr of its own task
+- POSIX resource limits bound CPU time (per task) and address space
+  (``memory_limit_mb`` above the worker's baseline)
+- a task exceeding its timeout gets its worker killed (SIGKILL) and a
+  fresh worker started in its place
+- up to ``size`` tasks run concurrently; further tasks queue
+
+Workers are forked from a fork server where available (POSIX) and spawned
+elsewhere. The host process runs threads (event loop executors, the
+dispatcher threads below), and a plain fork of it can leave a worker
+deadlocked on a lock another thread held; the fork server is a
+single-threaded process that imports the allowed modules once, so each
+fork from it is still cheap.
+
+Usage:
+    pool = get_worker_pool(ALLOWED_IMPORTS)
+    result = await pool.submit("result = 2 + 2", timeout=5.0)
+"""
+
+import asyncio
+import atexit
+import importlib
+import io
+import logging
+import math
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection
+from typing import Any, Iterable, Optional
+
+from kagura.core.executor import ALLOWED_IMPORTS, CodeExecutor, ExecutionResult
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+def _default_size() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def _context(allowed_imports: Iterable[str]) -> Any:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        # Takes effect when the fork server starts (first pool); workers of
+        # later pools import their other modules themselves
+        ctx.set_forkserver_preload([__name__, *sorted(allowed_imports)])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _address_space_bytes() -> int:
+    """Current virtual memory size of this process (0 if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _set_soft_limit(limit: int, value: int) -> None:
+    if resource is None:
+        return
+    try:
+        _, hard = resource.getrlimit(limit)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        resource.setrlimit(limit, (value, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _limit_cpu(seconds: float) -> None:
+    """Let the next task use ``seconds`` more CPU time (SIGXCPU after that)."""
+    if resource is None:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _set_soft_limit(
+        resource.RLIMIT_CPU,
+        math.ceil(usage.ru_utime + usage.ru_stime + seconds) + 1,
+    )
+
+
+def _worker_main(
+    conn: Connection, allowed_imports: frozenset[str], memory_limit_mb: Optional[int]
+) -> None:
+    """Worker process loop: receive code, execute it, send a result dict."""
+    for name in sorted(allowed_imports):
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+    if memory_limit_mb is not None and resource is not None:
+        _set_soft_limit(
+            resource.RLIMIT_AS,
+            _address_space_bytes() + memory_limit_mb * 1024 * 1024,
+        )
+
+    executor = CodeExecutor(allowed_imports=set(allowed_imports), isolation="thread")
+    parent_pid = os.getppid()
+
+    while True:
+        try:
+            # Exit if the parent died without stopping us (orphaned worker)
+            while not conn.poll(1.0):
+                if os.getppid() != parent_pid:
+                    return
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+
+        code, cpu_seconds = task
+        _limit_cpu(cpu_seconds)
+        namespace = executor.create_safe_globals()
+        stdout_capture = io.StringIO()
+        stderr_capture = io.StringIO()
+        response: dict[str, Any] = {"success": True, "result": None, "error": None}
+        try:
+            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+                exec(code, namespace, namespace)
+            response["result"] = namespace.get("result", None)
+        except BaseException as e:
+            response["success"] = False
+            response["error"] = f"{type(e).__name__}: {str(e)}"
+        response["stdout"] = stdout_capture.getvalue()
+        response["stderr"] = stderr_capture.getvalue()
+
+        try:
+            conn.send(response)
+        except Exception:
+            # Results that cannot be pickled (e.g. instances of classes
+            # defined by the snippet) are returned as their repr
+            response["result"] = repr(response["result"])
+            conn.send(response)
+
+
+@dataclass
+class WorkerPoolStats:
+    """Counters of a worker pool.
+
+    Attributes:
+        tasks: Tasks executed
+        timeouts: Tasks killed for exceeding their timeout
+        crashes: Workers that died during a task (e.g. CPU limit reached)
+        respawns: Workers replaced after a timeout or crash
+    """
+
+    tasks: int = 0
+    timeouts: int = 0
+    crashes: int = 0
+    respawns: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe."""
+
+    def __init__(
+        self,
+        ctx: Any,
+        allowed_imports: frozenset[str],
+        memory_limit_mb: Optional[int],
+    ) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, allowed_imports, memory_limit_mb),
+            name="kagura-code-worker",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1.0)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1.0)
+        self.kill()
+
+
+class WorkerPool:
+    """Warm worker processes executing validated code with hard timeouts.
+
+    Code must be validated (CodeExecutor.validate_code) before submission;
+    the pool only isolates and bounds execution.
+
+    Example:
+        >>> pool = WorkerPool(size=4, allowed_imports={"math"})
+        >>> results = await asyncio.gather(
+        ...     *(pool.submit(code, timeout=5.0) for code in snippets)
+        ... )
+        >>> pool.close()
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        allowed_imports: Optional[Iterable[str]] = None,
+        memory_limit_mb: Optional[int] = None,
+    ) -> None:
+        """Start the workers.
+
+        Args:
+            size: Number of worker processes (default: CPU count, at most 4)
+            allowed_imports: Modules snippets may import (pre-imported by
+                every worker)
+            memory_limit_mb: Address space a task may allocate on top of the
+                worker's baseline (POSIX only; None = unlimited)
+        """
+        self.size = size or _default_size()
+        if self.size < 1:
+            raise ValueError(f"size must be positive, got {self.size}")
+
+        self.allowed_imports = frozenset(
+            ALLOWED_IMPORTS if allowed_imports is None else allowed_imports
+        )
+        self.memory_limit_mb = memory_limit_mb
+        self.stats = WorkerPoolStats()
+
+        self._ctx = _context(self.allowed_imports)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._idle: queue.SimpleQueue[_Worker] = queue.SimpleQueue()
+        self._workers: set[_Worker] = set()
+        # One dispatcher thread per worker; each blocks on its worker's pipe
+        self._dispatcher = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="kagura-code-dispatch"
+        )
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+        logger.debug(f"Started {self.size} code execution workers")
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, self.allowed_imports, self.memory_limit_mb)
+        with self._lock:
+            self._workers.add(worker)
+        return worker
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _replace(self, worker: _Worker, reason: str) -> None:
+        """Kill a timed-out or crashed worker and start its replacement."""
+        worker.kill()
+        with self._lock:
+            setattr(self.stats, reason, getattr(self.stats, reason) + 1)
+            self._workers.discard(worker)
+            if self._closed:
+                return
+            self.stats.respawns += 1
+        self._idle.put(self._spawn())
+
+    @property
+    def closed(self) -> bool:
+        """Whether close() was called."""
+        return self._closed
+
+    def run(self, code: str, timeout: float) -> ExecutionResult:
+        """Execute code in a worker, blocking until done or timed out.
+
+        Args:
+            code: Validated Python code
+            timeout: Wall-clock seconds before the worker is killed
+
+        Returns:
+            ExecutionResult (execution_time covers the worker round trip)
+        """
+        if self._closed:
+            raise RuntimeError("WorkerPool is closed")
+
+        worker = self._idle.get()
+        start_time = time.time()
+        try:
+            worker.conn.send((code, timeout))
+            if not worker.conn.poll(timeout):
+                self._replace(worker, "timeouts")
+                return ExecutionResult(
+                    success=False,
+                    error=f"TimeoutError: Execution exceeded {timeout} seconds",
+                    execution_time=time.time() - start_time,
+                )
+            response = worker.conn.recv()
+        except (EOFError, OSError):
+            exitcode = worker.process.exitcode
+            self._replace(worker, "crashes")
+            return ExecutionResult(
+                success=False,
+                error=f"WorkerError: Worker process exited (exit code {exitcode})",
+                execution_time=time.time() - start_time,
+            )
+
+        self._count("tasks")
+        self._idle.put(worker)
+        return ExecutionResult(**response, execution_time=time.time() - start_time)
+
+    async def submit(self, code: str, timeout: float) -> ExecutionResult:
+        """Execute code in a worker without blocking the event loop.
+
+        Args:
+            code: Validated Python code
+            timeout: Wall-clock seconds before the worker is killed
+
+        Returns:
+            ExecutionResult
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._dispatcher, self.run, code, timeout)
+
+    def close(self) -> None:
+        """Stop all workers (idempotent)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            self._workers.clear()
+        self._dispatcher.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> "WorkerPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+_pools: dict[tuple[frozenset[str], Optional[int], int], WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(
+    allowed_imports: Iterable[str],
+    memory_limit_mb: Optional[int] = None,
+    size: Optional[int] = None,
+) -> WorkerPool:
+    """Get the process-wide pool for a configuration (started on first use).
+
+    CodeExecutor instances with the same allowed imports, memory limit and
+    size share one pool, so creating executors stays cheap.
+
+    Args:
+        allowed_imports: Modules snippets may import
+        memory_limit_mb: Per-task memory limit
+        size: Number of workers (default: CPU count, at most 4)
+
+    Returns:
+        Shared WorkerPool
+    """
+    key = (frozenset(allowed_imports), memory_limit_mb, size or _default_size())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.closed:
+            pool = WorkerPool(
+                size=key[2], allowed_imports=key[0], memory_limit_mb=memory_limit_mb
+            )
+            _pools[key] = pool
+        return pool
+
+
+@atexit.register
+def shutdown_worker_pools() -> None:
+    """Stop all shared worker pools."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,181 @@
+"""Secondary indexes for GraphMemory.
+
+:class:`GraphIndex` is maintained by :class:`~kagura.core.graph.store.TrackedDiGraph`
+on every node/edge mutation and answers typed lookups without scanning:
+
+- nodes by ``type`` and by ``user_id`` attribute (and nodes with no owner)
+- edges by ``type``
+- a node's successors/predecessors grouped by neighbor node type
+  (e.g. the interactions pointing at a user)
+- a node's successors/predecessors grouped by edge type
+  (e.g. rel_filters in multi-hop traversal)
+"""
+
+from typing import Any, Hashable, Optional
+
+Node = Hashable
+Edge = tuple[Hashable, Hashable]
+_Adjacency = dict[Node, dict[Any, set[Node]]]
+
+
+def _add(index: dict[Any, set], key: Any, value: Any) -> None:
+    index.setdefault(key, set()).add(value)
+
+
+def _discard(index: dict[Any, set], key: Any, value: Any) -> None:
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.discard(value)
+        if not bucket:
+            del index[key]
+
+
+def _adj_add(adjacency: _Adjacency, node: Node, key: Any, neighbor: Node) -> None:
+    adjacency.setdefault(node, {}).setdefault(key, set()).add(neighbor)
+
+
+def _adj_discard(adjacency: _Adjacency, node: Node, key: Any, neighbor: Node) -> None:
+    groups = adjacency.get(node)
+    if groups is None:
+        return
+    _discard(groups, key, neighbor)
+    if not groups:
+        del adjacency[node]
+
+
+class GraphIndex:
+    """Typed node/edge indexes kept in sync with a DiGraph."""
+
+    def __init__(self) -> None:
+        self.nodes_by_type: dict[Any, set[Node]] = {}
+        self.nodes_by_user: dict[Any, set[Node]] = {}
+        self.unowned_nodes: set[Node] = set()
+        self.edges_by_type: dict[Any, set[Edge]] = {}
+        self._node_type: dict[Node, Any] = {}
+        self._node_user: dict[Node, Any] = {}
+        self._edge_type: dict[Edge, Any] = {}
+        self._succ_by_node_type: _Adjacency = {}
+        self._pred_by_node_type: _Adjacency = {}
+        self._succ_by_edge_type: _Adjacency = {}
+        self._pred_by_edge_type: _Adjacency = {}
+
+    def clear(self) -> None:
+        """Drop all index entries."""
+        self.__init__()  # type: ignore[misc]
+
+    # ---- maintenance ---------------------------------------------------------
+
+    def node_changed(self, node: Node, data: Optional[dict[str, Any]]) -> None:
+        """Re-index a node after it was added, modified or removed.
+
+        Args:
+            node: Node ID
+            data: Current node attributes (None if the node was removed)
+        """
+        if data is None:
+            old_type = self._node_type.pop(node, None)
+            _discard(self.nodes_by_type, old_type, node)
+            _discard(self.nodes_by_user, self._node_user.pop(node, None), node)
+            self.unowned_nodes.discard(node)
+            for adjacency in (
+                self._succ_by_node_type,
+                self._pred_by_node_type,
+                self._succ_by_edge_type,
+                self._pred_by_edge_type,
+            ):
+                adjacency.pop(node, None)
+            return
+
+        new_type = data.get("type")
+        if node not in self._node_type or self._node_type[node] != new_type:
+            old_type = self._node_type.get(node)
+            existed = node in self._node_type
+            if existed:
+                _discard(self.nodes_by_type, old_type, node)
+            self._node_type[node] = new_type
+            _add(self.nodes_by_type, new_type, node)
+            if existed:
+                self._retype_neighbors(node, old_type, new_type)
+
+        new_user = data.get("user_id")
+        if new_user:
+            self.unowned_nodes.discard(node)
+        else:
+            self.unowned_nodes.add(node)
+        old_user = self._node_user.get(node)
+        if new_user != old_user:
+            _discard(self.nodes_by_user, old_user, node)
+            if new_user is None:
+                self._node_user.pop(node, None)
+            else:
+                self._node_user[node] = new_user
+                _add(self.nodes_by_user, new_user, node)
+
+    def _retype_neighbors(self, node: Node, old_type: Any, new_type: Any) -> None:
+        """Move a node between neighbor-type groups of its neighbors."""
+        for groups in self._succ_by_edge_type.get(node, {}).values():
+            for dst in groups:
+                _adj_discard(self._pred_by_node_type, dst, old_type, node)
+                _adj_add(self._pred_by_node_type, dst, new_type, node)
+        for groups in self._pred_by_edge_type.get(node, {}).values():
+            for src in groups:
+                _adj_discard(self._succ_by_node_type, src, old_type, node)
+                _adj_add(self._succ_by_node_type, src, new_type, node)
+
+    def edge_changed(
+        self, src: Node, dst: Node, data: Optional[dict[str, Any]]
+    ) -> None:
+        """Re-index an edge after it was added, modified or removed.
+
+        Args:
+            src: Source node ID
+            dst: Destination node ID
+            data: Current edge attributes (None if the edge was removed)
+        """
+        key = (src, dst)
+        indexed = key in self._edge_type
+        old_type = self._edge_type.get(key)
+
+        if data is None:
+            if not indexed:
+                return
+            del self._edge_type[key]
+            _discard(self.edges_by_type, old_type, key)
+            _adj_discard(self._succ_by_edge_type, src, old_type, dst)
+            _adj_discard(self._pred_by_edge_type, dst, old_type, src)
+            _adj_discard(self._succ_by_node_type, src, self._node_type.get(dst), dst)
+            _adj_discard(self._pred_by_node_type, dst, self._node_type.get(src), src)
+            return
+
+        new_type = data.get("type")
+        if indexed and old_type == new_type:
+            return
+        if indexed:
+            _discard(self.edges_by_type, old_type, key)
+            _adj_discard(self._succ_by_edge_type, src, old_type, dst)
+            _adj_discard(self._pred_by_edge_type, dst, old_type, src)
+        else:
+            _adj_add(self._succ_by_node_type, src, self._node_type.get(dst), dst)
+            _adj_add(self._pred_by_node_type, dst, self._node_type.get(src), src)
+        self._edge_type[key] = new_type
+        _add(self.edges_by_type, new_type, key)
+        _adj_add(self._succ_by_edge_type, src, new_type, dst)
+        _adj_add(self._pred_by_edge_type, dst, new_type, src)
+
+    # ---- lookups --------------------------------------------------------------
+
+    def successors_of_type(self, node: Node, node_type: Any) -> set[Node]:
+        """Successors of a node whose ``type`` is node_type."""
+        return self._succ_by_node_type.get(node, {}).get(node_type, set())
+
+    def predecessors_of_type(self, node: Node, node_type: Any) -> set[Node]:
+        """Predecessors of a node whose ``type`` is node_type."""
+        return self._pred_by_node_type.get(node, {}).get(node_type, set())
+
+    def successors_by_edge_type(self, node: Node, edge_type: Any) -> set[Node]:
+        """Successors reached over edges of the given ``type``."""
+        return self._succ_by_edge_type.get(node, {}).get(edge_type, set())
+
+    def predecessors_by_edge_type(self, node: Node, edge_type: Any) -> set[Node]:
+        """Predecessors linked over edges of the given ``type``."""
+        return self._pred_by_edge_type.get(node, {}).get(edge_type, set())
@@ -5,14 +5,35 @@ NetworkX-based knowledge graph for memories, users, topics, and interactions.
 Issue #345: GraphDB integration for AI-User relationship memory
 """
 
-import json
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Hashable, Optional
 
 import networkx as nx
 
+from kagura.core.graph.store import (
+    TrackedDiGraph,
+    append_changes,
+    load_graph,
+    should_compact,
+    write_snapshot,
+)
+
+
+def _edge_valid_at(edge_data: dict[str, Any], timestamp: datetime) -> bool:
+    """Check an edge's valid_from/valid_until window against a timestamp."""
+    valid_from_str = edge_data.get("valid_from")
+    if valid_from_str and timestamp < datetime.fromisoformat(valid_from_str):
+        return False
+
+    valid_until_str = edge_data.get("valid_until")
+    if valid_until_str and timestamp >= datetime.fromisoformat(valid_until_str):
+        return False
+
+    return True
+
 
 class GraphMemory:
     """NetworkX-based graph memory for tracking relationships.
@@ -34,7 +55,8 @@ class GraphMemory:
         - works_on: Project/task relationship
 
     Attributes:
-        graph: NetworkX DiGraph instance for relationship storage
+        graph: NetworkX DiGraph instance for relationship storage (loaded
+            from persist_path on first access)
 
     Example:
         >>> graph = GraphMemory()
@@ -87,14 +109,34 @@ class GraphMemory:
         """Initialize graph memory.
 
         Args:
-            persist_path: Path to save/load graph (JSON format)
+            persist_path: Path to save/load graph (JSON snapshot; changes
+                are appended to a ``.log`` file next to it, see store.py)
         """
-        self.graph: nx.DiGraph = nx.DiGraph()
+        self._graph: Optional[TrackedDiGraph] = None
         self.persist_path = persist_path
-
-        # Load existing graph if path exists
-        if persist_path and persist_path.exists():
+        # Snapshot the in-memory graph was loaded from / last fully saved to
+        self._synced_path: Optional[Path] = None
+        self._log_ops = 0
+        self._persist_lock = threading.Lock()
+
+        # Existing graphs are loaded lazily on first access
+        if not (persist_path and persist_path.exists()):
+            self._graph = TrackedDiGraph()
+
+    @property
+    def graph(self) -> TrackedDiGraph:
+        """The underlying graph (loaded from persist_path on first access)."""
+        if self._graph is None:
             self.load()
+        assert self._graph is not None
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: nx.DiGraph) -> None:
+        tracked = value if isinstance(value, TrackedDiGraph) else TrackedDiGraph(value)
+        # A replaced graph has no change history; the next persist rewrites it
+        tracked.reset_required = True
+        self._graph = tracked
 
     def add_node(
         self, node_id: str, node_type: str, data: Optional[dict[str, Any]] = None
@@ -207,51 +249,8 @@ class GraphMemory:
             ...     rel_filters=["related_to", "depends_on"]
             ... )
         """
-        # Collect nodes within hops
-        visited_nodes = set(seed_ids)
-        current_layer = set(seed_ids)
-
-        for _ in range(hops):
-            next_layer = set()
-            for node_id in current_layer:
-                if not self.graph.has_node(node_id):
-                    continue
-
-                # Get successors (outgoing edges)
-                for neighbor in self.graph.successors(node_id):
-                    edge_data = self.graph.edges[node_id, neighbor]
-                    edge_type = edge_data.get("type")
-
-                    # Filter by relationship type if specified
-                    if rel_filters and edge_type not in rel_filters:
-                        continue
-
-                    if neighbor not in visited_nodes:
-                        visited_nodes.add(neighbor)
-                        next_layer.add(neighbor)
-
-                # Get predecessors (incoming edges)
-                for neighbor in self.graph.predecessors(node_id):
-                    edge_data = self.graph.edges[neighbor, node_id]
-                    edge_type = edge_data.get("type")
-
-                    # Filter by relationship type if specified
-                    if rel_filters and edge_type not in rel_filters:
-                        continue
-
-                    if neighbor not in visited_nodes:
-                        visited_nodes.add(neighbor)
-                        next_layer.add(neighbor)
-
-            current_layer = next_layer
-
-            if not current_layer:
-                break  # No more nodes to explore
-
-        # Build subgraph
-        subgraph = self.graph.subgraph(visited_nodes)
-
-        return self._serialize_subgraph(subgraph)  # pyright: ignore[reportArgumentType]
+        visited_nodes = self._expand(seed_ids, hops, rel_filters)
+        return self._serialize_nodes_and_edges(visited_nodes)
 
     def get_related(
         self, node_id: str, depth: int = 2, rel_type: Optional[str] = None
@@ -397,7 +396,11 @@ class GraphMemory:
         return data
 
     def persist(self) -> None:
-        """Save graph to disk (JSON format).
+        """Save changes to disk.
+
+        Appends only the nodes and edges changed since the last save to the
+        change log; the JSON snapshot is rewritten when the log grows large
+        (see compact()) or when saving to a new path.
 
         Raises:
             ValueError: If persist_path is not set
@@ -405,19 +408,48 @@ class GraphMemory:
         if not self.persist_path:
             raise ValueError("persist_path not set. Cannot save graph.")
 
-        # Ensure parent directory exists
-        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._graph is None:
+            return  # Never loaded, so nothing changed
+
+        with self._persist_lock:
+            nodes, edges, reset = self._graph.take_changes()
+            if (
+                reset
+                or self._synced_path != self.persist_path
+                or not self.persist_path.exists()
+            ):
+                self._write_snapshot()
+                return
+
+            self._log_ops += append_changes(
+                self._graph, self.persist_path, nodes, edges
+            )
+            if should_compact(self._log_ops, self._graph):
+                self._write_snapshot()
+
+    def compact(self) -> None:
+        """Rewrite the JSON snapshot and truncate the change log.
+
+        Raises:
+            ValueError: If persist_path is not set
+        """
+        if not self.persist_path:
+            raise ValueError("persist_path not set. Cannot save graph.")
 
-        # Convert NetworkX graph to JSON-serializable format
-        # edges="links" ensures forward compatibility with NetworkX 3.6+
-        data = nx.node_link_data(self.graph, edges="links")
+        self.graph  # Load if needed
+        assert self._graph is not None
+        with self._persist_lock:
+            self._graph.take_changes()
+            self._write_snapshot()
 
-        # Save graph using JSON
-        with open(self.persist_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+    def _write_snapshot(self) -> None:
+        assert self.persist_path is not None
+        write_snapshot(self.graph, self.persist_path)
+        self._synced_path = self.persist_path
+        self._log_ops = 0
 
     def load(self) -> None:
-        """Load graph from disk (JSON format).
+        """Load graph from disk (JSON snapshot plus change log).
 
         Raises:
             ValueError: If persist_path is not set
@@ -429,14 +461,8 @@ class GraphMemory:
         if not self.persist_path.exists():
             raise FileNotFoundError(f"Graph file not found: {self.persist_path}")
 
-        # Load graph using JSON
-        with open(self.persist_path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Convert JSON data back to NetworkX graph
-        # edges="links" ensures forward compatibility with NetworkX 3.6+
-        # edges="links" ensures forward compatibility with NetworkX 3.6+
-        self.graph: nx.DiGraph = nx.node_link_graph(data, edges="links")  # type: ignore[assignment]
+        self._graph, self._log_ops = load_graph(self.persist_path)
+        self._synced_path = self.persist_path
 
     def stats(self) -> dict[str, Any]:
         """Get graph statistics.
@@ -444,15 +470,16 @@ class GraphMemory:
         Returns:
             Stats dict with node/edge counts
         """
-        node_counts = {}
-        for node_id in self.graph.nodes():
-            node_type = self.graph.nodes[node_id].get("type", "unknown")
-            node_counts[node_type] = node_counts.get(node_type, 0) + 1
+        index = self.graph.index
+        node_counts: dict[str, int] = {}
+        for node_type, members in index.nodes_by_type.items():
+            key = "unknown" if node_type is None else node_type
+            node_counts[key] = node_counts.get(key, 0) + len(members)
 
-        edge_counts = {}
-        for src, dst in self.graph.edges():  # type: ignore[misc]
-            edge_type = self.graph.edges[src, dst].get("type", "unknown")
-            edge_counts[edge_type] = edge_counts.get(edge_type, 0) + 1
+        edge_counts: dict[str, int] = {}
+        for edge_type, members in index.edges_by_type.items():
+            key = "unknown" if edge_type is None else edge_type
+            edge_counts[key] = edge_counts.get(key, 0) + len(members)
 
         return {
             "total_nodes": self.graph.number_of_nodes(),
@@ -464,30 +491,6 @@ class GraphMemory:
             else False,
         }
 
-    def _serialize_subgraph(self, subgraph: nx.DiGraph) -> dict[str, Any]:
-        """Serialize subgraph to dict.
-
-        Args:
-            subgraph: NetworkX subgraph
-
-        Returns:
-            Dict with nodes and edges lists
-        """
-        nodes = []
-        for node_id in subgraph.nodes():
-            node_data = dict(subgraph.nodes[node_id])
-            node_data["id"] = node_id
-            nodes.append(node_data)
-
-        edges = []
-        for src, dst in subgraph.edges():  # type: ignore[misc]
-            edge_data = dict(subgraph.edges[src, dst])
-            edge_data["src"] = src
-            edge_data["dst"] = dst
-            edges.append(edge_data)
-
-        return {"nodes": nodes, "edges": edges}
-
     def get_user_topics(self, user_id: str) -> list[dict[str, Any]]:
         """Get topics associated with a user.
 
@@ -504,20 +507,16 @@ class GraphMemory:
         if not self.graph.has_node(user_id):
             return []
 
+        index = self.graph.index
         topics = []
-        # Find all interactions from this user
-        for predecessor in self.graph.predecessors(user_id):
-            pred_data = self.graph.nodes[predecessor]
-            if pred_data.get("type") == "interaction":
-                # Find topics connected to this interaction
-                for neighbor in self.graph.successors(predecessor):
-                    if neighbor == user_id:
-                        continue
-                    neighbor_data = self.graph.nodes[neighbor]
-                    if neighbor_data.get("type") == "topic":
-                        topic_dict = dict(neighbor_data)
-                        topic_dict["id"] = neighbor
-                        topics.append(topic_dict)
+        # Interactions from this user, then the topics they mention
+        for interaction in index.predecessors_of_type(user_id, "interaction"):
+            for topic in index.successors_of_type(interaction, "topic"):
+                if topic == user_id:
+                    continue
+                topic_dict = dict(self.graph.nodes[topic])
+                topic_dict["id"] = topic
+                topics.append(topic_dict)
 
         return topics
 
@@ -540,13 +539,13 @@ class GraphMemory:
             return []
 
         interactions = []
-        # Find all interactions connected to this user
-        for predecessor in self.graph.predecessors(user_id):
-            pred_data = self.graph.nodes[predecessor]
-            if pred_data.get("type") == "interaction":
-                interaction_dict = dict(pred_data)
-                interaction_dict["id"] = predecessor
-                interactions.append(interaction_dict)
+        # Interactions linked to this user, via the node-type index
+        for predecessor in self.graph.index.predecessors_of_type(
+            user_id, "interaction"
+        ):
+            interaction_dict = dict(self.graph.nodes[predecessor])
+            interaction_dict["id"] = predecessor
+            interactions.append(interaction_dict)
 
         # Sort by timestamp (newest first)
         interactions.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
@@ -667,24 +666,9 @@ class GraphMemory:
         if not self.graph.has_edge(src_id, dst_id):
             return False
 
-        edge_data = self.graph.edges[src_id, dst_id]
-        timestamp = timestamp or datetime.now()
-
-        # Parse valid_from
-        valid_from_str = edge_data.get("valid_from")
-        if valid_from_str:
-            valid_from = datetime.fromisoformat(valid_from_str)
-            if timestamp < valid_from:
-                return False
-
-        # Parse valid_until
-        valid_until_str = edge_data.get("valid_until")
-        if valid_until_str:
-            valid_until = datetime.fromisoformat(valid_until_str)
-            if timestamp >= valid_until:
-                return False
-
-        return True
+        return _edge_valid_at(
+            self.graph.edges[src_id, dst_id], timestamp or datetime.now()
+        )
 
     def invalidate_edge(
         self, src_id: str, dst_id: str, invalidate_at: Optional[datetime] = None
@@ -754,76 +738,121 @@ class GraphMemory:
         """
         timestamp = timestamp or datetime.now()
 
+        def is_valid(edge_data: dict[str, Any]) -> bool:
+            return _edge_valid_at(edge_data, timestamp)
+
         # Collect nodes within hops (only through valid edges)
-        visited_nodes = set(seed_ids)
-        current_layer = set(seed_ids)
+        visited_nodes = self._expand(seed_ids, hops, rel_filters, is_valid)
+        return self._serialize_nodes_and_edges(visited_nodes, is_valid)
 
-        for _ in range(hops):
-            next_layer = set()
-            for node_id in current_layer:
-                if not self.graph.has_node(node_id):
-                    continue
+    def _expand(
+        self,
+        seed_ids: list[str],
+        hops: int,
+        rel_filters: Optional[list[str]] = None,
+        edge_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    ) -> set[Hashable]:
+        """Collect the nodes within `hops` of the seeds (edges in both directions).
 
-                # Get successors (outgoing edges)
-                for neighbor in self.graph.successors(node_id):
-                    # Check temporal validity
-                    if not self.is_edge_valid_at(node_id, neighbor, timestamp):
-                        continue
+        With rel_filters, only edges of those types are followed, looked up
+        through the edge-type index instead of scanning every neighbor.
 
-                    edge_data = self.graph.edges[node_id, neighbor]
-                    edge_type = edge_data.get("type")
+        Args:
+            seed_ids: Starting node IDs
+            hops: Number of hops (depth) to traverse
+            rel_filters: Relationship types to follow (None = all types)
+            edge_filter: Optional predicate on edge attributes
 
-                    # Filter by relationship type if specified
-                    if rel_filters and edge_type not in rel_filters:
-                        continue
+        Returns:
+            Set of existing node IDs reached (including the seeds)
+        """
+        graph = self.graph
+        index = graph.index
+        succ, pred = graph._succ, graph._pred
 
-                    if neighbor not in visited_nodes:
-                        visited_nodes.add(neighbor)
-                        next_layer.add(neighbor)
+        visited_nodes: set[Hashable] = {
+            node_id for node_id in seed_ids if node_id in succ
+        }
+        current_layer = set(visited_nodes)
 
-                # Get predecessors (incoming edges)
-                for neighbor in self.graph.predecessors(node_id):
-                    # Check temporal validity
-                    if not self.is_edge_valid_at(neighbor, node_id, timestamp):
+        for _ in range(hops):
+            next_layer: set[Hashable] = set()
+            for node_id in current_layer:
+                if rel_filters:
+                    outgoing = [
+                        dst
+                        for rel in rel_filters
+                        for dst in index.successors_by_edge_type(node_id, rel)
+                    ]
+                    incoming = [
+                        src
+                        for rel in rel_filters
+                        for src in index.predecessors_by_edge_type(node_id, rel)
+                    ]
+                else:
+                    outgoing = succ[node_id]  # type: ignore[assignment]
+                    incoming = pred[node_id]  # type: ignore[assignment]
+
+                for neighbor in outgoing:
+                    if neighbor in visited_nodes:
                         continue
-
-                    edge_data = self.graph.edges[neighbor, node_id]
-                    edge_type = edge_data.get("type")
-
-                    # Filter by relationship type if specified
-                    if rel_filters and edge_type not in rel_filters:
+                    if edge_filter and not edge_filter(succ[node_id][neighbor]):
                         continue
+                    visited_nodes.add(neighbor)
+                    next_layer.add(neighbor)
 
-                    if neighbor not in visited_nodes:
-                        visited_nodes.add(neighbor)
-                        next_layer.add(neighbor)
+                for neighbor in incoming:
+                    if neighbor in visited_nodes:
+                        continue
+                    if edge_filter and not edge_filter(succ[neighbor][node_id]):
+                        continue
+                    visited_nodes.add(neighbor)
+                    next_layer.add(neighbor)
 
             current_layer = next_layer
 
             if not current_layer:
                 break  # No more nodes to explore
 
-        # Build subgraph (only include temporally valid edges)
-        subgraph_nodes = visited_nodes
-        subgraph_edges = []
+        return visited_nodes
+
+    def _serialize_nodes_and_edges(
+        self,
+        node_ids: set[Hashable],
+        edge_filter: Optional[Callable[[dict[str, Any]], bool]] = None,
+    ) -> dict[str, Any]:
+        """Serialize nodes and the edges among them.
+
+        Edges are found by walking each node's outgoing adjacency once, so
+        the cost is proportional to the degree of the result nodes rather
+        than to the square of their count.
 
-        for src in subgraph_nodes:
-            for dst in subgraph_nodes:
-                if self.graph.has_edge(src, dst):
-                    if self.is_edge_valid_at(src, dst, timestamp):
-                        edge_data = dict(self.graph.edges[src, dst])
-                        edge_data["src"] = src
-                        edge_data["dst"] = dst
-                        subgraph_edges.append(edge_data)
+        Args:
+            node_ids: Existing node IDs to include
+            edge_filter: Optional predicate on edge attributes
 
-        # Build result
+        Returns:
+            Dict with nodes and edges lists
+        """
+        graph = self.graph
         nodes = []
-        for node_id in subgraph_nodes:
-            node_data = dict(self.graph.nodes[node_id])
+        edges = []
+        for node_id in node_ids:
+            node_data = dict(graph._node[node_id])
             node_data["id"] = node_id
             nodes.append(node_data)
 
-        return {"nodes": nodes, "edges": subgraph_edges}
+            for dst, data in graph._succ[node_id].items():
+                if dst not in node_ids:
+                    continue
+                if edge_filter and not edge_filter(data):
+                    continue
+                edge_data = dict(data)
+                edge_data["src"] = node_id
+                edge_data["dst"] = dst
+                edges.append(edge_data)
+
+        return {"nodes": nodes, "edges": edges}
 
     def __repr__(self) -> str:
         """String representation."""
@@ -0,0 +1,394 @@
+"""Incremental persistence for GraphMemory.
+
+The graph is stored as a compacted JSON snapshot (``graph.json``, NetworkX
+node-link format) plus an append-only change log next to it
+(``graph.json.log``, one JSON operation per line). Saving only appends the
+nodes and edges that changed since the last save, so a write costs
+O(changed elements) instead of re-serializing the whole graph. When the log
+grows past a fraction of the node count, the snapshot is rewritten and the
+log truncated (compaction).
+
+Changes are detected by :class:`TrackedDiGraph`, a ``networkx.DiGraph``
+whose node and edge attribute dicts report mutations, so code that edits
+``graph_memory.graph`` directly (neural memory, coding memory) is tracked
+too. Mutating a nested value in place (e.g. appending to a list attribute)
+is not detected; reassign the attribute instead.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+import networkx as nx
+
+from kagura.core.graph.index import GraphIndex
+
+logger = logging.getLogger(__name__)
+
+# Compact once the log holds this many operations and at least
+# _COMPACT_RATIO times as many as the graph has nodes
+_COMPACT_MIN_OPS = 1000
+_COMPACT_RATIO = 0.5
+
+
+class _TrackedDict(dict):
+    """Attribute dict that notifies its graph when it is modified."""
+
+    __slots__ = ("_owner", "_key", "_is_edge")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._owner: Optional["TrackedDiGraph"] = None
+        self._key: Any = None
+        self._is_edge = False
+
+    def _bind(self, owner: "TrackedDiGraph", key: Any, is_edge: bool) -> None:
+        self._owner = owner
+        self._key = key
+        self._is_edge = is_edge
+
+    def _touch(self) -> None:
+        if self._owner is not None:
+            if self._is_edge:
+                self._owner._note_edge(*self._key)
+            else:
+                self._owner._note_node(self._key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._touch()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._touch()
+
+    def __ior__(self, other: Any) -> "_TrackedDict":  # type: ignore[override]
+        super().__ior__(other)
+        self._touch()
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._touch()
+
+    def pop(self, *args: Any) -> Any:
+        value = super().pop(*args)
+        self._touch()
+        return value
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = super().popitem()
+        self._touch()
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self._touch()
+        return super().setdefault(key, default)
+
+    def clear(self) -> None:
+        super().clear()
+        self._touch()
+
+
+class TrackedDiGraph(nx.DiGraph):
+    """DiGraph that records which nodes and edges changed.
+
+    Attributes:
+        changed_nodes: Node IDs added, removed or modified since the last
+            take_changes()
+        changed_edges: (src, dst) pairs added, removed or modified
+        reset_required: True after clear()/clear_edges(); the next save
+            must rewrite the snapshot
+        index: Typed secondary indexes, updated on every mutation
+
+    Other structures derived from the graph (e.g. the neural memory CSR
+    shards) can subscribe with add_listener(); listeners are called as
+    ``listener("node", node_id)``, ``listener("edge", (src, dst))`` or
+    ``listener("reset", None)`` after every mutation.
+    """
+
+    node_attr_dict_factory = _TrackedDict
+    edge_attr_dict_factory = _TrackedDict
+
+    # nx.DiGraph internals (set by its __init__). Hot paths here and in the
+    # neural memory read them directly; declared so type checkers see them.
+    _node: dict[Hashable, dict[str, Any]]
+    _succ: dict[Hashable, dict[Hashable, dict[str, Any]]]
+    _pred: dict[Hashable, dict[Hashable, dict[str, Any]]]
+
+    def __init__(self, incoming_graph_data: Any = None, **attr: Any) -> None:
+        self.changed_nodes: set[Hashable] = set()
+        self.changed_edges: set[tuple[Hashable, Hashable]] = set()
+        self.reset_required = False
+        self.index = GraphIndex()
+        self._listeners: list[Callable[[str, Any], None]] = []
+        super().__init__(incoming_graph_data, **attr)
+
+    def add_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """Subscribe to node/edge mutations."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Any], None]) -> None:
+        """Unsubscribe a listener added with add_listener()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, kind: str, key: Any) -> None:
+        for listener in self._listeners:
+            listener(kind, key)
+
+    def _note_node(self, node: Hashable) -> None:
+        self.changed_nodes.add(node)
+        self.index.node_changed(node, self._node.get(node))
+        if self._listeners:
+            self._notify("node", node)
+
+    def _note_edge(self, u: Hashable, v: Hashable) -> None:
+        self.changed_edges.add((u, v))
+        self.index.edge_changed(u, v, self._succ.get(u, {}).get(v))
+        if self._listeners:
+            self._notify("edge", (u, v))
+
+    def _bind_node(self, node: Hashable) -> None:
+        data = self._node[node]
+        if isinstance(data, _TrackedDict) and data._owner is not self:
+            data._bind(self, node, is_edge=False)
+
+    def add_node(self, node_for_adding: Hashable, **attr: Any) -> None:
+        super().add_node(node_for_adding, **attr)
+        self._bind_node(node_for_adding)
+        self._note_node(node_for_adding)
+
+    def add_nodes_from(self, nodes_for_adding: Iterable[Any], **attr: Any) -> None:
+        for n in nodes_for_adding:
+            # (node, attr_dict) tuples, as accepted by nx.DiGraph
+            if isinstance(n, tuple) and len(n) == 2 and isinstance(n[1], dict):
+                self.add_node(n[0], **{**attr, **n[1]})
+            else:
+                self.add_node(n, **attr)
+
+    def add_edge(self, u_of_edge: Hashable, v_of_edge: Hashable, **attr: Any) -> None:
+        new_nodes = [n for n in (u_of_edge, v_of_edge) if n not in self._succ]
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        for node in new_nodes:
+            self._bind_node(node)
+            self._note_node(node)
+        data = self._succ[u_of_edge][v_of_edge]
+        if isinstance(data, _TrackedDict) and data._owner is not self:
+            data._bind(self, (u_of_edge, v_of_edge), is_edge=True)
+        self._note_edge(u_of_edge, v_of_edge)
+
+    def add_edges_from(self, ebunch_to_add: Iterable[Any], **attr: Any) -> None:
+        for e in ebunch_to_add:
+            if len(e) == 3:
+                u, v, dd = e
+                self.add_edge(u, v, **{**attr, **dd})
+            elif len(e) == 2:
+                self.add_edge(e[0], e[1], **attr)
+            else:
+                raise nx.NetworkXError(f"Edge tuple {e} must be a 2-tuple or 3-tuple.")
+
+    def remove_node(self, n: Hashable) -> None:
+        incident: list[tuple[Hashable, Hashable]] = []
+        if n in self._succ:
+            incident += [(n, dst) for dst in self._succ[n]]
+            incident += [(src, n) for src in self._pred[n]]
+        super().remove_node(n)
+        for u, v in incident:
+            self._note_edge(u, v)
+        self._note_node(n)
+
+    def remove_nodes_from(self, nodes: Iterable[Hashable]) -> None:
+        for n in list(nodes):
+            if n in self._succ:
+                self.remove_node(n)
+
+    def remove_edge(self, u: Hashable, v: Hashable) -> None:
+        super().remove_edge(u, v)
+        self._note_edge(u, v)
+
+    def remove_edges_from(self, ebunch: Iterable[Any]) -> None:
+        for e in list(ebunch):
+            u, v = e[:2]
+            if u in self._succ and v in self._succ[u]:
+                self.remove_edge(u, v)
+
+    def clear(self) -> None:
+        super().clear()
+        self.take_changes()
+        self.index.clear()
+        self.reset_required = True
+        self._notify("reset", None)
+
+    def clear_edges(self) -> None:
+        super().clear_edges()
+        self.changed_edges.clear()
+        self.index.clear()
+        for node, data in self._node.items():
+            self.index.node_changed(node, data)
+        self.reset_required = True
+        self._notify("reset", None)
+
+    def take_changes(
+        self,
+    ) -> tuple[set[Hashable], set[tuple[Hashable, Hashable]], bool]:
+        """Return and reset the recorded changes.
+
+        Returns:
+            Tuple of (changed_nodes, changed_edges, reset_required)
+        """
+        changes = (self.changed_nodes, self.changed_edges, self.reset_required)
+        self.changed_nodes = set()
+        self.changed_edges = set()
+        self.reset_required = False
+        return changes
+
+
+def journal_path(snapshot_path: Path) -> Path:
+    """Return the change log path belonging to a snapshot."""
+    return snapshot_path.with_name(snapshot_path.name + ".log")
+
+
+def load_graph(snapshot_path: Path) -> tuple[TrackedDiGraph, int]:
+    """Load a snapshot and replay its change log.
+
+    Args:
+        snapshot_path: Snapshot file (NetworkX node-link JSON)
+
+    Returns:
+        Tuple of (graph, number of replayed log operations)
+    """
+    with open(snapshot_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    graph = TrackedDiGraph()
+    graph.graph.update(data.get("graph", {}))
+    for node in data.get("nodes", []):
+        node = dict(node)
+        graph.add_node(node.pop("id"), **node)
+    # edges="links" matches nx.node_link_data(..., edges="links")
+    for link in data.get("links", data.get("edges", [])):
+        link = dict(link)
+        graph.add_edge(link.pop("source"), link.pop("target"), **link)
+
+    replayed = 0
+    log_path = journal_path(snapshot_path)
+    if log_path.exists():
+        with open(log_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    op = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from an interrupted write
+                    logger.warning(f"Ignoring corrupt graph log entry in {log_path}")
+                    continue
+                _apply_op(graph, op)
+                replayed += 1
+
+    graph.take_changes()
+    return graph, replayed
+
+
+def _apply_op(graph: nx.DiGraph, op: dict[str, Any]) -> None:
+    """Apply one logged operation (operations are idempotent)."""
+    kind = op.get("op")
+    if kind == "node":
+        if graph.has_node(op["id"]):
+            attrs = graph.nodes[op["id"]]
+            attrs.clear()
+            attrs.update(op["data"])
+        else:
+            graph.add_node(op["id"], **op["data"])
+    elif kind == "edge":
+        if graph.has_edge(op["src"], op["dst"]):
+            attrs = graph.edges[op["src"], op["dst"]]
+            attrs.clear()
+            attrs.update(op["data"])
+        else:
+            graph.add_edge(op["src"], op["dst"], **op["data"])
+    elif kind == "del_node":
+        if graph.has_node(op["id"]):
+            graph.remove_node(op["id"])
+    elif kind == "del_edge":
+        if graph.has_edge(op["src"], op["dst"]):
+            graph.remove_edge(op["src"], op["dst"])
+
+
+def write_snapshot(graph: nx.DiGraph, snapshot_path: Path) -> None:
+    """Atomically rewrite the snapshot and truncate the change log.
+
+    Args:
+        graph: Graph to save
+        snapshot_path: Snapshot file path
+    """
+    snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+    # edges="links" ensures forward compatibility with NetworkX 3.6+
+    data = nx.node_link_data(graph, edges="links")
+    tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, default=str)
+    os.replace(tmp_path, snapshot_path)
+
+    # A crash before this point leaves a log whose (idempotent) operations
+    # are already contained in the new snapshot
+    log_path = journal_path(snapshot_path)
+    if log_path.exists():
+        log_path.unlink()
+
+
+def append_changes(
+    graph: nx.DiGraph,
+    snapshot_path: Path,
+    nodes: set[Hashable],
+    edges: set[tuple[Hashable, Hashable]],
+) -> int:
+    """Append the current state of changed elements to the change log.
+
+    Args:
+        graph: Graph holding the current state
+        snapshot_path: Snapshot whose log is appended to
+        nodes: Changed node IDs
+        edges: Changed (src, dst) pairs
+
+    Returns:
+        Number of operations written
+    """
+    # Deletions first, then node upserts before the edges that use them
+    ops: list[dict[str, Any]] = []
+    ops += [
+        {"op": "del_edge", "src": u, "dst": v}
+        for u, v in edges
+        if not graph.has_edge(u, v)
+    ]
+    ops += [{"op": "del_node", "id": n} for n in nodes if not graph.has_node(n)]
+    ops += [
+        {"op": "node", "id": n, "data": dict(graph.nodes[n])}
+        for n in nodes
+        if graph.has_node(n)
+    ]
+    ops += [
+        {"op": "edge", "src": u, "dst": v, "data": dict(graph.edges[u, v])}
+        for u, v in edges
+        if graph.has_edge(u, v)
+    ]
+    if not ops:
+        return 0
+
+    payload = "".join(json.dumps(op, default=str) + "\n" for op in ops)
+    with open(journal_path(snapshot_path), "a", encoding="utf-8") as f:
+        f.write(payload)
+    return len(ops)
+
+
+def should_compact(log_ops: int, graph: nx.DiGraph) -> bool:
+    """Return True when the change log is large relative to the graph.
+
+    Uses the node count (O(1)); counting edges is O(V) in NetworkX.
+    """
+    return (
+        log_ops >= _COMPACT_MIN_OPS
+        and log_ops >= _COMPACT_RATIO * graph.number_of_nodes()
+    )
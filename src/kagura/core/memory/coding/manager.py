@@ -243,25 +243,22 @@ class CodingMemoryManager(MemoryManager):
         Returns:
             List of records associated with session
         """
-        import json
-
         records = []
 
-        # Query persistent storage by session_id (primary method)
-        pattern = f"project:{self.project_id}:{record_type}:%"
-        all_records = self.persistent.search(
-            query=pattern, user_id=self.user_id, limit=1000
+        # Indexed lookup by (project_id, record_type, session_id) - returns
+        # every record of the session regardless of project size
+        session_rows = self.persistent.fetch_project_records(
+            user_id=self.user_id,
+            project_id=self.project_id,
+            record_type=record_type,
+            session_id=session_id,
         )
 
-        for record_data in all_records:
+        for record_data in session_rows:
             try:
-                value_str = record_data.get("value", "{}")
-                data = (
-                    json.loads(value_str) if isinstance(value_str, str) else value_str
-                )
-                if data.get("session_id") == session_id:
-                    records.append(record_class(**data))
-            except (json.JSONDecodeError, TypeError, ValueError):
+                data = record_data.get("value") or {}
+                records.append(record_class(**data))
+            except (TypeError, ValueError):
                 continue
 
         # Fallback: Use graph if available and no records found
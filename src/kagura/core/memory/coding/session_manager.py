@@ -23,17 +23,19 @@ logger = logging.getLogger(__name__)
 def _detect_active_session(self: CodingMemoryManager) -> str | None:
     """Auto-detect active session from persistent storage.
 
-    Scans persistent storage for sessions with no end_time (active sessions).
-    Returns the first active session found, or None.
+    Looks up sessions with no end_time (active sessions) through the
+    project record index. Returns the most recently updated one, or None.
 
     Returns:
         Active session ID or None
     """
     try:
-        # Search persistent storage for sessions
-        key_pattern = f"project:{self.project_id}:session:%"
-        sessions = self.persistent.search(
-            query=key_pattern, user_id=self.user_id, limit=100
+        sessions = self.persistent.fetch_project_records(
+            user_id=self.user_id,
+            project_id=self.project_id,
+            record_type="session",
+            open_only=True,
+            newest_first=True,
         )
 
         # Find active session (no end_time)
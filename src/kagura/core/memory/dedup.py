@@ -0,0 +1,110 @@
+"""Content fingerprints for skipping unchanged and near-duplicate writes.
+
+MemoryRAG stores two fingerprints in each document's (or chunk's) metadata:
+
+- ``content_hash``: SHA-256 of the full content. A store() of content that
+  is already stored is answered from a metadata lookup, without embedding.
+- ``simhash``: 64-bit SimHash of character 4-grams, which differs in only a
+  few bits between near-identical texts. It is also stored as four 16-bit
+  bands (``simhash_b0`` .. ``simhash_b3``): two SimHashes within Hamming
+  distance 3 share at least one band, so candidates are found with an
+  equality filter before the exact distance check.
+
+Usage:
+    fingerprint = simhash("Deploy with blue green rollout")
+    hamming_distance(fingerprint, simhash("Deploy with blue-green rollout"))
+"""
+
+import hashlib
+import re
+
+import numpy as np
+
+SIMHASH_BANDS = 4
+_BAND_BITS = 64 // SIMHASH_BANDS
+_SHINGLE = 4
+_BLOCK = 1 << 16  # 4-grams hashed per numpy pass (bounds memory)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def content_hash(content: str) -> str:
+    """SHA-256 hex digest of the full content."""
+    return hashlib.sha256(content.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads n-gram hashes over all 64 bits."""
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of a text's character 4-grams.
+
+    Case and whitespace runs are normalized first, so reformatting does
+    not change the fingerprint. Works on any script (no word splitting).
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Unsigned 64-bit fingerprint (0 for empty text)
+    """
+    normalized = _WHITESPACE.sub(" ", text).strip().lower()
+    if not normalized:
+        return 0
+    codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32).astype(
+        np.uint64
+    )
+    if len(codes) < _SHINGLE:
+        codes = np.pad(codes, (0, _SHINGLE - len(codes)))
+
+    counts = np.zeros(64, dtype=np.int64)
+    total = len(codes) - _SHINGLE + 1
+    with np.errstate(over="ignore"):
+        for start in range(0, total, _BLOCK):
+            stop = min(start + _BLOCK, total)
+            h = np.zeros(stop - start, dtype=np.uint64)
+            for offset in range(_SHINGLE):
+                h = h * np.uint64(0x100000001B3) + codes[start + offset : stop + offset]
+            # Little-endian bytes, least significant bit first: column i = bit i
+            bytes_ = _mix(h).astype("<u8").view(np.uint8)
+            bits = np.unpackbits(bytes_, bitorder="little")
+            counts += bits.reshape(-1, 64).sum(axis=0, dtype=np.int64)
+
+    fingerprint = 0
+    for bit in np.flatnonzero(counts * 2 > total):
+        fingerprint |= 1 << int(bit)
+    return fingerprint
+
+
+def simhash_bands(fingerprint: int) -> list[int]:
+    """Split a SimHash into SIMHASH_BANDS integers (LSH buckets)."""
+    mask = (1 << _BAND_BITS) - 1
+    return [(fingerprint >> (i * _BAND_BITS)) & mask for i in range(SIMHASH_BANDS)]
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+def fingerprint_metadata(content: str, with_simhash: bool = True) -> dict[str, object]:
+    """Metadata fields recording a content's fingerprints.
+
+    Args:
+        content: Document content
+        with_simhash: Also include the SimHash and its bands
+
+    Returns:
+        {"content_hash": ...} plus "simhash" (16 hex chars) and
+        "simhash_b0".."simhash_b3" when with_simhash is set
+    """
+    metadata: dict[str, object] = {"content_hash": content_hash(content)}
+    if with_simhash:
+        fingerprint = simhash(content)
+        metadata["simhash"] = f"{fingerprint:016x}"
+        for i, band in enumerate(simhash_bands(fingerprint)):
+            metadata[f"simhash_b{i}"] = band
+    return metadata
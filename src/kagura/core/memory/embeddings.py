@@ -5,6 +5,8 @@ This module provides embedding functionality with support for:
 - Query/passage prefix handling (required for E5)
 - Configurable embedding dimensions
 - Fallback to default models
+- PyTorch (sentence-transformers) or ONNX Runtime backend (``backend="onnx"``)
+- Token-budgeted batching of length-sorted texts, with throughput counters
 
 Based on intfloat/multilingual-e5-large:
 https://huggingface.co/intfloat/multilingual-e5-large
@@ -12,7 +14,10 @@ https://huggingface.co/intfloat/multilingual-e5-large
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Optional
 
 import numpy as np
 
@@ -22,6 +27,76 @@ if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
 
+def load_embedding_model(config: EmbeddingConfig) -> Any:
+    """Load (or reuse) the bi-encoder of an embedding configuration.
+
+    Args:
+        config: Embedding configuration; ``config.backend`` selects
+            sentence-transformers ("torch") or onnxruntime ("onnx")
+
+    Returns:
+        Model with the SentenceTransformer ``encode`` interface
+
+    Raises:
+        ImportError: If the backend's packages are not installed
+    """
+    if config.backend == "onnx":
+        from kagura.core.memory.onnx_backend import load_onnx_embedder
+
+        return load_onnx_embedder(
+            config.model,
+            quantize=config.quantize,
+            intra_op_threads=config.intra_op_threads,
+            max_length=config.max_tokens,
+        )
+
+    from kagura.core.memory.model_cache import load_sentence_transformer
+
+    try:
+        return load_sentence_transformer(config.model)
+    except ImportError as e:
+        raise ImportError(
+            "sentence-transformers not installed. "
+            "Install with: pip install sentence-transformers"
+        ) from e
+
+
+@dataclass
+class EmbedderStats:
+    """Embedding counters and cumulative model time.
+
+    Attributes:
+        calls: encode_queries/encode_passages calls
+        texts: Texts embedded
+        tokens: Tokens embedded (after truncation, without padding)
+        padded_tokens: Tokens the model processed including padding
+        batches: Model calls
+        seconds: Time spent in the model
+    """
+
+    calls: int = 0
+    texts: int = 0
+    tokens: int = 0
+    padded_tokens: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+    @property
+    def texts_per_second(self) -> float:
+        return self.texts / self.seconds if self.seconds else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens / self.seconds if self.seconds else 0.0
+
+    @property
+    def padding_ratio(self) -> float:
+        """Share of processed tokens that were padding."""
+        if not self.padded_tokens:
+            return 0.0
+        return 1.0 - self.tokens / self.padded_tokens
+
+
 class Embedder:
     """Base embedder with query/passage prefix support.
 
@@ -33,6 +108,11 @@ class Embedder:
         >>> embedder = Embedder(config)
         >>> query_emb = embedder.encode_queries(["What is Python?"])
         >>> doc_emb = embedder.encode_passages(["Python is a programming language"])
+
+    Texts are sorted by token length and grouped into batches of at most
+    ``config.max_batch_tokens`` padded tokens, so short chunks are not
+    padded to the longest text of a mixed batch. Results are returned in
+    input order. ``stats()`` reports texts/sec and tokens/sec.
     """
 
     def __init__(self, config: Optional[EmbeddingConfig] = None):
@@ -42,19 +122,15 @@ class Embedder:
             config: Embedding configuration (defaults to E5-large)
 
         Raises:
-            ImportError: If sentence-transformers is not installed
+            ImportError: If the configured backend is not installed
+                (sentence-transformers, or onnxruntime for ``backend="onnx"``)
         """
         self.config = config or EmbeddingConfig()
 
-        try:
-            from sentence_transformers import SentenceTransformer
-
-            self.model: SentenceTransformer = SentenceTransformer(self.config.model)
-        except ImportError as e:
-            raise ImportError(
-                "sentence-transformers not installed. "
-                "Install with: pip install sentence-transformers"
-            ) from e
+        # Shared per process: every Embedder of a model reuses one instance
+        self.model: SentenceTransformer = load_embedding_model(self.config)
+        self._stats = EmbedderStats()
+        self._lock = threading.Lock()
 
     def encode_queries(self, texts: list[str]) -> np.ndarray:
         """Encode queries with 'query: ' prefix.
@@ -72,11 +148,7 @@ class Embedder:
         if self.config.use_prefix:
             texts = [f"query: {t}" for t in texts]
 
-        return self.model.encode(
-            texts,
-            normalize_embeddings=self.config.normalize,
-            show_progress_bar=False,
-        )
+        return self._encode(texts)
 
     def encode_passages(self, texts: list[str]) -> np.ndarray:
         """Encode passages/documents with 'passage: ' prefix.
@@ -94,11 +166,107 @@ class Embedder:
         if self.config.use_prefix:
             texts = [f"passage: {t}" for t in texts]
 
-        return self.model.encode(
-            texts,
-            normalize_embeddings=self.config.normalize,
-            show_progress_bar=False,
-        )
+        return self._encode(texts)
+
+    @property
+    def max_length(self) -> int:
+        """Tokens per text the model sees (config and model limit)."""
+        model_limit = getattr(self.model, "max_seq_length", None)
+        if model_limit:
+            return min(self.config.max_tokens, model_limit)
+        return self.config.max_tokens
+
+    def _token_lengths(self, texts: list[str]) -> list[int]:
+        """Token count of each text, truncated to max_length."""
+        max_length = self.max_length
+        tokenizer: Any = getattr(self.model, "tokenizer", None)
+        if tokenizer is None:
+            # Rough estimate (~4 characters per token) for unknown models
+            lengths = [len(t) // 4 + 2 for t in texts]
+        elif hasattr(tokenizer, "encode_batch"):  # tokenizers.Tokenizer
+            # Batch padding may be enabled; count only the real tokens
+            lengths = [sum(e.attention_mask) for e in tokenizer.encode_batch(texts)]
+        else:  # transformers tokenizer
+            input_ids = tokenizer(
+                texts, truncation=True, max_length=max_length, verbose=False
+            )["input_ids"]
+            lengths = [len(ids) for ids in input_ids]
+        return [min(length, max_length) for length in lengths]
+
+    def _batches(self, lengths: list[int]) -> list[list[int]]:
+        """Group text indexes, longest first, under the padded token budget.
+
+        A batch is padded to its longest text, so its cost is
+        ``len(batch) * max(length)``. A text longer than the budget gets a
+        batch of its own.
+        """
+        budget = self.config.max_batch_tokens
+        order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+        batches: list[list[int]] = []
+        for i in order:
+            # Sorted descending: the batch's first text is its longest
+            if batches and (len(batches[-1]) + 1) * lengths[batches[-1][0]] <= budget:
+                batches[-1].append(i)
+            else:
+                batches.append([i])
+        return batches
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Embed texts in token-budgeted, length-sorted batches.
+
+        Returns:
+            Embeddings in input order
+        """
+        if not texts:
+            return self.model.encode(
+                texts,
+                normalize_embeddings=self.config.normalize,
+                show_progress_bar=False,
+            )
+
+        lengths = self._token_lengths(texts)
+        batches = self._batches(lengths)
+        result: Optional[np.ndarray] = None
+        padded_tokens = 0
+        start = time.perf_counter()
+        for batch in batches:
+            embeddings = np.asarray(
+                self.model.encode(
+                    [texts[i] for i in batch],
+                    batch_size=len(batch),
+                    normalize_embeddings=self.config.normalize,
+                    show_progress_bar=False,
+                )
+            )
+            if result is None:
+                result = np.empty((len(texts), *embeddings.shape[1:]), embeddings.dtype)
+            result[batch] = embeddings
+            padded_tokens += len(batch) * lengths[batch[0]]
+        seconds = time.perf_counter() - start
+
+        with self._lock:
+            self._stats.calls += 1
+            self._stats.texts += len(texts)
+            self._stats.tokens += sum(lengths)
+            self._stats.padded_tokens += padded_tokens
+            self._stats.batches += len(batches)
+            self._stats.seconds += seconds
+        return result  # type: ignore[return-value]
+
+    def stats(self) -> dict[str, Any]:
+        """Get embedding throughput statistics.
+
+        Returns:
+            Dictionary with EmbedderStats counters, texts_per_second,
+            tokens_per_second and padding_ratio
+        """
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "texts_per_second": self._stats.texts_per_second,
+                "tokens_per_second": self._stats.tokens_per_second,
+                "padding_ratio": self._stats.padding_ratio,
+            }
 
     def encode(self, texts: list[str], is_query: bool = False) -> np.ndarray:
         """Encode texts with appropriate prefix.
@@ -133,5 +301,6 @@ class Embedder:
         return (
             f"Embedder(model={self.config.model}, "
             f"dim={self.config.dimension}, "
-            f"prefix={self.config.use_prefix})"
+            f"prefix={self.config.use_prefix}, "
+            f"backend={self.config.backend})"
         )
@@ -1,28 +1,189 @@
 """Memory export/import functionality.
 
 Exports and imports memories, graph data, and interactions in JSONL format.
+
+Both directions stream: the exporter reads SQLite in batches and writes each
+batch of encoded lines at once, and the importer stores persistent memories
+through MemoryManager.remember_many() one batch at a time (one SQLite
+transaction and one embedding call per batch), rebuilding the lexical index
+once at the end. JSONL files may be gzip (``.jsonl.gz``) or zstd
+(``.jsonl.zst``, needs ``zstandard``) compressed; the importer picks up
+whichever variant is present.
+
+With ``include_vectors=True`` the persistent-RAG vectors are exported too,
+as ``vectors.npy`` (float16, one row per line of memories.jsonl, NaN rows
+for memories without a stored vector) described in metadata.json by
+embedding model and dimension. On import the rows are written to the
+vector store directly when the target uses the same model; only memories
+without a usable vector are embedded.
 """
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
+import logging
+import shutil
 import sqlite3
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import IO, Any, Callable, Iterator, Literal, Optional
 
 from kagura.core.memory import MemoryManager
 
+logger = logging.getLogger(__name__)
+
+Compression = Literal["gzip", "zstd"]
+
+# Rows per SQLite fetch / import transaction / embedding batch
+DEFAULT_BATCH_SIZE = 1000
+
+_SUFFIXES: dict[Optional[str], str] = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+ProgressCallback = Callable[[int], None]
+
+VECTORS_FILE = "vectors.npy"
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard not installed. Install with: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+@contextmanager
+def _open_text(
+    path: Path, mode: Literal["r", "w"], compression: Optional[str] = None
+) -> Iterator[IO[str]]:
+    """Open a (possibly compressed) text file.
+
+    Args:
+        path: File path
+        mode: "r" or "w"
+        compression: None, "gzip" or "zstd"; when reading, inferred from the
+            file suffix if omitted
+    """
+    if compression is None and mode == "r":
+        compression = {".gz": "gzip", ".zst": "zstd"}.get(path.suffix)
+
+    if compression is None:
+        with open(path, mode, encoding="utf-8") as f:
+            yield f
+    elif compression == "gzip":
+        with gzip.open(path, mode + "t", encoding="utf-8") as f:
+            yield f
+    elif compression == "zstd":
+        zstandard = _import_zstandard()
+        with open(path, mode + "b") as raw:
+            if mode == "w":
+                stream = zstandard.ZstdCompressor().stream_writer(raw)
+            else:
+                stream = zstandard.ZstdDecompressor().stream_reader(raw)
+            with io.TextIOWrapper(stream, encoding="utf-8") as f:
+                yield f
+    else:
+        raise ValueError(
+            f"Unsupported compression: {compression}. Must be 'gzip' or 'zstd'"
+        )
+
+
+def _find_jsonl(input_path: Path, stem: str) -> Optional[Path]:
+    """Return ``<stem>.jsonl`` or its compressed variant, if present."""
+    for suffix in _SUFFIXES.values():
+        path = input_path / f"{stem}.jsonl{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def _vector_row(vectors: Any, row: int) -> Optional[list[float]]:
+    """Return row `row` as float list (None if missing or NaN)."""
+    if row >= len(vectors):
+        return None
+    vector = vectors[row].astype("float32")
+    if vector.size == 0 or vector[0] != vector[0]:  # NaN marks "no vector"
+        return None
+    return vector.tolist()
+
+
+class _VectorWriter:
+    """Stream float16 rows aligned to memories.jsonl into a .npy file.
+
+    The row count is only known at the end, so rows go to a raw sidecar
+    file first and are copied behind the .npy header on close().
+    """
+
+    def __init__(self, path: Path) -> None:
+        import numpy as np
+
+        self._np = np
+        self.path = path
+        self._raw_path = path.with_name(path.name + ".tmp")
+        self._raw: Optional[IO[bytes]] = None
+        self.dimension: Optional[int] = None
+        self.rows = 0
+        self.stored = 0
+
+    def add(self, vectors: list[Optional[list[float]]]) -> None:
+        """Append one row per memory (None = no vector, written as NaN)."""
+        np = self._np
+        if self.dimension is None:
+            first = next((v for v in vectors if v is not None), None)
+            if first is None:
+                self.rows += len(vectors)
+                return
+            self.dimension = len(first)
+            self._raw = open(self._raw_path, "wb")
+            # NaN rows for the memories written before the first vector
+            np.full((self.rows, self.dimension), np.nan, np.float16).tofile(self._raw)
+
+        block = np.full((len(vectors), self.dimension), np.nan, dtype=np.float16)
+        for i, vector in enumerate(vectors):
+            if vector is not None and len(vector) == self.dimension:
+                block[i] = vector
+                self.stored += 1
+        assert self._raw is not None
+        block.tofile(self._raw)
+        self.rows += len(vectors)
+
+    def close(self) -> bool:
+        """Write the .npy file. Returns False if no vector was found."""
+        if self._raw is None:
+            return False
+        self._raw.close()
+        with open(self.path, "wb") as out, open(self._raw_path, "rb") as raw:
+            self._np.lib.format.write_array_header_1_0(
+                out,
+                {
+                    "descr": self._np.dtype(self._np.float16).str,
+                    "fortran_order": False,
+                    "shape": (self.rows, self.dimension),
+                },
+            )
+            shutil.copyfileobj(raw, out)
+        self._raw_path.unlink()
+        return True
+
 
 class MemoryExporter:
     """Export memory data to JSONL format."""
 
-    def __init__(self, manager: MemoryManager):
+    def __init__(self, manager: MemoryManager, batch_size: int = DEFAULT_BATCH_SIZE):
         """Initialize exporter.
 
         Args:
             manager: MemoryManager instance to export from
+            batch_size: Rows fetched from SQLite and written per batch
         """
         self.manager = manager
+        self.batch_size = batch_size
+        self._encode = json.JSONEncoder().encode
 
     async def export_all(
         self,
@@ -30,6 +191,9 @@ class MemoryExporter:
         include_working: bool = True,
         include_persistent: bool = True,
         include_graph: bool = True,
+        compression: Optional[Compression] = None,
+        progress: Optional[ProgressCallback] = None,
+        include_vectors: bool = False,
     ) -> dict[str, int]:
         """Export all memory data to JSONL files.
 
@@ -38,6 +202,11 @@ class MemoryExporter:
             include_working: Export working memory
             include_persistent: Export persistent memory
             include_graph: Export graph data
+            compression: Compress JSONL files with "gzip" or "zstd"
+            progress: Called with the number of memories written so far
+                after each batch
+            include_vectors: Also export persistent-RAG vectors to
+                vectors.npy (requires numpy)
 
         Returns:
             Dict with export counts: {
@@ -51,6 +220,12 @@ class MemoryExporter:
             >>> stats = await exporter.export_all("./backup")
             >>> print(f"Exported {stats['memories']} memories")
         """
+        if compression not in _SUFFIXES:
+            raise ValueError(
+                f"Unsupported compression: {compression}. Must be 'gzip' or 'zstd'"
+            )
+        suffix = _SUFFIXES[compression]
+
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
@@ -59,27 +234,45 @@ class MemoryExporter:
             "graph_nodes": 0,
             "graph_edges": 0,
         }
+        vectors: Optional[dict[str, Any]] = None
 
         # Export memories
         if include_working or include_persistent:
-            memories_file = output_path / "memories.jsonl"
+            memories_file = output_path / f"memories.jsonl{suffix}"
+            vector_writer = None
+            if include_vectors and include_persistent and self.manager.persistent_rag:
+                vector_writer = _VectorWriter(output_path / VECTORS_FILE)
             count = await self._export_memories(
                 memories_file,
                 include_working=include_working,
                 include_persistent=include_persistent,
+                compression=compression,
+                progress=progress,
+                vector_writer=vector_writer,
             )
             stats["memories"] = count
+            if vector_writer and vector_writer.close():
+                stats["vectors"] = vector_writer.stored
+                vectors = {
+                    "file": VECTORS_FILE,
+                    "model": self.manager.persistent_rag.embedding_space,  # type: ignore[union-attr]
+                    "dimension": vector_writer.dimension,
+                    "dtype": "float16",
+                    "rows": vector_writer.rows,
+                }
 
         # Export graph
         if include_graph and self.manager.graph:
-            graph_file = output_path / "graph.jsonl"
-            node_count, edge_count = await self._export_graph(graph_file)
+            graph_file = output_path / f"graph.jsonl{suffix}"
+            node_count, edge_count = await self._export_graph(
+                graph_file, compression=compression
+            )
             stats["graph_nodes"] = node_count
             stats["graph_edges"] = edge_count
 
         # Export metadata
         metadata_file = output_path / "metadata.json"
-        await self._export_metadata(metadata_file, stats)
+        await self._export_metadata(metadata_file, stats, compression, vectors)
 
         return stats
 
@@ -88,6 +281,9 @@ class MemoryExporter:
         output_file: Path,
         include_working: bool = True,
         include_persistent: bool = True,
+        compression: Optional[Compression] = None,
+        progress: Optional[ProgressCallback] = None,
+        vector_writer: Optional[_VectorWriter] = None,
     ) -> int:
         """Export memories to JSONL.
 
@@ -95,29 +291,36 @@ class MemoryExporter:
             output_file: Output JSONL file path
             include_working: Include working memory
             include_persistent: Include persistent memory
+            compression: None, "gzip" or "zstd"
+            progress: Called with the running count after each batch
+            vector_writer: Receives one vector row per written line
 
         Returns:
             Number of memories exported
         """
         count = 0
+        encode = self._encode
+        exported_at = datetime.now().isoformat()
 
-        with open(output_file, "w") as f:
+        with _open_text(output_file, "w", compression) as f:
             # Export working memory
             if include_working:
-                working_keys = self.manager.working.keys()
-                for key in working_keys:
-                    value = self.manager.working.get(key)
+                lines = []
+                for key in self.manager.working.keys():
                     memory_record = {
                         "type": "memory",
                         "scope": "working",
                         "key": key,
-                        "value": value,
+                        "value": self.manager.working.get(key),
                         "user_id": self.manager.user_id,
                         "agent_name": self.manager.agent_name,
-                        "exported_at": datetime.now().isoformat(),
+                        "exported_at": exported_at,
                     }
-                    f.write(json.dumps(memory_record) + "\n")
-                    count += 1
+                    lines.append(encode(memory_record) + "\n")
+                f.write("".join(lines))
+                count += len(lines)
+                if vector_writer:
+                    vector_writer.add([None] * len(lines))
 
             # Export persistent memory
             if include_persistent and self.manager.persistent:
@@ -126,8 +329,6 @@ class MemoryExporter:
 
                 if db_path.exists():
                     with sqlite3.connect(db_path) as conn:
-                        conn.row_factory = sqlite3.Row
-
                         cursor = conn.execute(
                             """
                             SELECT key, value, user_id, agent_name,
@@ -139,33 +340,51 @@ class MemoryExporter:
                             (self.manager.user_id,),
                         )
 
-                        for row in cursor:
-                            memory_record = {
-                                "type": "memory",
-                                "scope": "persistent",
-                                "key": row["key"],
-                                "value": json.loads(row["value"]),
-                                "user_id": row["user_id"],
-                                "agent_name": row["agent_name"],
-                                "created_at": row["created_at"],
-                                "updated_at": row["updated_at"],
-                                "metadata": (
-                                    json.loads(row["metadata"])
-                                    if row["metadata"]
-                                    else None
-                                ),
-                                "exported_at": datetime.now().isoformat(),
-                            }
-                            f.write(json.dumps(memory_record) + "\n")
-                            count += 1
-
+                        while rows := cursor.fetchmany(self.batch_size):
+                            # value/metadata are stored JSON-encoded; splice
+                            # them in as-is instead of decoding and re-encoding
+                            lines = [
+                                '{"type": "memory", "scope": "persistent", '
+                                f'"key": {encode(key)}, "value": {value}, '
+                                f'"user_id": {encode(user_id)}, '
+                                f'"agent_name": {encode(agent_name)}, '
+                                f'"created_at": {encode(created_at)}, '
+                                f'"updated_at": {encode(updated_at)}, '
+                                f'"metadata": {metadata or "null"}, '
+                                f'"exported_at": "{exported_at}"}}\n'
+                                for (
+                                    key,
+                                    value,
+                                    user_id,
+                                    agent_name,
+                                    created_at,
+                                    updated_at,
+                                    metadata,
+                                ) in rows
+                            ]
+                            f.write("".join(lines))
+                            count += len(lines)
+                            if vector_writer:
+                                vector_writer.add(
+                                    self.manager.semantic_embeddings(
+                                        [(row[0], json.loads(row[1])) for row in rows]
+                                    )
+                                )
+                            if progress:
+                                progress(count)
+
+        if progress:
+            progress(count)
         return count
 
-    async def _export_graph(self, output_file: Path) -> tuple[int, int]:
+    async def _export_graph(
+        self, output_file: Path, compression: Optional[Compression] = None
+    ) -> tuple[int, int]:
         """Export graph data to JSONL.
 
         Args:
             output_file: Output JSONL file path
+            compression: None, "gzip" or "zstd"
 
         Returns:
             Tuple of (node_count, edge_count)
@@ -175,9 +394,12 @@ class MemoryExporter:
 
         node_count = 0
         edge_count = 0
+        encode = self._encode
+        exported_at = datetime.now().isoformat()
 
-        with open(output_file, "w") as f:
+        with _open_text(output_file, "w", compression) as f:
             # Export nodes
+            lines = []
             for node_id, node_data in self.manager.graph.graph.nodes(data=True):  # type: ignore
                 # Extract data safely
                 items = node_data.items() if node_data else []  # type: ignore
@@ -188,10 +410,13 @@ class MemoryExporter:
                     "id": node_id,
                     "node_type": node_data.get("type") if node_data else None,  # type: ignore
                     "data": filtered_data,
-                    "exported_at": datetime.now().isoformat(),
+                    "exported_at": exported_at,
                 }
-                f.write(json.dumps(node_record) + "\n")
+                lines.append(encode(node_record) + "\n")
                 node_count += 1
+                if len(lines) >= self.batch_size:
+                    f.write("".join(lines))
+                    lines.clear()
 
             # Export edges
             for src, dst, edge_data in self.manager.graph.graph.edges(data=True):  # type: ignore
@@ -210,25 +435,41 @@ class MemoryExporter:
                     "rel_type": edge_data.get("type") if edge_data else None,  # type: ignore
                     "weight": edge_data.get("weight", 1.0) if edge_data else 1.0,  # type: ignore
                     "data": filtered_edge_data,
-                    "exported_at": datetime.now().isoformat(),
+                    "exported_at": exported_at,
                 }
-                f.write(json.dumps(edge_record) + "\n")
+                lines.append(encode(edge_record) + "\n")
                 edge_count += 1
+                if len(lines) >= self.batch_size:
+                    f.write("".join(lines))
+                    lines.clear()
+
+            f.write("".join(lines))
 
         return node_count, edge_count
 
-    async def _export_metadata(self, output_file: Path, stats: dict[str, int]) -> None:
+    async def _export_metadata(
+        self,
+        output_file: Path,
+        stats: dict[str, int],
+        compression: Optional[Compression] = None,
+        vectors: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Export metadata about the export.
 
         Args:
             output_file: Output JSON file path
             stats: Export statistics
+            compression: Compression used for the JSONL files
+            vectors: Description of vectors.npy (file, model, dimension,
+                dtype, rows), if exported
         """
         metadata = {
             "exported_at": datetime.now().isoformat(),
             "user_id": self.manager.user_id,
             "agent_name": self.manager.agent_name,
             "stats": stats,
+            "compression": compression,
+            "vectors": vectors,
             "format_version": "1.0",
         }
 
@@ -239,24 +480,30 @@ class MemoryExporter:
 class MemoryImporter:
     """Import memory data from JSONL format."""
 
-    def __init__(self, manager: MemoryManager):
+    def __init__(self, manager: MemoryManager, batch_size: int = DEFAULT_BATCH_SIZE):
         """Initialize importer.
 
         Args:
             manager: MemoryManager instance to import into
+            batch_size: Persistent memories stored per transaction and
+                embedding batch
         """
         self.manager = manager
+        self.batch_size = batch_size
 
     async def import_all(
         self,
         input_dir: str | Path,
         clear_existing: bool = False,
+        progress: Optional[ProgressCallback] = None,
     ) -> dict[str, int]:
         """Import all memory data from JSONL files.
 
         Args:
             input_dir: Input directory path
             clear_existing: Clear existing data before import
+            progress: Called with the number of memories imported so far
+                after each batch
 
         Returns:
             Dict with import counts
@@ -275,6 +522,7 @@ class MemoryImporter:
             "memories": 0,
             "graph_nodes": 0,
             "graph_edges": 0,
+            "vectors_reused": 0,
         }
 
         # Clear existing data if requested
@@ -283,36 +531,110 @@ class MemoryImporter:
             # TODO: Clear persistent memory (need clear method)
 
         # Import memories
-        memories_file = input_path / "memories.jsonl"
-        if memories_file.exists():
-            count = await self._import_memories(memories_file)
+        memories_file = _find_jsonl(input_path, "memories")
+        if memories_file:
+            count, reused = await self._import_memories(
+                memories_file,
+                progress=progress,
+                vectors=self._load_vectors(input_path),
+            )
             stats["memories"] = count
+            stats["vectors_reused"] = reused
 
         # Import graph
-        graph_file = input_path / "graph.jsonl"
-        if graph_file.exists() and self.manager.graph:
+        graph_file = _find_jsonl(input_path, "graph")
+        if graph_file and self.manager.graph:
             node_count, edge_count = await self._import_graph(graph_file)
             stats["graph_nodes"] = node_count
             stats["graph_edges"] = edge_count
 
         return stats
 
-    async def _import_memories(self, input_file: Path) -> int:
+    def _load_vectors(self, input_path: Path) -> Any:
+        """Open exported vectors if they match the target embedding model.
+
+        Args:
+            input_path: Import directory
+
+        Returns:
+            Memory-mapped float16 array (one row per memories.jsonl line),
+            or None to embed everything
+        """
+        metadata_file = input_path / "metadata.json"
+        rag = self.manager.persistent_rag
+        if not (rag and metadata_file.exists()):
+            return None
+        with open(metadata_file) as f:
+            info = json.load(f).get("vectors")
+        if not info or not (input_path / info["file"]).exists():
+            return None
+        if info.get("model") != rag.embedding_space:
+            logger.info(
+                f"Exported vectors use {info.get('model')}, target uses "
+                f"{rag.embedding_space}: re-embedding on import"
+            )
+            return None
+
+        import numpy as np
+
+        vectors = np.load(input_path / info["file"], mmap_mode="r")
+        if vectors.ndim != 2 or vectors.shape[1] != info.get("dimension"):
+            logger.warning(
+                f"Ignoring {info['file']}: shape {vectors.shape} does not match "
+                f"dimension {info.get('dimension')}"
+            )
+            return None
+        return vectors
+
+    async def _import_memories(
+        self,
+        input_file: Path,
+        progress: Optional[ProgressCallback] = None,
+        vectors: Any = None,
+    ) -> tuple[int, int]:
         """Import memories from JSONL.
 
+        Persistent memories are stored in batches; the lexical index is
+        rebuilt once after the last batch.
+
         Args:
-            input_file: Input JSONL file path
+            input_file: Input JSONL file path (optionally compressed)
+            progress: Called with the running count after each batch
+            vectors: Exported vectors aligned to the file's lines (see
+                _load_vectors); rows are reused instead of re-embedding
 
         Returns:
-            Number of memories imported
+            Tuple of (memories imported, vectors reused)
         """
         count = 0
-
-        with open(input_file) as f:
+        reused = 0
+        line_number = -1
+        batch: list[tuple[str, Any, Optional[dict]]] = []
+        batch_vectors: list[Optional[list[float]]] = []
+        stored_persistent = False
+
+        def flush() -> None:
+            nonlocal stored_persistent, reused
+            if batch and self.manager.persistent:
+                embeddings = None
+                if vectors is not None:
+                    embeddings = list(batch_vectors)
+                    reused += sum(v is not None for v in embeddings)
+                self.manager.remember_many(
+                    batch, index_lexical=False, embeddings=embeddings
+                )
+                stored_persistent = True
+            batch.clear()
+            batch_vectors.clear()
+            if progress:
+                progress(count)
+
+        with _open_text(input_file, "r") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
+                line_number += 1
 
                 record = json.loads(line)
 
@@ -323,29 +645,30 @@ class MemoryImporter:
                 key = record["key"]
                 value = record["value"]
                 scope = record["scope"]
-                metadata = record.get("metadata")
 
                 # Import to appropriate scope
                 if scope == "working":
                     self.manager.working.set(key, value)
                 elif scope == "persistent" and self.manager.persistent:
-                    self.manager.persistent.store(
-                        key=key,
-                        value=value,
-                        user_id=self.manager.user_id,
-                        agent_name=self.manager.agent_name,
-                        metadata=metadata,
-                    )
+                    batch.append((key, value, record.get("metadata")))
+                    if vectors is not None:
+                        batch_vectors.append(_vector_row(vectors, line_number))
 
                 count += 1
+                if len(batch) >= self.batch_size:
+                    flush()
 
-        return count
+        flush()
+        if stored_persistent:
+            self.manager.rebuild_lexical_index()
+
+        return count, reused
 
     async def _import_graph(self, input_file: Path) -> tuple[int, int]:
         """Import graph data from JSONL.
 
         Args:
-            input_file: Input JSONL file path
+            input_file: Input JSONL file path (optionally compressed)
 
         Returns:
             Tuple of (node_count, edge_count)
@@ -356,7 +679,7 @@ class MemoryImporter:
         node_count = 0
         edge_count = 0
 
-        with open(input_file) as f:
+        with _open_text(input_file, "r") as f:
             for line in f:
                 line = line.strip()
                 if not line:
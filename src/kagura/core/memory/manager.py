@@ -6,6 +6,8 @@ Provides a unified interface to all memory types (working, context, persistent).
 from __future__ import annotations
 
 import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -25,6 +27,21 @@ from .working import WorkingMemory
 if TYPE_CHECKING:
     from .rag import MemoryRAG
 
+logger = logging.getLogger(__name__)
+
+# Shared pool for querying working and persistent collections concurrently
+_query_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_query_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for concurrent collection queries."""
+    global _query_executor
+    if _query_executor is None:
+        _query_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="kagura-recall"
+        )
+    return _query_executor
+
 
 class MemoryManager:
     """Unified memory management interface.
@@ -124,6 +141,8 @@ class MemoryManager:
                 persist_dir=vector_dir,
                 chunking_config=self.config.chunking if self.config else None,
                 embedding_config=self.config.embedding if self.config else None,
+                vector_store_config=self.config.vector_store if self.config else None,
+                dedup_config=self.config.dedup if self.config else None,
             )
             logger.debug("MemoryManager: Working MemoryRAG created")
 
@@ -134,6 +153,8 @@ class MemoryManager:
                 persist_dir=vector_dir,
                 chunking_config=self.config.chunking if self.config else None,
                 embedding_config=self.config.embedding if self.config else None,
+                vector_store_config=self.config.vector_store if self.config else None,
+                dedup_config=self.config.dedup if self.config else None,
             )
             logger.debug("MemoryManager: Persistent MemoryRAG created")
         else:
@@ -393,6 +414,14 @@ class MemoryManager:
         else:
             self.lexical_searcher.clear()
 
+    def rebuild_lexical_index(self) -> None:
+        """Rebuild the lexical index from persistent memory.
+
+        Used after bulk loads that skipped per-batch lexical indexing
+        (remember_many(..., index_lexical=False)).
+        """
+        self._rebuild_lexical_index()
+
     def _ensure_lexical_index(self) -> None:
         """Ensure lexical index is ready before searching."""
         if self.lexical_searcher and self.lexical_searcher.count() == 0:
@@ -436,6 +465,102 @@ class MemoryManager:
             )
             self.lexical_searcher.add_document(document)
 
+    def remember_many(
+        self,
+        items: list[tuple[str, Any, Optional[dict]]],
+        embed: bool = True,
+        index_lexical: bool = True,
+        embeddings: Optional[list[Optional[list[float]]]] = None,
+    ) -> None:
+        """Store many persistent memories at once.
+
+        Equivalent to calling remember() per item, but SQLite writes share one
+        transaction, RAG documents are embedded in one batch and the lexical
+        index is rebuilt once.
+
+        Args:
+            items: List of (key, value, metadata) tuples
+            embed: Index in persistent RAG now. When False, callers are
+                expected to call index_semantic_many() later.
+            index_lexical: Add to the lexical index now. When False (bulk
+                loads spanning many batches), callers are expected to call
+                rebuild_lexical_index() once at the end.
+            embeddings: Optional precomputed RAG vectors per item (None
+                entries are embedded); see index_semantic_many()
+        """
+        if not items:
+            return
+
+        self.persistent.store_many(items, self.user_id, self.agent_name)
+
+        if embed:
+            self.index_semantic_many(items, embeddings=embeddings)
+
+        if self.lexical_searcher and index_lexical:
+            self.lexical_searcher.add_documents(
+                [
+                    self._prepare_lexical_document(
+                        key=key, value=value, metadata=metadata
+                    )
+                    for key, value, metadata in items
+                ]
+            )
+
+    def index_semantic_many(
+        self,
+        items: list[tuple[str, Any, Optional[dict]]],
+        embeddings: Optional[list[Optional[list[float]]]] = None,
+    ) -> None:
+        """Index already-stored persistent memories in persistent RAG.
+
+        Args:
+            items: List of (key, value, metadata) tuples
+            embeddings: Optional precomputed vectors per item, e.g. from an
+                export made with the same embedding model (None entries
+                are embedded)
+        """
+        if not self.persistent_rag or not items:
+            return
+
+        contents = []
+        metadatas = []
+        for key, value, metadata in items:
+            full_metadata = metadata.copy() if metadata else {}
+            value_str = self._stringify_value(value)
+            full_metadata.update(
+                {
+                    "type": "persistent_memory",
+                    "key": key,
+                    "value": value_str,
+                }
+            )
+            contents.append(f"{key}: {value_str}")
+            metadatas.append(full_metadata)
+
+        self.persistent_rag.store_batch(
+            contents,
+            self.user_id,
+            metadatas,
+            self.agent_name,
+            embeddings=embeddings,
+        )
+
+    def semantic_embeddings(
+        self, items: list[tuple[str, Any]]
+    ) -> list[Optional[list[float]]]:
+        """Look up the persistent RAG vectors of persistent memories.
+
+        Args:
+            items: List of (key, value) tuples
+
+        Returns:
+            Vector per item (None if not indexed as a single document)
+        """
+        if not self.persistent_rag:
+            return [None] * len(items)
+        contents = [f"{key}: {self._stringify_value(value)}" for key, value in items]
+        return self.persistent_rag.get_embeddings(contents, self.user_id)
+
     def recall(
         self,
         key: str,
@@ -473,6 +598,49 @@ class MemoryManager:
         """
         return self.persistent.search(query, self.user_id, self.agent_name, limit)
 
+    def recall_lexical(self, query: str, top_k: int = 5) -> list[dict[str, Any]]:
+        """Keyword search over persistent memory, without embedding models.
+
+        Used as the degraded search path while models are still loading
+        (see kagura.core.memory.prewarm). Ranks with BM25 when rank-bm25 is
+        installed, otherwise matches the query against keys.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+
+        Returns:
+            Memory dictionaries with id, key, value, content, metadata,
+            scope ("persistent") and score (BM25; None for key matches)
+        """
+        if self.lexical_searcher:
+            self._ensure_lexical_index()
+            # Rank everything, then keep documents containing a query term:
+            # in small corpora IDF is zero or negative, so BM25 scores alone
+            # can't separate matches from non-matches
+            results = self.lexical_searcher.search(
+                query, k=self.lexical_searcher.count(), min_score=float("-inf")
+            )
+            terms = query.lower().split()
+            return [
+                r
+                for r in results
+                if any(term in r["content"].lower() for term in terms)
+            ][:top_k]
+
+        return [
+            {
+                "id": memory["key"],
+                "key": memory["key"],
+                "value": memory["value"],
+                "content": f"{memory['key']}: {self._stringify_value(memory['value'])}",
+                "metadata": memory.get("metadata") or {},
+                "scope": "persistent",
+                "score": None,
+            }
+            for memory in self.search_memory(query, limit=top_k)
+        ]
+
     def forget(self, key: str) -> None:
         """Delete persistent memory.
 
@@ -490,9 +658,7 @@ class MemoryManager:
                 where["agent_name"] = self.agent_name
 
             try:
-                results = self.persistent_rag.collection.get(where=where)  # type: ignore
-                if results["ids"]:
-                    self.persistent_rag.collection.delete(ids=results["ids"])
+                self.persistent_rag.delete_matching(where)
             except Exception:
                 # Silently fail if RAG deletion fails
                 pass
@@ -602,6 +768,28 @@ class MemoryManager:
         Returns:
             List of memory dictionaries with content, distance, metadata, and scope
 
+        Raises:
+            ValueError: If RAG is not enabled
+        """
+        return self.recall_semantic_many([query], top_k=top_k, scope=scope)[0]
+
+    def recall_semantic_many(
+        self, queries: list[str], top_k: int = 5, scope: str = "all"
+    ) -> list[list[dict[str, Any]]]:
+        """Semantic search for several queries at once.
+
+        Each query is embedded once (in a single batch) and the vectors are
+        reused for every searched collection; working and persistent
+        collections are queried concurrently.
+
+        Args:
+            queries: Search queries
+            top_k: Number of results per query
+            scope: Memory scope to search ("working", "persistent", or "all")
+
+        Returns:
+            One result list per query (same format as recall_semantic())
+
         Raises:
             ValueError: If RAG is not enabled
         """
@@ -613,30 +801,86 @@ class MemoryManager:
                 "  2. Set enable_rag=True when creating MemoryManager\n\n"
                 "💡 Semantic search finds memories by meaning, not exact keywords"
             )
+        if not queries:
+            return []
 
-        results = []
-
-        # Search working memory RAG
+        targets: list[tuple[str, MemoryRAG]] = []
         if scope in ("all", "working") and self.rag:
-            working_results = self.rag.recall(
-                query, self.user_id, top_k, self.agent_name
-            )
-            for r in working_results:
-                r["scope"] = "working"
-            results.extend(working_results)
-
-        # Search persistent memory RAG
+            targets.append(("working", self.rag))
         if scope in ("all", "persistent") and self.persistent_rag:
-            persistent_results = self.persistent_rag.recall(
-                query, self.user_id, top_k, self.agent_name
+            targets.append(("persistent", self.persistent_rag))
+
+        embeddings = self._embed_queries_once(queries, targets)
+
+        def _search(
+            target: tuple[str, MemoryRAG],
+        ) -> tuple[str, list[list[dict[str, Any]]]]:
+            scope_name, rag = target
+            query_embeddings = embeddings.get(rag.embedding_space)
+            if query_embeddings is None:
+                # Embedding failed up front; let ChromaDB embed the text
+                return scope_name, [
+                    rag.recall(query, self.user_id, top_k, self.agent_name)
+                    for query in queries
+                ]
+            if len(queries) == 1:
+                return scope_name, [
+                    rag.recall(
+                        queries[0],
+                        self.user_id,
+                        top_k,
+                        self.agent_name,
+                        query_embedding=query_embeddings[0],
+                    )
+                ]
+            return scope_name, rag.recall_many(
+                queries,
+                self.user_id,
+                top_k,
+                self.agent_name,
+                query_embeddings=query_embeddings,
             )
-            for r in persistent_results:
-                r["scope"] = "persistent"
-            results.extend(persistent_results)
+
+        if len(targets) > 1:
+            searched = list(_get_query_executor().map(_search, targets))
+        else:
+            searched = [_search(target) for target in targets]
+
+        merged: list[list[dict[str, Any]]] = [[] for _ in queries]
+        for scope_name, per_query in searched:
+            for results, query_results in zip(merged, per_query):
+                for r in query_results:
+                    r["scope"] = scope_name
+                results.extend(query_results)
 
         # Sort by distance (lower is better) and limit to top_k
-        results.sort(key=lambda x: x["distance"])
-        return results[:top_k]
+        for results in merged:
+            results.sort(key=lambda x: x["distance"])
+        return [results[:top_k] for results in merged]
+
+    def _embed_queries_once(
+        self, queries: list[str], targets: list[tuple[str, MemoryRAG]]
+    ) -> dict[str, list[list[float]]]:
+        """Embed queries once per distinct embedding space among targets.
+
+        Args:
+            queries: Search queries
+            targets: (scope, MemoryRAG) pairs to be searched
+
+        Returns:
+            Mapping of embedding_space to query vectors; spaces whose
+            embedding failed are omitted
+        """
+        embeddings: dict[str, list[list[float]]] = {}
+        for _, rag in targets:
+            space = rag.embedding_space
+            if space in embeddings:
+                continue
+            try:
+                embeddings[space] = rag.embed_queries(queries)
+            except Exception as e:
+                logger.debug(f"Query embedding failed, using query_texts: {e}")
+        return embeddings
 
     def recall_semantic_with_rerank(
         self,
@@ -1010,6 +1254,7 @@ class MemoryManager:
         parent_id: str,
         chunk_index: int,
         context_size: int = 1,
+        context_chars: Optional[int] = None,
     ) -> list[dict[str, Any]]:
         """Get neighboring chunks around a specific chunk.
 
@@ -1017,6 +1262,8 @@ class MemoryManager:
             parent_id: Parent document ID
             chunk_index: Index of the target chunk (0-indexed)
             context_size: Number of chunks before/after to retrieve (default: 1)
+            context_chars: Characters of context before/after instead of a
+                chunk count (see MemoryRAG.get_chunk_context)
 
         Returns:
             List of chunks sorted by chunk_index, including target chunk and neighbors
@@ -1038,6 +1285,7 @@ class MemoryManager:
                 chunk_index=chunk_index,
                 context_size=context_size,
                 user_id=self.user_id,
+                context_chars=context_chars,
             )
             if result:  # Non-empty list
                 return result
@@ -1049,6 +1297,7 @@ class MemoryManager:
                 chunk_index=chunk_index,
                 context_size=context_size,
                 user_id=self.user_id,
+                context_chars=context_chars,
             )
 
         # Both RAGs returned empty
@@ -0,0 +1,93 @@
+"""Process-wide cache of loaded embedding and reranking models.
+
+Loading a SentenceTransformer or CrossEncoder takes seconds (minutes on the
+first download) and hundreds of MB. Every MemoryRAG used to load its own
+copy; models are now loaded once per process and shared, so the two RAG
+collections of a MemoryManager, every cached MemoryManager and the startup
+prewarm (see :mod:`kagura.core.memory.prewarm`) all use the same instance.
+
+Loads are serialized per model: a caller asking for a model that another
+thread is loading waits for that load instead of starting a second one.
+
+Usage:
+    model = load_sentence_transformer("intfloat/multilingual-e5-large")
+    is_model_loaded("sentence_transformer", "intfloat/multilingual-e5-large")
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_models: dict[tuple[str, str], Any] = {}
+_load_locks: dict[tuple[str, str], threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def get_model(kind: str, name: str, loader: Callable[[], Any]) -> Any:
+    """Return a cached model, loading it on first use.
+
+    Args:
+        kind: Model family (e.g. "sentence_transformer")
+        name: Model name or path
+        loader: Called (once per process) to load the model
+
+    Returns:
+        The loaded model
+
+    Raises:
+        Exception: Whatever ``loader`` raises (failed loads are not cached)
+    """
+    key = (kind, name)
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        lock = _load_locks.setdefault(key, threading.Lock())
+    with lock:
+        model = _models.get(key)
+        if model is None:
+            start = time.perf_counter()
+            model = loader()
+            _models[key] = model
+            logger.debug(
+                f"Loaded {kind} '{name}' in {time.perf_counter() - start:.1f}s"
+            )
+    return model
+
+
+def is_model_loaded(kind: str, name: str) -> bool:
+    """Check whether a model is already in the cache."""
+    return (kind, name) in _models
+
+
+def clear_model_cache() -> None:
+    """Drop all cached models (mainly for tests)."""
+    with _registry_lock:
+        _models.clear()
+        _load_locks.clear()
+
+
+def load_sentence_transformer(name: str) -> Any:
+    """Load (or reuse) a SentenceTransformer bi-encoder.
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    from sentence_transformers import SentenceTransformer
+
+    return get_model("sentence_transformer", name, lambda: SentenceTransformer(name))
+
+
+def load_cross_encoder(name: str) -> Any:
+    """Load (or reuse) a CrossEncoder reranker.
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    from sentence_transformers import CrossEncoder
+
+    return get_model("cross_encoder", name, lambda: CrossEncoder(name))
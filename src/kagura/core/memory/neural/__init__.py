@@ -18,11 +18,13 @@ References:
 """
 
 from .activation import ActivationSpreader
+from .adjacency import NeuralAdjacency
 from .co_activation import CoActivationTracker
 from .config import NeuralMemoryConfig
 from .decay import DecayManager
 from .engine import NeuralMemoryEngine
 from .hebbian import HebbianLearner
+from .maintenance import MaintenanceScheduler, MaintenanceStats
 from .models import (
     ActivationState,
     CoActivationRecord,
@@ -40,9 +42,12 @@ __all__ = [
     "NeuralMemoryEngine",
     # Subcomponents
     "ActivationSpreader",
+    "NeuralAdjacency",
     "CoActivationTracker",
     "DecayManager",
     "HebbianLearner",
+    "MaintenanceScheduler",
+    "MaintenanceStats",
     "UnifiedScorer",
     # Models
     "NeuralMemoryNode",
@@ -7,19 +7,23 @@ through the graph with decay, enabling discovery of related memories.
 Formula (for 1-hop spread):
     activation(j) = Σ_i activation(i) · decay · weight(i→j)
 
+Each hop is evaluated on the per-user CSR shard from adjacency.py as a
+vectorized gather + segmented sum over the frontier's outgoing edges.
+
 References:
     - Spreading activation in semantic networks
     - Hopfield Networks is All You Need (arXiv:2008.02217)
 """
 
 import logging
-from collections import defaultdict
 from typing import Any
 
 import networkx as nx
+import numpy as np
 
 from kagura.core.graph.memory import GraphMemory
 
+from .adjacency import NeuralAdjacency
 from .config import NeuralMemoryConfig
 from .models import ActivationState
 
@@ -33,15 +37,18 @@ class ActivationSpreader:
         self,
         graph: GraphMemory,
         config: NeuralMemoryConfig,
+        adjacency: NeuralAdjacency | None = None,
     ) -> None:
         """Initialize activation spreader.
 
         Args:
             graph: Graph memory instance
             config: Neural memory configuration
+            adjacency: Shared CSR adjacency (created if omitted)
         """
         self.graph = graph
         self.config = config
+        self.adjacency = adjacency or NeuralAdjacency(graph)
 
     def spread(
         self,
@@ -132,72 +139,80 @@ class ActivationSpreader:
         Returns:
             Map of node_id -> activation for next layer
         """
-        next_layer: dict[str, float] = defaultdict(float)
-
+        # GDPR compliance: the user's shard only contains edges into nodes
+        # owned by user_id (or by nobody), preventing cross-user leakage
+        graph = self.adjacency.tracked_graph
+        shard = self.adjacency.shard(user_id)
+
+        src_ids = []
+        src_rows = []
+        src_acts = []
         for src_id, src_activation in current_layer.items():
-            # Get outgoing edges (neighbors)
-            try:
-                neighbors = list(self.graph.graph.successors(src_id))
-            except nx.NetworkXError:
-                logger.debug(f"Node {src_id} not found in graph")
+            row = shard.index.get(src_id)
+            if row is None:
+                # Not in the graph, or no visible outgoing edges
                 continue
+            src_ids.append(src_id)
+            src_rows.append(row)
+            src_acts.append(src_activation)
 
-            for dst_id in neighbors:
-                # GDPR compliance: Filter by user_id to prevent cross-user data leakage
-                if user_id is not None:
-                    try:
-                        dst_node_data = self.graph.graph.nodes[dst_id]
-                        node_user_id = dst_node_data.get("user_id")
-                        if node_user_id and node_user_id != user_id:
-                            # Skip nodes belonging to other users
-                            continue
-                    except (KeyError, nx.NetworkXError):
-                        # Node not found or missing data - skip for safety
-                        continue
+        if not src_rows:
+            return {}
 
-                # Get edge weight
-                try:
-                    edge_data = self.graph.graph[src_id][dst_id]
-                    weight = edge_data.get("weight", 0.0)
-                except (KeyError, nx.NetworkXError):
-                    weight = 0.0
-
-                # Calculate propagated activation
-                # activation(dst) += activation(src) * decay * weight(src→dst)
-                propagated_activation = (
-                    src_activation * self.config.spread_decay * weight
-                )
+        sources, columns, weights = shard.gather(
+            graph, np.asarray(src_rows, dtype=np.int64)
+        )
 
-                # Check threshold
-                if propagated_activation < self.config.spread_threshold:
-                    continue
-
-                # Accumulate activation (sum from multiple paths)
-                next_layer[dst_id] += propagated_activation
-
-                # Update global activation map (keep max activation)
-                if dst_id in all_activations:
-                    # Node already activated in a previous hop - keep max
-                    if propagated_activation > all_activations[dst_id]["activation"]:
-                        all_activations[dst_id] = {
-                            "activation": propagated_activation,
-                            "hop": hop,
-                            "source": src_id,
-                        }
-                else:
-                    # First time activating this node
-                    all_activations[dst_id] = {
-                        "activation": propagated_activation,
-                        "hop": hop,
-                        "source": src_id,
-                    }
+        # activation(dst) += activation(src) * decay * weight(src→dst)
+        propagated = (
+            np.asarray(src_acts, dtype=np.float64)[sources]
+            * self.config.spread_decay
+            * weights
+        )
+
+        # Check threshold (removed edges have NaN weight and never pass)
+        passed = propagated >= self.config.spread_threshold
+        sources, columns, propagated = (
+            sources[passed],
+            columns[passed],
+            propagated[passed],
+        )
+        if len(columns) == 0:
+            return {}
+
+        # Accumulate activation per destination (sum from multiple paths)
+        dst_cols, groups = np.unique(columns, return_inverse=True)
+        totals = np.bincount(groups, weights=propagated)
+
+        # Strongest single path per destination (first one on ties)
+        order = np.lexsort((-propagated, groups))
+        first = order[np.r_[True, groups[order][1:] != groups[order][:-1]]]
+
+        next_layer: dict[str, float] = {}
+        for col, total, best, best_src in zip(
+            dst_cols.tolist(),
+            totals.tolist(),
+            propagated[first].tolist(),
+            sources[first].tolist(),
+        ):
+            dst_id = shard.node_ids[col]
+            next_layer[dst_id] = total
+
+            # Update global activation map (keep max activation)
+            existing = all_activations.get(dst_id)
+            if existing is None or best > existing["activation"]:
+                all_activations[dst_id] = {
+                    "activation": best,
+                    "hop": hop,
+                    "source": src_ids[best_src],
+                }
 
         logger.debug(
             f"Hop {hop}: propagated to {len(next_layer)} new nodes "
             f"(from {len(current_layer)} sources)"
         )
 
-        return dict(next_layer)
+        return next_layer
 
     def get_association_score(
         self,
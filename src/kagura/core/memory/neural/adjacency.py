@@ -0,0 +1,397 @@
+"""Compact array-backed adjacency for neural memory.
+
+Activation spreading, decay and pruning only need, for one user, the edges
+whose destination that user may see (nodes owned by the user or by nobody)
+and their weights. Reading those through NetworkX dict-of-dicts costs
+several Python lookups per edge, so :class:`NeuralAdjacency` keeps a CSR
+(compressed sparse row) shard per user, built from the user's nodes and the
+unowned nodes (GraphIndex), so its size does not depend on other users:
+
+    indptr[row] .. indptr[row + 1]  ->  positions of row's outgoing edges
+    indices[pos], weights[pos]      ->  destination column and weight
+
+One hop of spreading is then a gather over the frontier rows followed by a
+segmented sum (a sparse matrix-vector product restricted to the frontier),
+and decay/pruning are vectorized over the weight array.
+
+Shards are built lazily from GraphMemory and kept in sync through the
+TrackedDiGraph listener hook, so NetworkX stays the source of truth:
+
+- weight edits are patched into the weight array in place
+- removed edges are tombstoned with a NaN weight (NaN never passes a
+  threshold comparison); re-adding the edge revives the slot
+- new edges are kept in a small per-row overlay
+- a node changing owner, or the overlay/tombstones growing past a fraction
+  of the shard, drops the shard so it is rebuilt on next use
+
+Edges between two unowned nodes belong to no user's decay; the
+:data:`SHARED_EDGES` shard holds just those so they are maintained too.
+"""
+
+import logging
+import math
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Hashable, Iterable
+
+import numpy as np
+
+from kagura.core.graph.memory import GraphMemory
+from kagura.core.graph.store import TrackedDiGraph
+
+logger = logging.getLogger(__name__)
+
+Edge = tuple[Hashable, Hashable]
+
+# Shards kept in memory (least recently used are dropped)
+_MAX_SHARDS = 16
+# Rebuild once overlay edges + tombstones exceed this many ...
+_MIN_STALE_EDGES = 256
+# ... and this fraction of the shard's edges
+_STALE_RATIO = 0.1
+
+
+def edge_weight(data: dict[str, Any] | None) -> float:
+    """Return an edge's ``weight`` attribute as float (0.0 if missing)."""
+    if not data:
+        return 0.0
+    try:
+        return float(data.get("weight", 0.0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Shard key (maintained like a user) for edges between nodes nobody owns
+SHARED_EDGES = "__shared__"
+
+
+def _visible(owner: Any, user_id: str | None) -> bool:
+    """Whether a node owned by `owner` may be activated for `user_id`."""
+    return user_id is None or not owner or owner == user_id
+
+
+def _owns(owner: Any, user_id: str | None) -> bool:
+    """Whether a node owned by `owner` counts as owned by the shard's user."""
+    if user_id is None:
+        return True
+    if user_id == SHARED_EDGES:
+        return not owner
+    return owner == user_id
+
+
+def _in_shard(src_owner: Any, dst_owner: Any, user_id: str | None) -> bool:
+    """Whether an edge between nodes with these owners belongs to a shard.
+
+    A user's shard holds edges into visible nodes that leave the user's or
+    unowned nodes, plus edges from other users' nodes into the user's nodes
+    (decayed with the user, never followed by spreading).
+    """
+    if not _visible(dst_owner, user_id):
+        return False
+    if user_id is None or not src_owner or src_owner == user_id:
+        return True
+    return user_id != SHARED_EDGES and dst_owner == user_id
+
+
+class AdjacencyShard:
+    """CSR adjacency of the edges visible to one user.
+
+    Rows and columns share one node numbering (``node_ids``/``index``).
+
+    Attributes:
+        user_id: Owner of the shard (None = all edges, SHARED_EDGES = edges
+            between unowned nodes)
+        node_ids: Node ID per row/column
+        index: Node ID -> row/column
+        indptr: Row offsets into indices/weights (len = base rows + 1)
+        indices: Destination column per edge
+        weights: Weight per edge (NaN = removed)
+        keys: (src, dst) per edge position
+        owned: Per column, whether the node is owned by user_id (unowned
+            nodes for SHARED_EDGES)
+        stale: Overlay edges, tombstones and appended nodes since the build
+    """
+
+    def __init__(self, graph: TrackedDiGraph, user_id: str | None) -> None:
+        """Build the shard from the current graph.
+
+        Only the user's and unowned nodes' adjacency is read (all nodes for
+        None, unowned nodes for SHARED_EDGES).
+
+        Args:
+            graph: Tracked graph to read
+            user_id: User whose visible edges are collected (None = all)
+        """
+        self.user_id = user_id
+        self.node_ids: list[Hashable] = []
+        self.index: dict[Hashable, int] = {}
+        self._owners: list[Any] = []
+        self.pending: dict[int, dict[int, Edge]] = {}
+        self._pending_keys: dict[Edge, tuple[int, int]] = {}
+        self.stale = 0
+
+        node_attrs = graph._node
+        rows: list[int] = []
+        cols: list[int] = []
+        weights: list[float] = []
+        keys: list[Edge] = []
+
+        owned_nodes: Iterable[Hashable] = ()
+        sources: Iterable[Hashable] = graph._succ
+        if user_id is not None:
+            if user_id != SHARED_EDGES:
+                owned_nodes = graph.index.nodes_by_user.get(user_id, ())
+            sources = chain(owned_nodes, graph.index.unowned_nodes)
+
+        for src in sources:
+            src_col = -1
+            for dst, data in graph._succ[src].items():
+                if not _visible(node_attrs[dst].get("user_id"), user_id):
+                    continue
+                if src_col < 0:
+                    src_col = self._column(src, node_attrs[src])
+                rows.append(src_col)
+                cols.append(self._column(dst, node_attrs[dst]))
+                weights.append(edge_weight(data))
+                keys.append((src, dst))
+
+        # Edges from other users' nodes into the user's nodes
+        for dst in owned_nodes:
+            for src, data in graph._pred[dst].items():
+                src_owner = node_attrs[src].get("user_id")
+                if not src_owner or src_owner == user_id:
+                    continue  # collected above
+                rows.append(self._column(src, node_attrs[src]))
+                cols.append(self._column(dst, node_attrs[dst]))
+                weights.append(edge_weight(data))
+                keys.append((src, dst))
+
+        n_nodes = len(self.node_ids)
+        row_array = np.asarray(rows, dtype=np.int64)
+        order = np.argsort(row_array, kind="stable")
+        self.indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_array, minlength=n_nodes), out=self.indptr[1:])
+        self.indices = np.asarray(cols, dtype=np.int64)[order]
+        self.weights = np.asarray(weights, dtype=np.float64)[order]
+        self.keys = [keys[i] for i in order.tolist()]
+        self.edge_pos = {key: pos for pos, key in enumerate(self.keys)}
+        self.owned = np.fromiter(
+            (_owns(owner, user_id) for owner in self._owners),
+            dtype=bool,
+            count=n_nodes,
+        )
+        self._base_rows = n_nodes
+
+    def _column(self, node: Hashable, attrs: dict[str, Any]) -> int:
+        col = self.index.get(node)
+        if col is None:
+            col = len(self.node_ids)
+            self.index[node] = col
+            self.node_ids.append(node)
+            self._owners.append(attrs.get("user_id"))
+        return col
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edge slots (including tombstones and overlay edges)."""
+        return len(self.keys) + len(self._pending_keys)
+
+    def _over_limit(self) -> bool:
+        return self.stale > max(_MIN_STALE_EDGES, _STALE_RATIO * len(self.keys))
+
+    # ---- sync ----------------------------------------------------------------
+
+    def node_changed(self, graph: TrackedDiGraph, node: Hashable) -> bool:
+        """Apply a node mutation. Returns False if the shard must be rebuilt."""
+        col = self.index.get(node)
+        attrs = graph._node.get(node)
+        if attrs is None:
+            # Removed (its edges are reported separately)
+            return True
+        owner = attrs.get("user_id")
+        if col is None:
+            # Unknown nodes have no shard edges; re-owning may bring some in
+            if not _visible(owner, self.user_id):
+                return True
+            return not any(
+                _in_shard(owner, graph._node[dst].get("user_id"), self.user_id)
+                for dst in graph._succ[node]
+            ) and not any(
+                _in_shard(graph._node[src].get("user_id"), owner, self.user_id)
+                for src in graph._pred[node]
+            )
+        return owner == self._owners[col]
+
+    def edge_changed(self, graph: TrackedDiGraph, src: Hashable, dst: Hashable) -> bool:
+        """Apply an edge mutation. Returns False if the shard must be rebuilt."""
+        key = (src, dst)
+        data = graph._succ.get(src, {}).get(dst)
+
+        pos = self.edge_pos.get(key)
+        if pos is not None:
+            if data is None:
+                if not math.isnan(self.weights[pos]):
+                    self.weights[pos] = np.nan
+                    self.stale += 1
+            else:
+                self.weights[pos] = edge_weight(data)
+            return not self._over_limit()
+
+        if key in self._pending_keys:
+            if data is None:
+                row, col = self._pending_keys.pop(key)
+                del self.pending[row][col]
+                if not self.pending[row]:
+                    del self.pending[row]
+            # Overlay weights are read from the graph when gathered
+            return True
+
+        if data is None:
+            return True
+        src_attrs = graph._node[src]
+        dst_attrs = graph._node[dst]
+        if not _in_shard(
+            src_attrs.get("user_id"), dst_attrs.get("user_id"), self.user_id
+        ):
+            return True
+
+        n_nodes = len(self.node_ids)
+        row = self._column(src, src_attrs)
+        col = self._column(dst, dst_attrs)
+        self.pending.setdefault(row, {})[col] = key
+        self._pending_keys[key] = (row, col)
+        self.stale += 1 + len(self.node_ids) - n_nodes
+        return not self._over_limit()
+
+    # ---- access --------------------------------------------------------------
+
+    def gather(
+        self, graph: TrackedDiGraph, rows: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Collect the outgoing edges of the given rows.
+
+        Args:
+            graph: Tracked graph (for overlay edge weights)
+            rows: Row numbers
+
+        Returns:
+            Tuple of (position in `rows` of each edge's source, destination
+            columns, weights); tombstoned edges have NaN weight
+        """
+        base = rows[rows < self._base_rows]
+        base_idx = np.flatnonzero(rows < self._base_rows)
+        starts = self.indptr[base]
+        lengths = self.indptr[base + 1] - starts
+        total = int(lengths.sum())
+        # Positions starts[i] .. starts[i] + lengths[i] - 1, concatenated
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        positions = offsets + np.arange(total, dtype=np.int64)
+        sources = np.repeat(base_idx, lengths)
+        columns = self.indices[positions]
+        weights = self.weights[positions]
+
+        if self.pending:
+            extra_src: list[int] = []
+            extra_col: list[int] = []
+            extra_w: list[float] = []
+            for i, row in enumerate(rows.tolist()):
+                for col, (src, dst) in self.pending.get(row, {}).items():
+                    extra_src.append(i)
+                    extra_col.append(col)
+                    extra_w.append(edge_weight(graph._succ[src][dst]))
+            if extra_src:
+                sources = np.concatenate([sources, np.asarray(extra_src, np.int64)])
+                columns = np.concatenate([columns, np.asarray(extra_col, np.int64)])
+                weights = np.concatenate([weights, np.asarray(extra_w, np.float64)])
+
+        return sources, columns, weights
+
+    def owned_edges(self) -> np.ndarray:
+        """Positions of live edges with an endpoint owned by the user.
+
+        Only meaningful on a compact shard (no overlay, see
+        NeuralAdjacency.shard(..., compact=True)).
+        """
+        rows = np.repeat(
+            np.arange(self._base_rows, dtype=np.int64), np.diff(self.indptr)
+        )
+        mask = (self.owned[rows] | self.owned[self.indices]) & ~np.isnan(self.weights)
+        return np.flatnonzero(mask)
+
+
+class NeuralAdjacency:
+    """Per-user CSR shards of a GraphMemory, kept in sync with the graph.
+
+    Example:
+        >>> adjacency = NeuralAdjacency(graph_memory)
+        >>> shard = adjacency.shard("user_001")
+        >>> sources, columns, weights = shard.gather(graph, rows)
+    """
+
+    def __init__(self, graph: GraphMemory, max_shards: int = _MAX_SHARDS) -> None:
+        """Initialize adjacency (shards are built on first use).
+
+        Args:
+            graph: Graph memory instance
+            max_shards: Shards kept in memory
+        """
+        self.graph = graph
+        self.max_shards = max_shards
+        self._graph: TrackedDiGraph | None = None
+        self._shards: OrderedDict[str | None, AdjacencyShard] = OrderedDict()
+
+    @property
+    def tracked_graph(self) -> TrackedDiGraph:
+        """The current graph, (re)subscribing if GraphMemory.graph was replaced."""
+        graph = self.graph.graph
+        if graph is not self._graph:
+            if self._graph is not None:
+                self._graph.remove_listener(self._on_change)
+            graph.add_listener(self._on_change)
+            self._graph = graph
+            self._shards.clear()
+        return graph
+
+    def shard(self, user_id: str | None, compact: bool = False) -> AdjacencyShard:
+        """Return the shard of edges visible to a user.
+
+        Args:
+            user_id: User ID (None = all edges, SHARED_EDGES = edges between
+                unowned nodes)
+            compact: Rebuild first if the shard has overlay edges, tombstones
+                or appended nodes (needed for owned_edges())
+
+        Returns:
+            Up-to-date AdjacencyShard
+        """
+        graph = self.tracked_graph
+        shard = self._shards.get(user_id)
+        if shard is None or (compact and shard.stale):
+            shard = AdjacencyShard(graph, user_id)
+            logger.debug(
+                f"Built adjacency shard for user {user_id}: "
+                f"{len(shard.node_ids)} nodes, {shard.edge_count} edges"
+            )
+            self._shards[user_id] = shard
+            while len(self._shards) > self.max_shards:
+                self._shards.popitem(last=False)
+        self._shards.move_to_end(user_id)
+        return shard
+
+    def invalidate(self) -> None:
+        """Drop all shards."""
+        self._shards.clear()
+
+    def _on_change(self, kind: str, key: Any) -> None:
+        if kind == "reset":
+            self._shards.clear()
+            return
+        graph = self._graph
+        assert graph is not None
+        for user_id, shard in list(self._shards.items()):
+            if kind == "edge":
+                in_sync = shard.edge_changed(graph, *key)
+            else:
+                in_sync = shard.node_changed(graph, key)
+            if not in_sync:
+                del self._shards[user_id]
@@ -6,11 +6,30 @@ discovery of associations through usage patterns.
 
 "Cells that fire together, wire together" - the co-activation tracker
 identifies which cells are firing together.
+
+Memory use is bounded per user:
+
+- The time window is a ring buffer of at most ``co_activation_max_events``
+  activation events. A new event only counts the pairs it creates (pairs
+  within the event, and between the event and nodes already in the
+  window), instead of re-deriving every pair in the window.
+- Pair statistics are a top-K heavy-hitter table of at most
+  ``co_activation_max_pairs`` entries (Space-Saving algorithm: when full,
+  the least frequent pair is replaced and the newcomer inherits its count,
+  so frequent pairs are never lost and counts never under-estimate).
+
+Pair statistics are optionally persisted to SQLite (write-through per
+event) so learned associations survive restarts; the short time window is
+kept in memory only. New co-activations are also collected as pair deltas
+that HebbianLearner consumes via drain_pair_deltas().
 """
 
+import heapq
 import logging
-from collections import defaultdict
+import sqlite3
+from collections import defaultdict, deque
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
 from .config import NeuralMemoryConfig
@@ -18,6 +37,8 @@ from .models import ActivationState, CoActivationRecord
 
 logger = logging.getLogger(__name__)
 
+Pair = tuple[str, str]
+
 
 class CoActivationTracker:
     """Tracks co-activation patterns for Hebbian learning.
@@ -26,23 +47,39 @@ class CoActivationTracker:
     nodes are activated together (within the same retrieval session).
     """
 
-    def __init__(self, config: NeuralMemoryConfig) -> None:
+    def __init__(self, config: NeuralMemoryConfig, db_path: Path | None = None) -> None:
         """Initialize co-activation tracker.
 
         Args:
             config: Neural memory configuration
+            db_path: SQLite file for pair statistics (None = in-memory only)
         """
         self.config = config
-
-        # Map: user_id -> list of (timestamp, set of activated node IDs)
-        self._activation_history: dict[str, list[tuple[datetime, set[str]]]] = (
-            defaultdict(list)
+        self.db_path = db_path
+
+        # Map: user_id -> ring buffer of (timestamp, {node_id: activation})
+        self._activation_history: dict[
+            str, deque[tuple[datetime, dict[str, float]]]
+        ] = defaultdict(deque)
+        # Map: user_id -> {node_id: (events in window, latest activation)}
+        self._window_nodes: dict[str, dict[str, tuple[int, float]]] = defaultdict(
+            dict
         )
 
         # Map: user_id -> {(node_1, node_2): CoActivationRecord}
         self._co_activation_records: dict[
             str, dict[tuple[str, str], CoActivationRecord]
         ] = defaultdict(dict)
+        # Space-Saving bookkeeping: inherited count per pair, lazy min-heap
+        self._errors: dict[str, dict[Pair, int]] = defaultdict(dict)
+        self._heaps: dict[str, list[tuple[int, Pair]]] = defaultdict(list)
+        # New co-activations not yet consumed: pair -> [count, product sum]
+        self._pending: dict[str, dict[Pair, list[float]]] = defaultdict(dict)
+
+        self._loaded_users: set[str] = set()
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._init_db()
 
     def record_activation(
         self,
@@ -66,36 +103,72 @@ class CoActivationTracker:
         if not activations:
             return []
 
+        self._ensure_loaded(user_id)
         timestamp = datetime.utcnow()
-        activated_ids = {act.node_id for act in activations}
+        activated: dict[str, float] = {}
+        for act in activations:
+            activated[act.node_id] = max(
+                act.activation, activated.get(act.node_id, act.activation)
+            )
 
         # Clean old history (outside time window)
         self._clean_old_history(user_id, timestamp)
 
-        # Add to history
-        self._activation_history[user_id].append((timestamp, activated_ids))
+        # Detect the co-activations created by this event
+        co_activated_pairs = self._find_co_activations_in_window(user_id, activated)
 
-        # Detect co-activations within the time window
-        co_activated_pairs = self._find_co_activations_in_window(user_id, timestamp)
+        # Add to history
+        self._append_event(user_id, timestamp, activated)
 
         # Update co-activation records
-        updated_records = []
+        updated: dict[Pair, CoActivationRecord] = {}
+        evicted: set[Pair] = set()
         for node_1, node_2, act_1, act_2 in co_activated_pairs:
-            record = self._update_co_activation_record(
+            record, evicted_key = self._update_co_activation_record(
                 user_id=user_id,
                 node_1=node_1,
                 node_2=node_2,
                 activation_1=act_1,
                 activation_2=act_2,
             )
-            updated_records.append(record)
+            key = (record.node_id_1, record.node_id_2)
+            updated[key] = record
+            if evicted_key is not None:
+                evicted.add(evicted_key)
+                updated.pop(evicted_key, None)
+
+        self._save(user_id, list(updated.values()), evicted)
 
         logger.debug(
             f"Recorded {len(activations)} activations for user {user_id}, "
-            f"detected {len(updated_records)} co-activations"
+            f"detected {len(co_activated_pairs)} co-activations"
         )
 
-        return updated_records
+        return list(updated.values())
+
+    def drain_pair_deltas(self, user_id: str) -> list[CoActivationRecord]:
+        """Return and reset the co-activations recorded since the last call.
+
+        Each returned record holds, for one pair, the number of new
+        co-activations (count) and the sum of their activation products.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of per-pair deltas
+        """
+        pending = self._pending.pop(user_id, {})
+        return [
+            CoActivationRecord(
+                node_id_1=node_1,
+                node_id_2=node_2,
+                count=int(count),
+                total_activation_product=product,
+                user_id=user_id,
+            )
+            for (node_1, node_2), (count, product) in pending.items()
+        ]
 
     def get_co_activation_record(
         self, user_id: str, node_1: str, node_2: str
@@ -114,6 +187,7 @@ class CoActivationTracker:
         if node_1 > node_2:
             node_1, node_2 = node_2, node_1
 
+        self._ensure_loaded(user_id)
         return self._co_activation_records[user_id].get((node_1, node_2))
 
     def get_all_co_activations(
@@ -132,6 +206,7 @@ class CoActivationTracker:
             min_count if min_count is not None else self.config.min_co_activation_count
         )
 
+        self._ensure_loaded(user_id)
         records = list(self._co_activation_records[user_id].values())
 
         if min_count > 0:
@@ -155,6 +230,7 @@ class CoActivationTracker:
         Returns:
             List of (other_node_id, CoActivationRecord) tuples
         """
+        self._ensure_loaded(user_id)
         related = []
 
         for (n1, n2), record in self._co_activation_records[user_id].items():
@@ -178,50 +254,63 @@ class CoActivationTracker:
         window_seconds = self.config.co_activation_window
         cutoff_time = current_time - timedelta(seconds=window_seconds)
 
-        # Filter history
-        self._activation_history[user_id] = [
-            (ts, ids)
-            for ts, ids in self._activation_history[user_id]
-            if ts >= cutoff_time
-        ]
+        history = self._activation_history[user_id]
+        while history and history[0][0] < cutoff_time:
+            self._evict_oldest_event(user_id)
+
+    def _append_event(
+        self, user_id: str, timestamp: datetime, activated: dict[str, float]
+    ) -> None:
+        """Add an event to the window, dropping the oldest if it is full."""
+        self._activation_history[user_id].append((timestamp, activated))
+        window_nodes = self._window_nodes[user_id]
+        for node_id, activation in activated.items():
+            events, _ = window_nodes.get(node_id, (0, 0.0))
+            window_nodes[node_id] = (events + 1, activation)
+
+        while len(self._activation_history[user_id]) > (
+            self.config.co_activation_max_events
+        ):
+            self._evict_oldest_event(user_id)
+
+    def _evict_oldest_event(self, user_id: str) -> None:
+        _, activated = self._activation_history[user_id].popleft()
+        window_nodes = self._window_nodes[user_id]
+        for node_id in activated:
+            events, activation = window_nodes[node_id]
+            if events <= 1:
+                del window_nodes[node_id]
+            else:
+                window_nodes[node_id] = (events - 1, activation)
 
     def _find_co_activations_in_window(
-        self, user_id: str, current_time: datetime
+        self, user_id: str, activated: dict[str, float]
     ) -> list[tuple[str, str, float, float]]:
-        """Find all co-activated pairs within the time window.
+        """Find the pairs co-activated by a new event.
+
+        Pairs within the event, plus pairs between the event and nodes
+        already activated in the window (using their latest activation).
+        Pairs made only of earlier events were counted when they occurred.
 
         Args:
             user_id: User ID
-            current_time: Current timestamp
+            activated: Map of node_id -> activation for the new event
 
         Returns:
             List of (node_1, node_2, activation_1, activation_2) tuples
         """
-        # Get all activated nodes in the window
-        window_seconds = self.config.co_activation_window
-        cutoff_time = current_time - timedelta(seconds=window_seconds)
-
-        # Collect all node IDs activated in this window
-        all_activated: dict[str, list[float]] = defaultdict(list)
-
-        for ts, node_ids in self._activation_history[user_id]:
-            if ts >= cutoff_time:
-                for node_id in node_ids:
-                    # For simplicity, assume activation = 1.0 (can be refined)
-                    all_activated[node_id].append(1.0)
-
-        # Find pairs of nodes that were both activated
         co_activated_pairs = []
-        node_ids = list(all_activated.keys())
+        event_nodes = list(activated.items())
 
-        for i, node_1 in enumerate(node_ids):
-            for node_2 in node_ids[i + 1 :]:  # Avoid duplicates
-                # Both nodes were activated in this window
-                # Calculate average activation (for Hebbian update)
-                avg_act_1 = sum(all_activated[node_1]) / len(all_activated[node_1])
-                avg_act_2 = sum(all_activated[node_2]) / len(all_activated[node_2])
+        for i, (node_1, act_1) in enumerate(event_nodes):
+            for node_2, act_2 in event_nodes[i + 1 :]:  # Avoid duplicates
+                co_activated_pairs.append((node_1, node_2, act_1, act_2))
 
-                co_activated_pairs.append((node_1, node_2, avg_act_1, avg_act_2))
+        for node_2, (_, act_2) in self._window_nodes[user_id].items():
+            if node_2 in activated:
+                continue
+            for node_1, act_1 in event_nodes:
+                co_activated_pairs.append((node_1, node_2, act_1, act_2))
 
         return co_activated_pairs
 
@@ -232,7 +321,7 @@ class CoActivationTracker:
         node_2: str,
         activation_1: float,
         activation_2: float,
-    ) -> CoActivationRecord:
+    ) -> tuple[CoActivationRecord, Pair | None]:
         """Update or create a co-activation record.
 
         Args:
@@ -243,7 +332,8 @@ class CoActivationTracker:
             activation_2: Activation strength of node 2
 
         Returns:
-            Updated/created CoActivationRecord
+            Tuple of (updated/created CoActivationRecord, pair evicted to
+            make room or None)
         """
         # Ensure ordering
         if node_1 > node_2:
@@ -251,28 +341,68 @@ class CoActivationTracker:
             activation_1, activation_2 = activation_2, activation_1
 
         key = (node_1, node_2)
+        records = self._co_activation_records[user_id]
+        product = activation_1 * activation_2
+        evicted = None
 
-        if key in self._co_activation_records[user_id]:
+        if key in records:
             # Update existing record
-            record = self._co_activation_records[user_id][key]
+            record = records[key]
             record.update(activation_1, activation_2)
         else:
-            # Create new record
+            # Create new record, replacing the least frequent pair if full
+            inherited = 0
+            if len(records) >= self.config.co_activation_max_pairs:
+                evicted, inherited = self._evict_least_frequent(user_id)
             record = CoActivationRecord(
                 node_id_1=node_1,
                 node_id_2=node_2,
-                count=1,
-                total_activation_product=activation_1 * activation_2,
+                count=inherited + 1,
+                total_activation_product=product * (inherited + 1),
                 user_id=user_id,
             )
-            self._co_activation_records[user_id][key] = record
+            records[key] = record
+            if inherited:
+                self._errors[user_id][key] = inherited
+
+        self._push_heap(user_id, record.count, key)
+        pending = self._pending[user_id].setdefault(key, [0, 0.0])
+        pending[0] += 1
+        pending[1] += product
 
         logger.debug(
             f"Co-activation record updated: ({node_1}, {node_2}) "
             f"count={record.count}, avg_product={record.average_activation_product:.4f}"
         )
 
-        return record
+        return record, evicted
+
+    def _push_heap(self, user_id: str, count: int, key: Pair) -> None:
+        heap = self._heaps[user_id]
+        heapq.heappush(heap, (count, key))
+        records = self._co_activation_records[user_id]
+        # Entries go stale on every increment; rebuild before the heap bloats
+        if len(heap) > 4 * len(records) + 64:
+            heap[:] = [(r.count, k) for k, r in records.items()]
+            heapq.heapify(heap)
+
+    def _evict_least_frequent(self, user_id: str) -> tuple[Pair | None, int]:
+        """Remove the pair with the lowest count.
+
+        Returns:
+            Tuple of (evicted pair, its count)
+        """
+        heap = self._heaps[user_id]
+        records = self._co_activation_records[user_id]
+        while heap:
+            count, key = heapq.heappop(heap)
+            record = records.get(key)
+            if record is not None and record.count == count:
+                del records[key]
+                self._errors[user_id].pop(key, None)
+                self._pending[user_id].pop(key, None)
+                return key, count
+        return None, 0
 
     def clear_user_data(self, user_id: str) -> None:
         """Clear all co-activation data for a user (GDPR compliance).
@@ -280,11 +410,21 @@ class CoActivationTracker:
         Args:
             user_id: User ID to clear
         """
-        if user_id in self._activation_history:
-            del self._activation_history[user_id]
-
-        if user_id in self._co_activation_records:
-            del self._co_activation_records[user_id]
+        for store in (
+            self._activation_history,
+            self._window_nodes,
+            self._co_activation_records,
+            self._errors,
+            self._heaps,
+            self._pending,
+        ):
+            store.pop(user_id, None)  # type: ignore[attr-defined]
+
+        if self.db_path is not None:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM co_activations WHERE user_id = ?", (user_id,))
+                conn.commit()
+        self._loaded_users.add(user_id)
 
         logger.info(f"Cleared co-activation data for user {user_id}")
 
@@ -297,6 +437,7 @@ class CoActivationTracker:
         Returns:
             Dict with statistics
         """
+        self._ensure_loaded(user_id)
         records = self._co_activation_records[user_id].values()
 
         if not records:
@@ -315,4 +456,100 @@ class CoActivationTracker:
             "max_count": max(counts),
             "min_count": min(counts),
             "history_size": len(self._activation_history[user_id]),
+            "max_pairs": self.config.co_activation_max_pairs,
         }
+
+    # ---- persistence ---------------------------------------------------------
+
+    def _init_db(self) -> None:
+        """Create tables if they don't exist."""
+        assert self.db_path is not None
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS co_activations (
+                    user_id TEXT NOT NULL,
+                    node_1 TEXT NOT NULL,
+                    node_2 TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    error INTEGER NOT NULL DEFAULT 0,
+                    total_product REAL NOT NULL,
+                    last_co_activation TEXT NOT NULL,
+                    PRIMARY KEY (user_id, node_1, node_2)
+                )
+                """
+            )
+            conn.commit()
+
+    def _ensure_loaded(self, user_id: str) -> None:
+        """Load a user's pair statistics from SQLite on first use."""
+        if self.db_path is None or user_id in self._loaded_users:
+            return
+        self._loaded_users.add(user_id)
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT node_1, node_2, count, error, total_product,
+                       last_co_activation
+                FROM co_activations WHERE user_id = ?
+                ORDER BY count DESC LIMIT ?
+                """,
+                (user_id, self.config.co_activation_max_pairs),
+            ).fetchall()
+
+        records = self._co_activation_records[user_id]
+        errors = self._errors[user_id]
+        for node_1, node_2, count, error, total_product, last in rows:
+            records[(node_1, node_2)] = CoActivationRecord(
+                node_id_1=node_1,
+                node_id_2=node_2,
+                count=count,
+                last_co_activation=datetime.fromisoformat(last),
+                total_activation_product=total_product,
+                user_id=user_id,
+            )
+            if error:
+                errors[(node_1, node_2)] = error
+
+        heap = [(r.count, k) for k, r in records.items()]
+        heapq.heapify(heap)
+        self._heaps[user_id] = heap
+        if rows:
+            logger.debug(f"Loaded {len(rows)} co-activation pairs for user {user_id}")
+
+    def _save(
+        self, user_id: str, records: list[CoActivationRecord], evicted: set[Pair]
+    ) -> None:
+        """Write changed and evicted pairs through to SQLite."""
+        if self.db_path is None or not (records or evicted):
+            return
+
+        errors = self._errors[user_id]
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "DELETE FROM co_activations "
+                "WHERE user_id = ? AND node_1 = ? AND node_2 = ?",
+                [(user_id, n1, n2) for n1, n2 in evicted],
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO co_activations
+                    (user_id, node_1, node_2, count, error, total_product,
+                     last_co_activation)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        user_id,
+                        r.node_id_1,
+                        r.node_id_2,
+                        r.count,
+                        errors.get((r.node_id_1, r.node_id_2), 0),
+                        r.total_activation_product,
+                        r.last_co_activation.isoformat(),
+                    )
+                    for r in records
+                ],
+            )
+            conn.commit()
@@ -40,6 +40,9 @@ class NeuralMemoryConfig:
         track_co_activation: Enable co-activation tracking
         co_activation_window: Time window (seconds) for same-session tracking
         min_co_activation_count: Minimum count to create/strengthen edge
+        co_activation_max_events: Activation events kept per user in the
+            window (ring buffer)
+        co_activation_max_pairs: Node pairs tracked per user (top-K by count)
 
         # Forgetting/Decay
         enable_decay: Enable automatic edge weight decay
@@ -90,6 +93,8 @@ class NeuralMemoryConfig:
     track_co_activation: bool = True
     co_activation_window: int = 300  # 5 minutes
     min_co_activation_count: int = 2
+    co_activation_max_events: int = 32
+    co_activation_max_pairs: int = 10000
 
     # Forgetting/Decay
     enable_decay: bool = True
@@ -161,6 +166,16 @@ class NeuralMemoryConfig:
                 f"min_co_activation_count must be positive, "
                 f"got {self.min_co_activation_count}"
             )
+        if not self.co_activation_max_events > 0:
+            raise ValueError(
+                f"co_activation_max_events must be positive, "
+                f"got {self.co_activation_max_events}"
+            )
+        if not self.co_activation_max_pairs > 0:
+            raise ValueError(
+                f"co_activation_max_pairs must be positive, "
+                f"got {self.co_activation_max_pairs}"
+            )
 
         if not self.decay_rate >= 0:
             raise ValueError(f"decay_rate must be non-negative, got {self.decay_rate}")
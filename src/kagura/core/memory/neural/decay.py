@@ -5,22 +5,47 @@ memory bloat and enable graceful forgetting of unused associations.
 
 Biological inspiration: Memories that are not reinforced fade over time,
 allowing new information to be learned without interference.
+
+Decay and pruning operate on one user's edges (edges with an endpoint owned
+by the user), read from the per-user CSR shard in adjacency.py, so the
+weight math and threshold checks are vectorized instead of walking every
+edge in the global graph. Edges between unowned nodes are decayed under the
+SHARED_EDGES key.
+
+Each decayed edge records ``last_decayed``, which is saved with the graph.
+Δt is measured from it, so a fresh process (``kagura memory maintain``
+run from cron) applies the decay of the whole time since the last run.
 """
 
 import logging
-import math
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import networkx as nx
+import numpy as np
 
 from kagura.core.graph.memory import GraphMemory
 
+from .adjacency import NeuralAdjacency
 from .config import NeuralMemoryConfig
 
 logger = logging.getLogger(__name__)
 
 
+def _seconds_since(value: Any, now: datetime, default: float) -> float:
+    """Seconds from a stored timestamp (datetime or string) to now (UTC)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return default
+    if not isinstance(value, datetime):
+        return default
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (now - value).total_seconds()
+
+
 class DecayManager:
     """Manages automatic forgetting and weight decay for neural memory."""
 
@@ -28,25 +53,30 @@ class DecayManager:
         self,
         graph: GraphMemory,
         config: NeuralMemoryConfig,
+        adjacency: NeuralAdjacency | None = None,
     ) -> None:
         """Initialize decay manager.
 
         Args:
             graph: Graph memory instance
             config: Neural memory configuration
+            adjacency: Shared CSR adjacency (created if omitted)
         """
         self.graph = graph
         self.config = config
+        self.adjacency = adjacency or NeuralAdjacency(graph)
         self._last_decay_time: datetime | None = None
+        self._last_decay_by_user: dict[str, datetime] = {}
 
     def apply_decay(self, user_id: str) -> dict[str, int | float]:
-        """Apply exponential decay to all edge weights.
+        """Apply exponential decay to the user's edge weights.
 
         Formula:
             w_ij(t+Δt) = w_ij(t) · exp(-decay_rate · Δt)
 
         Args:
-            user_id: User ID (for filtering user-specific edges)
+            user_id: User ID (edges with an endpoint owned by this user), or
+                SHARED_EDGES for edges between unowned nodes
 
         Returns:
             Dict with statistics (edges_decayed, edges_pruned, delta_seconds)
@@ -57,49 +87,57 @@ class DecayManager:
 
         current_time = datetime.utcnow()
 
-        # Calculate time delta
-        if self._last_decay_time:
-            delta_seconds = (current_time - self._last_decay_time).total_seconds()
+        # Edges never decayed: since this process last decayed the user, or
+        # one default interval on the first run
+        last_decay_time = self._last_decay_by_user.get(user_id)
+        if last_decay_time:
+            default_seconds = (current_time - last_decay_time).total_seconds()
         else:
-            # First run - use default interval
-            delta_seconds = self.config.decay_background_interval
-
+            default_seconds = self.config.decay_background_interval
+
+        graph = self.adjacency.tracked_graph
+        shard = self.adjacency.shard(user_id, compact=True)
+        positions = shard.owned_edges()
+        keys = shard.keys
+
+        # Δt per edge, from its persisted last_decayed
+        succ = graph._succ
+        deltas = np.fromiter(
+            (
+                _seconds_since(
+                    succ[src][dst].get("last_decayed"), current_time, default_seconds
+                )
+                for src, dst in (keys[pos] for pos in positions.tolist())
+            ),
+            dtype=np.float64,
+            count=len(positions),
+        )
+        delta_seconds = float(deltas.max()) if len(deltas) else default_seconds
         if delta_seconds <= 0:
             return {"edges_decayed": 0, "edges_pruned": 0}
 
-        # Apply decay to all edges
-        edges_to_remove = []
-        edges_decayed = 0
-
-        for src, dst, data in self.graph.graph.edges(data=True):  # type: ignore[misc]
-            current_weight = data.get("weight", 0.0) if data else 0.0
-
-            # Calculate decay factor
-            # Note: decay_rate is per-second rate
-            decay_factor = math.exp(-self.config.decay_rate * delta_seconds)
-            new_weight = current_weight * decay_factor
-
-            # Update weight
-            if new_weight >= self.config.prune_threshold:
-                self.graph.graph[src][dst]["weight"] = new_weight
-                self.graph.graph[src][dst]["last_decayed"] = current_time
-                edges_decayed += 1
-            else:
-                # Mark for removal (below threshold)
-                edges_to_remove.append((src, dst))
-
-        # Remove weak edges
-        for src, dst in edges_to_remove:
-            try:
-                self.graph.graph.remove_edge(src, dst)
-                logger.debug(f"Pruned weak edge ({src}, {dst}) during decay")
-            except nx.NetworkXError:
-                pass
+        # Note: decay_rate is per-second rate
+        decay_factors = np.exp(-self.config.decay_rate * np.maximum(deltas, 0.0))
+        new_weights = shard.weights[positions] * decay_factors
+        kept = new_weights >= self.config.prune_threshold
 
+        # Write decayed weights back to the graph
+        for pos, new_weight in zip(
+            positions[kept].tolist(), new_weights[kept].tolist()
+        ):
+            src, dst = keys[pos]
+            succ[src][dst].update(weight=new_weight, last_decayed=current_time)
+
+        # Remove weak edges (below threshold)
+        edges_to_remove = [keys[pos] for pos in positions[~kept].tolist()]
+        self._remove_edges(edges_to_remove, reason="during decay")
+
+        self._last_decay_by_user[user_id] = current_time
         self._last_decay_time = current_time
+        edges_decayed = int(kept.sum())
 
         logger.info(
-            f"Applied decay: {edges_decayed} edges decayed, "
+            f"Applied decay for user {user_id}: {edges_decayed} edges decayed, "
             f"{len(edges_to_remove)} edges pruned "
             f"(Δt={delta_seconds:.0f}s)"
         )
@@ -111,7 +149,7 @@ class DecayManager:
         }
 
     def prune_weak_edges(self, user_id: str, threshold: float | None = None) -> int:
-        """Prune edges below a weight threshold.
+        """Prune the user's edges below a weight threshold.
 
         Args:
             user_id: User ID
@@ -122,18 +160,11 @@ class DecayManager:
         """
         threshold = threshold if threshold is not None else self.config.prune_threshold
 
-        edges_to_remove = []
-
-        for src, dst, data in self.graph.graph.edges(data=True):  # type: ignore[misc]
-            weight = data.get("weight", 0.0) if data else 0.0
-            if weight < threshold:
-                edges_to_remove.append((src, dst))
-
-        for src, dst in edges_to_remove:
-            try:
-                self.graph.graph.remove_edge(src, dst)
-            except nx.NetworkXError:
-                pass
+        shard = self.adjacency.shard(user_id, compact=True)
+        positions = shard.owned_edges()
+        weak = positions[shard.weights[positions] < threshold]
+        edges_to_remove = [shard.keys[pos] for pos in weak.tolist()]
+        self._remove_edges(edges_to_remove)
 
         logger.info(
             f"Pruned {len(edges_to_remove)} weak edges (threshold={threshold:.4f})"
@@ -141,13 +172,23 @@ class DecayManager:
 
         return len(edges_to_remove)
 
+    def _remove_edges(self, edges: list[tuple[str, str]], reason: str = "") -> None:
+        """Remove edges from the graph, ignoring ones already gone."""
+        for src, dst in edges:
+            try:
+                self.graph.graph.remove_edge(src, dst)
+                if reason:
+                    logger.debug(f"Pruned weak edge ({src}, {dst}) {reason}")
+            except nx.NetworkXError:
+                pass
+
     def prune_old_nodes(
         self, user_id: str, age_days: float, importance_threshold: float = 0.3
     ) -> int:
-        """Prune old, low-importance nodes.
+        """Prune the user's old, low-importance nodes.
 
         Args:
-            user_id: User ID
+            user_id: User ID (nodes whose user_id attribute matches)
             age_days: Age threshold in days
             importance_threshold: Importance threshold [0, 1]
 
@@ -159,9 +200,9 @@ class DecayManager:
 
         nodes_to_remove = []
 
-        for node_id, node_data in self.graph.graph.nodes(data=True):  # type: ignore[misc]
-            if not node_data:
-                continue
+        graph = self.adjacency.tracked_graph
+        for node_id in list(graph.index.nodes_by_user.get(user_id, ())):
+            node_data = graph._node[node_id]
 
             # Check if this is a memory node (has created_at)
             created_at = node_data.get("created_at")
@@ -171,6 +212,8 @@ class DecayManager:
             # Check age
             if isinstance(created_at, str):
                 created_at = datetime.fromisoformat(created_at)
+            if created_at.tzinfo is not None:
+                created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
 
             if created_at > cutoff_time:
                 continue  # Too recent
@@ -12,6 +12,7 @@ Usage:
 import asyncio
 import logging
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
@@ -19,10 +20,12 @@ from kagura.core.graph.memory import GraphMemory
 from kagura.core.memory.rag import MemoryRAG
 
 from .activation import ActivationSpreader
+from .adjacency import NeuralAdjacency
 from .co_activation import CoActivationTracker
 from .config import NeuralMemoryConfig
 from .decay import DecayManager
 from .hebbian import HebbianLearner
+from .maintenance import MaintenanceScheduler
 from .models import (
     ActivationState,
     MemoryKind,
@@ -34,6 +37,9 @@ from .scoring import UnifiedScorer
 
 logger = logging.getLogger(__name__)
 
+# Seconds between maintenance ticks while users are still queued
+_BACKLOG_TICK_INTERVAL = 1.0
+
 
 class NeuralMemoryEngine:
     """Neural Memory Network engine.
@@ -59,12 +65,25 @@ class NeuralMemoryEngine:
         self.rag = rag
         self.config = config or NeuralMemoryConfig()
 
-        # Initialize components
-        self.activation_spreader = ActivationSpreader(graph, self.config)
+        # Initialize components (spreading and decay share one CSR adjacency)
+        self.adjacency = NeuralAdjacency(graph)
+        self.activation_spreader = ActivationSpreader(
+            graph, self.config, adjacency=self.adjacency
+        )
         self.hebbian_learner = HebbianLearner(graph, self.config)
-        self.co_activation_tracker = CoActivationTracker(self.config)
-        self.decay_manager = DecayManager(graph, self.config)
+        # Learned co-activation statistics persist next to the graph
+        persist_path = getattr(graph, "persist_path", None)
+        self.co_activation_tracker = CoActivationTracker(
+            self.config,
+            db_path=persist_path.with_name("co_activation.db")
+            if isinstance(persist_path, Path)
+            else None,
+        )
+        self.decay_manager = DecayManager(graph, self.config, adjacency=self.adjacency)
         self.scorer = UnifiedScorer(self.config, self.activation_spreader)
+        self.maintenance = MaintenanceScheduler(
+            graph, self.config, decay_manager=self.decay_manager
+        )
 
         # Background task handle
         self._decay_task: asyncio.Task | None = None
@@ -155,9 +174,16 @@ class NeuralMemoryEngine:
         ]
         self.co_activation_tracker.record_activation(user_id, activated_nodes)
 
-        # 6. Queue Hebbian updates (async)
+        # 6. Queue Hebbian updates (async) for the new co-activations
         nodes_dict = {result.node.id: result.node for result in scored_results}
-        self.hebbian_learner.queue_update(user_id, activated_nodes, nodes_dict)
+        if self.config.track_co_activation:
+            self.hebbian_learner.queue_co_activations(
+                user_id,
+                self.co_activation_tracker.drain_pair_deltas(user_id),
+                nodes_dict,
+            )
+        else:
+            self.hebbian_learner.queue_update(user_id, activated_nodes, nodes_dict)
 
         # Schedule async update application
         asyncio.create_task(self._apply_hebbian_updates_async(user_id))
@@ -431,16 +457,27 @@ class NeuralMemoryEngine:
 
     async def _background_decay_loop(self) -> None:
         """Background loop for periodic decay application."""
+        interval = self.config.decay_background_interval
+        delay = interval
         while True:
             try:
-                await asyncio.sleep(self.config.decay_background_interval)
-
-                # Apply decay for all users (simplified - in production, would batch)
-                # user_ids = self._get_all_user_ids()
-                # for user_id in user_ids:
-                #     self.decay_manager.apply_decay(user_id)
+                await asyncio.sleep(delay)
+
+                # One CPU-budgeted tick per wake-up. A backlog (recall keeps
+                # marking users dirty) is worked off by later ticks, at most
+                # one per _BACKLOG_TICK_INTERVAL, so recall is not starved
+                stats = await self.maintenance.run_tick()
+                delay = (
+                    min(_BACKLOG_TICK_INTERVAL, interval)
+                    if stats.pending_users
+                    else interval
+                )
 
-                logger.debug("Background decay cycle completed")
+                logger.debug(
+                    f"Background decay tick completed: {stats.users} users, "
+                    f"{stats.edges_pruned} edges pruned, "
+                    f"{stats.pending_users} users pending"
+                )
 
             except asyncio.CancelledError:
                 logger.info("Background decay loop cancelled")
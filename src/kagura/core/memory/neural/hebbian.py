@@ -25,7 +25,12 @@ from datetime import datetime
 from kagura.core.graph.memory import GraphMemory
 
 from .config import NeuralMemoryConfig
-from .models import ActivationState, HebbianUpdate, NeuralMemoryNode
+from .models import (
+    ActivationState,
+    CoActivationRecord,
+    HebbianUpdate,
+    NeuralMemoryNode,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -114,6 +119,76 @@ class HebbianLearner:
             f"for user {user_id}"
         )
 
+    def queue_co_activations(
+        self,
+        user_id: str,
+        co_activations: list[CoActivationRecord],
+        nodes: dict[str, NeuralMemoryNode] | None = None,
+    ) -> None:
+        """Queue Hebbian updates from co-activation pair deltas.
+
+        Consumes the deltas of CoActivationTracker.drain_pair_deltas()
+        instead of re-deriving pairs from an activation list. For a pair
+        co-activated `count` times with activation products summing to
+        Σ(a_i · a_j):
+
+            Δw = η · C_i · C_j · Σ(a_i · a_j) - count · λ · w_ij
+
+        which equals `count` single updates of the formula above.
+
+        Args:
+            user_id: User ID (for sharding)
+            co_activations: Pair deltas (count, total_activation_product)
+            nodes: Optional map of node_id -> NeuralMemoryNode for confidence
+                scores; other nodes use the ``confidence`` graph attribute
+        """
+        nodes = nodes or {}
+
+        for record in co_activations:
+            node_i, node_j = record.node_id_1, record.node_id_2
+            confidence_i = self._get_confidence(node_i, nodes)
+            confidence_j = self._get_confidence(node_j, nodes)
+            if confidence_i is None or confidence_j is None:
+                continue
+            if not self.config.enable_trust_modulation:
+                confidence_i = confidence_j = 1.0
+
+            current_weight = self._get_current_weight(user_id, node_i, node_j)
+            delta_w = (
+                self.config.learning_rate
+                * confidence_i
+                * confidence_j
+                * record.total_activation_product
+                - record.count * self.config.decay_lambda * current_weight
+            )
+
+            # Queue bidirectional updates (undirected graph)
+            for src_id, dst_id in ((node_i, node_j), (node_j, node_i)):
+                self._update_queue[user_id].append(
+                    HebbianUpdate(
+                        user_id=user_id,
+                        src_id=src_id,
+                        dst_id=dst_id,
+                        delta_weight=delta_w,
+                    )
+                )
+
+        logger.debug(
+            f"Queued {len(self._update_queue[user_id])} Hebbian updates "
+            f"for user {user_id} from {len(co_activations)} co-activated pairs"
+        )
+
+    def _get_confidence(
+        self, node_id: str, nodes: dict[str, NeuralMemoryNode]
+    ) -> float | None:
+        """Confidence of a node (None if the node is unknown)."""
+        if node_id in nodes:
+            return nodes[node_id].confidence
+        graph = self.graph.graph
+        if node_id in graph:
+            return graph.nodes[node_id].get("confidence", 1.0)
+        return None
+
     def apply_updates(self, user_id: str) -> int:
         """Apply all queued updates for a user (with gradient clipping).
 
@@ -0,0 +1,301 @@
+"""Background maintenance for neural memory.
+
+Decay, pruning and consolidation are per-user operations on DecayManager.
+:class:`MaintenanceScheduler` runs them for every user without stalling
+recall:
+
+- a FIFO work queue of users whose part of the graph changed (tracked
+  through the TrackedDiGraph listener hook) or whose last maintenance is
+  older than ``decay_background_interval``
+- users are processed one at a time, yielding to the event loop between
+  users, until the per-tick CPU budget is spent
+- every run reports edges decayed/pruned and nodes pruned/consolidated
+- edges between unowned nodes are maintained under the SHARED_EDGES key,
+  queued like a user
+
+Deferring decay for a user loses nothing: apply_decay() scales weights by
+exp(-rate · Δt) over the whole time since that user's last decay, which is
+the same as applying it in smaller steps.
+
+Usage:
+    scheduler = MaintenanceScheduler(graph, config)
+    stats = await scheduler.run_tick()  # in-process (one time slice)
+    stats = scheduler.run_once()  # CLI / cron (all due users)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable
+
+from kagura.core.graph.memory import GraphMemory
+from kagura.core.graph.store import TrackedDiGraph
+
+from .adjacency import SHARED_EDGES
+from .config import NeuralMemoryConfig
+from .decay import DecayManager
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MaintenanceStats:
+    """Result of one maintenance run.
+
+    Attributes:
+        users: Users processed
+        edges_decayed: Edges whose weight was decayed
+        edges_pruned: Edges removed (decayed below prune_threshold)
+        nodes_pruned: Old, low-importance nodes removed
+        nodes_consolidated: Nodes promoted to long-term memory
+        cpu_ms: CPU time spent (milliseconds)
+        pending_users: Users still queued after the run
+    """
+
+    users: int = 0
+    edges_decayed: int = 0
+    edges_pruned: int = 0
+    nodes_pruned: int = 0
+    nodes_consolidated: int = 0
+    cpu_ms: float = 0.0
+    pending_users: int = 0
+
+    def merge(self, other: "MaintenanceStats") -> None:
+        """Add another run's counters to this one."""
+        self.users += other.users
+        self.edges_decayed += other.edges_decayed
+        self.edges_pruned += other.edges_pruned
+        self.nodes_pruned += other.nodes_pruned
+        self.nodes_consolidated += other.nodes_consolidated
+        self.cpu_ms += other.cpu_ms
+        self.pending_users = other.pending_users
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+class MaintenanceScheduler:
+    """Time-sliced decay, pruning and consolidation across all users.
+
+    Example:
+        >>> scheduler = MaintenanceScheduler(graph, config, cpu_budget_ms=20)
+        >>> while scheduler.pending_users:
+        ...     await scheduler.run_tick()
+    """
+
+    def __init__(
+        self,
+        graph: GraphMemory,
+        config: NeuralMemoryConfig,
+        decay_manager: DecayManager | None = None,
+        cpu_budget_ms: float = 50.0,
+        prune_node_age_days: float | None = None,
+        prune_importance_threshold: float = 0.3,
+    ) -> None:
+        """Initialize scheduler (the graph is not touched until the first run).
+
+        Args:
+            graph: Graph memory instance
+            config: Neural memory configuration
+            decay_manager: Shared decay manager (created if omitted)
+            cpu_budget_ms: CPU time one tick may spend before yielding
+            prune_node_age_days: Also prune nodes older than this many days
+                with importance below prune_importance_threshold (None = keep)
+            prune_importance_threshold: Importance threshold for node pruning
+        """
+        if cpu_budget_ms <= 0:
+            raise ValueError(f"cpu_budget_ms must be positive, got {cpu_budget_ms}")
+
+        self.graph = graph
+        self.config = config
+        self.decay_manager = decay_manager or DecayManager(graph, config)
+        self.cpu_budget_ms = cpu_budget_ms
+        self.prune_node_age_days = prune_node_age_days
+        self.prune_importance_threshold = prune_importance_threshold
+
+        self._graph: TrackedDiGraph | None = None
+        self._queue: OrderedDict[str, None] = OrderedDict()
+        self._last_run: dict[str, float] = {}
+        self._in_maintenance = False
+        self.last_run: MaintenanceStats | None = None
+        self.totals = MaintenanceStats()
+
+    # ---- work queue ----------------------------------------------------------
+
+    @property
+    def tracked_graph(self) -> TrackedDiGraph:
+        """The current graph, (re)subscribing if GraphMemory.graph was replaced.
+
+        On (re)subscription every user in the graph is queued once.
+        """
+        graph = self.graph.graph
+        if graph is not self._graph:
+            if self._graph is not None:
+                self._graph.remove_listener(self._on_change)
+            graph.add_listener(self._on_change)
+            self._graph = graph
+            self._last_run.clear()
+            self.mark_dirty(*self._owners(graph))
+        return graph
+
+    @staticmethod
+    def _owners(graph: TrackedDiGraph) -> list[str]:
+        """Users in the graph, plus SHARED_EDGES if some nodes have no owner."""
+        owners = list(graph.index.nodes_by_user)
+        if graph.index.unowned_nodes:
+            owners.append(SHARED_EDGES)
+        return owners
+
+    @property
+    def pending_users(self) -> int:
+        """Number of users waiting for maintenance."""
+        return len(self._queue)
+
+    def mark_dirty(self, *user_ids: Any) -> None:
+        """Queue users for maintenance (no-op for users already queued)."""
+        for user_id in user_ids:
+            if user_id and user_id not in self._queue:
+                self._queue[user_id] = None
+
+    def enqueue_due(self, now: float | None = None) -> None:
+        """Queue users not maintained within ``decay_background_interval``.
+
+        Args:
+            now: Current monotonic time (default: time.monotonic())
+        """
+        graph = self.tracked_graph
+        now = time.monotonic() if now is None else now
+        interval = self.config.decay_background_interval
+        for user_id in self._owners(graph):
+            last = self._last_run.get(user_id)
+            if last is None or now - last >= interval:
+                self.mark_dirty(user_id)
+
+    def _on_change(self, kind: str, key: Any) -> None:
+        # Our own decay/pruning writes must not re-queue the user
+        if self._in_maintenance:
+            return
+        if kind == "reset":
+            assert self._graph is not None
+            self.mark_dirty(*self._owners(self._graph))
+            return
+        nodes = key if kind == "edge" else (key,)
+        node_attrs = self._graph._node if self._graph is not None else {}
+        owners = [
+            attrs.get("user_id")
+            for attrs in map(node_attrs.get, nodes)
+            if attrs is not None
+        ]
+        self.mark_dirty(*owners)
+        if owners and not any(owners):
+            self.mark_dirty(SHARED_EDGES)
+
+    # ---- maintenance ---------------------------------------------------------
+
+    def maintain_user(self, user_id: str) -> MaintenanceStats:
+        """Consolidate, decay and (optionally) prune one user's memory.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            MaintenanceStats for this user
+        """
+        graph = self.tracked_graph
+        stats = MaintenanceStats(users=1)
+        self._in_maintenance = True
+        try:
+            node_attrs = graph._node
+            candidates = [
+                {"id": node_id, **node_attrs[node_id]}
+                for node_id in graph.index.nodes_by_user.get(user_id, ())
+                if not node_attrs[node_id].get("long_term", False)
+            ]
+            if candidates:
+                promoted = self.decay_manager.consolidate_to_long_term(
+                    user_id, candidates
+                )
+                stats.nodes_consolidated = len(promoted)
+
+            decay_stats = self.decay_manager.apply_decay(user_id)
+            stats.edges_decayed = int(decay_stats.get("edges_decayed", 0))
+            stats.edges_pruned = int(decay_stats.get("edges_pruned", 0))
+
+            if self.prune_node_age_days is not None:
+                stats.nodes_pruned = self.decay_manager.prune_old_nodes(
+                    user_id,
+                    age_days=self.prune_node_age_days,
+                    importance_threshold=self.prune_importance_threshold,
+                )
+        finally:
+            self._in_maintenance = False
+
+        self._queue.pop(user_id, None)
+        self._last_run[user_id] = time.monotonic()
+        return stats
+
+    def _maintain_safely(self, user_id: str, stats: MaintenanceStats) -> None:
+        """Run maintain_user(), adding its counters and CPU time to stats."""
+        start = time.thread_time()
+        try:
+            stats.merge(self.maintain_user(user_id))
+        except Exception as e:
+            # Dropped from this round; it is queued again once due
+            self._queue.pop(user_id, None)
+            logger.error(f"Maintenance failed for user {user_id}: {e}", exc_info=True)
+        stats.cpu_ms += (time.thread_time() - start) * 1000.0
+
+    def _finish(self, stats: MaintenanceStats) -> MaintenanceStats:
+        stats.pending_users = len(self._queue)
+        self.last_run = stats
+        self.totals.merge(stats)
+        if stats.users:
+            logger.info(
+                f"Maintenance: {stats.users} users, "
+                f"{stats.edges_decayed} edges decayed, "
+                f"{stats.edges_pruned} edges pruned, "
+                f"{stats.nodes_pruned} nodes pruned, "
+                f"{stats.nodes_consolidated} nodes consolidated "
+                f"({stats.cpu_ms:.1f}ms CPU, {stats.pending_users} users pending)"
+            )
+        return stats
+
+    async def run_tick(self) -> MaintenanceStats:
+        """Process queued users within one CPU budget, yielding between users.
+
+        At least one user is processed per tick; the rest stay queued for
+        the next tick.
+
+        Returns:
+            MaintenanceStats for this tick
+        """
+        self.enqueue_due()
+        stats = MaintenanceStats()
+        while self._queue:
+            self._maintain_safely(next(iter(self._queue)), stats)
+            if stats.cpu_ms >= self.cpu_budget_ms:
+                break
+            await asyncio.sleep(0)
+        return self._finish(stats)
+
+    def run_once(self, user_ids: Iterable[str] | None = None) -> MaintenanceStats:
+        """Run maintenance to completion, ignoring the CPU budget.
+
+        Args:
+            user_ids: Users to maintain (default: every queued or due user)
+
+        Returns:
+            MaintenanceStats for the run
+        """
+        stats = MaintenanceStats()
+        if user_ids is None:
+            self.enqueue_due()
+            while self._queue:
+                self._maintain_safely(next(iter(self._queue)), stats)
+        else:
+            for user_id in dict.fromkeys(user_ids):
+                self._maintain_safely(user_id, stats)
+        return self._finish(stats)
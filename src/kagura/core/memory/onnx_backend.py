@@ -0,0 +1,476 @@
+"""ONNX Runtime inference backend for embedding and reranking models.
+
+Runs the bi-encoder (``Embedder``) and cross-encoder (``MemoryReranker``)
+through onnxruntime on CPU instead of PyTorch. Selected with
+``EmbeddingConfig.backend = "onnx"`` / ``RerankConfig.backend = "onnx"``:
+
+- the ONNX graph is taken from a local directory, from the model's
+  ``onnx/`` folder on the Hugging Face Hub, or exported once with optimum
+  (``pip install optimum[onnxruntime]``) into ``<cache dir>/onnx``
+- weights are quantized to int8 with onnxruntime dynamic quantization
+  (``quantize=True``, needs ``pip install onnx``); the quantized graph is
+  cached next to the exported one
+- ``intra_op_threads`` sets the onnxruntime intra-op thread pool size
+- tokenization uses the model's ``tokenizer.json`` (``tokenizers``)
+
+The returned models expose the subset of the SentenceTransformer /
+CrossEncoder API used by Kagura (``encode`` / ``predict``), so callers do
+not depend on the backend. Models are shared per process through
+:mod:`kagura.core.memory.model_cache`.
+
+Usage:
+    model = load_onnx_embedder("intfloat/multilingual-e5-large", intra_op_threads=4)
+    vectors = model.encode(["query: What is Python?"], normalize_embeddings=True)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Optional, Sequence
+
+import numpy as np
+
+from kagura.config.paths import get_cache_dir
+from kagura.core.memory.model_cache import get_model
+
+if TYPE_CHECKING:
+    from onnxruntime import InferenceSession
+    from tokenizers import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+OnnxTask = Literal["feature-extraction", "text-classification"]
+
+# Files needed to run a model besides the ONNX graph
+_HUB_PATTERNS = [
+    "onnx/model.onnx",
+    "onnx/model.onnx_data",
+    "tokenizer.json",
+    "config.json",
+    "1_Pooling/config.json",
+]
+
+
+def _import_onnxruntime() -> Any:
+    try:
+        import onnxruntime
+    except ImportError as e:
+        raise ImportError(
+            "onnxruntime not installed. Install with: pip install onnxruntime"
+        ) from e
+    return onnxruntime
+
+
+def get_onnx_cache_dir(name: str) -> Path:
+    """Directory holding the exported and quantized graphs of a model."""
+    return get_cache_dir() / "onnx" / name.replace("/", "--")
+
+
+def _find_graph(directory: Path) -> Optional[Path]:
+    for candidate in (directory / "model.onnx", directory / "onnx" / "model.onnx"):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _download_from_hub(name: str) -> Optional[Path]:
+    """Download a pre-exported ONNX graph published with the model."""
+    try:
+        from huggingface_hub import snapshot_download
+
+        directory = Path(snapshot_download(name, allow_patterns=_HUB_PATTERNS))
+    except Exception as e:
+        logger.debug(f"No ONNX graph downloaded for '{name}': {e}")
+        return None
+    return directory if _find_graph(directory) else None
+
+
+def _export(name: str, task: OnnxTask, output_dir: Path) -> Path:
+    """Export a transformers model to ONNX with optimum."""
+    try:
+        from optimum.onnxruntime import (
+            ORTModelForFeatureExtraction,
+            ORTModelForSequenceClassification,
+        )
+        from transformers import AutoTokenizer
+    except ImportError as e:
+        raise ImportError(
+            f"No ONNX graph found for '{name}' and optimum is not installed to "
+            "export one. Install with: pip install optimum[onnxruntime]"
+        ) from e
+
+    model_class = (
+        ORTModelForFeatureExtraction
+        if task == "feature-extraction"
+        else ORTModelForSequenceClassification
+    )
+    logger.info(f"Exporting '{name}' to ONNX in {output_dir} (one-time)")
+    model_class.from_pretrained(name, export=True).save_pretrained(output_dir)
+    AutoTokenizer.from_pretrained(name).save_pretrained(output_dir)
+    return output_dir
+
+
+def resolve_onnx_model(name: str, task: OnnxTask) -> Path:
+    """Locate (or export) the ONNX graph of a model.
+
+    Args:
+        name: Local model directory or Hugging Face model identifier
+        task: "feature-extraction" (bi-encoder) or "text-classification"
+            (cross-encoder), used when exporting
+
+    Returns:
+        Directory containing the graph (``model.onnx`` or
+        ``onnx/model.onnx``) and ``tokenizer.json``
+
+    Raises:
+        ImportError: If the model must be exported and optimum is missing
+    """
+    local = Path(name)
+    if local.is_dir() and _find_graph(local):
+        return local
+
+    exported = get_onnx_cache_dir(name)
+    if _find_graph(exported):
+        return exported
+
+    return _download_from_hub(name) or _export(name, task, exported)
+
+
+def quantize_model(graph: Path, output: Path) -> Path:
+    """Quantize a graph's weights to int8 (dynamic quantization).
+
+    Activations stay in float and are quantized on the fly, so no
+    calibration data is needed. The result is written once and reused.
+
+    Args:
+        graph: Float ONNX graph
+        output: Path of the quantized graph
+
+    Returns:
+        ``output``
+
+    Raises:
+        ImportError: If the onnx package is not installed
+    """
+    if output.exists():
+        return output
+
+    _import_onnxruntime()
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as e:
+        raise ImportError(
+            "onnx not installed (needed for int8 quantization). "
+            "Install with: pip install onnx"
+        ) from e
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    logger.info(f"Quantizing {graph} to int8 (one-time)")
+    quantize_dynamic(
+        str(graph),
+        str(output),
+        weight_type=QuantType.QInt8,
+        use_external_data_format=graph.with_suffix(".onnx_data").exists(),
+    )
+    return output
+
+
+def create_session(graph: Path, intra_op_threads: Optional[int] = None) -> Any:
+    """Create a CPU onnxruntime session.
+
+    Args:
+        graph: ONNX graph to load
+        intra_op_threads: Intra-op thread pool size (None = onnxruntime
+            default, one thread per physical core)
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    ort = _import_onnxruntime()
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if intra_op_threads:
+        options.intra_op_num_threads = intra_op_threads
+    return ort.InferenceSession(
+        str(graph), sess_options=options, providers=["CPUExecutionProvider"]
+    )
+
+
+def load_tokenizer(directory: Path, max_length: int) -> Tokenizer:
+    """Load ``tokenizer.json`` with truncation and batch padding enabled."""
+    try:
+        from tokenizers import Tokenizer
+    except ImportError as e:
+        raise ImportError(
+            "tokenizers not installed. Install with: pip install tokenizers"
+        ) from e
+
+    tokenizer = Tokenizer.from_file(str(directory / "tokenizer.json"))
+    tokenizer.enable_truncation(max_length=max_length)
+    if tokenizer.padding is None:
+        pad_token = next(
+            (t for t in ("<pad>", "[PAD]") if tokenizer.token_to_id(t) is not None),
+            "[PAD]",
+        )
+        tokenizer.enable_padding(
+            pad_id=tokenizer.token_to_id(pad_token) or 0, pad_token=pad_token
+        )
+    return tokenizer
+
+
+def _read_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _OnnxModel:
+    """Tokenizer + onnxruntime session shared by both model types."""
+
+    def __init__(self, session: InferenceSession, tokenizer: Tokenizer):
+        self.session = session
+        self.tokenizer = tokenizer
+        self._input_names = {i.name for i in session.get_inputs()}
+
+    @property
+    def max_seq_length(self) -> Optional[int]:
+        """Tokens per input after truncation (as SentenceTransformer)."""
+        truncation = self.tokenizer.truncation
+        return truncation["max_length"] if truncation else None
+
+    def _run(self, batch: Sequence[Any]) -> tuple[np.ndarray, np.ndarray]:
+        """Tokenize a batch and return (first output, attention mask)."""
+        encodings = self.tokenizer.encode_batch(list(batch))
+        features = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array(
+                [e.attention_mask for e in encodings], dtype=np.int64
+            ),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        inputs = {k: v for k, v in features.items() if k in self._input_names}
+        output = np.asarray(self.session.run(None, inputs)[0])
+        return output, features["attention_mask"]
+
+
+class OnnxEmbedder(_OnnxModel):
+    """Bi-encoder with the ``SentenceTransformer.encode`` interface.
+
+    Attributes:
+        pooling: "mean" (E5-series) or "cls" token pooling
+    """
+
+    def __init__(
+        self,
+        session: InferenceSession,
+        tokenizer: Tokenizer,
+        pooling: Literal["mean", "cls"] = "mean",
+    ):
+        super().__init__(session, tokenizer)
+        self.pooling = pooling
+
+    def encode(
+        self,
+        sentences: str | list[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+        normalize_embeddings: bool = False,
+    ) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            sentences: Text or list of texts
+            batch_size: Texts per inference call
+            show_progress_bar: Ignored (API compatibility)
+            normalize_embeddings: Scale embeddings to unit length
+
+        Returns:
+            Float32 array of shape (len(sentences), dimension)
+        """
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            output, mask = self._run(texts[start : start + batch_size])
+            if output.ndim == 3:  # token embeddings -> pool
+                if self.pooling == "cls":
+                    output = output[:, 0]
+                else:
+                    weights = mask[..., None].astype(output.dtype)
+                    output = (output * weights).sum(axis=1) / np.clip(
+                        weights.sum(axis=1), 1e-9, None
+                    )
+            chunks.append(output.astype(np.float32))
+
+        if not chunks:
+            return np.zeros((0, 0), dtype=np.float32)
+        embeddings = np.concatenate(chunks)
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings
+
+
+class OnnxCrossEncoder(_OnnxModel):
+    """Cross-encoder with the ``CrossEncoder.predict`` interface.
+
+    Attributes:
+        activation: "sigmoid" or "identity", as sentence-transformers applies
+            it to the model's logits
+    """
+
+    def __init__(
+        self,
+        session: InferenceSession,
+        tokenizer: Tokenizer,
+        activation: Literal["sigmoid", "identity"] = "identity",
+    ):
+        super().__init__(session, tokenizer)
+        self.activation = activation
+
+    def predict(
+        self,
+        sentences: Sequence[Sequence[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        """Score (query, document) pairs.
+
+        Args:
+            sentences: Pairs to score
+            batch_size: Pairs per inference call
+            show_progress_bar: Ignored (API compatibility)
+
+        Returns:
+            Float32 array of one score per pair (one row of label scores per
+            pair for multi-label models)
+        """
+        pairs = [(str(query), str(doc)) for query, doc in sentences]
+        chunks = []
+        for start in range(0, len(pairs), batch_size):
+            logits, _ = self._run(pairs[start : start + batch_size])
+            chunks.append(logits.astype(np.float32))
+
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        scores = np.concatenate(chunks)
+        if scores.ndim == 2 and scores.shape[1] == 1:
+            scores = scores[:, 0]
+        if self.activation == "sigmoid":
+            scores = 1.0 / (1.0 + np.exp(-scores))
+        return scores
+
+
+def _pooling_mode(directory: Path) -> Literal["mean", "cls"]:
+    config = _read_json(directory / "1_Pooling" / "config.json")
+    return "cls" if config.get("pooling_mode_cls_token") else "mean"
+
+
+def _activation(directory: Path) -> Literal["sigmoid", "identity"]:
+    """Activation sentence-transformers' CrossEncoder would apply."""
+    config = _read_json(directory / "config.json")
+    configured = config.get("sbert_ce_default_activation_function") or config.get(
+        "sentence_transformers", {}
+    ).get("activation_fn")
+    if configured:
+        return "sigmoid" if configured.endswith("Sigmoid") else "identity"
+    return "sigmoid" if config.get("num_labels", 1) == 1 else "identity"
+
+
+def _load(
+    name: str,
+    task: OnnxTask,
+    quantize: bool,
+    intra_op_threads: Optional[int],
+    max_length: int,
+) -> tuple[Path, Any, Tokenizer]:
+    directory = resolve_onnx_model(name, task)
+    graph = _find_graph(directory)
+    if graph is None:
+        raise FileNotFoundError(f"No model.onnx found for '{name}' in {directory}")
+    if quantize:
+        graph = quantize_model(graph, get_onnx_cache_dir(name) / "model.int8.onnx")
+    session = create_session(graph, intra_op_threads)
+    tokenizer = load_tokenizer(directory, max_length)
+    return directory, session, tokenizer
+
+
+def _variant(
+    name: str, quantize: bool, intra_op_threads: Optional[int], max_length: int
+) -> str:
+    precision = "int8" if quantize else "fp32"
+    return f"{name}|{precision}|threads={intra_op_threads}|max_length={max_length}"
+
+
+def load_onnx_embedder(
+    name: str,
+    quantize: bool = True,
+    intra_op_threads: Optional[int] = None,
+    max_length: int = 512,
+) -> OnnxEmbedder:
+    """Load (or reuse) a bi-encoder on onnxruntime.
+
+    Args:
+        name: Local model directory or Hugging Face model identifier
+        quantize: Use int8 dynamically quantized weights
+        intra_op_threads: onnxruntime intra-op threads (None = default)
+        max_length: Maximum tokens per text
+
+    Returns:
+        OnnxEmbedder
+
+    Raises:
+        ImportError: If onnxruntime (or a package needed to export or
+            quantize the model) is not installed
+    """
+
+    def loader() -> OnnxEmbedder:
+        directory, session, tokenizer = _load(
+            name, "feature-extraction", quantize, intra_op_threads, max_length
+        )
+        return OnnxEmbedder(session, tokenizer, pooling=_pooling_mode(directory))
+
+    _import_onnxruntime()
+    return get_model(
+        "onnx_embedder",
+        _variant(name, quantize, intra_op_threads, max_length),
+        loader,
+    )
+
+
+def load_onnx_cross_encoder(
+    name: str,
+    quantize: bool = True,
+    intra_op_threads: Optional[int] = None,
+    max_length: int = 512,
+) -> OnnxCrossEncoder:
+    """Load (or reuse) a cross-encoder on onnxruntime.
+
+    Args:
+        name: Local model directory or Hugging Face model identifier
+        quantize: Use int8 dynamically quantized weights
+        intra_op_threads: onnxruntime intra-op threads (None = default)
+        max_length: Maximum tokens per (query, document) pair
+
+    Returns:
+        OnnxCrossEncoder
+
+    Raises:
+        ImportError: If onnxruntime (or a package needed to export or
+            quantize the model) is not installed
+    """
+
+    def loader() -> OnnxCrossEncoder:
+        directory, session, tokenizer = _load(
+            name, "text-classification", quantize, intra_op_threads, max_length
+        )
+        return OnnxCrossEncoder(session, tokenizer, activation=_activation(directory))
+
+    _import_onnxruntime()
+    return get_model(
+        "onnx_cross_encoder",
+        _variant(name, quantize, intra_op_threads, max_length),
+        loader,
+    )
@@ -8,6 +8,45 @@ from typing import Any, Optional
 
 from kagura.config.paths import get_data_dir
 
+# Key prefix used by project-scoped records (see CodingMemoryManager._make_key)
+_PROJECT_KEY_PREFIX = "project:"
+
+
+def _project_record_fields(
+    key: str, value: Any
+) -> tuple[Optional[str], Optional[str], Optional[str], Optional[str]]:
+    """Extract indexed record columns from a project-scoped key.
+
+    Project-scoped records use keys of the form
+    ``project:{project_id}:{record_type}:{record_id}``. Their session_id and
+    end_time are lifted out of the JSON value so that session lookups can be
+    answered by an index instead of a LIKE scan.
+
+    Args:
+        key: Memory key
+        value: Value being stored (before JSON serialization)
+
+    Returns:
+        Tuple of (project_id, record_type, session_id, end_time)
+    """
+    if not key.startswith(_PROJECT_KEY_PREFIX):
+        return None, None, None, None
+
+    parts = key[len(_PROJECT_KEY_PREFIX) :].rsplit(":", 2)
+    if len(parts) != 3 or not all(parts):
+        return None, None, None, None
+
+    project_id, record_type, _record_id = parts
+    session_id: Optional[str] = None
+    end_time: Optional[str] = None
+    if isinstance(value, dict):
+        session_id = value.get("session_id") or None
+        end_time = value.get("end_time") or None
+        if end_time is not None:
+            end_time = str(end_time)
+
+    return project_id, record_type, session_id, end_time
+
 
 class PersistentMemory:
     """Long-term persistent memory using SQLite.
@@ -69,6 +108,25 @@ class PersistentMemory:
                 # Column already exists
                 pass
 
+            # Migration: Add indexed columns for project-scoped records
+            backfill_records = False
+            try:
+                conn.execute("ALTER TABLE memories ADD COLUMN project_id TEXT")
+                backfill_records = True
+            except sqlite3.OperationalError:
+                # Column already exists
+                pass
+
+            for column in ("record_type", "session_id", "end_time"):
+                try:
+                    conn.execute(f"ALTER TABLE memories ADD COLUMN {column} TEXT")
+                except sqlite3.OperationalError:
+                    # Column already exists
+                    pass
+
+            if backfill_records:
+                self._backfill_project_records(conn)
+
             # Create indexes (after ensuring all columns exist)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_key ON memories(key)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_agent ON memories(agent_name)")
@@ -83,6 +141,44 @@ class PersistentMemory:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_user_key ON memories(user_id, key)"
             )
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_project_session
+                   ON memories(user_id, project_id, record_type, session_id)"""
+            )
+            conn.execute(
+                """CREATE INDEX IF NOT EXISTS idx_project_end_time
+                   ON memories(user_id, project_id, record_type, end_time)"""
+            )
+
+    def _backfill_project_records(self, conn: sqlite3.Connection) -> None:
+        """Populate record columns for rows written before they existed.
+
+        Args:
+            conn: Open connection (migration runs inside its transaction)
+        """
+        cursor = conn.execute(
+            "SELECT id, key, value FROM memories WHERE key LIKE ?",
+            (f"{_PROJECT_KEY_PREFIX}%",),
+        )
+        updates = []
+        for row_id, key, value_json in cursor.fetchall():
+            try:
+                value = json.loads(value_json)
+            except (json.JSONDecodeError, TypeError):
+                value = None
+            fields = _project_record_fields(key, value)
+            if fields[0] is not None:
+                updates.append((*fields, row_id))
+
+        if updates:
+            conn.executemany(
+                """
+                UPDATE memories
+                SET project_id = ?, record_type = ?, session_id = ?, end_time = ?
+                WHERE id = ?
+                """,
+                updates,
+            )
 
     def store(
         self,
@@ -103,6 +199,7 @@ class PersistentMemory:
         """
         value_json = json.dumps(value)
         metadata_json = json.dumps(metadata) if metadata else None
+        record_fields = _project_record_fields(key, value)
 
         with sqlite3.connect(self.db_path) as conn:
             # Check if exists (user_id + key + agent_name combination)
@@ -121,21 +218,105 @@ class PersistentMemory:
                 conn.execute(
                     """
                     UPDATE memories
-                    SET value = ?, updated_at = ?, metadata = ?
+                    SET value = ?, updated_at = ?, metadata = ?,
+                        project_id = ?, record_type = ?, session_id = ?,
+                        end_time = ?
                     WHERE id = ?
                     """,
-                    (value_json, datetime.now(), metadata_json, existing[0]),
+                    (
+                        value_json,
+                        datetime.now(),
+                        metadata_json,
+                        *record_fields,
+                        existing[0],
+                    ),
                 )
             else:
                 # Insert
                 conn.execute(
                     """
-                    INSERT INTO memories (key, value, user_id, agent_name, metadata)
-                    VALUES (?, ?, ?, ?, ?)
+                    INSERT INTO memories (
+                        key, value, user_id, agent_name, metadata,
+                        project_id, record_type, session_id, end_time
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (key, value_json, user_id, agent_name, metadata_json),
+                    (
+                        key,
+                        value_json,
+                        user_id,
+                        agent_name,
+                        metadata_json,
+                        *record_fields,
+                    ),
                 )
 
+    def store_many(
+        self,
+        items: list[tuple[str, Any, Optional[dict]]],
+        user_id: str,
+        agent_name: Optional[str] = None,
+    ) -> None:
+        """Store many memories in a single transaction.
+
+        Same upsert semantics as store(), but one connection and one commit
+        for the whole batch.
+
+        Args:
+            items: List of (key, value, metadata) tuples
+            user_id: User identifier (memory owner)
+            agent_name: Optional agent name for scoping
+        """
+        if not items:
+            return
+
+        now = datetime.now()
+        with sqlite3.connect(self.db_path) as conn:
+            for key, value, metadata in items:
+                value_json = json.dumps(value)
+                metadata_json = json.dumps(metadata) if metadata else None
+                record_fields = _project_record_fields(key, value)
+
+                cursor = conn.execute(
+                    """
+                    SELECT id FROM memories
+                    WHERE key = ? AND user_id = ?
+                      AND (agent_name = ? OR (agent_name IS NULL AND ? IS NULL))
+                    """,
+                    (key, user_id, agent_name, agent_name),
+                )
+                existing = cursor.fetchone()
+
+                if existing:
+                    conn.execute(
+                        """
+                        UPDATE memories
+                        SET value = ?, updated_at = ?, metadata = ?,
+                            project_id = ?, record_type = ?, session_id = ?,
+                            end_time = ?
+                        WHERE id = ?
+                        """,
+                        (value_json, now, metadata_json, *record_fields, existing[0]),
+                    )
+                else:
+                    conn.execute(
+                        """
+                        INSERT INTO memories (
+                            key, value, user_id, agent_name, metadata,
+                            project_id, record_type, session_id, end_time
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            key,
+                            value_json,
+                            user_id,
+                            agent_name,
+                            metadata_json,
+                            *record_fields,
+                        ),
+                    )
+
     def recall(
         self,
         key: str,
@@ -324,6 +505,79 @@ class PersistentMemory:
 
             return results
 
+    def fetch_project_records(
+        self,
+        user_id: str,
+        project_id: str,
+        record_type: str,
+        session_id: Optional[str] = None,
+        open_only: bool = False,
+        newest_first: bool = False,
+        limit: Optional[int] = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch project-scoped records using the record indexes.
+
+        Unlike ``search()``, this is an indexed point query on
+        (user_id, project_id, record_type, session_id) and returns every
+        matching row unless ``limit`` is given.
+
+        Args:
+            user_id: User identifier (memory owner)
+            project_id: Project identifier
+            record_type: Record type (e.g., "session", "file_change", "error")
+            session_id: Optional session filter
+            open_only: Only return records without an end_time
+                (e.g., active sessions)
+            newest_first: Order by updated_at descending instead of
+                insertion order
+            limit: Optional maximum number of results to return
+
+        Returns:
+            List of memory dictionaries (same shape as ``search()``)
+        """
+        query_parts = [
+            "SELECT key, value, created_at, updated_at, metadata,",
+            "       access_count, last_accessed_at",
+            "FROM memories",
+            "WHERE user_id = ? AND project_id = ? AND record_type = ?",
+        ]
+        params: list[Any] = [user_id, project_id, record_type]
+
+        if session_id is not None:
+            query_parts.append("  AND session_id = ?")
+            params.append(session_id)
+        if open_only:
+            query_parts.append("  AND end_time IS NULL")
+
+        if newest_first:
+            query_parts.append("ORDER BY updated_at DESC, id DESC")
+        else:
+            query_parts.append("ORDER BY id ASC")
+        if limit is not None:
+            query_parts.append("LIMIT ?")
+            params.append(limit)
+
+        sql = "\n".join(query_parts)
+
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(sql, tuple(params))
+
+            results: list[dict[str, Any]] = []
+            for row in cursor.fetchall():
+                results.append(
+                    {
+                        "key": row[0],
+                        "value": json.loads(row[1]),
+                        "created_at": row[2],
+                        "updated_at": row[3],
+                        "metadata": json.loads(row[4]) if row[4] else None,
+                        "access_count": row[5] if row[5] is not None else 0,
+                        "last_accessed_at": row[6],
+                    }
+                )
+
+            return results
+
     def forget(self, key: str, user_id: str, agent_name: Optional[str] = None) -> None:
         """Delete memory.
 
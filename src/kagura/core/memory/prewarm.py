@@ -0,0 +1,253 @@
+"""Background prewarming of memory models and stores.
+
+The first semantic memory operation of a process loads the embedding model,
+the reranker and the vector store client, which takes 30-60s (longer while
+the models download). Servers start a :class:`Prewarmer` at startup so this
+happens in a background thread instead of inside the first request:
+
+- each stage (a named loader) runs once, in registration order
+- per-stage readiness is reported by :meth:`Prewarmer.status` (health
+  endpoints)
+- while the prewarmer is warming, request handlers check
+  :func:`memory_warming` and degrade (e.g. lexical-only search) instead of
+  blocking on the models
+
+Models are loaded through :mod:`kagura.core.memory.model_cache`, so the
+instances loaded here are the ones every MemoryManager reuses.
+
+Usage:
+    start_memory_prewarm(
+        extra_stages=[("memory_store", lambda: get_memory_manager("default_user"))]
+    )
+
+    if memory_warming():
+        results = memory.recall_lexical(query)
+"""
+
+import importlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal, Optional
+
+from kagura.config.memory_config import MemorySystemConfig
+
+logger = logging.getLogger(__name__)
+
+StageState = Literal["pending", "warming", "ready", "failed"]
+
+Loader = Callable[[], Any]
+
+
+@dataclass
+class PrewarmStage:
+    """A named startup loader and its progress.
+
+    Attributes:
+        name: Stage name (e.g. "embedding", "reranker", "memory_store")
+        loader: Called once in the prewarm thread
+        state: pending, warming, ready or failed
+        error: Error message if the loader raised
+        seconds: Time the loader took
+    """
+
+    name: str
+    loader: Loader
+    state: StageState = "pending"
+    error: Optional[str] = None
+    seconds: Optional[float] = None
+
+
+class Prewarmer:
+    """Runs startup loaders in a background daemon thread.
+
+    A failed stage is logged and reported, never raised: the component is
+    then loaded (or fails) on first use as it would without prewarming.
+
+    Example:
+        >>> prewarmer = Prewarmer()
+        >>> prewarmer.add("embedding", lambda: load_sentence_transformer(name))
+        >>> prewarmer.start()
+        >>> prewarmer.wait(timeout=120)
+        True
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, PrewarmStage] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._done = threading.Event()
+
+    def add(self, name: str, loader: Loader) -> None:
+        """Register a stage (ignored if a stage of that name exists).
+
+        Args:
+            name: Stage name
+            loader: Callable loading the component
+        """
+        with self._lock:
+            if name in self._stages:
+                return
+            self._stages[name] = PrewarmStage(name, loader)
+
+    def add_stages(self, stages: Iterable[tuple[str, Loader]]) -> None:
+        """Register several stages."""
+        for name, loader in stages:
+            self.add(name, loader)
+
+    def start(self) -> "Prewarmer":
+        """Start the background thread.
+
+        No-op while it is running; after it finished, only starts again if
+        stages were added since.
+
+        Returns:
+            self
+        """
+        with self._lock:
+            if self._thread is not None:
+                pending = any(s.state == "pending" for s in self._stages.values())
+                if not (self._done.is_set() and pending):
+                    return self
+            self._done.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="kagura-prewarm", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._lock:
+                    stage = next(
+                        (s for s in self._stages.values() if s.state == "pending"),
+                        None,
+                    )
+                    if stage is None:
+                        self._done.set()
+                        return
+                    stage.state = "warming"
+
+                start = time.perf_counter()
+                try:
+                    stage.loader()
+                except Exception as e:
+                    stage.error = str(e)
+                    stage.state = "failed"
+                    logger.warning(f"Prewarm stage '{stage.name}' failed: {e}")
+                else:
+                    stage.state = "ready"
+                stage.seconds = time.perf_counter() - start
+                logger.info(
+                    f"Prewarm stage '{stage.name}' {stage.state} "
+                    f"in {stage.seconds:.1f}s"
+                )
+        finally:
+            self._done.set()
+
+    @property
+    def started(self) -> bool:
+        """Whether start() has been called."""
+        return self._thread is not None
+
+    @property
+    def warming(self) -> bool:
+        """Whether stages are still loading."""
+        return self._thread is not None and not self._done.is_set()
+
+    def is_ready(self, name: str) -> bool:
+        """Whether a stage finished loading successfully."""
+        stage = self._stages.get(name)
+        return stage is not None and stage.state == "ready"
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all stages finished.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if prewarming finished (or was never started)
+        """
+        if self._thread is None:
+            return True
+        return self._done.wait(timeout)
+
+    def status(self) -> dict[str, StageState]:
+        """Current state of each stage, in registration order."""
+        with self._lock:
+            return {name: stage.state for name, stage in self._stages.items()}
+
+    def reset(self) -> None:
+        """Forget all stages (the running thread, if any, is left to finish)."""
+        with self._lock:
+            self._stages.clear()
+            self._thread = None
+            self._done.clear()
+
+
+_prewarmer = Prewarmer()
+
+
+def get_prewarmer() -> Prewarmer:
+    """Get the process-wide prewarmer used by the API and MCP servers."""
+    return _prewarmer
+
+
+def memory_warming() -> bool:
+    """Whether memory models are still loading in the background.
+
+    Request handlers use this to choose a degraded path (lexical search,
+    no reranking) rather than wait for the models. Always False when no
+    prewarm was started, i.e. models load on first use as before.
+    """
+    return _prewarmer.warming
+
+
+def memory_prewarm_stages(
+    config: Optional[MemorySystemConfig] = None,
+) -> list[tuple[str, Loader]]:
+    """Prewarm stages for what a RAG-enabled MemoryManager loads.
+
+    Args:
+        config: Memory configuration (default: MemorySystemConfig())
+
+    Returns:
+        ("vector_store", loader) importing the vector store client,
+        ("embedding", loader) and, if reranking is enabled,
+        ("reranker", loader) pairs
+    """
+    from kagura.core.memory.embeddings import load_embedding_model
+    from kagura.core.memory.reranker import load_rerank_model
+
+    config = config or MemorySystemConfig()
+    embedding, rerank = config.embedding, config.rerank
+    stages: list[tuple[str, Loader]] = [
+        ("vector_store", lambda: importlib.import_module("kagura.core.memory.rag")),
+        ("embedding", lambda: load_embedding_model(embedding)),
+    ]
+    if rerank.enabled:
+        stages.append(("reranker", lambda: load_rerank_model(rerank.model, rerank)))
+    return stages
+
+
+def start_memory_prewarm(
+    extra_stages: Iterable[tuple[str, Loader]] = (),
+    config: Optional[MemorySystemConfig] = None,
+) -> Prewarmer:
+    """Start prewarming memory models on the process-wide prewarmer.
+
+    Args:
+        extra_stages: Server-specific stages run after the models (e.g.
+            opening a MemoryManager)
+        config: Memory configuration (default: MemorySystemConfig())
+
+    Returns:
+        The started prewarmer
+    """
+    prewarmer = get_prewarmer()
+    prewarmer.add_stages(memory_prewarm_stages(config))
+    prewarmer.add_stages(extra_stages)
+    return prewarmer.start()
@@ -10,13 +10,26 @@ Features:
 """
 
 import hashlib
+import logging
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
 
 from kagura.config.paths import get_cache_dir
+from kagura.core.memory.dedup import (
+    SIMHASH_BANDS,
+    content_hash,
+    fingerprint_metadata,
+    hamming_distance,
+)
+from kagura.core.memory.rag_stats import RAGCollectionStats, RAGStatsStore, stats_key
+
+logger = logging.getLogger(__name__)
 
 # Document ID generation constants
-_CONTENT_HASH_PREFIX_LENGTH = 100  # First N chars for stable hash generation
+_CONTENT_HASH_PREFIX_LENGTH = 100  # Prefix hashed by pre-dedup document IDs
+_NEAR_DUPLICATE_CANDIDATES = 100  # Band matches checked per store()
 _DOCUMENT_ID_LENGTH = 16  # Hex characters for document ID (64-bit hash)
 
 # Embedding dimension reference (for documentation and validation)
@@ -26,8 +39,13 @@ E5_LATENCY_OVERHEAD_MS_MIN = 20  # Minimum additional latency
 E5_LATENCY_OVERHEAD_MS_MAX = 50  # Maximum additional latency
 
 if TYPE_CHECKING:
-    from kagura.config.memory_config import ChunkingConfig, EmbeddingConfig
-    from kagura.core.memory.semantic_chunker import SemanticChunker
+    from kagura.config.memory_config import (
+        ChunkingConfig,
+        DedupConfig,
+        EmbeddingConfig,
+        VectorStoreConfig,
+    )
+    from kagura.core.memory.semantic_chunker import ChunkMetadata, SemanticChunker
 
 # ChromaDB (lightweight, local vector DB)
 try:
@@ -143,11 +161,36 @@ class ChromaDBEmbeddingFunction:
         return False
 
 
+def _default_embedding_function() -> Any:
+    """Return ChromaDB's default embedding function (all-MiniLM-L6-v2).
+
+    Raises:
+        ImportError: If ChromaDB is not installed (e.g. with the flat vector
+            backend and no sentence-transformers embedding config)
+    """
+    try:
+        from chromadb.utils.embedding_functions import (  # type: ignore
+            DefaultEmbeddingFunction,
+        )
+    except ImportError:
+        try:
+            # Fallback for older ChromaDB versions (<0.4.0)
+            from chromadb.api.types import DefaultEmbeddingFunction  # type: ignore
+        except ImportError as e:
+            raise ImportError(
+                "No embedding function available. Install sentence-transformers "
+                "(with an embedding config) or chromadb."
+            ) from e
+
+    return DefaultEmbeddingFunction()  # type: ignore
+
+
 class MemoryRAG:
     """Vector-based semantic memory search.
 
-    Uses ChromaDB for efficient semantic search over stored memories.
-    Memories are automatically embedded and indexed for similarity search.
+    Uses ChromaDB (or the embedded flat backend, see vector_store) for
+    efficient semantic search over stored memories. Memories are
+    automatically embedded and indexed for similarity search.
 
     Example:
         >>> rag = MemoryRAG(collection_name="my_memories")
@@ -163,6 +206,8 @@ class MemoryRAG:
         persist_dir: Optional[Path] = None,
         chunking_config: Optional["ChunkingConfig"] = None,
         embedding_config: Optional["EmbeddingConfig"] = None,
+        vector_store_config: Optional["VectorStoreConfig"] = None,
+        dedup_config: Optional["DedupConfig"] = None,
     ) -> None:
         """Initialize RAG memory with optional semantic chunking and custom embeddings.
 
@@ -174,9 +219,13 @@ class MemoryRAG:
             embedding_config: Embedding configuration (v4.2.0+)
                              If provided, uses E5-large with query:/passage: prefixes
                              If None, uses ChromaDB default (all-MiniLM-L6-v2)
+            vector_store_config: Vector store backend configuration
+                             If None, uses KAGURA_VECTOR_BACKEND (default: chromadb)
+            dedup_config: Unchanged/near-duplicate write detection
+                             If None, uses DedupConfig() defaults
 
         Raises:
-            ImportError: If ChromaDB is not installed
+            ImportError: If the selected backend's dependencies are not installed
 
         Note:
             E5-series models REQUIRE query:/passage: prefixes for optimal performance.
@@ -191,20 +240,18 @@ class MemoryRAG:
 
         logger.debug(f"MemoryRAG init: collection={collection_name}, dir={persist_dir}")
 
-        if not CHROMADB_AVAILABLE:
+        from kagura.config.memory_config import VectorStoreConfig
+
+        vector_store_config = vector_store_config or VectorStoreConfig()
+        self.backend = vector_store_config.backend
+
+        if self.backend == "chromadb" and not CHROMADB_AVAILABLE:
             raise ImportError(
                 "ChromaDB not installed. Install with: pip install chromadb"
             )
 
         persist_dir = persist_dir or get_cache_dir() / "chromadb"
         persist_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"MemoryRAG: Creating ChromaDB client at {persist_dir}")
-
-        self.client = chromadb.PersistentClient(
-            path=str(persist_dir),
-            settings=Settings(anonymized_telemetry=False),
-        )
-        logger.debug("MemoryRAG: ChromaDB client created")
 
         # Custom embedding function (E5-large with query:/passage: prefixes)
         self._embedding_config = embedding_config
@@ -226,31 +273,38 @@ class MemoryRAG:
                     "sentence-transformers not installed, falling back to ChromaDB default embeddings. "
                     "Install with: pip install sentence-transformers"
                 )
-                try:
-                    from chromadb.utils.embedding_functions import (  # type: ignore
-                        DefaultEmbeddingFunction,
-                    )
-                except ImportError:
-                    # Fallback for older ChromaDB versions (<0.4.0)
-                    from chromadb.api.types import (
-                        DefaultEmbeddingFunction,  # type: ignore
-                    )
-
-                embedding_function = DefaultEmbeddingFunction()  # type: ignore
+                embedding_function = _default_embedding_function()
                 # Clear embedding_config since we're using default
                 embedding_config = None
         else:
             # Use ChromaDB default (all-MiniLM-L6-v2) when no custom config
             logger.debug("MemoryRAG: Using ChromaDB default embeddings (all-MiniLM-L6-v2)")
-            try:
-                from chromadb.utils.embedding_functions import (  # type: ignore
-                    DefaultEmbeddingFunction,
-                )
-            except ImportError:
-                # Fallback for older ChromaDB versions (<0.4.0)
-                from chromadb.api.types import DefaultEmbeddingFunction  # type: ignore
+            embedding_function = _default_embedding_function()
+
+        # Kept for embedding queries outside collection.query() (see embed_queries)
+        self._embedding_function = embedding_function
+        self.embedding_space = (
+            embedding_function.name()
+            if isinstance(embedding_function, ChromaDBEmbeddingFunction)
+            else "chromadb-default"
+        )
+
+        if self.backend == "flat":
+            from kagura.core.memory.vector_store import FlatVectorClient
 
-            embedding_function = DefaultEmbeddingFunction()  # type: ignore
+            logger.debug(f"MemoryRAG: Creating flat vector client at {persist_dir}")
+            self.client = FlatVectorClient(
+                persist_dir / "flat",
+                embedding_function=embedding_function,
+                quantization=vector_store_config.quantization,
+            )
+        else:
+            logger.debug(f"MemoryRAG: Creating ChromaDB client at {persist_dir}")
+            self.client = chromadb.PersistentClient(
+                path=str(persist_dir),
+                settings=Settings(anonymized_telemetry=False),
+            )
+        logger.debug(f"MemoryRAG: {self.backend} client created")
 
         logger.debug(f"MemoryRAG: Getting/creating collection '{collection_name}'")
 
@@ -364,6 +418,15 @@ class MemoryRAG:
         else:
             self.collection = existing_collection
 
+        # Per-user/agent counts (O(1) count()/stats() without materializing)
+        self._stats: Optional[RAGStatsStore] = RAGStatsStore(
+            persist_dir / "rag_stats.db", collection_name
+        )
+        if needs_recreation:
+            self._stats.reset()
+
+        self._dedup_config = dedup_config
+
         # Semantic chunking support (lazy-loaded)
         self._chunker: Optional["SemanticChunker"] = None
         self._chunking_config = chunking_config
@@ -442,6 +505,11 @@ class MemoryRAG:
             - Original metadata preserved in all chunks
             - If content < min_chunk_size, stored as single document (backward compat)
 
+            Writes are deduplicated (see DedupConfig): re-storing unchanged
+            content returns the existing ID without embedding, and
+            near-duplicates of stored documents are flagged with
+            ``near_duplicate_of`` (or skipped, if configured).
+
         Example:
             >>> # Short text - stored as single document
             >>> id1 = rag.store("Short text", user_id="jfk")
@@ -449,18 +517,220 @@ class MemoryRAG:
             >>> id2 = rag.store("Very long document..." * 100, user_id="jfk")
         """
         parent_id = self._generate_document_id(user_id, content)
+        dedup = self._dedup()
+
+        # Unchanged content: answer from metadata without embedding
+        if dedup.skip_unchanged:
+            existing_id = self._find_unchanged(parent_id, user_id, content)
+            if existing_id is not None:
+                logger.debug(
+                    f"MemoryRAG: Content unchanged, skipped write ({existing_id})"
+                )
+                return existing_id
+
         base_metadata = self._prepare_base_metadata(metadata, user_id, agent_name)
+        with_simhash = len(content) >= dedup.near_duplicate_min_chars
+        base_metadata.update(fingerprint_metadata(content, with_simhash=with_simhash))
+
+        if with_simhash and dedup.near_duplicates != "off":
+            duplicate_of = self._find_near_duplicate(
+                base_metadata, user_id, agent_name, dedup.near_duplicate_distance
+            )
+            if duplicate_of is not None:
+                if dedup.near_duplicates == "skip":
+                    logger.debug(
+                        f"MemoryRAG: Near-duplicate of {duplicate_of}, skipped write"
+                    )
+                    return duplicate_of
+                base_metadata["near_duplicate_of"] = duplicate_of
 
         if not self._should_chunk(content):
             return self._store_single_document(parent_id, content, base_metadata)
 
         return self._store_chunked_document(parent_id, content, base_metadata)
 
+    def store_batch(
+        self,
+        contents: list[str],
+        user_id: str,
+        metadatas: Optional[list[Optional[dict[str, Any]]]] = None,
+        agent_name: Optional[str] = None,
+        ids: Optional[list[str]] = None,
+        embeddings: Optional[Sequence[Optional[Sequence[float]]]] = None,
+    ) -> list[str]:
+        """Store many documents with a single embedding + write call.
+
+        Callers that pre-chunk their content (e.g. source indexing) should
+        pass explicit ``ids``; those documents are stored as-is. Without
+        ``ids``, documents long enough for semantic chunking are routed
+        through store() and the rest are written in one batch.
+
+        Args:
+            contents: Documents to store
+            user_id: User identifier (memory owner)
+            metadatas: Optional per-document metadata (same length as contents)
+            agent_name: Optional agent name for scoping
+            ids: Optional explicit document IDs. When given, existing
+                documents with the same IDs are replaced (upsert).
+            embeddings: Optional precomputed vectors (same length as
+                contents; None entries are embedded as usual). Documents
+                with a vector are stored as-is, without chunking. Vectors
+                must come from this collection's embedding model.
+
+        Returns:
+            Document IDs in input order
+        """
+        if not contents:
+            return []
+
+        if metadatas is not None and len(metadatas) != len(contents):
+            raise ValueError("metadatas must have the same length as contents")
+        if ids is not None and len(ids) != len(contents):
+            raise ValueError("ids must have the same length as contents")
+        if embeddings is not None and len(embeddings) != len(contents):
+            raise ValueError("embeddings must have the same length as contents")
+
+        if embeddings is not None and any(v is not None for v in embeddings):
+            given = [i for i, vector in enumerate(embeddings) if vector is not None]
+            missing = [i for i, vector in enumerate(embeddings) if vector is None]
+            doc_ids = [""] * len(contents)
+            # Repeated content (e.g. one memory under two agents in an
+            # import) maps to one ID; write it once like the embed path
+            first_by_id: dict[str, int] = {}
+            for i in given:
+                doc_id = (
+                    ids[i]
+                    if ids is not None
+                    else self._generate_document_id(user_id, contents[i])
+                )
+                doc_ids[i] = doc_id
+                first_by_id.setdefault(doc_id, i)
+            unique = list(first_by_id.values())
+            min_chars = self._dedup().near_duplicate_min_chars
+            given_metadatas = []
+            for i in unique:
+                prepared = self._prepare_base_metadata(
+                    dict(metadatas[i] or {}) if metadatas else None,
+                    user_id,
+                    agent_name,
+                )
+                # Fingerprint like store(), so later writes can match these
+                prepared.update(
+                    fingerprint_metadata(
+                        contents[i], with_simhash=len(contents[i]) >= min_chars
+                    )
+                )
+                given_metadatas.append(prepared)
+            self._write_documents(
+                list(first_by_id),
+                [contents[i] for i in unique],
+                given_metadatas,
+                upsert=ids is not None,
+                embeddings=[list(embeddings[i] or ()) for i in unique],
+            )
+            if missing:
+                missing_ids = self.store_batch(
+                    [contents[i] for i in missing],
+                    user_id,
+                    [metadatas[i] for i in missing] if metadatas else None,
+                    agent_name,
+                    [ids[i] for i in missing] if ids is not None else None,
+                )
+                for i, doc_id in zip(missing, missing_ids):
+                    doc_ids[i] = doc_id
+            return doc_ids
+
+        if ids is not None:
+            prepared = [
+                self._prepare_base_metadata(
+                    dict(metadatas[i] or {}) if metadatas else None,
+                    user_id,
+                    agent_name,
+                )
+                for i in range(len(contents))
+            ]
+            self._write_documents(list(ids), contents, prepared, upsert=True)
+            return list(ids)
+
+        doc_ids: list[str] = []
+        batch_ids: list[str] = []
+        batch_docs: list[str] = []
+        batch_metadatas: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        for i, content in enumerate(contents):
+            metadata = dict(metadatas[i] or {}) if metadatas else None
+            if self._should_chunk(content):
+                doc_ids.append(self.store(content, user_id, metadata, agent_name))
+                continue
+
+            doc_id = self._generate_document_id(user_id, content)
+            doc_ids.append(doc_id)
+            if doc_id in seen:
+                continue
+            seen.add(doc_id)
+            prepared = self._prepare_base_metadata(metadata, user_id, agent_name)
+            prepared.update(fingerprint_metadata(content, with_simhash=False))
+            batch_ids.append(doc_id)
+            batch_docs.append(content)
+            batch_metadatas.append(prepared)
+
+        if batch_ids and self._dedup().skip_unchanged:
+            # One lookup for the whole batch; stored hashes mean unchanged
+            stored = self._stored_hashes(batch_ids)
+            keep = [
+                i
+                for i, doc_id in enumerate(batch_ids)
+                if stored.get(doc_id) != batch_metadatas[i]["content_hash"]
+            ]
+            batch_ids = [batch_ids[i] for i in keep]
+            batch_docs = [batch_docs[i] for i in keep]
+            batch_metadatas = [batch_metadatas[i] for i in keep]
+
+        if batch_ids:
+            self._write_documents(batch_ids, batch_docs, batch_metadatas)
+        return doc_ids
+
+    def get_embeddings(
+        self, contents: list[str], user_id: str
+    ) -> list[Optional[list[float]]]:
+        """Look up the stored vectors of documents written by store_batch().
+
+        Args:
+            contents: Document contents (as passed to store/store_batch)
+            user_id: User identifier (memory owner)
+
+        Returns:
+            Vector per content, in input order (None if the document is not
+            stored as a single document, e.g. it was chunked)
+        """
+        if not contents:
+            return []
+        ids = [self._generate_document_id(user_id, content) for content in contents]
+        legacy_ids = [
+            self._legacy_document_id(user_id, content) for content in contents
+        ]
+        result = self.collection.get(
+            ids=list(dict.fromkeys(ids + legacy_ids)),
+            include=["embeddings"],  # type: ignore
+        )
+        embeddings = result.get("embeddings")
+        if embeddings is None:
+            return [None] * len(contents)
+        by_id = {
+            doc_id: [float(x) for x in vector]
+            for doc_id, vector in zip(result["ids"], embeddings)
+        }
+        # Documents stored before full-content IDs live under the prefix ID
+        return [
+            by_id.get(doc_id) or by_id.get(legacy_id)
+            for doc_id, legacy_id in zip(ids, legacy_ids)
+        ]
+
     def _generate_document_id(self, user_id: str, content: str) -> str:
-        """Generate stable document ID from user_id and content.
+        """Generate stable document ID from user_id and the full content.
 
-        Uses first {_CONTENT_HASH_PREFIX_LENGTH} characters of content
-        for stability across similar documents.
+        Content of up to {_CONTENT_HASH_PREFIX_LENGTH} characters keeps the
+        ID it had under the older prefix-hash scheme.
 
         Args:
             user_id: User identifier
@@ -469,14 +739,158 @@ class MemoryRAG:
         Returns:
             {_DOCUMENT_ID_LENGTH}-character hex hash (stable identifier)
         """
-        prefix_content = (
-            content[:_CONTENT_HASH_PREFIX_LENGTH]
-            if len(content) > _CONTENT_HASH_PREFIX_LENGTH
-            else content
-        )
-        unique_str = f"{user_id}:{prefix_content}"
+        unique_str = f"{user_id}:{content}"
         return hashlib.sha256(unique_str.encode()).hexdigest()[:_DOCUMENT_ID_LENGTH]
 
+    def _legacy_document_id(self, user_id: str, content: str) -> str:
+        """Document ID from the first {_CONTENT_HASH_PREFIX_LENGTH} characters.
+
+        IDs were generated this way before full-content hashing; used to
+        recognize documents stored by earlier versions.
+        """
+        return self._generate_document_id(
+            user_id, content[:_CONTENT_HASH_PREFIX_LENGTH]
+        )
+
+    def _dedup(self) -> "DedupConfig":
+        """Return the dedup configuration (defaults if none was given)."""
+        config = getattr(self, "_dedup_config", None)
+        if config is None:
+            from kagura.config.memory_config import DedupConfig
+
+            config = DedupConfig()
+        return config
+
+    def _stored_hashes(self, ids: list[str]) -> dict[str, Optional[str]]:
+        """Look up the stored content_hash of existing documents.
+
+        Args:
+            ids: Document IDs
+
+        Returns:
+            Dict mapping each existing ID to its content_hash (None if the
+            document predates content hashing)
+        """
+        try:
+            existing = self.collection.get(ids=ids, include=["metadatas"])  # type: ignore
+        except Exception as e:
+            logger.debug(f"MemoryRAG: Content hash lookup failed: {e}")
+            return {}
+        metadatas = existing.get("metadatas") or [None] * len(existing["ids"])
+        return {
+            doc_id: (metadata or {}).get("content_hash")
+            for doc_id, metadata in zip(existing["ids"], metadatas)
+        }
+
+    def _find_unchanged(self, doc_id: str, user_id: str, content: str) -> Optional[str]:
+        """Find an already stored copy of exactly this content.
+
+        A single ID lookup covers the single-document ID, the first chunk of
+        a chunked document and the legacy prefix-hash ID.
+
+        Args:
+            doc_id: Full-content document ID
+            user_id: User identifier
+            content: Document content
+
+        Returns:
+            ID of the stored document, or None if the content must be written
+        """
+        legacy_id = self._legacy_document_id(user_id, content)
+        first_chunk_id = f"{doc_id}_chunk_000"
+        try:
+            existing = self.collection.get(
+                ids=list(dict.fromkeys([doc_id, first_chunk_id, legacy_id])),
+                include=["metadatas", "documents"],  # type: ignore
+            )
+        except Exception as e:
+            logger.debug(f"MemoryRAG: Unchanged-content lookup failed: {e}")
+            return None
+
+        count = len(existing["ids"])
+        found = {
+            found_id: ((metadata or {}), document)
+            for found_id, metadata, document in zip(
+                existing["ids"],
+                existing.get("metadatas") or [None] * count,
+                existing.get("documents") or [None] * count,
+            )
+        }
+        expected = content_hash(content)
+
+        for candidate in (doc_id, legacy_id):
+            if candidate not in found:
+                continue
+            metadata, document = found[candidate]
+            stored_hash = metadata.get("content_hash")
+            if stored_hash == expected or (stored_hash is None and document == content):
+                return candidate
+
+        if first_chunk_id in found:
+            metadata, _ = found[first_chunk_id]
+            total = metadata.get("total_chunks")
+            if metadata.get("content_hash") != expected or not isinstance(total, int):
+                return None
+            # Chunks are written in windows; require the last one to exist
+            last_chunk_id = f"{doc_id}_chunk_{total - 1:03d}"
+            if total == 1 or self.collection.get(ids=[last_chunk_id])["ids"]:
+                return doc_id
+        return None
+
+    def _find_near_duplicate(
+        self,
+        fingerprint: dict[str, Any],
+        user_id: str,
+        agent_name: Optional[str],
+        max_distance: int,
+    ) -> Optional[str]:
+        """Find a stored document whose SimHash is within max_distance bits.
+
+        Candidates share at least one SimHash band (exact metadata match);
+        the Hamming distance is then checked on the full fingerprint.
+
+        Args:
+            fingerprint: Metadata from fingerprint_metadata() (with SimHash)
+            user_id: User identifier
+            agent_name: Optional agent name (duplicates are scoped like recall)
+            max_distance: Maximum Hamming distance (at most SIMHASH_BANDS - 1)
+
+        Returns:
+            ID of the nearest stored document (parent ID for chunks), or None
+        """
+        scope = self._build_where(user_id, agent_name)
+        conditions: list[Any] = list(scope.get("$and", [scope]))
+        conditions.append(
+            {
+                "$or": [
+                    {f"simhash_b{i}": fingerprint[f"simhash_b{i}"]}
+                    for i in range(SIMHASH_BANDS)
+                ]
+            }
+        )
+        try:
+            candidates = self.collection.get(
+                where={"$and": conditions},  # type: ignore
+                limit=_NEAR_DUPLICATE_CANDIDATES,
+                include=["metadatas"],  # type: ignore
+            )
+        except Exception as e:
+            logger.debug(f"MemoryRAG: Near-duplicate lookup failed: {e}")
+            return None
+
+        target = int(fingerprint["simhash"], 16)
+        best: Optional[tuple[int, str]] = None
+        for candidate_id, metadata in zip(
+            candidates["ids"], candidates.get("metadatas") or []
+        ):
+            stored = (metadata or {}).get("simhash")
+            if not stored:
+                continue
+            distance = hamming_distance(target, int(stored, 16))
+            if distance <= max_distance and (best is None or distance < best[0]):
+                best = (distance, metadata.get("parent_id") or candidate_id)
+        return best[1] if best else None
+
     def _prepare_base_metadata(
         self,
         metadata: Optional[dict[str, Any]],
@@ -535,11 +949,7 @@ class MemoryRAG:
         logger.debug(
             "Storing as single document (chunking disabled or content too short)"
         )
-        self.collection.add(
-            ids=[doc_id],
-            documents=[content],
-            metadatas=[metadata] if metadata else None,
-        )
+        self._write_documents([doc_id], [content], [metadata] if metadata else None)
         return doc_id
 
     def _store_chunked_document(
@@ -568,41 +978,102 @@ class MemoryRAG:
             f"max_chunk_size={self._chunking_config.max_chunk_size}"
         )
 
-        # Generate chunks with metadata
-        chunks_with_metadata = self.chunker.chunk_with_metadata(
+        # Stream chunks and embed/write them one bounded window at a time
+        chunks = self.chunker.iter_chunks(
             text=content, source=base_metadata.get("file_path", "unknown")
         )
-
-        # Prepare batch data
-        chunk_data = self._prepare_chunk_batch(
-            parent_id, chunks_with_metadata, base_metadata
-        )
+        window_size = self._chunking_config.write_batch_size
+        stored = 0
+        while window := list(islice(chunks, window_size)):
+            chunk_data = self._prepare_chunk_batch(parent_id, window, base_metadata)
+            self._write_documents(
+                chunk_data["ids"], chunk_data["documents"], chunk_data["metadatas"]
+            )
+            stored += len(window)
 
         logger.debug(
-            f"Storing {len(chunk_data['ids'])} chunks (parent_id={parent_id}, "
-            f"avg_chunk_size={len(content) // len(chunk_data['ids'])} chars)"
-        )
-
-        # Batch insert to ChromaDB
-        self.collection.add(
-            ids=chunk_data["ids"],
-            documents=chunk_data["documents"],
-            metadatas=chunk_data["metadatas"],
+            f"Stored {stored} chunks (parent_id={parent_id}, "
+            f"avg_chunk_size={len(content) // max(stored, 1)} chars, "
+            f"write_batch_size={window_size})"
         )
 
         return parent_id
 
+    def _write_documents(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: Optional[list[dict[str, Any]]],
+        upsert: bool = False,
+        embeddings: Optional[list[list[float]]] = None,
+    ) -> None:
+        """Add (or upsert) documents and update the count sidecar.
+
+        Documents whose IDs already exist are left untouched by add() and
+        replaced by upsert(), so only genuinely new IDs are counted.
+
+        Args:
+            ids: Document IDs
+            documents: Document contents
+            metadatas: Per-document metadata (None to store without metadata)
+            upsert: Replace existing documents with the same IDs
+            embeddings: Precomputed vectors (None = embed documents)
+        """
+        previous: dict[str, Any] = {}
+        if self._stats_store() is not None:
+            existing = self.collection.get(
+                ids=list(dict.fromkeys(ids)), include=["metadatas"]  # type: ignore
+            )
+            previous = dict(
+                zip(existing["ids"], existing.get("metadatas") or [None] * len(ids))
+            )
+
+        vectors: dict[str, Any] = {}
+        if embeddings is not None:
+            vectors["embeddings"] = embeddings
+        if upsert:
+            self.collection.upsert(
+                ids=ids, documents=documents, metadatas=metadatas, **vectors  # type: ignore
+            )
+        else:
+            self.collection.add(
+                ids=ids, documents=documents, metadatas=metadatas, **vectors  # type: ignore
+            )
+
+        deltas: Counter[tuple[str, str]] = Counter()
+        for doc_id, metadata in dict(zip(ids, metadatas or [None] * len(ids))).items():
+            if doc_id in previous:
+                if not upsert:
+                    continue
+                deltas[stats_key(previous[doc_id])] -= 1
+            deltas[stats_key(metadata)] += 1
+        self._apply_stats(deltas)
+
+    def _stats_store(self) -> Optional[RAGStatsStore]:
+        """Return the count sidecar, if this instance has one."""
+        return getattr(self, "_stats", None)
+
+    def _apply_stats(self, deltas: "Counter[tuple[str, str]]") -> None:
+        """Apply count changes; failures are healed by the next count()."""
+        stats = self._stats_store()
+        if stats is None or not deltas:
+            return
+        try:
+            stats.apply(dict(deltas))
+        except Exception as e:
+            logger.debug(f"MemoryRAG: Failed to update count sidecar: {e}")
+
     def _prepare_chunk_batch(
         self,
         parent_id: str,
-        chunks_with_metadata: list,
+        chunks_with_metadata: Iterable["ChunkMetadata"],
         base_metadata: dict[str, Any],
     ) -> dict[str, list]:
         """Prepare batch data for ChromaDB insertion.
 
         Args:
             parent_id: Parent document ID
-            chunks_with_metadata: List of ChunkMetadata objects
+            chunks_with_metadata: ChunkMetadata objects (one write window)
             base_metadata: Base metadata to apply to all chunks
 
         Returns:
@@ -629,18 +1100,68 @@ class MemoryRAG:
                     "chunk_source": chunk_meta.source,
                     "start_char": chunk_meta.start_char,
                     "end_char": chunk_meta.end_char,
+                    # Offsets index the parent text (older chunks: approximate)
+                    "exact_offsets": True,
                 }
             )
             chunk_metadatas.append(chunk_metadata)
 
         return {"ids": chunk_ids, "documents": chunk_docs, "metadatas": chunk_metadatas}
 
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed search queries with this collection's embedding function.
+
+        Lets callers embed a query once and reuse the vector across several
+        collections that share the same ``embedding_space``.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            One embedding vector per query
+        """
+        embed_query: Any = getattr(self._embedding_function, "embed_query", None)
+        if embed_query is not None:
+            embeddings = embed_query(queries)
+        else:
+            embeddings = self._embedding_function(queries)
+        return [list(map(float, embedding)) for embedding in embeddings]
+
+    def _build_where(self, user_id: str, agent_name: Optional[str]) -> "Where":
+        """Build metadata filter for user and agent scoping."""
+        # ChromaDB requires $and for multiple conditions
+        if agent_name:
+            return {"$and": [{"user_id": user_id}, {"agent_name": agent_name}]}
+        return {"user_id": user_id}
+
+    def _parse_query_results(
+        self, results: dict[str, Any], index: int
+    ) -> list[dict[str, Any]]:
+        """Flatten the results of one query in a ChromaDB query response."""
+        memories = []
+        if results["documents"]:
+            for i, doc in enumerate(results["documents"][index]):
+                memories.append(
+                    {
+                        "id": results["ids"][index][i],  # ChromaDB content hash
+                        "content": doc,
+                        "distance": results["distances"][index][i],
+                        "metadata": (
+                            results["metadatas"][index][i]
+                            if results["metadatas"]
+                            else None
+                        ),
+                    }
+                )
+        return memories
+
     def recall(
         self,
         query: str,
         user_id: str,
         top_k: int = 5,
         agent_name: Optional[str] = None,
+        query_embedding: Optional[list[float]] = None,
     ) -> list[dict[str, Any]]:
         """Semantic search for memories using vector similarity.
 
@@ -652,6 +1173,8 @@ class MemoryRAG:
             user_id: User identifier (filter by memory owner)
             top_k: Number of results to return (sorted by similarity)
             agent_name: Optional agent name filter (for agent-scoped search)
+            query_embedding: Precomputed query vector (from embed_queries());
+                skips embedding the query again
 
         Returns:
             List of memory dictionaries, each containing:
@@ -660,8 +1183,8 @@ class MemoryRAG:
             - metadata: Optional metadata dict
 
         Note:
-            ChromaDB handles query embedding internally using the default
-            sentence-transformers model. Distance range: 0.0 (identical)
+            Without query_embedding, ChromaDB embeds the query using the
+            collection's embedding function. Distance range: 0.0 (identical)
             to 2.0 (opposite).
 
         Example:
@@ -670,37 +1193,113 @@ class MemoryRAG:
             >>> print(results[0]["content"])
             'Python is a programming language'
         """
-        # Build metadata filter for user and agent scoping
-        # ChromaDB requires $and for multiple conditions
-        where: "Where | None" = None
-        if agent_name:
-            where = {"$and": [{"user_id": user_id}, {"agent_name": agent_name}]}
+        where = self._build_where(user_id, agent_name)
+
+        if query_embedding is not None:
+            results = self.collection.query(
+                query_embeddings=[query_embedding], n_results=top_k, where=where
+            )
         else:
-            where = {"user_id": user_id}
+            # ChromaDB automatically uses embed_query() if custom embedding function provided
+            # This applies 'query:' prefix for E5-series models (defined in ChromaDBEmbeddingFunction)
+            results = self.collection.query(
+                query_texts=[query], n_results=top_k, where=where
+            )
+
+        return self._parse_query_results(results, 0)
+
+    def recall_many(
+        self,
+        queries: list[str],
+        user_id: str,
+        top_k: int = 5,
+        agent_name: Optional[str] = None,
+        query_embeddings: Optional[list[list[float]]] = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Semantic search for several queries in one collection query.
+
+        Queries are embedded in a single batch and sent to ChromaDB together.
+
+        Args:
+            queries: Search queries
+            user_id: User identifier (filter by memory owner)
+            top_k: Number of results per query
+            agent_name: Optional agent name filter
+            query_embeddings: Precomputed query vectors (one per query)
+
+        Returns:
+            One result list per query, in the same order (see recall())
+
+        Raises:
+            ValueError: If query_embeddings length does not match queries
+        """
+        if not queries:
+            return []
+        if query_embeddings is None:
+            query_embeddings = self.embed_queries(queries)
+        elif len(query_embeddings) != len(queries):
+            raise ValueError("query_embeddings must have the same length as queries")
 
-        # Query ChromaDB collection
-        # ChromaDB automatically uses embed_query() if custom embedding function provided
-        # This applies 'query:' prefix for E5-series models (defined in ChromaDBEmbeddingFunction)
         results = self.collection.query(
-            query_texts=[query], n_results=top_k, where=where
+            query_embeddings=query_embeddings,  # type: ignore
+            n_results=top_k,
+            where=self._build_where(user_id, agent_name),
         )
+        return [self._parse_query_results(results, i) for i in range(len(queries))]
 
-        # Parse and flatten ChromaDB results
-        memories = []
-        if results["documents"]:
-            for i, doc in enumerate(results["documents"][0]):
-                memories.append(
-                    {
-                        "id": results["ids"][0][i],  # ChromaDB content hash
-                        "content": doc,
-                        "distance": results["distances"][0][i],
-                        "metadata": (
-                            results["metadatas"][0][i] if results["metadatas"] else None
-                        ),
-                    }
-                )
+    def delete(self, ids: list[str]) -> int:
+        """Delete documents by ID.
 
-        return memories
+        Args:
+            ids: Document (or chunk) IDs to delete; unknown IDs are ignored
+
+        Returns:
+            Number of documents deleted
+        """
+        if not ids:
+            return 0
+        existing = self.collection.get(ids=list(ids), include=["metadatas"])  # type: ignore
+        return self._delete_results(existing)
+
+    def delete_matching(self, filters: dict[str, Any]) -> int:
+        """Delete documents whose metadata equals all given values.
+
+        Args:
+            filters: Metadata field/value pairs (e.g. {"key": ..., "agent_name": ...})
+
+        Returns:
+            Number of documents deleted
+        """
+        if not filters:
+            raise ValueError("filters must not be empty (use delete_all())")
+
+        existing = self.collection.get(
+            where=self._match_all(filters), include=["metadatas"]  # type: ignore
+        )
+        return self._delete_results(existing)
+
+    @staticmethod
+    def _match_all(filters: dict[str, Any]) -> "Where":
+        """Build a metadata filter matching all field/value pairs."""
+        conditions = [{field: value} for field, value in filters.items()]
+        # ChromaDB requires $and for multiple conditions
+        if len(conditions) == 1:
+            return conditions[0]  # type: ignore
+        return {"$and": conditions}  # type: ignore
+
+    def _delete_results(self, results: Any) -> int:
+        """Delete the documents of a get() result and update the sidecar."""
+        doc_ids = results["ids"]
+        if not doc_ids:
+            return 0
+
+        self.collection.delete(ids=doc_ids)
+        metadatas = results.get("metadatas") or [None] * len(doc_ids)
+        deltas: Counter[tuple[str, str]] = Counter()
+        for metadata in metadatas:
+            deltas[stats_key(metadata)] -= 1
+        self._apply_stats(deltas)
+        return len(doc_ids)
 
     def delete_all(self, agent_name: Optional[str] = None) -> None:
         """Delete all memories.
@@ -709,33 +1308,103 @@ class MemoryRAG:
             agent_name: Optional agent name filter (deletes only that agent's memories)
         """
         if agent_name:
-            # Delete by agent - query and delete
-            results = self.collection.get(where={"agent_name": agent_name})
-            if results["ids"]:
-                self.collection.delete(ids=results["ids"])
+            self.delete_matching({"agent_name": agent_name})
         else:
             # Delete entire collection
             self.client.delete_collection(self.collection.name)
             # Recreate collection
             self.collection = self.client.get_or_create_collection(
-                name=self.collection.name, metadata={"hnsw:space": "cosine"}
+                name=self.collection.name,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=self._embedding_function,  # type: ignore
             )
+            stats = self._stats_store()
+            if stats is not None:
+                stats.reset()
 
-    def count(self, agent_name: Optional[str] = None) -> int:
+    def _synced_stats(self) -> Optional[RAGStatsStore]:
+        """Return the count sidecar after checking it against the collection.
+
+        collection.count() is O(1); only when it disagrees with the sidecar
+        (first use on an existing collection, or writes that bypassed this
+        class) are the counts rebuilt from a metadata-only scan.
+        """
+        stats = self._stats_store()
+        if stats is None:
+            return None
+
+        try:
+            if stats.total() != self.collection.count():
+                logger.debug(
+                    f"MemoryRAG: Rebuilding counts for '{self.collection.name}'"
+                )
+                stats.rebuild(self._iter_metadatas())
+        except Exception as e:
+            logger.debug(f"MemoryRAG: Count sidecar unavailable: {e}")
+            return None
+        return stats
+
+    def _iter_metadatas(self, page_size: int = 5000) -> Iterator[Any]:
+        """Yield the metadata of every document, one page at a time."""
+        offset = 0
+        while True:
+            page = self.collection.get(
+                include=["metadatas"], limit=page_size, offset=offset  # type: ignore
+            )
+            if not page["ids"]:
+                return
+            yield from page.get("metadatas") or [None] * len(page["ids"])
+            offset += len(page["ids"])
+
+    def count(
+        self, agent_name: Optional[str] = None, user_id: Optional[str] = None
+    ) -> int:
         """Count stored memories.
 
+        Served from the count sidecar without loading any documents.
+
         Args:
             agent_name: Optional agent name filter
+            user_id: Optional user filter
 
         Returns:
             Number of memories
         """
-        if agent_name:
-            results = self.collection.get(where={"agent_name": agent_name})
-            return len(results["ids"])
-        else:
+        if not agent_name and not user_id:
             return self.collection.count()
 
+        stats = self._synced_stats()
+        if stats is not None:
+            return stats.count(user_id=user_id, agent_name=agent_name or None)
+
+        filters: dict[str, Any] = {}
+        if user_id:
+            filters["user_id"] = user_id
+        if agent_name:
+            filters["agent_name"] = agent_name
+        results = self.collection.get(
+            where=self._match_all(filters), include=[]  # type: ignore
+        )
+        return len(results["ids"])
+
+    def stats(self) -> RAGCollectionStats:
+        """Return document counts per user and per agent.
+
+        Returns:
+            RAGCollectionStats (total, by_user, by_agent)
+        """
+        stats = self._synced_stats()
+        if stats is not None:
+            return stats.stats()
+
+        result = RAGCollectionStats(collection=self.collection.name)
+        for metadata in self._iter_metadatas():
+            user_id, agent_name = stats_key(metadata)
+            result.total += 1
+            result.by_user[user_id] = result.by_user.get(user_id, 0) + 1
+            result.by_agent[agent_name] = result.by_agent.get(agent_name, 0) + 1
+        return result
+
     def _build_chunks_from_results(
         self, results: Any  # GetResult type from ChromaDB
     ) -> list[dict[str, Any]]:
@@ -836,12 +1505,108 @@ class MemoryRAG:
         results = self.collection.get(where=where_clause)
         return self._build_chunks_from_results(results)
 
+    def _get_chunks_by_parent_in_chars(
+        self,
+        parent_id: str,
+        start_char: int,
+        end_char: int,
+        user_id: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Get the chunks of a parent document overlapping a character range.
+
+        Uses the chunks' recorded offsets, so only the chunks covering the
+        range are fetched.
+
+        Args:
+            parent_id: Parent document ID
+            start_char: Range start (inclusive)
+            end_char: Range end (exclusive)
+            user_id: Optional user filter
+
+        Returns:
+            List of chunks sorted by chunk_index
+        """
+        conditions: list[dict[str, Any]] = [
+            {"parent_id": parent_id},
+            {"start_char": {"$lt": end_char}},
+            {"end_char": {"$gt": start_char}},
+        ]
+        if user_id:
+            conditions.append({"user_id": user_id})
+
+        results = self.collection.get(where={"$and": conditions})
+        return self._build_chunks_from_results(results)
+
+    @staticmethod
+    def _stitch_chunks(
+        chunks: list[dict[str, Any]], start_char: int, end_char: int
+    ) -> str:
+        """Rebuild text[start_char:end_char] from chunks with exact offsets.
+
+        Overlapping text is taken once; whitespace the chunker stripped
+        between two chunks is replaced by a single space.
+        """
+        pieces: list[str] = []
+        pos = start_char
+        for chunk in sorted(chunks, key=lambda c: c["metadata"]["start_char"]):
+            chunk_start = chunk["metadata"]["start_char"]
+            chunk_end = min(chunk["metadata"]["end_char"], end_char)
+            if chunk_end <= pos:
+                continue
+            if chunk_start > pos:
+                if pieces:
+                    pieces.append(" ")
+                pos = chunk_start
+            pieces.append(chunk["content"][pos - chunk_start : chunk_end - chunk_start])
+            pos = chunk_end
+            if pos >= end_char:
+                break
+        return "".join(pieces)
+
+    @staticmethod
+    def _has_exact_offsets(chunks: list[dict[str, Any]]) -> bool:
+        return bool(chunks) and all(c["metadata"].get("exact_offsets") for c in chunks)
+
+    def get_text_range(
+        self,
+        parent_id: str,
+        start_char: int,
+        end_char: int,
+        user_id: Optional[str] = None,
+    ) -> str:
+        """Get a character range of a chunked document.
+
+        Only the chunks overlapping the range are fetched, so a slice of a
+        very large document does not load the whole parent.
+
+        Args:
+            parent_id: Parent document ID
+            start_char: Range start in the original document (inclusive)
+            end_char: Range end (exclusive)
+            user_id: Optional user filter
+
+        Returns:
+            The text of the range ("" if no stored chunk covers it)
+
+        Example:
+            >>> rag.get_text_range("doc123", 10_000, 12_000)
+            '...2,000 characters of the document...'
+        """
+        chunks = self._get_chunks_by_parent_in_chars(
+            parent_id, start_char, end_char, user_id
+        )
+        if not self._has_exact_offsets(chunks):
+            # Chunks stored before offsets were exact: whole chunks, in order
+            return "".join(c["content"] for c in chunks)
+        return self._stitch_chunks(chunks, start_char, end_char)
+
     def get_chunk_context(
         self,
         parent_id: str,
         chunk_index: int,
         context_size: int = 1,
         user_id: Optional[str] = None,
+        context_chars: Optional[int] = None,
     ) -> list[dict[str, Any]]:
         """Get neighboring chunks around a specific chunk.
 
@@ -850,6 +1615,10 @@ class MemoryRAG:
             chunk_index: Index of the target chunk (0-indexed)
             context_size: Number of chunks before/after to retrieve (default: 1)
             user_id: Optional user filter
+            context_chars: If set, return the chunks overlapping this many
+                characters before/after the target chunk instead (uses the
+                recorded chunk offsets; falls back to context_size for chunks
+                stored without exact offsets)
 
         Returns:
             List of chunks sorted by chunk_index, including target chunk and neighbors
@@ -859,6 +1628,19 @@ class MemoryRAG:
             >>> chunks = rag.get_chunk_context("doc123", 5, context_size=1)
             >>> print(len(chunks))  # 3 chunks
         """
+        if context_chars is not None:
+            target = self._get_chunks_by_parent_in_range(
+                parent_id, chunk_index, chunk_index + 1, user_id
+            )
+            if self._has_exact_offsets(target):
+                metadata = target[0]["metadata"]
+                return self._get_chunks_by_parent_in_chars(
+                    parent_id,
+                    max(0, metadata["start_char"] - context_chars),
+                    metadata["end_char"] + context_chars,
+                    user_id,
+                )
+
         # Calculate range and use efficient range query
         start_idx = max(0, chunk_index - context_size)
         end_idx = chunk_index + context_size + 1
@@ -899,8 +1681,13 @@ class MemoryRAG:
                 "error": "Document not found",
             }
 
-        # Reconstruct full document
-        full_content = "".join(c["content"] for c in chunks)
+        # Reconstruct full document (overlaps merged when offsets are exact)
+        if self._has_exact_offsets(chunks):
+            full_content = self._stitch_chunks(
+                chunks, 0, max(c["metadata"]["end_char"] for c in chunks)
+            )
+        else:
+            full_content = "".join(c["content"] for c in chunks)
 
         return {
             "full_content": full_content,
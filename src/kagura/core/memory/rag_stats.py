@@ -0,0 +1,243 @@
+"""Per-user/agent document counts for RAG collections.
+
+ChromaDB can only answer filtered counts by materializing every matching
+record (``collection.get(where=...)``). MemoryRAG instead keeps a small
+SQLite sidecar next to the vector store with one row per
+(collection, user_id, agent_name), updated on every store/delete, so that
+count and stats calls are O(1) regardless of collection size.
+
+The sidecar also records the collection total it believes is correct. When
+that disagrees with ``collection.count()`` (e.g. after a write from an
+older version or another process), the counts are rebuilt once from a
+metadata-only scan.
+"""
+
+import sqlite3
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Stored in place of a missing agent_name (NULLs do not compare in PRIMARY KEY)
+_NO_AGENT = ""
+
+
+def stats_key(metadata: Optional[dict[str, Any]]) -> tuple[str, str]:
+    """Return the (user_id, agent_name) bucket a document is counted under.
+
+    Args:
+        metadata: Document metadata as stored in the collection
+
+    Returns:
+        Tuple of (user_id, agent_name); missing values map to ""
+    """
+    metadata = metadata or {}
+    return (
+        str(metadata.get("user_id") or ""),
+        str(metadata.get("agent_name") or _NO_AGENT),
+    )
+
+
+@dataclass
+class RAGCollectionStats:
+    """Document counts of a RAG collection.
+
+    Attributes:
+        collection: Collection name
+        total: Total number of documents (chunks count individually)
+        by_user: Document count per user_id
+        by_agent: Document count per agent_name ("" for unscoped documents)
+    """
+
+    collection: str
+    total: int = 0
+    by_user: dict[str, int] = field(default_factory=dict)
+    by_agent: dict[str, int] = field(default_factory=dict)
+
+
+class RAGStatsStore:
+    """SQLite sidecar holding per-user/agent counts of a RAG collection."""
+
+    def __init__(self, db_path: Path, collection: str) -> None:
+        """Initialize the stats store.
+
+        Args:
+            db_path: Path to the sidecar SQLite database
+            collection: Name of the collection whose counts are tracked
+        """
+        self.db_path = db_path
+        self.collection = collection
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create tables if they don't exist."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rag_counts (
+                    collection TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    agent_name TEXT NOT NULL,
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (collection, user_id, agent_name)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS rag_totals (
+                    collection TEXT PRIMARY KEY,
+                    total INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_rag_counts_agent
+                ON rag_counts(collection, agent_name)
+                """
+            )
+            conn.commit()
+
+    def apply(self, deltas: dict[tuple[str, str], int]) -> None:
+        """Apply count changes.
+
+        Args:
+            deltas: Mapping of (user_id, agent_name) to signed count change
+        """
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not deltas:
+            return
+
+        with sqlite3.connect(self.db_path) as conn:
+            rows = [
+                (self.collection, user_id, agent_name)
+                for (user_id, agent_name) in deltas
+            ]
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO rag_counts (collection, user_id, agent_name)
+                VALUES (?, ?, ?)
+                """,
+                rows,
+            )
+            conn.executemany(
+                """
+                UPDATE rag_counts SET count = MAX(count + ?, 0)
+                WHERE collection = ? AND user_id = ? AND agent_name = ?
+                """,
+                [(delta, *row) for row, delta in zip(rows, deltas.values())],
+            )
+            conn.execute(
+                "DELETE FROM rag_counts WHERE collection = ? AND count = 0",
+                (self.collection,),
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO rag_totals (collection) VALUES (?)",
+                (self.collection,),
+            )
+            conn.execute(
+                """
+                UPDATE rag_totals SET total = MAX(total + ?, 0)
+                WHERE collection = ?
+                """,
+                (sum(deltas.values()), self.collection),
+            )
+            conn.commit()
+
+    def total(self) -> Optional[int]:
+        """Return the collection total recorded in the sidecar.
+
+        Returns:
+            Recorded total, or None if the collection was never counted
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT total FROM rag_totals WHERE collection = ?",
+                (self.collection,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def count(
+        self, user_id: Optional[str] = None, agent_name: Optional[str] = None
+    ) -> int:
+        """Count documents, optionally filtered by user and/or agent.
+
+        Args:
+            user_id: Optional user filter
+            agent_name: Optional agent filter
+
+        Returns:
+            Number of documents
+        """
+        sql = "SELECT COALESCE(SUM(count), 0) FROM rag_counts WHERE collection = ?"
+        params: list[Any] = [self.collection]
+        if user_id is not None:
+            sql += " AND user_id = ?"
+            params.append(user_id)
+        if agent_name is not None:
+            sql += " AND agent_name = ?"
+            params.append(agent_name)
+
+        with sqlite3.connect(self.db_path) as conn:
+            return int(conn.execute(sql, params).fetchone()[0])
+
+    def stats(self) -> RAGCollectionStats:
+        """Return per-user and per-agent counts.
+
+        Returns:
+            RAGCollectionStats for the collection
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(
+                """
+                SELECT user_id, agent_name, count FROM rag_counts
+                WHERE collection = ?
+                """,
+                (self.collection,),
+            ).fetchall()
+
+        result = RAGCollectionStats(collection=self.collection)
+        for user_id, agent_name, count in rows:
+            result.total += count
+            result.by_user[user_id] = result.by_user.get(user_id, 0) + count
+            result.by_agent[agent_name] = result.by_agent.get(agent_name, 0) + count
+        return result
+
+    def rebuild(self, metadatas: Iterable[Optional[dict[str, Any]]]) -> int:
+        """Replace the counts with those of a full metadata scan.
+
+        Args:
+            metadatas: Metadata of every document in the collection
+
+        Returns:
+            New collection total
+        """
+        counts = Counter(stats_key(metadata) for metadata in metadatas)
+        total = sum(counts.values())
+
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "DELETE FROM rag_counts WHERE collection = ?", (self.collection,)
+            )
+            conn.executemany(
+                """
+                INSERT INTO rag_counts (collection, user_id, agent_name, count)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (self.collection, user_id, agent_name, count)
+                    for (user_id, agent_name), count in counts.items()
+                ],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO rag_totals (collection, total) VALUES (?, ?)",
+                (self.collection, total),
+            )
+            conn.commit()
+        return total
+
+    def reset(self) -> None:
+        """Forget all counts (after the collection was dropped)."""
+        self.rebuild([])
@@ -23,10 +23,26 @@ Example:
     >>> reranked = reranker.rerank("What is Python?", candidates, top_k=1)
     >>> print(reranked[0]["content"])
     'Python is a programming language'
+
+Scores are cached per (query, document id, document content) in an LRU
+(``RerankConfig.cache_size``), so repeated queries over unchanged candidates
+skip the cross-encoder. ``RerankConfig.max_candidates`` caps the candidates
+scored per query, and ``RerankConfig.adaptive`` skips or truncates reranking
+when first-stage scores (RRF score, vector distance or BM25 score) already
+separate the results. ``MemoryReranker.stats()`` reports cache hits and the
+time spent per stage.
+
+``RerankConfig.backend = "onnx"`` runs the cross-encoder through onnxruntime
+with int8 quantized weights (see :mod:`kagura.core.memory.onnx_backend`).
 """
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -96,6 +112,81 @@ def is_reranker_available(
     return False
 
 
+def load_rerank_model(name: str, config: RerankConfig) -> Any:
+    """Load (or reuse) a cross-encoder on the configured backend.
+
+    Args:
+        name: Cross-encoder model identifier
+        config: Reranking configuration; ``config.backend`` selects
+            sentence-transformers ("torch") or onnxruntime ("onnx")
+
+    Returns:
+        Model with the CrossEncoder ``predict`` interface
+
+    Raises:
+        ImportError: If the backend's packages are not installed
+    """
+    if config.backend == "onnx":
+        from kagura.core.memory.onnx_backend import load_onnx_cross_encoder
+
+        return load_onnx_cross_encoder(
+            name,
+            quantize=config.quantize,
+            intra_op_threads=config.intra_op_threads,
+        )
+
+    from kagura.core.memory.model_cache import load_cross_encoder
+
+    return load_cross_encoder(name)
+
+
+@dataclass
+class RerankStats:
+    """Reranking counters and cumulative time per stage.
+
+    Attributes:
+        calls: Queries reranked
+        candidates: Candidates received
+        scored: Query-document pairs scored by the cross-encoder
+        cache_hits: Scores served from the cache
+        skipped: Queries answered in first-stage order (adaptive)
+        truncated: Candidates left unscored (budget or adaptive)
+        select_seconds: Choosing the candidates to score
+        cache_seconds: Cache lookups and stores
+        model_seconds: Cross-encoder inference
+    """
+
+    calls: int = 0
+    candidates: int = 0
+    scored: int = 0
+    cache_hits: int = 0
+    skipped: int = 0
+    truncated: int = 0
+    select_seconds: float = 0.0
+    cache_seconds: float = 0.0
+    model_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.cache_hits + self.scored
+        return self.cache_hits / total if total > 0 else 0.0
+
+
+def _first_stage_scores(candidates: list[dict[str, Any]]) -> Optional[list[float]]:
+    """Higher-is-better retrieval scores, or None if any candidate lacks one."""
+    scores = []
+    for candidate in candidates:
+        if candidate.get("rrf_score") is not None:
+            scores.append(float(candidate["rrf_score"]))
+        elif candidate.get("distance") is not None:
+            scores.append(-float(candidate["distance"]))
+        elif candidate.get("score") is not None:
+            scores.append(float(candidate["score"]))
+        else:
+            return None
+    return scores
+
+
 class MemoryReranker:
     """Cross-encoder reranker for memory search results.
 
@@ -130,21 +221,34 @@ class MemoryReranker:
 
         self.config = config or RerankConfig()
         original_model = self.config.model
+
+        # (query, doc id, content digest) -> score, in LRU order
+        self._cache: OrderedDict[tuple[str, str, bytes], float] = OrderedDict()
+        self._stats = RerankStats()
+        self._lock = threading.Lock()
         logger.debug(f"MemoryReranker init: model={self.config.model}")
 
         try:
-            logger.debug("MemoryReranker: Importing sentence_transformers...")
-            from sentence_transformers import CrossEncoder
+            if self.config.backend == "onnx":
+                import onnxruntime  # noqa: F401
+            else:
+                logger.debug("MemoryReranker: Importing sentence_transformers...")
+                import sentence_transformers  # noqa: F401
 
-            logger.debug("MemoryReranker: sentence_transformers imported")
+                logger.debug("MemoryReranker: sentence_transformers imported")
 
             # Try loading the configured model
             try:
                 logger.debug(f"MemoryReranker: Loading CrossEncoder '{self.config.model}'")
                 logger.debug("Note: First run may download model from Hugging Face (slow)")
-                self.model: CrossEncoder = CrossEncoder(self.config.model)
+                self.model: CrossEncoder = load_rerank_model(
+                    self.config.model, self.config
+                )
                 logger.debug("MemoryReranker: CrossEncoder model loaded successfully")
             except Exception as e:
+                if isinstance(e, ImportError) and self.config.backend == "onnx":
+                    # Missing export/quantization package: same for the fallback
+                    raise
                 # Fallback to ms-marco if primary model fails
                 fallback_model = "cross-encoder/ms-marco-MiniLM-L-6-v2"
                 if self.config.model != fallback_model:
@@ -153,7 +257,7 @@ class MemoryReranker:
                         f"Falling back to '{fallback_model}'..."
                     )
                     try:
-                        self.model = CrossEncoder(fallback_model)
+                        self.model = load_rerank_model(fallback_model, self.config)
                         self.config.model = fallback_model  # Update config to reflect actual model
                         logger.info(f"MemoryReranker: Fallback model '{fallback_model}' loaded successfully")
                     except Exception as fallback_error:
@@ -168,6 +272,11 @@ class MemoryReranker:
                         f"Failed to load reranker model '{self.config.model}': {e}"
                     ) from e
         except ImportError as e:
+            if self.config.backend == "onnx":
+                raise ImportError(
+                    f"ONNX reranker backend unavailable: {e}. "
+                    "Install with: pip install onnxruntime"
+                ) from e
             raise ImportError(
                 "sentence-transformers not installed. "
                 "Install with: pip install sentence-transformers"
@@ -187,7 +296,9 @@ class MemoryReranker:
             top_k: Number of results to return (defaults to config.top_k)
 
         Returns:
-            Reranked list of candidates with 'rerank_score' field added
+            Reranked list of candidates with 'rerank_score' field added.
+            Candidates left unscored (budget, adaptive mode) follow the
+            scored ones in first-stage order, without 'rerank_score'.
 
         Example:
             >>> reranker.rerank(
@@ -199,26 +310,7 @@ class MemoryReranker:
         if not candidates:
             return []
 
-        top_k = top_k or self.config.top_k
-
-        # Prepare [query, doc] pairs
-        pairs = [[query, c.get("content", "")] for c in candidates]
-
-        # Batch prediction with cross-encoder
-        scores = self.model.predict(
-            pairs, batch_size=self.config.batch_size, show_progress_bar=False
-        )
-
-        # Add rerank scores to candidates
-        for candidate, score in zip(candidates, scores):
-            candidate["rerank_score"] = float(score)
-
-        # Sort by rerank score (higher is better)
-        reranked = sorted(
-            candidates, key=lambda x: x.get("rerank_score", -float("inf")), reverse=True
-        )
-
-        return reranked[:top_k]
+        return self.rerank_batch([query], [candidates], top_k=top_k)[0]
 
     def rerank_batch(
         self,
@@ -237,7 +329,7 @@ class MemoryReranker:
             List of reranked candidate lists
 
         Note:
-            All reranking is done in a single batched call for efficiency.
+            Uncached pairs of all queries are scored in a single batched call.
         """
         if len(queries) != len(candidates_list):
             raise ValueError("queries and candidates_list must have same length")
@@ -247,42 +339,155 @@ class MemoryReranker:
 
         top_k = top_k or self.config.top_k
 
-        # Flatten all [query, doc] pairs for batched prediction
-        all_pairs: list[list[str]] = []
-        pair_counts: list[int] = []  # Track how many pairs per query
+        start = time.perf_counter()
+        selections = [self._select(candidates, top_k) for candidates in candidates_list]
+        select_seconds = time.perf_counter() - start
 
-        for query, candidates in zip(queries, candidates_list):
-            query_pairs = [[query, c.get("content", "")] for c in candidates]
-            all_pairs.extend(query_pairs)
-            pair_counts.append(len(query_pairs))
+        # Flatten all [query, doc] pairs for batched scoring
+        pairs = [
+            (query, candidate)
+            for query, (head, _) in zip(queries, selections)
+            for candidate in head
+        ]
+        scores = self._score(pairs)
 
-        # Batch predict all at once
-        all_scores = self.model.predict(
-            all_pairs, batch_size=self.config.batch_size, show_progress_bar=False
-        )
-
-        # Split scores back to per-query groups
         results: list[list[dict[str, Any]]] = []
         score_idx = 0
+        for head, tail in selections:
+            for candidate in head:
+                candidate["rerank_score"] = scores[score_idx]
+                score_idx += 1
+
+            reranked = sorted(head, key=lambda x: x["rerank_score"], reverse=True)
+            results.append((reranked + tail)[:top_k])
+
+        with self._lock:
+            self._stats.calls += len(queries)
+            self._stats.candidates += sum(len(c) for c in candidates_list)
+            self._stats.truncated += sum(len(tail) for _, tail in selections)
+            self._stats.skipped += sum(
+                1 for (head, tail) in selections if not head and tail
+            )
+            self._stats.select_seconds += select_seconds
+
+        return results
+
+    def _select(
+        self, candidates: list[dict[str, Any]], top_k: int
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Split candidates into those to score and those kept as ranked.
+
+        Without a budget or adaptive mode every candidate is scored. With
+        them, candidates are ordered by first-stage score (when every
+        candidate has one) and:
+
+        - adaptive: candidates whose normalized score is more than
+          ``adaptive_margin`` below the top_k-th candidate are not scored;
+          if no more than top_k remain and each is ``adaptive_margin`` ahead
+          of the next, nothing is scored (first-stage order is kept)
+        - max_candidates: at most this many candidates are scored
+
+        Returns:
+            (candidates to score, remaining candidates in first-stage order)
+        """
+        config = self.config
+        if not config.adaptive and config.max_candidates is None:
+            return candidates, []
+
+        first = _first_stage_scores(candidates)
+        head = candidates
+        if first is not None:
+            order = sorted(range(len(candidates)), key=lambda i: -first[i])
+            head = [candidates[i] for i in order]
+            first = [first[i] for i in order]
+
+        keep = len(head)
+        if config.adaptive and first is not None and len(first) > 1:
+            span = first[0] - first[-1]
+            if span > 0:
+                norm = [(score - first[-1]) / span for score in first]
+                margin = config.adaptive_margin
+                boundary = norm[min(top_k, len(norm)) - 1]
+                keep = sum(1 for score in norm if score >= boundary - margin)
+                separated = all(
+                    norm[i] - norm[i + 1] >= margin for i in range(keep - 1)
+                )
+                if keep <= top_k and separated:
+                    return [], head
 
-        for candidates, count in zip(candidates_list, pair_counts):
-            # Get scores for this query's candidates
-            query_scores = all_scores[score_idx : score_idx + count]
-            score_idx += count
+        if config.max_candidates is not None:
+            keep = min(keep, config.max_candidates)
+        return head[:keep], head[keep:]
 
-            # Add rerank scores
-            for candidate, score in zip(candidates, query_scores):
-                candidate["rerank_score"] = float(score)
+    def _score(self, pairs: list[tuple[str, dict[str, Any]]]) -> list[float]:
+        """Score (query, candidate) pairs, using and filling the cache."""
+        if not pairs:
+            return []
 
-            # Sort and take top-k
-            reranked = sorted(
-                candidates,
-                key=lambda x: x.get("rerank_score", -float("inf")),
-                reverse=True,
+        start = time.perf_counter()
+        cache_enabled = self.config.cache_size > 0
+        keys = [self._cache_key(query, c) for query, c in pairs]
+        scores: list[Optional[float]] = [None] * len(pairs)
+        if cache_enabled:
+            with self._lock:
+                for i, key in enumerate(keys):
+                    cached = self._cache.get(key)
+                    if cached is not None:
+                        self._cache.move_to_end(key)
+                        scores[i] = cached
+
+        # Each distinct uncached pair is predicted once
+        pending: dict[tuple[str, str, bytes], list[int]] = {}
+        for i, score in enumerate(scores):
+            if score is None:
+                pending.setdefault(keys[i], []).append(i)
+        cache_seconds = time.perf_counter() - start
+
+        model_seconds = 0.0
+        if pending:
+            start = time.perf_counter()
+            first_index = [indexes[0] for indexes in pending.values()]
+            predicted = self.model.predict(
+                [[pairs[i][0], pairs[i][1].get("content", "")] for i in first_index],
+                batch_size=self.config.batch_size,
+                show_progress_bar=False,
             )
-            results.append(reranked[:top_k])
+            model_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with self._lock:
+                for (key, indexes), value in zip(pending.items(), predicted):
+                    for i in indexes:
+                        scores[i] = float(value)
+                    if cache_enabled:
+                        self._cache[key] = float(value)
+                while len(self._cache) > self.config.cache_size:
+                    self._cache.popitem(last=False)
+            cache_seconds += time.perf_counter() - start
+
+        with self._lock:
+            self._stats.scored += len(pending)
+            self._stats.cache_hits += len(pairs) - sum(
+                len(indexes) for indexes in pending.values()
+            )
+            self._stats.cache_seconds += cache_seconds
+            self._stats.model_seconds += model_seconds
 
-        return results
+        return scores  # type: ignore[return-value]
+
+    @staticmethod
+    def _cache_key(query: str, candidate: dict[str, Any]) -> tuple[str, str, bytes]:
+        """(query, document id, document version) for the score cache.
+
+        The version is a digest of the content, so an updated document under
+        the same id is scored again.
+        """
+        content = candidate.get("content", "")
+        doc_id = candidate.get("id") or candidate.get("key") or ""
+        version = hashlib.blake2b(
+            content.encode("utf-8", errors="replace"), digest_size=16
+        ).digest()
+        return query, str(doc_id), version
 
     def score_pair(self, query: str, document: str) -> float:
         """Score a single query-document pair.
@@ -298,12 +503,32 @@ class MemoryReranker:
             >>> score = reranker.score_pair("Python", "Python is a language")
             >>> print(f"Relevance: {score:.2f}")
         """
-        score = self.model.predict([[query, document]], show_progress_bar=False)[0]
-        return float(score)
+        return self._score([(query, {"content": document})])[0]
+
+    def stats(self) -> dict[str, Any]:
+        """Get reranking statistics.
+
+        Returns:
+            Dictionary with RerankStats counters and stage times, hit_rate,
+            and the current and maximum cache size
+        """
+        with self._lock:
+            return {
+                **asdict(self._stats),
+                "hit_rate": self._stats.hit_rate,
+                "cache_size": len(self._cache),
+                "max_cache_size": self.config.cache_size,
+            }
+
+    def clear_cache(self) -> None:
+        """Drop all cached scores."""
+        with self._lock:
+            self._cache.clear()
 
     def __repr__(self) -> str:
         """String representation."""
         return (
             f"MemoryReranker(model={self.config.model}, "
-            f"batch_size={self.config.batch_size})"
+            f"batch_size={self.config.batch_size}, "
+            f"backend={self.config.backend})"
         )
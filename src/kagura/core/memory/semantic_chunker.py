@@ -37,12 +37,22 @@ Example:
     >>> chunks_with_metadata = chunker.chunk_with_metadata(mixed, source="doc.txt")
     >>> print(chunks_with_metadata[0].chunk_index)
     0
+
+Large documents:
+    ``iter_chunks()`` is a generator: the text is split one bounded segment
+    (cut at a paragraph or line break) at a time, so multi-megabyte logs or
+    transcripts never materialize all chunk strings and metadata at once.
+    ``start_char``/``end_char`` are the chunk's exact position in the text,
+    so ranges can be sliced from stored chunks without the parent document.
+
+    >>> for chunk in chunker.iter_chunks(huge_log, source="app.log"):
+    ...     store(chunk)
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 if TYPE_CHECKING:
     # Type stub for optional dependency
@@ -58,19 +68,15 @@ class ChunkMetadata:
         chunk_index: Position of this chunk in the sequence (0-indexed)
         total_chunks: Total number of chunks in the document
         source: Source identifier (file path, URL, etc.)
-        start_char: APPROXIMATE character position where this chunk starts
-        end_char: APPROXIMATE character position where this chunk ends
+        start_char: Character position where this chunk starts
+        end_char: Character position where this chunk ends (exclusive)
         content: The actual chunk text
 
-    Warning:
-        start_char and end_char are APPROXIMATIONS when overlap > 0.
-        RecursiveCharacterTextSplitter doesn't track original indices,
-        so positions are calculated heuristically.
-
-        For accurate document reconstruction:
-        - Sort chunks by chunk_index (not by start_char)
-        - Concatenate chunk.content in order
-        - Do NOT use start_char/end_char for slicing original text
+    Note:
+        ``text[start_char:end_char] == content``. Consecutive chunks overlap
+        (``overlap`` > 0), and whitespace stripped between chunks is not
+        part of any chunk, so reconstruct a range by merging chunks on their
+        offsets rather than concatenating contents.
     """
 
     chunk_index: int
@@ -92,6 +98,7 @@ class SemanticChunker:
         max_chunk_size: Maximum characters per chunk
         overlap: Number of overlapping characters between chunks
         separators: List of separators in priority order (default: paragraph > sentence > word)
+        segment_size: Characters handed to the splitter at a time
         splitter: RecursiveCharacterTextSplitter instance
     """
 
@@ -100,6 +107,7 @@ class SemanticChunker:
         max_chunk_size: int = 512,
         overlap: int = 50,
         separators: Optional[list[str]] = None,
+        segment_size: Optional[int] = None,
     ):
         """Initialize semantic chunker.
 
@@ -108,12 +116,16 @@ class SemanticChunker:
             overlap: Number of characters to overlap between chunks (default: 50)
             separators: Custom separators in priority order
                         (default: ["\n\n", "\n", ". ", " ", ""])
+            segment_size: Characters split at a time; bounds the memory of
+                        splitting very large texts (default: 64 chunks,
+                        at least 64K characters)
 
         Raises:
             ImportError: If langchain-text-splitters is not installed
         """
         self.max_chunk_size = max_chunk_size
         self.overlap = overlap
+        self.segment_size = segment_size or max(max_chunk_size * 64, 65536)
         self.separators = separators or [
             "\n\n",  # Paragraph breaks (highest priority)
             "\n",  # Line breaks
@@ -174,9 +186,53 @@ class SemanticChunker:
         if not text or not text.strip():
             return []
 
+        return [content for _, _, content in self._iter_spans(text)]
+
+    def _segments(self, text: str) -> Iterator[tuple[int, str]]:
+        """Cut text into segments of at most segment_size characters.
+
+        Each segment ends at the highest-priority separator found in its
+        second half, so semantic boundaries are kept.
+
+        Yields:
+            (offset of the segment in text, segment)
+        """
+        pos = 0
+        while pos < len(text):
+            end = min(pos + self.segment_size, len(text))
+            if end < len(text):
+                for separator in self.separators:
+                    if not separator:
+                        break
+                    cut = text.rfind(separator, pos + (end - pos) // 2, end)
+                    if cut != -1:
+                        end = cut + len(separator)
+                        break
+            yield pos, text[pos:end]
+            pos = end
+
+    def _iter_spans(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Split text segment by segment.
+
+        Yields:
+            (start_char, end_char, content) of each chunk, in order
+        """
         # LangChain's RecursiveCharacterTextSplitter handles the splitting
-        chunks = self.splitter.split_text(text)
-        return chunks
+        for offset, segment in self._segments(text):
+            search_from = previous_end = 0
+            for content in self.splitter.split_text(segment):
+                # The next chunk overlaps the previous one by at most
+                # `overlap` characters. In repetitive text (log lines) the same
+                # content also occurs earlier, so take its last occurrence that
+                # starts within the overlap, else the first one after it
+                local = segment.rfind(content, search_from, previous_end + len(content))
+                if local == -1:
+                    local = segment.find(content, search_from)
+                if local == -1:  # not verbatim (custom splitter): best guess
+                    local = search_from
+                yield offset + local, offset + local + len(content), content
+                previous_end = local + len(content)
+                search_from = max(local + 1, previous_end - self.overlap)
 
     def chunk_with_metadata(
         self, text: str, source: str = "unknown"
@@ -198,38 +254,55 @@ class SemanticChunker:
             >>> print(chunks[0].chunk_index, chunks[0].source)
             0 doc.pdf
         """
-        # Split text into chunks (chunk() handles validation)
-        chunk_strings = self.chunk(text)
-        if not chunk_strings:
+        if not text or not text.strip():
             return []
 
-        total_chunks = len(chunk_strings)
+        spans = list(self._iter_spans(text))
+        return [
+            ChunkMetadata(
+                chunk_index=idx,
+                total_chunks=len(spans),
+                source=source,
+                start_char=start_char,
+                end_char=end_char,
+                content=content,
+            )
+            for idx, (start_char, end_char, content) in enumerate(spans)
+        ]
+
+    def iter_chunks(
+        self, text: str, source: str = "unknown"
+    ) -> Iterator[ChunkMetadata]:
+        """Stream chunks with metadata, holding one segment at a time.
+
+        Same chunks as chunk_with_metadata(), but generated lazily. The text
+        is split twice (once to count total_chunks), trading CPU for never
+        holding all chunks of a very large document.
 
-        # Build metadata for each chunk
-        chunk_metadata_list = []
-        current_pos = 0
+        Args:
+            text: Input text to split
+            source: Source identifier (file path, URL, document ID, etc.)
 
-        for idx, chunk_content in enumerate(chunk_strings):
-            # Find chunk position in original text
-            # Note: This is approximate due to overlap
-            start_char = current_pos
-            end_char = start_char + len(chunk_content)
+        Yields:
+            ChunkMetadata objects in chunk_index order
 
-            chunk_metadata = ChunkMetadata(
+        Example:
+            >>> for chunk in chunker.iter_chunks(transcript, source="call.txt"):
+            ...     print(chunk.chunk_index, chunk.start_char)
+        """
+        if not text or not text.strip():
+            return
+
+        total_chunks = sum(1 for _ in self._iter_spans(text))
+        for idx, (start_char, end_char, content) in enumerate(self._iter_spans(text)):
+            yield ChunkMetadata(
                 chunk_index=idx,
                 total_chunks=total_chunks,
                 source=source,
                 start_char=start_char,
                 end_char=end_char,
-                content=chunk_content,
+                content=content,
             )
-            chunk_metadata_list.append(chunk_metadata)
-
-            # Move position forward (accounting for overlap)
-            # Overlap means next chunk starts before current chunk ends
-            current_pos += len(chunk_content) - self.overlap
-
-        return chunk_metadata_list
 
     def __repr__(self) -> str:
         """String representation of chunker."""
@@ -0,0 +1,726 @@
+"""Incremental, parallel source code indexer for RAG.
+
+Indexes source files into a MemoryRAG collection as AST-level chunks
+(module docstrings, classes, functions, methods).
+
+Features:
+- File manifest (path, mtime, size, content hash) so only changed files
+  are re-parsed and re-embedded
+- Stale chunk removal for modified and deleted files
+- AST parsing in a process pool (off the event loop)
+- Batched embedding and vector writes
+
+Example:
+    >>> indexer = SourceCodeIndexer(
+    ...     rag=memory.rag,
+    ...     manifest_path=memory.persistent.db_path,
+    ...     user_id="kiyota",
+    ...     project_id="kagura-ai",
+    ... )
+    >>> stats = await indexer.index_files(files, root=Path("src"))
+    >>> print(stats.files_indexed, stats.files_unchanged)
+"""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from kagura.core.memory.rag import MemoryRAG
+
+logger = logging.getLogger(__name__)
+
+# Below this many changed files, parsing inline is cheaper than starting a pool
+_PARALLEL_PARSE_THRESHOLD = 16
+
+# Chunks per embedding + vector write call
+_DEFAULT_BATCH_SIZE = 256
+
+
+@dataclass
+class IndexStats:
+    """Statistics for a single indexing run.
+
+    Attributes:
+        files_scanned: Files considered in this run
+        files_indexed: Files (re-)parsed and written
+        files_unchanged: Files skipped by the manifest check
+        files_removed: Previously indexed files that no longer exist
+        chunks_written: Chunks embedded and written
+        chunks_deleted: Stale chunks removed
+        errors: Per-file error messages
+    """
+
+    files_scanned: int = 0
+    files_indexed: int = 0
+    files_unchanged: int = 0
+    files_removed: int = 0
+    chunks_written: int = 0
+    chunks_deleted: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class _ManifestEntry:
+    """Manifest row for one indexed file."""
+
+    mtime_ns: int
+    size: int
+    content_hash: str
+    chunk_count: int
+
+
+def extract_code_chunks(
+    source: str,
+    tree: ast.AST,
+    file_path: Path,
+    overlap_lines: int = 5,
+) -> list[dict]:
+    """Extract code chunks from AST for indexing with overlap.
+
+    Args:
+        source: Source code string
+        tree: AST tree
+        file_path: Path to source file
+        overlap_lines: Number of lines to overlap before/after (default: 5)
+
+    Returns:
+        List of chunk dictionaries with overlapping context
+    """
+    chunks = []
+    source_lines = source.splitlines()
+    total_lines = len(source_lines)
+
+    # Extract imports for context
+    imports = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.append(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module or ""
+            for alias in node.names:
+                imports.append(f"{module}.{alias.name}")
+
+    imports_context = "Imports: " + ", ".join(imports[:10]) if imports else ""
+
+    # Module-level docstring + imports (full file overview)
+    if (
+        isinstance(tree, ast.Module)
+        and hasattr(tree, "body")
+        and tree.body
+        and isinstance(tree.body[0], ast.Expr)
+        and isinstance(tree.body[0].value, ast.Constant)
+    ):
+        docstring = tree.body[0].value.value
+        if isinstance(docstring, str):
+            chunks.append(
+                {
+                    "file_path": str(file_path),
+                    "type": "module",
+                    "name": file_path.stem,
+                    "line_start": 1,
+                    "line_end": len(docstring.split("\n")),
+                    "content": f"{docstring}\n\n{imports_context}",
+                    "imports": imports,
+                }
+            )
+
+    # Find all top-level classes for context
+    classes_info = {}
+    if isinstance(tree, ast.Module) and hasattr(tree, "body"):
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef):
+                classes_info[node.name] = {
+                    "line_start": node.lineno,
+                    "line_end": node.end_lineno or node.lineno,
+                    "docstring": ast.get_docstring(node) or "",
+                }
+
+    # Functions and classes with overlap
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            # Function/method
+            func_name = node.name
+            line_start = node.lineno
+            line_end = node.end_lineno or line_start
+
+            # Add overlap context
+            overlap_start = max(1, line_start - overlap_lines)
+            overlap_end = min(total_lines, line_end + overlap_lines)
+
+            # Extract function with overlap
+            func_source_with_overlap = "\n".join(
+                source_lines[overlap_start - 1 : overlap_end]
+            )
+
+            # Get docstring
+            docstring = ast.get_docstring(node) or ""
+
+            # Find parent class if method
+            parent_class = None
+            for class_name, class_info in classes_info.items():
+                if (
+                    line_start >= class_info["line_start"]
+                    and line_end <= class_info["line_end"]
+                ):
+                    parent_class = class_name
+                    break
+
+            context = f"Function: {func_name}"
+            if parent_class:
+                context = f"Class: {parent_class}, Method: {func_name}"
+
+            chunks.append(
+                {
+                    "file_path": str(file_path),
+                    "type": "function" if not parent_class else "method",
+                    "name": func_name,
+                    "line_start": line_start,
+                    "line_end": line_end,
+                    "content": (
+                        f"{context}\n"
+                        f"{imports_context}\n\n"
+                        f"Code (with {overlap_lines}-line overlap):\n"
+                        f"{func_source_with_overlap}\n\n"
+                        f"Docstring:\n{docstring}"
+                    ),
+                    "parent_class": parent_class,
+                    "imports": imports,
+                }
+            )
+
+        elif isinstance(node, ast.ClassDef):
+            # Class definition with all methods
+            class_name = node.name
+            line_start = node.lineno
+            line_end = node.end_lineno or line_start
+
+            # Add overlap
+            overlap_start = max(1, line_start - overlap_lines)
+            overlap_end = min(total_lines, line_end + overlap_lines)
+
+            # Extract class source with overlap
+            class_source = "\n".join(source_lines[overlap_start - 1 : overlap_end])
+
+            # Get docstring
+            docstring = ast.get_docstring(node) or ""
+
+            # List methods with signatures
+            methods = []
+            for m in node.body:
+                if isinstance(m, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    # Get method signature
+                    args = [a.arg for a in m.args.args]
+                    methods.append(f"{m.name}({', '.join(args)})")
+
+            chunks.append(
+                {
+                    "file_path": str(file_path),
+                    "type": "class",
+                    "name": class_name,
+                    "line_start": line_start,
+                    "line_end": line_end,
+                    "content": (
+                        f"Class: {class_name}\n"
+                        f"{imports_context}\n\n"
+                        f"Code (with {overlap_lines}-line overlap):\n"
+                        f"{class_source}\n\n"
+                        f"Docstring:\n{docstring}\n\n"
+                        f"Methods ({len(methods)}):\n"
+                        + "\n".join(f"- {m}" for m in methods)
+                    ),
+                    "methods": methods,
+                    "imports": imports,
+                }
+            )
+
+    return chunks
+
+
+def _parse_source_file(path_str: str) -> tuple[str, Optional[list[dict]], str]:
+    """Read and chunk a single Python file (process pool worker).
+
+    Args:
+        path_str: Absolute file path
+
+    Returns:
+        Tuple of (path, chunks or None on error, error message)
+    """
+    file_path = Path(path_str)
+    try:
+        source = file_path.read_text(encoding="utf-8")
+        tree = ast.parse(source, filename=path_str)
+        return path_str, extract_code_chunks(source, tree, file_path), ""
+    except SyntaxError as e:
+        return path_str, None, f"{file_path.name}: Syntax error at line {e.lineno}"
+    except Exception as e:
+        return path_str, None, f"{file_path.name}: {str(e)[:100]}"
+
+
+def _hash_file(path: Path) -> str:
+    """Compute SHA-256 of file contents.
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SourceIndexManifest:
+    """SQLite manifest of indexed source files.
+
+    Tracks (path, mtime, size, content hash, chunk count) per
+    user/project so unchanged files can be skipped and stale chunks of
+    modified or deleted files can be removed.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize manifest.
+
+        Args:
+            db_path: SQLite database path (may be shared with PersistentMemory)
+        """
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS source_index_manifest (
+                    user_id TEXT NOT NULL,
+                    project_id TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    chunk_count INTEGER NOT NULL,
+                    indexed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, project_id, path)
+                )
+            """)
+
+    def load(self, user_id: str, project_id: str) -> dict[str, _ManifestEntry]:
+        """Load all manifest entries for a project.
+
+        Args:
+            user_id: User identifier
+            project_id: Project identifier
+
+        Returns:
+            Mapping of file path to manifest entry
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                """
+                SELECT path, mtime_ns, size, content_hash, chunk_count
+                FROM source_index_manifest
+                WHERE user_id = ? AND project_id = ?
+                """,
+                (user_id, project_id),
+            )
+            return {
+                row[0]: _ManifestEntry(row[1], row[2], row[3], row[4])
+                for row in cursor.fetchall()
+            }
+
+    def paths(
+        self, user_id: str, project_id: str, root: Optional[Path] = None
+    ) -> list[str]:
+        """List indexed file paths (e.g. as the file set for a content search).
+
+        Args:
+            user_id: User identifier
+            project_id: Project identifier
+            root: Only files under this directory
+
+        Returns:
+            Sorted file paths
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(
+                """
+                SELECT path FROM source_index_manifest
+                WHERE user_id = ? AND project_id = ?
+                ORDER BY path
+                """,
+                (user_id, project_id),
+            )
+            paths = [row[0] for row in cursor.fetchall()]
+        if root is None:
+            return paths
+        prefix = str(Path(root).resolve())
+        return [p for p in paths if p == prefix or p.startswith(prefix + os.sep)]
+
+    def upsert(
+        self,
+        user_id: str,
+        project_id: str,
+        entries: dict[str, _ManifestEntry],
+    ) -> None:
+        """Insert or update manifest entries.
+
+        Args:
+            user_id: User identifier
+            project_id: Project identifier
+            entries: Mapping of file path to manifest entry
+        """
+        if not entries:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO source_index_manifest
+                    (user_id, project_id, path, mtime_ns, size, content_hash,
+                     chunk_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        user_id,
+                        project_id,
+                        path,
+                        e.mtime_ns,
+                        e.size,
+                        e.content_hash,
+                        e.chunk_count,
+                    )
+                    for path, e in entries.items()
+                ],
+            )
+
+    def remove(self, user_id: str, project_id: str, paths: list[str]) -> None:
+        """Remove manifest entries.
+
+        Args:
+            user_id: User identifier
+            project_id: Project identifier
+            paths: File paths to remove
+        """
+        if not paths:
+            return
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                DELETE FROM source_index_manifest
+                WHERE user_id = ? AND project_id = ? AND path = ?
+                """,
+                [(user_id, project_id, path) for path in paths],
+            )
+
+
+class SourceCodeIndexer:
+    """Incremental source code indexer backed by MemoryRAG.
+
+    Chunk IDs are deterministic per (user, project, file, chunk index), so a
+    modified file's previous chunks can be deleted by ID without a metadata
+    scan.
+    """
+
+    def __init__(
+        self,
+        rag: MemoryRAG,
+        manifest_path: Path,
+        user_id: str,
+        project_id: str,
+        agent_name: Optional[str] = None,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Initialize indexer.
+
+        Args:
+            rag: Target RAG collection
+            manifest_path: SQLite path for the file manifest
+            user_id: User identifier (memory owner)
+            project_id: Project identifier
+            agent_name: Optional agent name for scoping
+            batch_size: Chunks per embedding/write batch
+            max_workers: Parser processes (default: CPU count)
+        """
+        self.rag = rag
+        self.manifest = SourceIndexManifest(manifest_path)
+        self.user_id = user_id
+        self.project_id = project_id
+        self.agent_name = agent_name
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def _file_key(self, path: str) -> str:
+        """Stable short identifier for a file within this project."""
+        unique = f"{self.user_id}:{self.project_id}:{path}"
+        return hashlib.sha256(unique.encode()).hexdigest()[:16]
+
+    def _chunk_ids(self, path: str, count: int) -> list[str]:
+        """Deterministic chunk IDs for a file."""
+        file_key = self._file_key(path)
+        return [f"src_{file_key}_{i:04d}" for i in range(count)]
+
+    async def index_files(
+        self,
+        files: list[Path],
+        root: Optional[Path] = None,
+        language: str = "python",
+        force: bool = False,
+        matches: Optional[Callable[[Path], bool]] = None,
+    ) -> IndexStats:
+        """Index files, re-processing only those that changed.
+
+        Args:
+            files: Files to index
+            root: Scanned root directory. Previously indexed files under it
+                that are not in ``files`` are removed from the index if they
+                no longer exist on disk (or if ``matches`` accepts them).
+            language: Source language recorded in chunk metadata
+            force: Re-index every file regardless of the manifest
+            matches: Optional predicate for the pattern set ``files`` was
+                selected with. Indexed files it accepts that are missing from
+                ``files`` are removed; files it rejects (e.g. scanned with a
+                narrower pattern) keep their chunks.
+
+        Returns:
+            Indexing statistics
+        """
+        stats = IndexStats(files_scanned=len(files))
+        manifest = self.manifest.load(self.user_id, self.project_id)
+
+        # 1. Change detection (stat first, hash only when stat differs)
+        changed: dict[str, _ManifestEntry] = {}
+        touched: dict[str, _ManifestEntry] = {}
+        current_paths: set[str] = set()
+        for file_path in files:
+            path = str(file_path)
+            current_paths.add(path)
+            try:
+                st = file_path.stat()
+            except OSError as e:
+                stats.errors.append(f"{file_path.name}: {e}")
+                continue
+
+            previous = manifest.get(path)
+            if (
+                not force
+                and previous is not None
+                and previous.mtime_ns == st.st_mtime_ns
+                and previous.size == st.st_size
+            ):
+                stats.files_unchanged += 1
+                continue
+
+            content_hash = await asyncio.to_thread(_hash_file, file_path)
+            entry = _ManifestEntry(st.st_mtime_ns, st.st_size, content_hash, 0)
+            if (
+                not force
+                and previous is not None
+                and previous.content_hash == content_hash
+            ):
+                # Touched but identical: refresh stat fields only
+                entry.chunk_count = previous.chunk_count
+                touched[path] = entry
+                stats.files_unchanged += 1
+                continue
+
+            changed[path] = entry
+
+        # 2. Files that disappeared from the scanned root. Files outside the
+        # current pattern set still exist on disk and keep their chunks.
+        removed: list[str] = []
+        if root is not None:
+            root_prefix = str(root.resolve())
+            missing = [
+                path
+                for path in manifest
+                if path not in current_paths
+                and (path == root_prefix or path.startswith(root_prefix + os.sep))
+            ]
+            removed = await asyncio.to_thread(
+                lambda: [
+                    path
+                    for path in missing
+                    if not os.path.exists(path)
+                    or (matches is not None and matches(Path(path)))
+                ]
+            )
+
+        # 3. Delete stale chunks of modified and removed files
+        stale_ids: list[str] = []
+        for path in [*changed, *removed]:
+            previous = manifest.get(path)
+            if previous is not None and previous.chunk_count:
+                stale_ids.extend(self._chunk_ids(path, previous.chunk_count))
+        if stale_ids:
+            for start in range(0, len(stale_ids), self.batch_size * 4):
+                self.rag.delete(stale_ids[start : start + self.batch_size * 4])
+            stats.chunks_deleted = len(stale_ids)
+        stats.files_removed = len(removed)
+
+        # First manifest-based index of this project: chunks written by the
+        # pre-manifest indexer (content-hash IDs) would otherwise duplicate
+        if not manifest and changed:
+            stats.chunks_deleted += await asyncio.to_thread(
+                self._delete_legacy_chunks, list(changed)
+            )
+
+        # 4. Parse changed files (process pool off the event loop)
+        parsed = await self._parse_files(list(changed))
+
+        # 5. Embed and write chunks in batches
+        ids: list[str] = []
+        documents: list[str] = []
+        metadatas: list[Optional[dict[str, Any]]] = []
+        for path, chunks, error in parsed:
+            if chunks is None:
+                stats.errors.append(error)
+                # Keep the file out of the manifest so it is retried next run
+                changed.pop(path, None)
+                continue
+
+            changed[path].chunk_count = len(chunks)
+            stats.files_indexed += 1
+            for chunk_id, chunk in zip(self._chunk_ids(path, len(chunks)), chunks):
+                ids.append(chunk_id)
+                documents.append(self._format_chunk(chunk))
+                metadatas.append(self._chunk_metadata(chunk, language))
+
+            if len(ids) >= self.batch_size:
+                stats.chunks_written += await self._write_batch(
+                    ids, documents, metadatas
+                )
+                ids, documents, metadatas = [], [], []
+
+        if ids:
+            stats.chunks_written += await self._write_batch(ids, documents, metadatas)
+
+        # 6. Persist manifest
+        self.manifest.upsert(self.user_id, self.project_id, {**touched, **changed})
+        self.manifest.remove(self.user_id, self.project_id, removed)
+
+        logger.info(
+            f"Source index {self.project_id}: {stats.files_indexed} indexed, "
+            f"{stats.files_unchanged} unchanged, {stats.files_removed} removed, "
+            f"{stats.chunks_written} chunks written, "
+            f"{stats.chunks_deleted} chunks deleted"
+        )
+        return stats
+
+    async def _parse_files(
+        self, paths: list[str]
+    ) -> list[tuple[str, Optional[list[dict]], str]]:
+        """Parse files, using a process pool for larger change sets.
+
+        Args:
+            paths: File paths to parse
+
+        Returns:
+            List of (path, chunks or None, error message)
+        """
+        if not paths:
+            return []
+
+        if len(paths) < _PARALLEL_PARSE_THRESHOLD or self.max_workers <= 1:
+            return await asyncio.to_thread(
+                lambda: [_parse_source_file(p) for p in paths]
+            )
+
+        workers = min(self.max_workers, len(paths))
+        chunksize = max(1, len(paths) // (workers * 4))
+
+        def run_pool() -> list[tuple[str, Optional[list[dict]], str]]:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_parse_source_file, paths, chunksize=chunksize))
+
+        try:
+            return await asyncio.to_thread(run_pool)
+        except Exception as e:
+            # Pool unavailable (e.g. restricted environment) - parse inline
+            logger.warning(f"Process pool parsing failed ({e}), parsing inline")
+            return await asyncio.to_thread(
+                lambda: [_parse_source_file(p) for p in paths]
+            )
+
+    async def _write_batch(
+        self,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[Optional[dict[str, Any]]],
+    ) -> int:
+        """Embed and write one batch of chunks.
+
+        Args:
+            ids: Chunk IDs
+            documents: Chunk documents
+            metadatas: Chunk metadata
+
+        Returns:
+            Number of chunks written
+        """
+        await asyncio.to_thread(
+            self.rag.store_batch,
+            documents,
+            self.user_id,
+            metadatas,
+            self.agent_name,
+            ids,
+        )
+        return len(ids)
+
+    def _delete_legacy_chunks(self, paths: list[str]) -> int:
+        """Delete chunks stored for these files before the manifest existed.
+
+        Args:
+            paths: File paths about to be indexed
+
+        Returns:
+            Number of chunks deleted
+        """
+        deleted = 0
+        for start in range(0, len(paths), self.batch_size):
+            deleted += self.rag.delete_matching(
+                {
+                    "type": "source_code",
+                    "user_id": self.user_id,
+                    "file_path": {"$in": paths[start : start + self.batch_size]},
+                }
+            )
+        return deleted
+
+    def _format_chunk(self, chunk: dict) -> str:
+        """Build the embedded document text for a chunk."""
+        return (
+            f"File: {chunk['file_path']}\n"
+            f"Type: {chunk['type']}\n"
+            f"Name: {chunk['name']}\n"
+            f"Lines: {chunk['line_start']}-{chunk['line_end']}\n\n"
+            f"{chunk['content']}"
+        )
+
+    def _chunk_metadata(self, chunk: dict, language: str) -> dict[str, Any]:
+        """Build vector metadata for a chunk."""
+        return {
+            "type": "source_code",
+            "file_path": str(chunk["file_path"]),
+            "line_start": chunk["line_start"],
+            "line_end": chunk["line_end"],
+            "chunk_type": chunk["type"],
+            "name": chunk["name"],
+            "language": language,
+            "project_id": self.project_id,
+        }
@@ -0,0 +1,1130 @@
+"""Pluggable vector stores for MemoryRAG.
+
+MemoryRAG talks to its vector store through the small subset of the
+ChromaDB client/collection API described by :class:`VectorClient` and
+:class:`VectorCollection`. Two backends implement it:
+
+- ``chromadb``: ``chromadb.PersistentClient`` (HNSW index, default)
+- ``flat``: :class:`FlatVectorClient`, an embedded exact-search store
+
+The flat backend keeps one memory-mapped matrix of unit-normalized vectors
+per user (float16, or int8 with a per-row scale) plus a SQLite table for
+ids, documents and metadata. Queries scan the matrices of the users named
+in the ``where`` filter and select the top-k with ``np.argpartition``. For
+the few-thousand-vector stores typical of per-user memory, an exact scan is
+both faster and far lighter than maintaining an HNSW graph.
+
+Example:
+    >>> client = FlatVectorClient(tmp_path, embedding_function=embed)
+    >>> col = client.get_or_create_collection("memories")
+    >>> col.add(ids=["1"], documents=["hello"], metadatas=[{"user_id": "u"}])
+    >>> col.query(query_texts=["hi"], n_results=1, where={"user_id": "u"})
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Literal, Optional, Protocol, Sequence
+
+import numpy as np
+
+from kagura.core.memory.dedup import SIMHASH_BANDS
+
+logger = logging.getLogger(__name__)
+
+VectorBackend = Literal["chromadb", "flat"]
+Quantization = Literal["float16", "int8"]
+
+EmbeddingFunction = Callable[[list[str]], Sequence[Sequence[float]]]
+
+_DEFAULT_INCLUDE = ("documents", "metadatas")
+_QUERY_INCLUDE = ("documents", "metadatas", "distances")
+
+# Rewrite a partition file once this many of its rows are dead
+_COMPACT_MIN_DEAD_ROWS = 1024
+
+# Partition used for documents without a user_id
+_SHARED_PARTITION = "_shared"
+
+# Metadata fields mirrored into document_terms, so get(where=...) can select
+# candidates in SQL (chunk lookups by parent, near-duplicate SimHash bands)
+_INDEXED_FIELDS = frozenset(
+    ["parent_id", *(f"simhash_b{i}" for i in range(SIMHASH_BANDS))]
+)
+
+
+class VectorCollection(Protocol):
+    """Collection API used by MemoryRAG (subset of ``chromadb.Collection``)."""
+
+    name: str
+
+    def add(self, ids: list[str], **kwargs: Any) -> None: ...
+
+    def upsert(self, ids: list[str], **kwargs: Any) -> None: ...
+
+    def get(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def query(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def delete(self, ids: Optional[list[str]] = None, **kwargs: Any) -> None: ...
+
+    def count(self) -> int: ...
+
+    def peek(self, limit: int = 10) -> dict[str, Any]: ...
+
+
+class VectorClient(Protocol):
+    """Client API used by MemoryRAG (subset of ``chromadb.ClientAPI``)."""
+
+    def get_collection(self, name: str, **kwargs: Any) -> VectorCollection: ...
+
+    def create_collection(self, name: str, **kwargs: Any) -> VectorCollection: ...
+
+    def get_or_create_collection(
+        self, name: str, **kwargs: Any
+    ) -> VectorCollection: ...
+
+    def delete_collection(self, name: str) -> None: ...
+
+
+def match_where(metadata: Optional[dict[str, Any]], where: Optional[dict]) -> bool:
+    """Evaluate a ChromaDB-style metadata filter against one document.
+
+    Supports field equality, ``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``,
+    ``$lte``, ``$in``, ``$nin`` and the logical ``$and``/``$or`` operators.
+
+    Args:
+        metadata: Document metadata
+        where: Filter (None matches everything)
+
+    Returns:
+        True if the document matches
+    """
+    if not where:
+        return True
+    metadata = metadata or {}
+
+    for field, condition in where.items():
+        if field == "$and":
+            if not all(match_where(metadata, sub) for sub in condition):
+                return False
+        elif field == "$or":
+            if not any(match_where(metadata, sub) for sub in condition):
+                return False
+        elif isinstance(condition, dict):
+            value = metadata.get(field)
+            for op, operand in condition.items():
+                if not _compare(value, op, operand):
+                    return False
+        elif metadata.get(field) != condition:
+            return False
+    return True
+
+
+def _compare(value: Any, op: str, operand: Any) -> bool:
+    """Apply one comparison operator of a metadata filter."""
+    if op == "$eq":
+        return value == operand
+    if op == "$ne":
+        return value != operand
+    if op == "$in":
+        return value in operand
+    if op == "$nin":
+        return value not in operand
+    if value is None:
+        return False
+    try:
+        if op == "$gt":
+            return value > operand
+        if op == "$gte":
+            return value >= operand
+        if op == "$lt":
+            return value < operand
+        if op == "$lte":
+            return value <= operand
+    except TypeError:
+        return False
+    raise ValueError(f"Unsupported where operator: {op}")
+
+
+def _where_users(where: Optional[dict]) -> Optional[set[str]]:
+    """Return the user_ids a filter is restricted to, or None if unrestricted."""
+    if not where:
+        return None
+    users: Optional[set[str]] = None
+    for field, condition in where.items():
+        found: Optional[set[str]] = None
+        if field == "user_id":
+            if isinstance(condition, dict):
+                if "$eq" in condition:
+                    found = {condition["$eq"]}
+                elif "$in" in condition:
+                    found = set(condition["$in"])
+            else:
+                found = {condition}
+        elif field == "$and":
+            for sub in condition:
+                sub_users = _where_users(sub)
+                if sub_users is not None:
+                    found = sub_users if found is None else found & sub_users
+        if found is not None:
+            users = found if users is None else users & found
+    return users
+
+
+def _without_user_filter(where: dict) -> Optional[dict]:
+    """Drop the user_id conditions that partition selection already enforces.
+
+    Only valid for filters where _where_users() is not None: every partition
+    holds the documents of a single user.
+    """
+    residual: dict[str, Any] = {}
+    for field, condition in where.items():
+        if field == "user_id" and (
+            not isinstance(condition, dict) or {"$eq", "$in"} & condition.keys()
+        ):
+            continue
+        if field == "$and":
+            subs = [_without_user_filter(sub) for sub in condition]
+            subs = [sub for sub in subs if sub]
+            if len(subs) == 1:
+                residual.update(subs[0])
+            elif subs:
+                residual["$and"] = subs
+            continue
+        residual[field] = condition
+    return residual or None
+
+
+def _term_value(value: Any) -> Optional[str]:
+    """Encode an indexable metadata value (str or int), else None."""
+    if isinstance(value, str) or (
+        isinstance(value, int) and not isinstance(value, bool)
+    ):
+        return json.dumps(value)
+    return None
+
+
+def _where_terms(where: Optional[dict]) -> list[list[tuple[str, str]]]:
+    """Index lookups implied by a filter, as AND-ed lists of OR-ed terms.
+
+    Every document matching ``where`` has at least one term of each list,
+    so the lists select a superset of the matches; conditions that cannot
+    be looked up (other fields, ranges, floats) are left to match_where().
+    """
+    clauses: list[list[tuple[str, str]]] = []
+    for field, condition in (where or {}).items():
+        if field == "$and":
+            for sub in condition:
+                clauses.extend(_where_terms(sub))
+        elif field == "$or":
+            # One clause of each branch: any match satisfies one of them
+            alternatives: list[tuple[str, str]] = []
+            for sub in condition:
+                sub_clauses = _where_terms(sub)
+                if not sub_clauses:
+                    break
+                alternatives.extend(sub_clauses[0])
+            else:
+                if alternatives:
+                    clauses.append(alternatives)
+        elif field in _INDEXED_FIELDS:
+            if isinstance(condition, dict):
+                if "$eq" in condition:
+                    values = [condition["$eq"]]
+                elif "$in" in condition:
+                    values = list(condition["$in"])
+                else:
+                    continue
+            else:
+                values = [condition]
+            encoded = [_term_value(value) for value in values]
+            if encoded and None not in encoded:
+                clauses.append(
+                    [(field, value) for value in encoded if value is not None]
+                )
+    return clauses
+
+
+def _partition_name(user_id: Optional[str]) -> str:
+    """Map a user_id to a filesystem-safe partition name."""
+    if not user_id:
+        return _SHARED_PARTITION
+    digest = hashlib.sha256(str(user_id).encode()).hexdigest()[:12]
+    safe = re.sub(r"[^A-Za-z0-9_-]", "_", str(user_id))[:32]
+    return f"{safe}-{digest}"
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize rows (cosine similarity becomes a dot product)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class _Partition:
+    """Live rows of one user's vector matrix, cached in memory."""
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        ids: list[str],
+        metadatas: list[Optional[dict[str, Any]]],
+        matrix: Optional[np.ndarray],
+        scales: Optional[np.ndarray],
+    ) -> None:
+        self.rows = rows
+        self.ids = ids
+        self.metadatas = metadatas
+        self.matrix = matrix
+        self.scales = scales
+
+    def scores(self, query: np.ndarray, mask: Optional[np.ndarray]) -> np.ndarray:
+        """Cosine similarity of the query against the (masked) live rows."""
+        rows = self.rows if mask is None else self.rows[mask]
+        if self.matrix is None or not len(rows):
+            return np.empty(0, dtype=np.float32)
+        vectors = self.matrix[rows]
+        scores = vectors.astype(np.float32, copy=False) @ query
+        if self.scales is not None:
+            scores *= self.scales[rows]
+        return scores
+
+
+class FlatVectorCollection:
+    """Exact-search collection over per-user memory-mapped matrices.
+
+    Mirrors the parts of ``chromadb.Collection`` that MemoryRAG uses, with
+    cosine distances (``1 - similarity``) like an ``hnsw:space=cosine``
+    ChromaDB collection.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        name: str,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        quantization: Quantization = "float16",
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Open (or create) a collection directory.
+
+        Args:
+            path: Collection directory
+            name: Collection name
+            embedding_function: Embeds documents/query_texts
+            quantization: Vector storage format for new collections
+            metadata: Collection metadata (stored on creation)
+        """
+        self.name = name
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._embedding_function = embedding_function
+        self._db_path = self.path / "collection.db"
+        self._lock = threading.RLock()
+        self._partitions: dict[str, _Partition] = {}
+        # Files replaced by a compaction, removed once the write commits
+        self._obsolete: dict[str, int] = {}
+        self._cache_version = -1
+        self._init_db(quantization, metadata or {})
+
+    # ---- storage ------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._db_path)
+
+    def _init_db(self, quantization: Quantization, metadata: dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    id TEXT PRIMARY KEY,
+                    partition TEXT NOT NULL,
+                    row INTEGER NOT NULL,
+                    document TEXT,
+                    metadata TEXT
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_documents_partition "
+                "ON documents(partition, row)"
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS partitions (
+                    partition TEXT PRIMARY KEY,
+                    rows INTEGER NOT NULL DEFAULT 0,
+                    generation INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS document_terms (
+                    field TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    PRIMARY KEY (field, value, id)
+                ) WITHOUT ROWID
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_document_terms_id ON document_terms(id)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO info (key, value) VALUES ('quantization', ?)",
+                (quantization,),
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO info (key, value) VALUES ('metadata', ?)",
+                (json.dumps(metadata),),
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO info (key, value) VALUES ('version', '0')"
+            )
+            conn.commit()
+            info = dict(conn.execute("SELECT key, value FROM info").fetchall())
+            if "terms" not in info:
+                self._index_existing_terms(conn)
+
+        self.quantization: Quantization = info["quantization"]  # type: ignore[assignment]
+        self.metadata = json.loads(info["metadata"])
+        self._dimension: Optional[int] = (
+            int(info["dimension"]) if "dimension" in info else None
+        )
+        self._dtype = np.int8 if self.quantization == "int8" else np.float16
+
+    def _index_existing_terms(self, conn: sqlite3.Connection) -> None:
+        """Fill document_terms for collections written before it existed."""
+        conn.execute("BEGIN IMMEDIATE")
+        if conn.execute("SELECT 1 FROM info WHERE key = 'terms'").fetchone():
+            conn.commit()
+            return
+        records = conn.execute(
+            "SELECT id, metadata FROM documents WHERE metadata IS NOT NULL"
+        )
+        self._insert_terms(conn, ((r[0], json.loads(r[1])) for r in records))
+        conn.execute("INSERT INTO info (key, value) VALUES ('terms', '1')")
+        conn.commit()
+
+    @staticmethod
+    def _insert_terms(
+        conn: sqlite3.Connection,
+        documents: Iterable[tuple[str, Optional[dict[str, Any]]]],
+    ) -> None:
+        terms = []
+        for doc_id, metadata in documents:
+            for field in _INDEXED_FIELDS & (metadata or {}).keys():
+                value = _term_value(metadata[field])  # type: ignore[index]
+                if value is not None:
+                    terms.append((field, value, doc_id))
+        conn.executemany(
+            "INSERT OR IGNORE INTO document_terms (field, value, id) VALUES (?, ?, ?)",
+            terms,
+        )
+
+    def _file_path(self, partition: str, generation: int, suffix: str) -> Path:
+        # Compaction writes a new generation; generation 0 keeps the plain name
+        name = partition if not generation else f"{partition}.{generation}"
+        return self.path / f"{name}{suffix}"
+
+    def _matrix_path(self, partition: str, generation: int = 0) -> Path:
+        return self._file_path(partition, generation, ".vec")
+
+    def _scales_path(self, partition: str, generation: int = 0) -> Path:
+        return self._file_path(partition, generation, ".scale")
+
+    def _partition_info(
+        self, conn: sqlite3.Connection, partition: str
+    ) -> tuple[int, int]:
+        """Return (rows, generation) of a partition's vector files."""
+        row = conn.execute(
+            "SELECT rows, generation FROM partitions WHERE partition = ?",
+            (partition,),
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+    def _begin_write(self, conn: sqlite3.Connection) -> None:
+        """Take the database write lock before reading anything a write uses.
+
+        self._lock only serializes threads of this process. Other processes
+        may write the same collection, so the next free row of a partition
+        (and the dimension) must be read under SQLite's write lock, which is
+        held until the commit that records the appended rows.
+        """
+        conn.execute("BEGIN IMMEDIATE")
+        self._obsolete.clear()
+        if self._dimension is None:
+            row = conn.execute(
+                "SELECT value FROM info WHERE key = 'dimension'"
+            ).fetchone()
+            if row is not None:
+                self._dimension = int(row[0])
+
+    def _version(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM info WHERE key = 'version'").fetchone()
+        return int(row[0])
+
+    def _bump_version(self, conn: sqlite3.Connection, touched: set[str]) -> None:
+        """Record a write; only the touched partitions leave the cache.
+
+        If another process wrote since the cache was loaded, the whole cache
+        is dropped on the next read instead (see _sync).
+        """
+        version = self._version(conn)
+        conn.execute(
+            "UPDATE info SET value = ? WHERE key = 'version'", (str(version + 1),)
+        )
+        if version == self._cache_version:
+            self._cache_version = version + 1
+            for partition in touched:
+                self._partitions.pop(partition, None)
+
+    def _encode(self, vectors: np.ndarray) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """Quantize unit vectors to the on-disk format."""
+        if self.quantization == "int8":
+            scales = np.abs(vectors).max(axis=1) / 127.0
+            scales[scales == 0] = 1.0
+            quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+            return quantized, scales.astype(np.float32)
+        return vectors.astype(np.float16), None
+
+    def _embed(
+        self,
+        documents: Optional[list[str]],
+        embeddings: Optional[Sequence[Sequence[float]]],
+        query: bool = False,
+    ) -> np.ndarray:
+        """Return unit-normalized float32 vectors for documents or embeddings."""
+        if embeddings is None:
+            if documents is None:
+                raise ValueError("Either documents or embeddings must be provided")
+            if self._embedding_function is None:
+                raise ValueError(f"Collection '{self.name}' has no embedding function")
+            embed = self._embedding_function
+            if query and hasattr(embed, "embed_query"):
+                embed = embed.embed_query  # type: ignore[union-attr]
+            embeddings = embed(list(documents))
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        if vectors.ndim != 2:
+            raise ValueError("Embeddings must be a 2-D array")
+        if self._dimension is not None and vectors.shape[1] != self._dimension:
+            raise ValueError(
+                f"Embedding dimension {vectors.shape[1]} does not match collection "
+                f"dimensionality {self._dimension}"
+            )
+        return _normalize(vectors)
+
+    # ---- cache --------------------------------------------------------------
+
+    def _sync(self, conn: sqlite3.Connection) -> None:
+        """Drop cached partitions if any process wrote since they were loaded."""
+        version = self._version(conn)
+        if version != self._cache_version:
+            self._partitions.clear()
+            self._cache_version = version
+
+    def _load_partition(self, conn: sqlite3.Connection, partition: str) -> _Partition:
+        cached = self._partitions.get(partition)
+        if cached is not None:
+            return cached
+
+        # One read transaction: a compaction renumbers rows and switches
+        # files together, so both must come from the same snapshot
+        own_transaction = not conn.in_transaction
+        if own_transaction:
+            conn.execute("BEGIN")
+        try:
+            records = conn.execute(
+                "SELECT row, id, metadata FROM documents "
+                "WHERE partition = ? ORDER BY row",
+                (partition,),
+            ).fetchall()
+            total_rows, generation = self._partition_info(conn, partition)
+
+            matrix: Optional[np.ndarray] = None
+            scales: Optional[np.ndarray] = None
+            if total_rows and self._dimension:
+                matrix = np.memmap(
+                    self._matrix_path(partition, generation),
+                    dtype=self._dtype,
+                    mode="r",
+                    shape=(total_rows, self._dimension),
+                )
+                if self.quantization == "int8":
+                    scales = np.fromfile(
+                        self._scales_path(partition, generation), dtype=np.float32
+                    )[:total_rows]
+        finally:
+            if own_transaction:
+                conn.commit()
+
+        loaded = _Partition(
+            rows=np.fromiter(
+                (r[0] for r in records), dtype=np.int64, count=len(records)
+            ),
+            ids=[r[1] for r in records],
+            metadatas=[json.loads(r[2]) if r[2] else None for r in records],
+            matrix=matrix,
+            scales=scales,
+        )
+        self._partitions[partition] = loaded
+        return loaded
+
+    def _partitions_for(
+        self, conn: sqlite3.Connection, where: Optional[dict]
+    ) -> list[str]:
+        users = _where_users(where)
+        if users is not None:
+            return sorted({_partition_name(user) for user in users})
+        return [r[0] for r in conn.execute("SELECT partition FROM partitions")]
+
+    # ---- writes -------------------------------------------------------------
+
+    def add(
+        self,
+        ids: list[str],
+        documents: Optional[list[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+        metadatas: Optional[list[Optional[dict[str, Any]]]] = None,
+    ) -> None:
+        """Add documents; IDs that already exist are left unchanged."""
+        self._write(ids, documents, embeddings, metadatas, replace=False)
+
+    def upsert(
+        self,
+        ids: list[str],
+        documents: Optional[list[str]] = None,
+        embeddings: Optional[Sequence[Sequence[float]]] = None,
+        metadatas: Optional[list[Optional[dict[str, Any]]]] = None,
+    ) -> None:
+        """Add documents, replacing any with the same IDs."""
+        self._write(ids, documents, embeddings, metadatas, replace=True)
+
+    def _write(
+        self,
+        ids: list[str],
+        documents: Optional[list[str]],
+        embeddings: Optional[Sequence[Sequence[float]]],
+        metadatas: Optional[list[Optional[dict[str, Any]]]],
+        replace: bool,
+    ) -> None:
+        if not ids:
+            return
+        if len(set(ids)) != len(ids):
+            raise ValueError("Expected IDs to be unique")
+
+        with self._lock, self._connect() as conn:
+            self._begin_write(conn)
+            existing = self._existing_ids(conn, ids)
+            keep = [
+                i for i, doc_id in enumerate(ids) if replace or doc_id not in existing
+            ]
+            if not keep:
+                return
+
+            vectors = self._embed(
+                [documents[i] for i in keep] if documents is not None else None,
+                [embeddings[i] for i in keep] if embeddings is not None else None,
+            )
+            if self._dimension is None:
+                self._dimension = int(vectors.shape[1])
+                conn.execute(
+                    "INSERT OR REPLACE INTO info (key, value) VALUES ('dimension', ?)",
+                    (str(self._dimension),),
+                )
+
+            touched: set[str] = set()
+            stale = [ids[i] for i in keep if ids[i] in existing]
+            if stale:
+                touched |= self._delete_ids(conn, stale)
+
+            by_partition: dict[str, list[int]] = {}
+            for position, i in enumerate(keep):
+                metadata = metadatas[i] if metadatas else None
+                user_id = (metadata or {}).get("user_id")
+                by_partition.setdefault(_partition_name(user_id), []).append(position)
+
+            touched.update(by_partition)
+            for partition, positions in by_partition.items():
+                start = self._append_vectors(conn, partition, vectors[positions])
+                conn.executemany(
+                    """
+                    INSERT INTO documents (id, partition, row, document, metadata)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            ids[keep[p]],
+                            partition,
+                            start + offset,
+                            documents[keep[p]] if documents is not None else None,
+                            json.dumps(metadatas[keep[p]])
+                            if metadatas and metadatas[keep[p]]
+                            else None,
+                        )
+                        for offset, p in enumerate(positions)
+                    ],
+                )
+                if metadatas:
+                    self._insert_terms(
+                        conn, ((ids[keep[p]], metadatas[keep[p]]) for p in positions)
+                    )
+
+            self._bump_version(conn, touched)
+            conn.commit()
+            self._remove_obsolete()
+
+    def _existing_ids(self, conn: sqlite3.Connection, ids: Sequence[str]) -> set[str]:
+        found: set[str] = set()
+        for start in range(0, len(ids), 500):
+            batch = list(ids[start : start + 500])
+            placeholders = ",".join("?" * len(batch))
+            found.update(
+                r[0]
+                for r in conn.execute(
+                    f"SELECT id FROM documents WHERE id IN ({placeholders})", batch
+                )
+            )
+        return found
+
+    def _append_vectors(
+        self, conn: sqlite3.Connection, partition: str, vectors: np.ndarray
+    ) -> int:
+        """Append rows to a partition file and return the first new row index."""
+        start, generation = self._partition_info(conn, partition)
+
+        encoded, scales = self._encode(vectors)
+        self._append_file(self._matrix_path(partition, generation), encoded, start)
+        if scales is not None:
+            self._append_file(self._scales_path(partition, generation), scales, start)
+
+        conn.execute(
+            """
+            INSERT INTO partitions (partition, rows) VALUES (?, ?)
+            ON CONFLICT(partition) DO UPDATE SET rows = excluded.rows
+            """,
+            (partition, start + len(vectors)),
+        )
+        return start
+
+    @staticmethod
+    def _append_file(path: Path, array: np.ndarray, start_row: int) -> None:
+        """Write rows at start_row, discarding any bytes past it.
+
+        Truncating first makes a write that crashed before its SQLite commit
+        harmless: the next append simply overwrites the orphaned rows.
+        """
+        row_bytes = array[0].nbytes if array.ndim > 1 else array.itemsize
+        with open(path, "ab") as f:
+            f.truncate(start_row * row_bytes)
+            f.write(np.ascontiguousarray(array).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+    def delete(
+        self, ids: Optional[list[str]] = None, where: Optional[dict] = None
+    ) -> None:
+        """Delete documents by ID and/or metadata filter."""
+        with self._lock, self._connect() as conn:
+            self._begin_write(conn)
+            if where is not None:
+                matched = self.get(ids=ids, where=where, include=[])["ids"]
+            else:
+                matched = list(ids or [])
+            if not matched:
+                return
+            touched = self._delete_ids(conn, matched)
+            self._bump_version(conn, touched)
+            conn.commit()
+            self._remove_obsolete()
+
+    def _delete_ids(self, conn: sqlite3.Connection, ids: Sequence[str]) -> set[str]:
+        """Delete rows by ID and return the partitions they lived in."""
+        touched: set[str] = set()
+        for start in range(0, len(ids), 500):
+            batch = list(ids[start : start + 500])
+            placeholders = ",".join("?" * len(batch))
+            touched.update(
+                r[0]
+                for r in conn.execute(
+                    f"SELECT DISTINCT partition FROM documents WHERE id IN ({placeholders})",
+                    batch,
+                )
+            )
+            conn.execute(f"DELETE FROM documents WHERE id IN ({placeholders})", batch)
+            conn.execute(
+                f"DELETE FROM document_terms WHERE id IN ({placeholders})", batch
+            )
+        for partition in touched:
+            self._maybe_compact(conn, partition)
+        return touched
+
+    def _maybe_compact(self, conn: sqlite3.Connection, partition: str) -> None:
+        """Rewrite a partition without dead rows once enough have accumulated.
+
+        The live rows are copied to files of the next generation, and the
+        new row numbers are written in the same transaction that switches
+        the partition to them. Until that commits the old files stay
+        authoritative; they are removed only afterwards (_remove_obsolete).
+        """
+        total, generation = self._partition_info(conn, partition)
+        live = conn.execute(
+            "SELECT row, id FROM documents WHERE partition = ? ORDER BY row",
+            (partition,),
+        ).fetchall()
+        dead = total - len(live)
+        if dead < _COMPACT_MIN_DEAD_ROWS or dead < len(live):
+            return
+
+        logger.debug(
+            f"FlatVectorCollection: Compacting '{self.name}/{partition}' "
+            f"({dead} dead of {total} rows)"
+        )
+        self._partitions.pop(partition, None)
+        rows = np.array([r[0] for r in live], dtype=np.int64)
+        new_generation = generation + 1
+        files: list[tuple[Path, Path, Any, Optional[int]]] = [
+            (
+                self._matrix_path(partition, generation),
+                self._matrix_path(partition, new_generation),
+                self._dtype,
+                self._dimension,
+            )
+        ]
+        if self.quantization == "int8":
+            files.append(
+                (
+                    self._scales_path(partition, generation),
+                    self._scales_path(partition, new_generation),
+                    np.float32,
+                    None,
+                )
+            )
+        for old_path, new_path, dtype, width in files:
+            data = np.fromfile(old_path, dtype=dtype)
+            if width:
+                data = data.reshape(-1, width)
+            with open(new_path, "wb") as f:
+                f.write(np.ascontiguousarray(data[rows]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+        conn.executemany(
+            "UPDATE documents SET row = ? WHERE id = ?",
+            [(new_row, doc_id) for new_row, (_, doc_id) in enumerate(live)],
+        )
+        conn.execute(
+            "UPDATE partitions SET rows = ?, generation = ? WHERE partition = ?",
+            (len(live), new_generation, partition),
+        )
+        self._obsolete[partition] = new_generation
+
+    def _remove_obsolete(self) -> None:
+        """Delete the files of generations replaced by a committed compaction.
+
+        Older generations left behind by a crash after a commit are removed
+        too. Later generations are never touched: another process may be
+        writing one that it has not committed yet.
+        """
+        for partition, current in self._obsolete.items():
+            for path in self.path.glob(f"{partition}*"):
+                parts = path.name.split(".")
+                if parts[-1] not in ("vec", "scale"):
+                    continue
+                if len(parts) == 2:
+                    generation = 0
+                elif len(parts) == 3 and parts[1].isdigit():
+                    generation = int(parts[1])
+                else:
+                    continue
+                if parts[0] == partition and generation < current:
+                    path.unlink(missing_ok=True)
+        self._obsolete.clear()
+
+    # ---- reads --------------------------------------------------------------
+
+    def count(self) -> int:
+        """Return the number of documents."""
+        with self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0])
+
+    def get(
+        self,
+        ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Sequence[str] = _DEFAULT_INCLUDE,
+    ) -> dict[str, Any]:
+        """Fetch documents by ID and/or metadata filter."""
+        want_docs = "documents" in include
+        want_embeddings = "embeddings" in include
+        columns = "id, partition, row, metadata" + (", document" if want_docs else "")
+
+        with self._connect() as conn:
+            if ids is not None:
+                records = []
+                for start in range(0, len(ids), 500):
+                    batch = list(ids[start : start + 500])
+                    placeholders = ",".join("?" * len(batch))
+                    records.extend(
+                        conn.execute(
+                            f"SELECT {columns} FROM documents WHERE id IN ({placeholders})",
+                            batch,
+                        ).fetchall()
+                    )
+                order = {doc_id: i for i, doc_id in enumerate(ids)}
+                records.sort(key=lambda r: order[r[0]])
+            else:
+                # Narrow in SQL (user partitions, indexed terms); match_where()
+                # below still applies the full filter to the candidates
+                clauses: list[str] = []
+                params: list[Any] = []
+                if _where_users(where) is not None:
+                    partitions = self._partitions_for(conn, where)
+                    clauses.append(f"partition IN ({','.join('?' * len(partitions))})")
+                    params.extend(partitions)
+                for terms in _where_terms(where):
+                    matches = " OR ".join(["(field = ? AND value = ?)"] * len(terms))
+                    clauses.append(
+                        f"id IN (SELECT id FROM document_terms WHERE {matches})"
+                    )
+                    params.extend(part for term in terms for part in term)
+                sql = f"SELECT {columns} FROM documents"
+                if clauses:
+                    sql += " WHERE " + " AND ".join(clauses)
+                records = conn.execute(f"{sql} ORDER BY rowid", params).fetchall()
+
+            parsed = [(r, json.loads(r[3]) if r[3] else None) for r in records]
+            if where:
+                parsed = [(r, m) for r, m in parsed if match_where(m, where)]
+            start = offset or 0
+            parsed = parsed[start : start + limit if limit is not None else None]
+
+            result: dict[str, Any] = {
+                "ids": [r[0] for r, _ in parsed],
+                "documents": [r[4] for r, _ in parsed] if want_docs else None,
+                "metadatas": [m for _, m in parsed] if "metadatas" in include else None,
+                "embeddings": None,
+            }
+            if want_embeddings:
+                with self._lock:
+                    self._sync(conn)
+                    result["embeddings"] = [
+                        self._decode_row(conn, r[1], r[2]) for r, _ in parsed
+                    ]
+        return result
+
+    def _decode_row(self, conn: sqlite3.Connection, partition: str, row: int) -> list:
+        loaded = self._load_partition(conn, partition)
+        assert loaded.matrix is not None
+        vector = loaded.matrix[row].astype(np.float32)
+        if loaded.scales is not None:
+            vector *= loaded.scales[row]
+        return vector.tolist()
+
+    def peek(self, limit: int = 10) -> dict[str, Any]:
+        """Return the first documents including their embeddings."""
+        return self.get(limit=limit, include=["documents", "metadatas", "embeddings"])
+
+    def query(
+        self,
+        query_texts: Optional[list[str]] = None,
+        query_embeddings: Optional[Sequence[Sequence[float]]] = None,
+        n_results: int = 10,
+        where: Optional[dict] = None,
+        include: Sequence[str] = _QUERY_INCLUDE,
+    ) -> dict[str, Any]:
+        """Exact top-k search by cosine distance."""
+        queries = self._embed(query_texts, query_embeddings, query=True)
+        ids: list[list[str]] = []
+        distances: list[list[float]] = []
+        metadatas: list[list[Any]] = []
+
+        with self._lock, self._connect() as conn:
+            self._sync(conn)
+            candidates = []
+            residual = where
+            if where and _where_users(where) is not None:
+                residual = _without_user_filter(where)
+            for partition in self._partitions_for(conn, where):
+                loaded = self._load_partition(conn, partition)
+                mask = None
+                if residual:
+                    mask = np.fromiter(
+                        (match_where(m, residual) for m in loaded.metadatas),
+                        dtype=bool,
+                        count=len(loaded.metadatas),
+                    )
+                    if not mask.any():
+                        continue
+                candidates.append((loaded, mask))
+
+            for query in queries:
+                scores_parts = []
+                refs: list[tuple[_Partition, np.ndarray]] = []
+                for loaded, mask in candidates:
+                    scores_parts.append(loaded.scores(query, mask))
+                    positions = (
+                        np.arange(len(loaded.ids))
+                        if mask is None
+                        else np.flatnonzero(mask)
+                    )
+                    refs.append((loaded, positions))
+
+                scores = (
+                    np.concatenate(scores_parts)
+                    if scores_parts
+                    else np.empty(0, dtype=np.float32)
+                )
+                k = min(n_results, len(scores))
+                if k == 0:
+                    ids.append([])
+                    distances.append([])
+                    metadatas.append([])
+                    continue
+
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+
+                offsets = np.cumsum([0] + [len(p) for _, p in refs])
+                hit_ids, hit_meta = [], []
+                for index in top:
+                    part = int(np.searchsorted(offsets, index, side="right") - 1)
+                    loaded, positions = refs[part]
+                    position = positions[index - offsets[part]]
+                    hit_ids.append(loaded.ids[position])
+                    hit_meta.append(loaded.metadatas[position])
+                ids.append(hit_ids)
+                distances.append([float(1.0 - scores[i]) for i in top])
+                metadatas.append(hit_meta)
+
+        documents: Optional[list[list[Optional[str]]]] = None
+        if "documents" in include:
+            all_ids = [doc_id for hit_ids in ids for doc_id in hit_ids]
+            lookup = (
+                dict(
+                    zip(
+                        all_ids,
+                        self.get(ids=all_ids, include=["documents"])["documents"],
+                    )
+                )
+                if all_ids
+                else {}
+            )
+            documents = [[lookup.get(doc_id) for doc_id in hit_ids] for hit_ids in ids]
+
+        return {
+            "ids": ids,
+            "documents": documents,
+            "metadatas": metadatas if "metadatas" in include else None,
+            "distances": distances if "distances" in include else None,
+            "embeddings": None,
+        }
+
+
+class FlatVectorClient:
+    """Client managing :class:`FlatVectorCollection` directories.
+
+    Args:
+        path: Root directory; each collection lives in a subdirectory
+        embedding_function: Default embedding function for collections
+        quantization: Vector format for newly created collections
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        embedding_function: Optional[EmbeddingFunction] = None,
+        quantization: Quantization = "float16",
+    ) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._embedding_function = embedding_function
+        self._quantization: Quantization = quantization
+        self._collections: dict[str, FlatVectorCollection] = {}
+        self._lock = threading.Lock()
+
+    def _collection_path(self, name: str) -> Path:
+        if not re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9._-]*", name):
+            raise ValueError(f"Invalid collection name: {name!r}")
+        return self.path / name
+
+    def _open(
+        self,
+        name: str,
+        embedding_function: Optional[EmbeddingFunction],
+        metadata: Optional[dict[str, Any]],
+    ) -> FlatVectorCollection:
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                collection = FlatVectorCollection(
+                    self._collection_path(name),
+                    name,
+                    embedding_function or self._embedding_function,
+                    self._quantization,
+                    metadata,
+                )
+                self._collections[name] = collection
+            elif embedding_function is not None:
+                collection._embedding_function = embedding_function
+            return collection
+
+    def get_collection(
+        self, name: str, embedding_function: Optional[EmbeddingFunction] = None
+    ) -> FlatVectorCollection:
+        """Open an existing collection (raises ValueError if missing)."""
+        if not (self._collection_path(name) / "collection.db").exists():
+            raise ValueError(f"Collection {name} does not exist.")
+        return self._open(name, embedding_function, None)
+
+    def create_collection(
+        self,
+        name: str,
+        metadata: Optional[dict[str, Any]] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+    ) -> FlatVectorCollection:
+        """Create a new collection (raises ValueError if it exists)."""
+        if (self._collection_path(name) / "collection.db").exists():
+            raise ValueError(f"Collection {name} already exists.")
+        return self._open(name, embedding_function, metadata)
+
+    def get_or_create_collection(
+        self,
+        name: str,
+        metadata: Optional[dict[str, Any]] = None,
+        embedding_function: Optional[EmbeddingFunction] = None,
+    ) -> FlatVectorCollection:
+        """Open a collection, creating it if needed."""
+        return self._open(name, embedding_function, metadata)
+
+    def delete_collection(self, name: str) -> None:
+        """Delete a collection and its files."""
+        import shutil
+
+        path = self._collection_path(name)
+        with self._lock:
+            self._collections.pop(name, None)
+            if not path.exists():
+                raise ValueError(f"Collection {name} does not exist.")
+            shutil.rmtree(path)
+
+    def list_collections(self) -> list[FlatVectorCollection]:
+        """Return all collections under the root directory."""
+        return [
+            self._open(p.name, None, None)
+            for p in sorted(self.path.iterdir())
+            if (p / "collection.db").exists()
+        ]
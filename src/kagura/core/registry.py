@@ -27,6 +27,16 @@ class AgentRegistry:
     def __init__(self) -> None:
         """Initialize empty registry"""
         self._agents: dict[str, Callable[..., Any]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Modification counter, incremented on every register/unregister/clear
+
+        Lets callers cache data derived from the registry (e.g. MCP tool
+        schemas) and rebuild it only when the registry changes.
+        """
+        return self._version
 
     def register(self, name: str, func: Callable[..., Any]) -> None:
         """Register an agent
@@ -42,6 +52,7 @@ class AgentRegistry:
             raise ValueError(f"Agent '{name}' is already registered")
 
         self._agents[name] = func
+        self._version += 1
 
     def get(self, name: str) -> Callable[..., Any] | None:
         """Get agent by name
@@ -83,10 +94,12 @@ class AgentRegistry:
             raise KeyError(f"Agent '{name}' is not registered")
 
         del self._agents[name]
+        self._version += 1
 
     def clear(self) -> None:
         """Clear all agents from registry"""
         self._agents.clear()
+        self._version += 1
 
     def auto_discover(self, module_path: str) -> None:
         """Auto-discover agents in a module
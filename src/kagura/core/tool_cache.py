@@ -0,0 +1,460 @@
+"""Tool Result Caching System
+
+Declarative TTL/LRU cache for idempotent, network-bound tools. Tools opt in
+through the ``@tool`` decorator:
+
+    @tool(cache_ttl=3600)
+    async def arxiv_search(query: str, max_results: int = 5) -> str:
+        ...
+
+Features:
+- Argument-normalized cache keys (defaults applied, whitespace in strings
+  collapsed, integral floats as ints) so equivalent calls share an entry;
+  strings are never coerced to numbers ("007" and "7" stay distinct)
+- Single-flight: concurrent identical calls share one execution
+- LRU eviction in memory, optional SQLite persistence across processes
+- Error results are never cached
+- Hit/miss statistics per tool
+
+Example:
+    >>> cache = ToolResultCache(max_size=100)
+    >>> result = await cache.get_or_call(
+    ...     "arxiv_search", {"query": "rag"}, ttl=3600, call=lambda: fetch("rag")
+    ... )
+    >>> cache.stats()["hits"]
+    0
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Prefixes used by builtin tools for error strings (they return, not raise)
+_ERROR_PREFIXES = ("Error", "Search failed", "Failed", "Cannot")
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """Check whether a tool result may be cached
+
+    Builtin tools report failures as strings ("Error: ...") or JSON objects
+    with an "error" field instead of raising; those are not cached.
+
+    Args:
+        result: Tool return value
+
+    Returns:
+        True if the result looks like a successful response
+    """
+    if result is None:
+        return False
+    if isinstance(result, str):
+        stripped = result.lstrip()
+        if stripped.startswith(_ERROR_PREFIXES):
+            return False
+        if stripped.startswith("{"):
+            try:
+                data = json.loads(stripped)
+            except ValueError:
+                return True
+            if isinstance(data, dict) and "error" in data:
+                return False
+    return True
+
+
+def _normalize_argument(value: Any) -> Any:
+    """Normalize an argument value for cache key generation"""
+    if isinstance(value, str):
+        # Strings stay strings: "007" and "7" may be different queries
+        return " ".join(value.split())
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {str(k): _normalize_argument(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_argument(v) for v in value]
+    return value
+
+
+@dataclass
+class ToolCacheStats:
+    """Cache counters (overall or per tool)
+
+    Attributes:
+        hits: Results served from cache (memory or disk)
+        misses: Calls that executed the tool
+        disk_hits: Hits served from the persistent store
+        coalesced: Calls that waited on an identical in-flight call
+        stores: Results written to the cache
+    """
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    coalesced: int = 0
+    stores: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class ToolResultCache:
+    """TTL/LRU cache for tool results with single-flight and disk persistence
+
+    Attributes:
+        max_size: Maximum number of in-memory entries before LRU eviction
+        db_path: SQLite file for persistence (None for memory-only)
+    """
+
+    def __init__(self, max_size: int = 1000, db_path: Path | None = None) -> None:
+        """Initialize tool result cache
+
+        Args:
+            max_size: Maximum in-memory entries (default: 1000)
+            db_path: Optional SQLite path for persistence across processes
+        """
+        self.max_size = max_size
+        self.db_path = db_path
+        # key -> (value, expires_at, tool_name)
+        self._entries: OrderedDict[str, tuple[Any, float, str]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+        self._stats: dict[str, ToolCacheStats] = {}
+
+        if self.db_path is not None:
+            try:
+                self._init_db()
+            except sqlite3.Error as e:
+                logger.warning(f"Tool cache persistence disabled: {e}")
+                self.db_path = None
+
+    def _init_db(self) -> None:
+        assert self.db_path is not None
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tool_cache (
+                    key TEXT PRIMARY KEY,
+                    tool_name TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tool_cache_tool "
+                "ON tool_cache(tool_name)"
+            )
+
+    def make_key(
+        self, tool_name: str, arguments: dict[str, Any], scope: str | None = None
+    ) -> str:
+        """Generate deterministic cache key from tool name and arguments
+
+        Args:
+            tool_name: Tool name
+            arguments: Bound arguments (defaults applied)
+            scope: Optional extra context (e.g. working directory)
+
+        Returns:
+            32-character hex hash
+        """
+        payload = json.dumps(
+            {
+                "tool": tool_name,
+                "args": _normalize_argument(arguments),
+                "scope": scope,
+            },
+            sort_keys=True,
+            default=str,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _tool_stats(self, tool_name: str) -> ToolCacheStats:
+        if tool_name not in self._stats:
+            self._stats[tool_name] = ToolCacheStats()
+        return self._stats[tool_name]
+
+    def get(self, key: str, tool_name: str = "") -> tuple[bool, Any]:
+        """Look up a cached result
+
+        Args:
+            key: Cache key from make_key()
+            tool_name: Tool name (for statistics)
+
+        Returns:
+            Tuple of (found, value)
+        """
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at, _ = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self._tool_stats(tool_name).hits += 1
+                return True, value
+            del self._entries[key]
+
+        if self.db_path is not None:
+            found, value, expires_at = self._get_from_disk(key, now)
+            if found:
+                self._remember(key, value, expires_at, tool_name)
+                stats = self._tool_stats(tool_name)
+                stats.hits += 1
+                stats.disk_hits += 1
+                return True, value
+
+        return False, None
+
+    def _get_from_disk(self, key: str, now: float) -> tuple[bool, Any, float]:
+        assert self.db_path is not None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM tool_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return False, None, 0.0
+                if row[1] <= now:
+                    conn.execute("DELETE FROM tool_cache WHERE key = ?", (key,))
+                    return False, None, 0.0
+            return True, json.loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError) as e:
+            logger.debug(f"Tool cache disk read failed: {e}")
+            return False, None, 0.0
+
+    def _remember(self, key: str, value: Any, expires_at: float, tool_name: str) -> None:
+        self._entries[key] = (value, expires_at, tool_name)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, tool_name: str, value: Any, ttl: int) -> None:
+        """Store a result
+
+        Args:
+            key: Cache key from make_key()
+            tool_name: Tool name
+            value: Result to cache
+            ttl: Time-to-live in seconds
+        """
+        expires_at = time.time() + ttl
+        self._remember(key, value, expires_at, tool_name)
+        self._tool_stats(tool_name).stores += 1
+
+        if self.db_path is not None:
+            try:
+                value_json = json.dumps(value, ensure_ascii=False)
+            except (TypeError, ValueError):
+                # Not JSON serializable - keep in memory only
+                return
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO tool_cache
+                            (key, tool_name, value, expires_at)
+                        VALUES (?, ?, ?, ?)
+                        """,
+                        (key, tool_name, value_json, expires_at),
+                    )
+            except sqlite3.Error as e:
+                logger.debug(f"Tool cache disk write failed: {e}")
+
+    async def get_or_call(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        ttl: int,
+        call: Callable[[], Awaitable[Any]],
+        scope: str | None = None,
+        cacheable: Callable[[Any], bool] = is_cacheable_result,
+    ) -> Any:
+        """Return a cached result or execute the call once
+
+        Concurrent calls with the same key wait for the first one instead of
+        executing the tool again (single-flight).
+
+        Args:
+            tool_name: Tool name
+            arguments: Bound arguments (defaults applied)
+            ttl: Time-to-live in seconds
+            call: Zero-argument coroutine factory executing the tool
+            scope: Optional extra key context
+            cacheable: Predicate deciding whether a result is stored
+
+        Returns:
+            Tool result
+        """
+        key = self.make_key(tool_name, arguments, scope)
+        found, value = self.get(key, tool_name)
+        if found:
+            logger.debug(f"Tool cache HIT: {tool_name} ({key})")
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and not inflight.done():
+            self._tool_stats(tool_name).coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self._tool_stats(tool_name).misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve to avoid "exception was never retrieved" warnings
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if cacheable(result):
+            self.set(key, tool_name, result, ttl)
+        future.set_result(result)
+        return result
+
+    def get_or_call_sync(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        ttl: int,
+        call: Callable[[], Any],
+        scope: str | None = None,
+        cacheable: Callable[[Any], bool] = is_cacheable_result,
+    ) -> Any:
+        """Synchronous variant of get_or_call() (no single-flight)"""
+        key = self.make_key(tool_name, arguments, scope)
+        found, value = self.get(key, tool_name)
+        if found:
+            return value
+
+        self._tool_stats(tool_name).misses += 1
+        result = call()
+        if cacheable(result):
+            self.set(key, tool_name, result, ttl)
+        return result
+
+    def invalidate(self, tool_name: str | None = None) -> None:
+        """Invalidate cached results
+
+        Args:
+            tool_name: Only drop results of this tool. If None, clears all.
+        """
+        if tool_name is None:
+            self._entries.clear()
+        else:
+            for key in [k for k, v in self._entries.items() if v[2] == tool_name]:
+                del self._entries[key]
+
+        if self.db_path is not None:
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    if tool_name is None:
+                        conn.execute("DELETE FROM tool_cache")
+                    else:
+                        conn.execute(
+                            "DELETE FROM tool_cache WHERE tool_name = ?", (tool_name,)
+                        )
+            except sqlite3.Error as e:
+                logger.debug(f"Tool cache disk invalidation failed: {e}")
+
+    def prune_expired(self) -> int:
+        """Remove expired entries from memory and disk
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        expired = [k for k, v in self._entries.items() if v[1] <= now]
+        for key in expired:
+            del self._entries[key]
+        removed = len(expired)
+
+        if self.db_path is not None:
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.execute(
+                        "DELETE FROM tool_cache WHERE expires_at <= ?", (now,)
+                    )
+                    removed += cursor.rowcount
+            except sqlite3.Error as e:
+                logger.debug(f"Tool cache disk prune failed: {e}")
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache statistics
+
+        Returns:
+            Dictionary with overall counters, hit_rate, size and per_tool stats
+        """
+        total = ToolCacheStats()
+        for tool_stats in self._stats.values():
+            total.hits += tool_stats.hits
+            total.misses += tool_stats.misses
+            total.disk_hits += tool_stats.disk_hits
+            total.coalesced += tool_stats.coalesced
+            total.stores += tool_stats.stores
+
+        return {
+            **asdict(total),
+            "hit_rate": total.hit_rate,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "persistent": self.db_path is not None,
+            "per_tool": {
+                name: {**asdict(s), "hit_rate": s.hit_rate}
+                for name, s in sorted(self._stats.items())
+            },
+        }
+
+
+_tool_cache: ToolResultCache | None = None
+
+
+def get_tool_cache() -> ToolResultCache | None:
+    """Get the process-wide tool result cache
+
+    Controlled by ENABLE_TOOL_CACHE (default: true) and TOOL_CACHE_PERSIST
+    (default: true, stores results in <cache dir>/tool_results.db).
+
+    Returns:
+        ToolResultCache instance if caching is enabled, None otherwise
+    """
+    from kagura.config.env import get_tool_cache_enabled, get_tool_cache_persist
+
+    global _tool_cache
+
+    if not get_tool_cache_enabled():
+        return None
+
+    if _tool_cache is None:
+        db_path = None
+        if get_tool_cache_persist():
+            from kagura.config.paths import get_cache_dir
+
+            db_path = get_cache_dir() / "tool_results.db"
+        _tool_cache = ToolResultCache(db_path=db_path)
+
+    return _tool_cache
+
+
+__all__ = [
+    "ToolCacheStats",
+    "ToolResultCache",
+    "get_tool_cache",
+    "is_cacheable_result",
+]
@@ -25,6 +25,16 @@ class ToolRegistry:
     def __init__(self) -> None:
         """Initialize empty registry"""
         self._tools: dict[str, Callable[..., Any]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Modification counter, incremented on every register/unregister/clear
+
+        Lets callers cache data derived from the registry (e.g. MCP tool
+        schemas) and rebuild it only when the registry changes.
+        """
+        return self._version
 
     def register(self, name: str, func: Callable[..., Any]) -> None:
         """Register a tool
@@ -40,6 +50,7 @@ class ToolRegistry:
             raise ValueError(f"Tool '{name}' is already registered")
 
         self._tools[name] = func
+        self._version += 1
 
     def get(self, name: str) -> Callable[..., Any] | None:
         """Get tool by name
@@ -81,10 +92,12 @@ class ToolRegistry:
             raise KeyError(f"Tool '{name}' is not registered")
 
         del self._tools[name]
+        self._version += 1
 
     def clear(self) -> None:
         """Clear all tools from registry"""
         self._tools.clear()
+        self._version += 1
 
     def auto_discover(self, module_path: str) -> None:
         """Auto-discover tools in a module
@@ -25,6 +25,16 @@ class WorkflowRegistry:
     def __init__(self) -> None:
         """Initialize empty registry"""
         self._workflows: dict[str, Callable[..., Any]] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Modification counter, incremented on every register/unregister/clear
+
+        Lets callers cache data derived from the registry (e.g. MCP tool
+        schemas) and rebuild it only when the registry changes.
+        """
+        return self._version
 
     def register(self, name: str, func: Callable[..., Any]) -> None:
         """Register a workflow
@@ -40,6 +50,7 @@ class WorkflowRegistry:
             raise ValueError(f"Workflow '{name}' is already registered")
 
         self._workflows[name] = func
+        self._version += 1
 
     def get(self, name: str) -> Callable[..., Any] | None:
         """Get workflow by name
@@ -81,10 +92,12 @@ class WorkflowRegistry:
             raise KeyError(f"Workflow '{name}' is not registered")
 
         del self._workflows[name]
+        self._version += 1
 
     def clear(self) -> None:
         """Clear all workflows from registry"""
         self._workflows.clear()
+        self._version += 1
 
     def auto_discover(self, module_path: str) -> None:
         """Auto-discover workflows in a module
@@ -11,6 +11,7 @@ from typing import Optional
 
 from kagura.loaders.file_types import FileType, detect_file_type, is_multimodal_file
 from kagura.loaders.gemini import GeminiLoader
+from kagura.loaders.ignore import IgnoreRules
 
 
 @dataclass
@@ -65,7 +66,7 @@ class DirectoryScanner:
         self.directory = Path(directory)
         self.gemini = gemini
         self.respect_gitignore = respect_gitignore
-        self._ignore_patterns: set[str] = set()
+        self._ignore = IgnoreRules()
 
         if not self.directory.exists():
             raise FileNotFoundError(f"Directory not found: {self.directory}")
@@ -77,21 +78,13 @@ class DirectoryScanner:
         if self.respect_gitignore:
             self._load_ignore_patterns()
 
+    @property
+    def _ignore_patterns(self) -> set[str]:
+        return self._ignore.patterns
+
     def _load_ignore_patterns(self) -> None:
         """Load patterns from .gitignore and .kaguraignore."""
-        ignore_files = [
-            self.directory / ".gitignore",
-            self.directory / ".kaguraignore",
-        ]
-
-        for ignore_file in ignore_files:
-            if ignore_file.exists():
-                with open(ignore_file) as f:
-                    for line in f:
-                        line = line.strip()
-                        # Skip comments and empty lines
-                        if line and not line.startswith("#"):
-                            self._ignore_patterns.add(line)
+        self._ignore = IgnoreRules.load(self.directory)
 
     def _should_ignore(self, path: Path) -> bool:
         """Check if path should be ignored.
@@ -105,30 +98,7 @@ class DirectoryScanner:
         if not self.respect_gitignore:
             return False
 
-        # Always ignore hidden files/directories (starting with .)
-        if any(part.startswith(".") for part in path.parts):
-            return True
-
-        # Check against ignore patterns
-        rel_path = path.relative_to(self.directory)
-        rel_path_str = str(rel_path)
-
-        for pattern in self._ignore_patterns:
-            # Simple pattern matching (not full gitignore spec)
-            if pattern.endswith("/"):
-                # Directory pattern
-                if rel_path_str.startswith(pattern.rstrip("/")):
-                    return True
-            elif "*" in pattern:
-                # Wildcard pattern - simple implementation
-                if pattern.replace("*", "") in rel_path_str:
-                    return True
-            else:
-                # Exact match or substring
-                if pattern in rel_path_str or rel_path_str.startswith(pattern):
-                    return True
-
-        return False
+        return self._ignore.is_ignored(str(path.relative_to(self.directory)))
 
     async def scan(self) -> list[FileInfo]:
         """Scan directory recursively for files.
@@ -0,0 +1,84 @@
+"""Ignore rules from .gitignore/.kaguraignore.
+
+Shared by DirectoryScanner and the content search engine so both skip the
+same files. The matching is deliberately simple (not the full gitignore
+spec): hidden paths are always ignored, ``dir/`` patterns match path
+prefixes, ``*`` patterns match their literal remainder anywhere in the
+path and plain patterns match as substrings.
+"""
+
+from pathlib import Path
+from typing import Iterable
+
+IGNORE_FILES = (".gitignore", ".kaguraignore")
+
+
+class IgnoreRules:
+    """Ignore patterns of a root directory.
+
+    Example:
+        >>> rules = IgnoreRules.load(Path("."))
+        >>> rules.is_ignored("build/output.txt")
+        True
+    """
+
+    def __init__(self, patterns: Iterable[str] = ()) -> None:
+        """Initialize rules.
+
+        Args:
+            patterns: Ignore patterns (comments/blank lines already removed)
+        """
+        self.patterns: set[str] = set(patterns)
+
+    @classmethod
+    def load(cls, root: Path) -> "IgnoreRules":
+        """Load patterns from .gitignore and .kaguraignore in root.
+
+        Args:
+            root: Directory containing the ignore files
+
+        Returns:
+            IgnoreRules (empty if no ignore file exists)
+        """
+        patterns: set[str] = set()
+        for name in IGNORE_FILES:
+            ignore_file = Path(root) / name
+            if ignore_file.exists():
+                with open(ignore_file) as f:
+                    for line in f:
+                        line = line.strip()
+                        # Skip comments and empty lines
+                        if line and not line.startswith("#"):
+                            patterns.add(line)
+        return cls(patterns)
+
+    def is_ignored(self, rel_path: str) -> bool:
+        """Check a path relative to the root.
+
+        Args:
+            rel_path: Relative path ("/" or OS separators)
+
+        Returns:
+            True if the path (or one of its parent directories) is ignored
+        """
+        parts = Path(rel_path).parts
+        # Always ignore hidden files/directories (starting with .)
+        if any(part.startswith(".") and part not in (".", "..") for part in parts):
+            return True
+
+        rel_path_str = str(Path(rel_path))
+        for pattern in self.patterns:
+            if pattern.endswith("/"):
+                # Directory pattern
+                if rel_path_str.startswith(pattern.rstrip("/")):
+                    return True
+            elif "*" in pattern:
+                # Wildcard pattern - simple implementation
+                if pattern.replace("*", "") in rel_path_str:
+                    return True
+            else:
+                # Exact match or substring
+                if pattern in rel_path_str or rel_path_str.startswith(pattern):
+                    return True
+
+        return False
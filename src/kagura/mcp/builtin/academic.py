@@ -13,7 +13,7 @@ from kagura import tool
 logger = logging.getLogger(__name__)
 
 
-@tool
+@tool(cache_ttl=21600)
 async def arxiv_search(
     query: str,
     max_results: int = 5,
@@ -222,7 +222,7 @@ _NEWS_COUNTRY_PRESETS = {
 }
 
 
-@tool
+@tool(cache_ttl=900)
 async def brave_news_search(
     query: str,
     count: str | int = 5,
@@ -395,7 +395,7 @@ async def brave_news_search(
         )
 
 
-@tool
+@tool(cache_ttl=3600)
 async def brave_image_search(
     query: str,
     count: int = 10,
@@ -501,7 +501,7 @@ async def brave_image_search(
         )
 
 
-@tool
+@tool(cache_ttl=3600)
 async def brave_video_search(
     query: str,
     count: int = 10,
@@ -4,10 +4,19 @@ These tools use GitHub REST API directly (not gh CLI), making them safe
 for remote access via MCP servers.
 """
 
+import os
 from typing import Any
 
 from kagura import tool
 from kagura.config.env import get_github_token
+from kagura.core.tool_cache import get_tool_cache
+
+# Read tools cached for a short TTL, keyed by working directory (= repository)
+_CACHED_READ_TOOLS = (
+    "github_issue_view_api",
+    "github_issue_list_api",
+    "github_pr_view_api",
+)
 
 
 async def _get_github_repo_info() -> tuple[str, str] | str:
@@ -47,6 +56,14 @@ async def _get_github_repo_info() -> tuple[str, str] | str:
         return f"Error parsing repository info: {e}"
 
 
+def _invalidate_read_cache() -> None:
+    """Drop cached issue/PR reads after a write so they are not stale."""
+    cache = get_tool_cache()
+    if cache:
+        for tool_name in _CACHED_READ_TOOLS:
+            cache.invalidate(tool_name)
+
+
 def _get_github_headers() -> dict[str, str] | str:
     """Get GitHub API headers with authentication.
 
@@ -134,6 +151,7 @@ async def github_issue_create(
                 if assignees:
                     output += f"Assignees: {', '.join(assignees)}\n"
 
+                _invalidate_read_cache()
                 return output
             else:
                 error_msg = response.text
@@ -143,7 +161,7 @@ async def github_issue_create(
         return f"Error making API request: {e}"
 
 
-@tool
+@tool(cache_ttl=300, cache_scope=os.getcwd)
 async def github_issue_view_api(issue_number: int) -> str:
     """Get GitHub issue details using REST API.
 
@@ -205,7 +223,7 @@ async def github_issue_view_api(issue_number: int) -> str:
         return f"Error making API request: {e}"
 
 
-@tool
+@tool(cache_ttl=300, cache_scope=os.getcwd)
 async def github_issue_list_api(state: str = "open", limit: int = 30) -> str:
     """List GitHub issues using REST API.
 
@@ -277,7 +295,7 @@ async def github_issue_list_api(state: str = "open", limit: int = 30) -> str:
         return f"Error making API request: {e}"
 
 
-@tool
+@tool(cache_ttl=300, cache_scope=os.getcwd)
 async def github_pr_view_api(pr_number: int) -> str:
     """Get GitHub PR details using REST API.
 
@@ -407,6 +425,7 @@ async def github_pr_create_api(
                 output += f"Base: {base} ← Head: {head}\n"
                 output += f"Draft: {draft}\n"
 
+                _invalidate_read_cache()
                 return output
             else:
                 error_msg = response.text
@@ -481,6 +500,7 @@ async def github_pr_merge_api(
                 output += f"Merged: {merge_data.get('merged', False)}\n"
                 output += f"Message: {merge_data.get('message', 'N/A')}\n"
 
+                _invalidate_read_cache()
                 return output
             else:
                 error_msg = response.text
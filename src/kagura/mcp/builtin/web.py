@@ -10,7 +10,7 @@ from __future__ import annotations
 from kagura import tool
 
 
-@tool
+@tool(cache_ttl=900)
 async def web_scrape(url: str, selector: str = "body") -> str:
     """Scrape web page content
 
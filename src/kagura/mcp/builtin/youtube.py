@@ -44,7 +44,7 @@ def extract_video_id(url: str) -> str:
     raise ValueError(f"Could not extract video ID from URL: {url}")
 
 
-@tool
+@tool(cache_ttl=86400)
 async def get_youtube_transcript(video_url: str, lang: str = "en") -> str:
     """
     Get YouTube video transcript.
@@ -107,7 +107,7 @@ async def get_youtube_transcript(video_url: str, lang: str = "en") -> str:
         return f"Error getting transcript: {str(e)}"
 
 
-@tool
+@tool(cache_ttl=3600)
 async def get_youtube_metadata(video_url: str) -> str:
     """
     Get YouTube video metadata.
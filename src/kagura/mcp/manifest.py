@@ -0,0 +1,148 @@
+"""Static manifest of the builtin MCP tools.
+
+Importing ``kagura.mcp.builtin`` imports every builtin tool module and
+their dependencies (litellm, API clients, ...), which takes seconds. The
+manifest (``builtin_manifest.json``, generated from the registered tools)
+holds each tool's name, defining module, description, JSON schema and
+category, so ``kagura mcp serve`` can answer ``tools/list`` without
+importing any tool module; a module is imported when one of its tools is
+first called.
+
+Regenerate after adding or changing builtin tools:
+    python -m kagura.mcp.manifest
+
+Check that the committed manifest is current (exit code 1 if stale):
+    python -m kagura.mcp.manifest --check
+"""
+
+import argparse
+import json
+import logging
+import sys
+from importlib import resources
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE = "builtin_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def manifest_path() -> Path:
+    """Path of the manifest shipped with the package."""
+    return Path(str(resources.files("kagura.mcp") / MANIFEST_FILE))
+
+
+def build_manifest() -> dict[str, Any]:
+    """Generate the manifest by importing and inspecting all builtin tools.
+
+    Returns:
+        Manifest dict ({"version": ..., "tools": [...]}, tools sorted by name)
+    """
+    import kagura.mcp.builtin  # noqa: F401
+    from kagura.core.tool_registry import tool_registry
+    from kagura.mcp.schema import generate_json_schema
+    from kagura.mcp.tool_classification import infer_category
+
+    tools = []
+    for name, func in sorted(tool_registry.get_all().items()):
+        module = getattr(func, "__module__", "") or ""
+        if not module.startswith("kagura.mcp."):
+            continue
+        # Same schema/description as the MCP server's catalog
+        try:
+            input_schema = generate_json_schema(func)
+        except Exception:
+            input_schema = {"type": "object", "properties": {}}
+        description = func.__doc__ or f"Kagura tool: {name}"
+        tools.append(
+            {
+                "name": name,
+                "module": module,
+                "category": infer_category(name),
+                "description": description.strip().split("\n")[0],
+                "input_schema": input_schema,
+            }
+        )
+    return {"version": MANIFEST_VERSION, "tools": tools}
+
+
+def load_manifest(path: Path | None = None) -> list[dict[str, Any]]:
+    """Load tool specs from the manifest.
+
+    Args:
+        path: Manifest file (default: the one shipped with the package)
+
+    Returns:
+        Tool specs, or an empty list if the manifest is missing, unreadable
+        or of another version
+    """
+    path = path or manifest_path()
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read MCP tool manifest {path}: {e}")
+        return []
+    if data.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Ignoring MCP tool manifest {path}: unsupported version")
+        return []
+    return data.get("tools", [])
+
+
+def register_builtin_tools(lazy: bool = True) -> int:
+    """Make the builtin tools available to MCP servers.
+
+    Args:
+        lazy: Advertise tools from the manifest and import their modules on
+            first call; falls back to importing everything if the manifest
+            is unavailable
+
+    Returns:
+        Number of builtin tools available
+    """
+    if lazy:
+        from kagura.mcp.server import register_lazy_tools
+
+        specs = load_manifest()
+        if specs:
+            return register_lazy_tools(specs)
+
+    import kagura.mcp.builtin  # noqa: F401
+    from kagura.core.tool_registry import tool_registry
+
+    return len(tool_registry.get_all())
+
+
+def _render(manifest: dict[str, Any]) -> str:
+    return json.dumps(manifest, indent=2, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write (or check) the builtin tool manifest."""
+    parser = argparse.ArgumentParser(
+        description="Static manifest of the builtin MCP tools."
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if the manifest is stale"
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Output path")
+    args = parser.parse_args(argv)
+
+    path = args.output or manifest_path()
+    content = _render(build_manifest())
+    if args.check:
+        current = path.read_text(encoding="utf-8") if path.exists() else ""
+        if current != content:
+            print(f"{path} is stale; run: python -m kagura.mcp.manifest")
+            return 1
+        print(f"{path} is up to date")
+        return 0
+
+    path.write_text(content, encoding="utf-8")
+    print(f"Wrote {len(json.loads(content)['tools'])} tools to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
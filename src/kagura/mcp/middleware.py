@@ -8,6 +8,7 @@ Features:
 - Recursion prevention (excludes memory_* tools)
 - Configurable via environment variables
 - Result truncation (default 500 chars)
+- Write-behind journal: entries are queued and written in batches
 
 Example:
     # Automatic logging when user calls any MCP tool
@@ -18,14 +19,25 @@ Example:
 Privacy:
     Opt-out: Set KAGURA_DISABLE_AUTO_LOGGING=true
 
+Tuning (environment variables):
+    KAGURA_AUTO_LOG_QUEUE_SIZE: Max queued entries before dropping (default 1000)
+    KAGURA_AUTO_LOG_BATCH_SIZE: Entries written per batch (default 32)
+    KAGURA_AUTO_LOG_FLUSH_MS: Max time to wait for a partial batch to fill
+        (default 50)
+    KAGURA_AUTO_LOG_DEFER_EMBEDDING: Write SQLite rows immediately but embed
+        entries later in larger batches (default false)
+
 Related: Issue #400 - Auto-remember MCP tool requests and results
 """
 
+import asyncio
 import json
 import logging
 import os
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +116,296 @@ def should_log_tool(tool_name: str) -> bool:
     return True
 
 
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment."""
+    try:
+        value = int(os.getenv(name, str(default)))
+    except (ValueError, TypeError):
+        logger.warning(f"Invalid {name} value, using default {default}")
+        return default
+    return value if value > 0 else default
+
+
+@dataclass
+class _JournalEntry:
+    """A single tool call waiting to be written."""
+
+    user_id: str
+    key: str
+    value: str
+    metadata: dict[str, Any]
+
+
+@dataclass
+class JournalStats:
+    """Counters for the tool call journal."""
+
+    queue_depth: int = 0
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    batches: int = 0
+    errors: int = 0
+    deferred_pending: int = 0
+
+
+class ToolCallJournal:
+    """Write-behind journal for auto-logged tool calls.
+
+    Tool calls are put on a bounded queue and a single background task writes
+    them in batches (one SQLite transaction and one embedding call per user
+    per batch) instead of spawning a memory_store() task per call.
+
+    When the queue is full, enqueue() waits briefly and then drops the entry;
+    tool execution is never blocked for longer than that.
+    """
+
+    # Embeddings deferred with KAGURA_AUTO_LOG_DEFER_EMBEDDING are flushed
+    # once this many entries are pending
+    DEFERRED_EMBED_BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        enqueue_timeout: float = 0.05,
+        defer_embedding: Optional[bool] = None,
+    ) -> None:
+        """Initialize journal.
+
+        Args:
+            max_queue_size: Max queued entries (default: KAGURA_AUTO_LOG_QUEUE_SIZE)
+            batch_size: Entries per write (default: KAGURA_AUTO_LOG_BATCH_SIZE)
+            flush_interval: Seconds to wait for a partial batch to fill
+                (default: KAGURA_AUTO_LOG_FLUSH_MS / 1000)
+            enqueue_timeout: Seconds to wait for queue space before dropping
+            defer_embedding: Defer RAG indexing
+                (default: KAGURA_AUTO_LOG_DEFER_EMBEDDING)
+        """
+        self.max_queue_size = max_queue_size or _env_int(
+            "KAGURA_AUTO_LOG_QUEUE_SIZE", 1000
+        )
+        self.batch_size = batch_size or _env_int("KAGURA_AUTO_LOG_BATCH_SIZE", 32)
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else _env_int("KAGURA_AUTO_LOG_FLUSH_MS", 50) / 1000
+        )
+        self.enqueue_timeout = enqueue_timeout
+        if defer_embedding is None:
+            defer_embedding = os.getenv(
+                "KAGURA_AUTO_LOG_DEFER_EMBEDDING", ""
+            ).lower() in ("true", "1", "yes")
+        self.defer_embedding = defer_embedding
+
+        self._queue: Optional[asyncio.Queue[_JournalEntry]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        # Extended by the writer thread, swapped out by flush()'s thread
+        self._deferred: dict[str, list[tuple[str, Any, Optional[dict]]]] = {}
+        self._deferred_lock = threading.Lock()
+        self._stats = JournalStats()
+
+    def _ensure_worker(self) -> asyncio.Queue[_JournalEntry]:
+        """Start the flusher on the running loop, carrying over queued entries."""
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._loop is loop and self._worker:
+            if not self._worker.done():
+                return self._queue
+
+        pending: list[_JournalEntry] = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        for entry in pending[: self.max_queue_size]:
+            self._queue.put_nowait(entry)
+        self._stats.dropped += max(0, len(pending) - self.max_queue_size)
+
+        self._loop = loop
+        self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def enqueue(self, entry: _JournalEntry) -> bool:
+        """Queue an entry for writing.
+
+        Args:
+            entry: Entry to write
+
+        Returns:
+            True if queued, False if dropped because the queue stayed full
+        """
+        queue = self._ensure_worker()
+        try:
+            queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(queue.put(entry), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self._stats.dropped += 1
+                logger.debug(f"Auto-log queue full, dropped {entry.key}")
+                return False
+        self._stats.enqueued += 1
+        return True
+
+    async def _run(self, queue: asyncio.Queue[_JournalEntry]) -> None:
+        """Collect entries into batches and write them off the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            # Entries queued while the previous batch was being written are
+            # picked up here (group commit); optionally linger for more
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if not queue.empty():
+                    batch.append(queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _write_batch(self, batch: list[_JournalEntry]) -> None:
+        """Write a batch grouped by user (runs in a worker thread)."""
+        by_user: dict[str, list[tuple[str, Any, Optional[dict]]]] = {}
+        for entry in batch:
+            by_user.setdefault(entry.user_id, []).append(
+                (entry.key, entry.value, entry.metadata)
+            )
+
+        self._stats.batches += 1
+        for user_id, items in by_user.items():
+            try:
+                memory = _get_history_memory(user_id)
+                memory.remember_many(items, embed=not self.defer_embedding)
+                self._stats.written += len(items)
+                if self.defer_embedding and memory.persistent_rag:
+                    with self._deferred_lock:
+                        self._deferred.setdefault(user_id, []).extend(items)
+            except Exception as e:
+                self._stats.errors += len(items)
+                logger.warning(f"Failed to auto-log {len(items)} tool call(s): {e}")
+
+        if self._deferred_count() >= self.DEFERRED_EMBED_BATCH_SIZE:
+            self._embed_deferred()
+
+    def _deferred_count(self) -> int:
+        with self._deferred_lock:
+            return sum(len(items) for items in self._deferred.values())
+
+    def _embed_deferred(self) -> None:
+        """Index deferred entries in persistent RAG."""
+        with self._deferred_lock:
+            deferred, self._deferred = self._deferred, {}
+        for user_id, items in deferred.items():
+            try:
+                _get_history_memory(user_id).index_semantic_many(items)
+            except Exception as e:
+                self._stats.errors += len(items)
+                logger.warning(f"Failed to embed {len(items)} tool call(s): {e}")
+
+    async def flush(self) -> None:
+        """Wait until all queued entries are written and embedded."""
+        if self._queue is not None and self._loop is asyncio.get_running_loop():
+            if self._worker and not self._worker.done():
+                await self._queue.join()
+            elif not self._queue.empty():
+                self._ensure_worker()
+                await self._queue.join()
+        if self._deferred:
+            await asyncio.to_thread(self._embed_deferred)
+
+    async def close(self) -> None:
+        """Flush pending entries and stop the background writer."""
+        await self.flush()
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> JournalStats:
+        """Get journal counters.
+
+        Returns:
+            Snapshot of journal statistics
+        """
+        return JournalStats(
+            queue_depth=self._queue.qsize() if self._queue is not None else 0,
+            enqueued=self._stats.enqueued,
+            written=self._stats.written,
+            dropped=self._stats.dropped,
+            batches=self._stats.batches,
+            errors=self._stats.errors,
+            deferred_pending=self._deferred_count(),
+        )
+
+
+def _get_history_memory(user_id: str) -> Any:
+    """Get the cached mcp_history MemoryManager (same instance as memory_store)."""
+    from kagura.mcp.tools.memory.common import _memory_cache, get_memory_manager
+
+    agent_name = "mcp_history"
+    try:
+        return get_memory_manager(user_id, agent_name, enable_rag=True)
+    except ImportError:
+        # RAG dependencies not installed - keep cache key consistent with memory_store
+        from kagura.core.memory import MemoryManager
+
+        cache_key = f"{user_id}:{agent_name}:rag=True"
+        if cache_key not in _memory_cache:
+            _memory_cache[cache_key] = MemoryManager(
+                user_id=user_id, agent_name=agent_name, enable_rag=False
+            )
+        return _memory_cache[cache_key]
+
+
+_journal: Optional[ToolCallJournal] = None
+
+
+def get_tool_call_journal() -> ToolCallJournal:
+    """Get the process-wide tool call journal.
+
+    Returns:
+        Shared ToolCallJournal instance
+    """
+    global _journal
+    if _journal is None:
+        _journal = ToolCallJournal()
+    return _journal
+
+
+async def close_tool_call_journal() -> None:
+    """Write queued tool calls and stop the journal (server shutdown).
+
+    Deferred embeddings are indexed before returning. Does nothing if no
+    tool call was logged in this process.
+    """
+    global _journal
+    journal, _journal = _journal, None
+    if journal is None:
+        return
+    try:
+        await journal.close()
+    except Exception as e:
+        logger.warning(f"Failed to flush auto-logged tool calls: {e}")
+
+
 async def log_tool_call_to_memory(
     user_id: str,
     tool_name: str,
@@ -141,11 +443,6 @@ async def log_tool_call_to_memory(
         return
 
     try:
-        import asyncio
-
-        # Import here to avoid circular dependency
-        from kagura.mcp.builtin.memory import memory_store
-
         timestamp = datetime.now().isoformat()
 
         # Truncate large results
@@ -169,26 +466,25 @@ async def log_tool_call_to_memory(
             "timestamp": timestamp,
         }
 
-        # Store in persistent memory (fire-and-forget to avoid blocking)
-        # CRITICAL: Use create_task() to prevent RAG initialization from blocking tool calls
-        # See PR #574 review feedback - memory_store with RAG can take 30-60s on first call
-        async def _store_log():
-            try:
-                await memory_store(
-                    user_id=user_id,
-                    agent_name="mcp_history",
-                    key=f"{tool_name}_{timestamp}",
-                    value=json.dumps(log_entry, ensure_ascii=False),
-                    scope="persistent",
-                    tags=json.dumps(["mcp_history", tool_name]),
-                    importance=0.3,  # Low importance (housekeeping data)
-                )
-                logger.debug(f"Auto-logged tool call: {tool_name}")
-            except Exception as e:
-                logger.warning(f"Failed to auto-log tool call '{tool_name}': {e}")
+        # Same metadata layout as memory_store(scope="persistent")
+        metadata = {
+            "metadata": "{}",
+            "tags": json.dumps(["mcp_history", tool_name]),
+            "importance": 0.3,  # Low importance (housekeeping data)
+            "created_at": timestamp,
+            "updated_at": timestamp,
+        }
 
-        # Fire and forget - don't await, don't block tool execution
-        asyncio.create_task(_store_log())
+        # Queue for the background writer - RAG initialization and embedding
+        # (30-60s on first call, see PR #574) never block tool execution
+        await get_tool_call_journal().enqueue(
+            _JournalEntry(
+                user_id=user_id,
+                key=f"{tool_name}_{timestamp}",
+                value=json.dumps(log_entry, ensure_ascii=False),
+                metadata=metadata,
+            )
+        )
 
     except Exception as e:
         # CRITICAL: Don't fail tool execution if logging setup fails
@@ -199,5 +495,9 @@ __all__ = [
     "is_auto_logging_enabled",
     "should_log_tool",
     "log_tool_call_to_memory",
+    "ToolCallJournal",
+    "JournalStats",
+    "get_tool_call_journal",
+    "close_tool_call_journal",
     "EXCLUDED_TOOLS",
 ]
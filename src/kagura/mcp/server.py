@@ -5,10 +5,12 @@ Exposes Kagura agents as MCP tools, enabling integration with
 Claude Code, Cline, and other MCP clients.
 """
 
+import importlib
 import inspect
 import logging
 import time
-from typing import Any, Literal
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal
 
 from mcp.server import Server  # type: ignore
 from mcp.types import TextContent, Tool  # type: ignore
@@ -19,155 +21,214 @@ from kagura.core.workflow_registry import workflow_registry
 
 from .permissions import get_allowed_tools, get_denied_tools
 from .schema import generate_json_schema
+from .tool_classification import infer_category
 
 logger = logging.getLogger(__name__)
 
 
-def create_mcp_server(
-    name: str = "kagura-ai",
-    context: Literal["local", "remote"] = "local",
-    categories: set[str] | None = None,
-) -> Server:
-    """Create MCP server instance with tool access control.
+_MCP_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("tool", "kagura_tool_"),
+    ("workflow", "kagura_workflow_"),
+    ("agent", "kagura_"),
+)
+
+
+def _split_mcp_name(name: str) -> tuple[str, str]:
+    """Split an MCP tool name into (item_type, item_name)
 
     Args:
-        name: Server name (default: "kagura-ai")
-        context: Execution context ("local" or "remote")
-                 - "local": All tools allowed (stdio transport)
-                 - "remote": Only safe tools allowed (HTTP/SSE transport)
-        categories: Optional set of categories to enable (filters tools by category)
-                    If None, all tools (subject to context permissions) are enabled
+        name: MCP tool name (kagura_tool_xxx, kagura_workflow_xxx, kagura_xxx)
 
     Returns:
-        Configured MCP Server instance with filtered tools
+        Tuple of ("tool" | "workflow" | "agent", registry name)
+    """
+    for item_type, prefix in _MCP_PREFIXES:
+        if name.startswith(prefix):
+            return item_type, name[len(prefix) :]
+    return "agent", name
 
-    Example:
-        >>> # Local server (all tools)
-        >>> server = create_mcp_server(context="local")
-        >>>
-        >>> # Remote server (safe tools only)
-        >>> server = create_mcp_server(context="remote")
-        >>>
-        >>> # Local server with only coding and memory tools
-        >>> server = create_mcp_server(categories={"coding", "memory"})
 
-    Note:
-        Remote context filters out dangerous tools like:
-        - file_read, file_write (filesystem access)
-        - shell_exec (command execution)
-        - media_open_* (local app execution)
+@dataclass(frozen=True)
+class _CatalogEntry:
+    """Registered callable resolved from an MCP tool name
 
-        Categories filter is orthogonal to permissions:
-        - Permissions: Security layer (local vs remote)
-        - Categories: UX layer (which tools to expose)
+    Lazy tools (advertised from a manifest, module not imported yet) have
+    no func; ``module`` is imported on first call to register it.
     """
-    server = Server(name)
 
-    # Log context
-    if categories:
-        logger.info(
-            f"Creating MCP server '{name}' in {context} context "
-            f"with categories: {', '.join(sorted(categories))}"
-        )
-    else:
-        logger.info(f"Creating MCP server '{name}' in {context} context")
+    item_type: str
+    item_name: str
+    func: Callable[..., Any] | None
+    is_async: bool
+    module: str | None = None
 
-    @server.list_tools()
-    async def handle_list_tools() -> list[Tool]:
-        """List all Kagura agents, tools, and workflows as MCP tools
 
-        Returns all registered items from agent_registry, tool_registry,
-        and workflow_registry, converting them to MCP Tool format.
+class _ToolCatalog:
+    """Cached MCP view of agent_registry, tool_registry and workflow_registry
+
+    JSON schemas are generated once per registered item and the whole
+    catalog is rebuilt only when a registry's version counter changes.
+    Filtered views are memoized per (context, categories).
+
+    Lazy tools (see add_lazy_tools) are listed from their precomputed
+    name/description/schema until their module registers the real tool.
+    """
+
+    def __init__(self) -> None:
+        self._versions: tuple[int, int, int] | None = None
+        self._tools: list[Tool] = []
+        self._dispatch: dict[str, _CatalogEntry] = {}
+        self._views: dict[tuple[str, frozenset[str] | None], list[Tool]] = {}
+        self._lazy: dict[str, dict[str, Any]] = {}
+
+    def add_lazy_tools(self, specs: Iterable[dict[str, Any]]) -> int:
+        """Advertise tools whose modules are imported on first call
+
+        Args:
+            specs: Tool specs with "name" (tool_registry name), "module",
+                "description" and "input_schema"
 
         Returns:
-            List of MCP Tool objects
+            Number of specs added
         """
-        # Helper function to extract base name from MCP tool name
-        def get_base_name(tool_name: str) -> str:
-            """Extract base name from MCP tool name (kagura_tool_xxx -> xxx)"""
-            if tool_name.startswith("kagura_tool_"):
-                return tool_name.replace("kagura_tool_", "")
-            elif tool_name.startswith("kagura_workflow_"):
-                return tool_name.replace("kagura_workflow_", "")
-            elif tool_name.startswith("kagura_"):
-                return tool_name.replace("kagura_", "")
-            return tool_name
-
-        mcp_tools: list[Tool] = []
-
-        # 1. Get all registered agents
-        agents = agent_registry.get_all()
-        for agent_name, agent_func in agents.items():
-            # Generate JSON Schema from function signature
-            try:
-                input_schema = generate_json_schema(agent_func)
-            except Exception:
-                # Fallback to empty schema if generation fails
-                input_schema = {"type": "object", "properties": {}}
-
-            # Extract description from docstring
-            description = agent_func.__doc__ or f"Kagura agent: {agent_name}"
-            # Clean up description (first line only)
-            description = description.strip().split("\n")[0]
-
-            # Create MCP Tool
-            mcp_tools.append(
-                Tool(
-                    name=f"kagura_{agent_name}",
-                    description=description,
-                    inputSchema=input_schema,
-                )
-            )
-
-        # 2. Get all registered tools
-        tools = tool_registry.get_all()
-        for tool_name, tool_func in tools.items():
-            # Generate JSON Schema
-            try:
-                input_schema = generate_json_schema(tool_func)
-            except Exception:
-                input_schema = {"type": "object", "properties": {}}
+        count = 0
+        for spec in specs:
+            self._lazy[spec["name"]] = spec
+            count += 1
+        self._versions = None
+        return count
+
+    def _current_versions(self) -> tuple[int, int, int]:
+        return (
+            agent_registry.version,
+            tool_registry.version,
+            workflow_registry.version,
+        )
 
-            description = tool_func.__doc__ or f"Kagura tool: {tool_name}"
-            description = description.strip().split("\n")[0]
+    def _refresh(self) -> None:
+        """Rebuild the catalog if any registry changed"""
+        versions = self._current_versions()
+        if versions == self._versions:
+            return
+
+        tools: list[Tool] = []
+        dispatch: dict[str, _CatalogEntry] = {}
+        # Agents first so that tool/workflow prefixes win on name clashes,
+        # matching the prefix routing order in _split_mcp_name
+        sources = (
+            ("agent", "kagura_", agent_registry.get_all()),
+            ("tool", "kagura_tool_", tool_registry.get_all()),
+            ("workflow", "kagura_workflow_", workflow_registry.get_all()),
+        )
+        for item_type, prefix, items in sources:
+            for item_name, func in items.items():
+                # Generate JSON Schema from function signature
+                try:
+                    input_schema = generate_json_schema(func)
+                except Exception:
+                    # Fallback to empty schema if generation fails
+                    input_schema = {"type": "object", "properties": {}}
+
+                # First docstring line as description
+                description = func.__doc__ or f"Kagura {item_type}: {item_name}"
+                description = description.strip().split("\n")[0]
+
+                mcp_name = f"{prefix}{item_name}"
+                tools.append(
+                    Tool(
+                        name=mcp_name,
+                        description=description,
+                        inputSchema=input_schema,
+                    )
+                )
+                dispatch[mcp_name] = _CatalogEntry(
+                    item_type=item_type,
+                    item_name=item_name,
+                    func=func,
+                    is_async=inspect.iscoroutinefunction(func),
+                )
 
-            mcp_tools.append(
+        for item_name, spec in self._lazy.items():
+            mcp_name = f"kagura_tool_{item_name}"
+            if mcp_name in dispatch:
+                continue
+            tools.append(
                 Tool(
-                    name=f"kagura_tool_{tool_name}",
-                    description=description,
-                    inputSchema=input_schema,
+                    name=mcp_name,
+                    description=spec["description"],
+                    inputSchema=spec["input_schema"],
                 )
             )
+            dispatch[mcp_name] = _CatalogEntry(
+                item_type="tool",
+                item_name=item_name,
+                func=None,
+                is_async=False,
+                module=spec["module"],
+            )
 
-        # 3. Get all registered workflows
-        workflows = workflow_registry.get_all()
-        for workflow_name, workflow_func in workflows.items():
-            # Generate JSON Schema
-            try:
-                input_schema = generate_json_schema(workflow_func)
-            except Exception:
-                input_schema = {"type": "object", "properties": {}}
+        self._tools = tools
+        self._dispatch = dispatch
+        self._views = {}
+        self._versions = versions
+        logger.debug(f"Built MCP tool catalog: {len(tools)} tools")
 
-            description = workflow_func.__doc__ or f"Kagura workflow: {workflow_name}"
-            description = description.strip().split("\n")[0]
+    def resolve(self, name: str) -> _CatalogEntry | None:
+        """Look up the callable behind an MCP tool name
 
-            mcp_tools.append(
-                Tool(
-                    name=f"kagura_workflow_{workflow_name}",
-                    description=description,
-                    inputSchema=input_schema,
-                )
-            )
+        Args:
+            name: MCP tool name
 
-        # 4. Filter tools by categories (if specified)
-        if categories:
-            from kagura.mcp.builtin.common import infer_category
+        Returns:
+            Catalog entry, or None if not registered
+        """
+        self._refresh()
+        entry = self._dispatch.get(name)
+        if entry is not None and entry.func is None and entry.module:
+            # Lazy tool: importing its module registers it via @tool
+            logger.info(f"Importing {entry.module} for {name}")
+            importlib.import_module(entry.module)
+            self._refresh()
+            entry = self._dispatch.get(name)
+        if entry is not None and entry.func is None:
+            return None
+        return entry
+
+    def list_tools(
+        self,
+        context: Literal["local", "remote"] = "local",
+        categories: set[str] | None = None,
+    ) -> list[Tool]:
+        """Get the tool list filtered by categories and context
+
+        Args:
+            context: Execution context ("local" or "remote")
+            categories: Optional set of categories to expose
 
-            # Filter by category
+        Returns:
+            List of MCP Tool objects (a new list; the cache is not exposed)
+        """
+        self._refresh()
+        view_key = (context, frozenset(categories) if categories else None)
+        view = self._views.get(view_key)
+        if view is None:
+            view = self._build_view(context, categories)
+            self._views[view_key] = view
+        return list(view)
+
+    def _build_view(
+        self,
+        context: Literal["local", "remote"],
+        categories: set[str] | None,
+    ) -> list[Tool]:
+        mcp_tools = self._tools
+
+        # Filter tools by categories (if specified)
+        if categories:
             category_filtered_tools = [
                 tool
                 for tool in mcp_tools
-                if infer_category(get_base_name(tool.name)) in categories
+                if infer_category(self._dispatch[tool.name].item_name) in categories
             ]
 
             logger.info(
@@ -177,26 +238,18 @@ def create_mcp_server(
 
             mcp_tools = category_filtered_tools
 
-        # 5. Filter tools by context (local vs remote)
+        # Filter tools by context (local vs remote)
         if context == "remote":
-            # Extract base names for permission check
-            base_names = [get_base_name(tool.name) for tool in mcp_tools]
+            base_names = [self._dispatch[tool.name].item_name for tool in mcp_tools]
 
             # Filter based on permissions
-            allowed_base_names = get_allowed_tools(base_names, context="remote")
+            allowed_base_names = set(get_allowed_tools(base_names, context="remote"))
             denied_names = get_denied_tools(base_names, context="remote")
 
-            # Rebuild tool name set for filtering
-            allowed_names_set = set()
-            for base_name in allowed_base_names:
-                # Reconstruct full names
-                allowed_names_set.add(f"kagura_tool_{base_name}")
-                allowed_names_set.add(f"kagura_workflow_{base_name}")
-                allowed_names_set.add(f"kagura_{base_name}")
-
-            # Filter mcp_tools
             filtered_tools = [
-                tool for tool in mcp_tools if tool.name in allowed_names_set
+                tool
+                for tool in mcp_tools
+                if self._dispatch[tool.name].item_name in allowed_base_names
             ]
 
             # Log filtering
@@ -214,12 +267,93 @@ def create_mcp_server(
             logger.info(
                 f"Remote context: Exposing {len(filtered_tools)}/{len(mcp_tools)} tools"
             )
-
             return filtered_tools
 
         # Local context - return all tools
         logger.info(f"Local context: Exposing all {len(mcp_tools)} tools")
-        return mcp_tools
+        return list(mcp_tools)
+
+
+_tool_catalog = _ToolCatalog()
+
+
+def register_lazy_tools(specs: Iterable[dict[str, Any]]) -> int:
+    """Advertise tools via MCP without importing their modules yet
+
+    Each tool's module is imported the first time the tool is called.
+    Tools already in tool_registry take precedence over their spec.
+
+    Args:
+        specs: Tool specs with "name", "module", "description" and
+            "input_schema" (see kagura.mcp.manifest)
+
+    Returns:
+        Number of specs registered
+    """
+    return _tool_catalog.add_lazy_tools(specs)
+
+
+def create_mcp_server(
+    name: str = "kagura-ai",
+    context: Literal["local", "remote"] = "local",
+    categories: set[str] | None = None,
+) -> Server:
+    """Create MCP server instance with tool access control.
+
+    Args:
+        name: Server name (default: "kagura-ai")
+        context: Execution context ("local" or "remote")
+                 - "local": All tools allowed (stdio transport)
+                 - "remote": Only safe tools allowed (HTTP/SSE transport)
+        categories: Optional set of categories to enable (filters tools by category)
+                    If None, all tools (subject to context permissions) are enabled
+
+    Returns:
+        Configured MCP Server instance with filtered tools
+
+    Example:
+        >>> # Local server (all tools)
+        >>> server = create_mcp_server(context="local")
+        >>>
+        >>> # Remote server (safe tools only)
+        >>> server = create_mcp_server(context="remote")
+        >>>
+        >>> # Local server with only coding and memory tools
+        >>> server = create_mcp_server(categories={"coding", "memory"})
+
+    Note:
+        Remote context filters out dangerous tools like:
+        - file_read, file_write (filesystem access)
+        - shell_exec (command execution)
+        - media_open_* (local app execution)
+
+        Categories filter is orthogonal to permissions:
+        - Permissions: Security layer (local vs remote)
+        - Categories: UX layer (which tools to expose)
+    """
+    server = Server(name)
+
+    # Log context
+    if categories:
+        logger.info(
+            f"Creating MCP server '{name}' in {context} context "
+            f"with categories: {', '.join(sorted(categories))}"
+        )
+    else:
+        logger.info(f"Creating MCP server '{name}' in {context} context")
+
+    @server.list_tools()
+    async def handle_list_tools() -> list[Tool]:
+        """List all Kagura agents, tools, and workflows as MCP tools
+
+        Returns all registered items from agent_registry, tool_registry,
+        and workflow_registry, converting them to MCP Tool format.
+        The catalog is cached and rebuilt only when a registry changes.
+
+        Returns:
+            List of MCP Tool objects
+        """
+        return _tool_catalog.list_tools(context, categories)
 
     @server.call_tool()
     async def handle_call_tool(
@@ -259,64 +393,33 @@ def create_mcp_server(
         # Track execution with telemetry
         async with collector.track_execution(f"mcp_{name}", **tracking_args):
             # Determine tool type
-            if name.startswith("kagura_tool_"):
-                collector.add_tag("type", "tool")
-                item_name = name.replace("kagura_tool_", "", 1)
-            elif name.startswith("kagura_workflow_"):
-                collector.add_tag("type", "workflow")
-                item_name = name.replace("kagura_workflow_", "", 1)
-            else:
-                collector.add_tag("type", "agent")
-                item_name = name.replace("kagura_", "", 1)
+            item_type, item_name = _split_mcp_name(name)
+            collector.add_tag("type", item_type)
 
             collector.add_tag("item_name", item_name)
             collector.add_tag("mcp_name", name)
 
-            # Route to appropriate registry and execute
+            # Resolve via cached dispatch map and execute
             start_time = time.time()
             try:
                 logger.debug(f"Executing tool: {item_name}")
-                if name.startswith("kagura_tool_"):
-                    # Execute @tool
-                    tool_func = tool_registry.get(item_name)
-                    if tool_func is None:
-                        raise ValueError(f"Tool not found: {item_name}")
-
-                    # Tools can be async or sync
-                    logger.debug(f"Calling tool function: {item_name}")
-                    if inspect.iscoroutinefunction(tool_func):
-                        result = await tool_func(**args)
-                    else:
-                        result = tool_func(**args)
-                    logger.debug(f"Tool {item_name} returned, converting to string")
-                    result_text = str(result)
-                    logger.debug(f"Result text length: {len(result_text)}")
-
-                elif name.startswith("kagura_workflow_"):
-                    # Execute @workflow
-                    workflow_func = workflow_registry.get(item_name)
-                    if workflow_func is None:
-                        raise ValueError(f"Workflow not found: {item_name}")
-
-                    # Workflows can be async or sync
-                    if inspect.iscoroutinefunction(workflow_func):
-                        result = await workflow_func(**args)
-                    else:
-                        result = workflow_func(**args)
-                    result_text = str(result)
+                entry = _tool_catalog.resolve(name)
+                # resolve() imports lazy tools, so func is only None if the
+                # module failed to register the tool it advertised
+                func = entry.func if entry is not None else None
+                if entry is None or func is None or entry.item_type != item_type:
+                    raise ValueError(
+                        f"{item_type.capitalize()} not found: {item_name}"
+                    )
 
+                # Agents, tools and workflows can be async or sync
+                if entry.is_async:
+                    result = await func(**args)
                 else:
-                    # Execute @agent
-                    agent_func = agent_registry.get(item_name)
-                    if agent_func is None:
-                        raise ValueError(f"Agent not found: {item_name}")
-
-                    # Agents are async
-                    if inspect.iscoroutinefunction(agent_func):
-                        result = await agent_func(**args)
-                    else:
-                        result = agent_func(**args)
-                    result_text = str(result)
+                    result = func(**args)
+                logger.debug(f"{item_name} returned, converting to string")
+                result_text = str(result)
+                logger.debug(f"Result text length: {len(result_text)}")
 
                 # Record successful tool call
                 duration = time.time() - start_time
@@ -360,4 +463,4 @@ def create_mcp_server(
     return server
 
 
-__all__ = ["create_mcp_server"]
+__all__ = ["create_mcp_server", "register_lazy_tools"]
@@ -5,12 +5,12 @@ Indexes source code into RAG for semantic search and retrieval.
 
 from __future__ import annotations
 
-import ast
 import fnmatch
 import logging
 from pathlib import Path
 
 from kagura import tool
+from kagura.core.memory.source_indexer import SourceCodeIndexer, extract_code_chunks
 from kagura.mcp.builtin.common import parse_json_list, to_int
 from kagura.mcp.tools.coding.common import get_coding_memory
 
@@ -30,6 +30,9 @@ async def coding_index_source_code(
 
     Scans a directory for source files, parses them (using AST for Python),
     chunks by function/class, and stores in RAG with metadata.
+    Indexing is incremental: only files whose content changed since the last
+    run are re-parsed and re-embedded, and chunks of modified or deleted
+    files are replaced.
 
     Use this tool to enable semantic code search across your project.
     Useful for:
@@ -80,6 +83,9 @@ async def coding_index_source_code(
     # Get CodingMemoryManager
     memory = get_coding_memory(user_id, project_id)
 
+    if not memory.rag:
+        return "❌ RAG not available. Source indexing requires ChromaDB and sentence-transformers."
+
     # Scan directory for files
     dir_path = Path(directory).resolve()
     if not dir_path.exists():
@@ -92,9 +98,13 @@ async def coding_index_source_code(
     for pattern in include_patterns:
         matched_files.extend(dir_path.glob(pattern))
 
-    # Filter exclusions
+    # Filter exclusions (dedupe overlapping include patterns)
     filtered_files = []
+    seen: set[Path] = set()
     for file in matched_files:
+        if file in seen:
+            continue
+        seen.add(file)
         should_exclude = False
         for exclude_pattern in exclude_patterns_list:
             if fnmatch.fnmatch(str(file), exclude_pattern):
@@ -108,60 +118,37 @@ async def coding_index_source_code(
 
     logger.info(f"Found {len(filtered_files)} files to index")
 
-    # Index each file
-    total_chunks = 0
-    indexed_files = 0
-    errors = []
-
-    for file_path in filtered_files:
-        try:
-            # Read file content
-            with open(file_path, "r", encoding="utf-8") as f:
-                source = f.read()
-
-            # Parse AST
-            tree = ast.parse(source, filename=str(file_path))
-
-            # Extract chunks (functions, classes, module docstring)
-            chunks = _extract_code_chunks(source, tree, file_path)
-
-            # Store each chunk in RAG
-            for chunk in chunks:
-                content = (
-                    f"File: {chunk['file_path']}\n"
-                    f"Type: {chunk['type']}\n"
-                    f"Name: {chunk['name']}\n"
-                    f"Lines: {chunk['line_start']}-{chunk['line_end']}\n\n"
-                    f"{chunk['content']}"
-                )
-
-                metadata = {
-                    "type": "source_code",
-                    "file_path": str(chunk["file_path"]),
-                    "line_start": chunk["line_start"],
-                    "line_end": chunk["line_end"],
-                    "chunk_type": chunk["type"],
-                    "name": chunk["name"],
-                    "language": language,
-                }
-
-                # Store in RAG
-                memory.store_semantic(content=content, metadata=metadata)
-                total_chunks += 1
-
-            indexed_files += 1
-
-        except SyntaxError as e:
-            errors.append(f"{file_path.name}: Syntax error at line {e.lineno}")
-        except Exception as e:
-            errors.append(f"{file_path.name}: {str(e)[:100]}")
+    # Incremental index: unchanged files are skipped via the file manifest,
+    # changed files are parsed in a process pool and embedded in batches
+    indexer = SourceCodeIndexer(
+        rag=memory.rag,
+        manifest_path=memory.persistent.db_path,
+        user_id=memory.user_id,
+        project_id=project_id,
+        agent_name=memory.agent_name,
+    )
+    # Indexed files the include patterns still cover but that were not
+    # selected (now excluded) lose their chunks
+    included = set(matched_files)
+    stats = await indexer.index_files(
+        filtered_files,
+        root=dir_path,
+        language=language,
+        matches=lambda path: path in included,
+    )
+    errors = stats.errors
 
     # Build result
     result = "✅ Source Code Indexing Complete\n\n"
     result += f"**Project:** {project_id}\n"
     result += f"**Directory:** {directory}\n"
-    result += f"**Files indexed:** {indexed_files}/{len(filtered_files)}\n"
-    result += f"**Code chunks:** {total_chunks}\n"
+    result += f"**Files indexed:** {stats.files_indexed}/{len(filtered_files)}\n"
+    result += f"**Files unchanged (skipped):** {stats.files_unchanged}\n"
+    if stats.files_removed:
+        result += f"**Files removed:** {stats.files_removed}\n"
+    result += f"**Code chunks:** {stats.chunks_written}\n"
+    if stats.chunks_deleted:
+        result += f"**Stale chunks removed:** {stats.chunks_deleted}\n"
     result += f"**Language:** {language}\n\n"
 
     if errors:
@@ -177,172 +164,8 @@ async def coding_index_source_code(
     return result
 
 
-def _extract_code_chunks(
-    source: str,
-    tree: ast.AST,
-    file_path: Path,
-    overlap_lines: int = 5,
-) -> list[dict]:
-    """Extract code chunks from AST for indexing with overlap.
-
-    Args:
-        source: Source code string
-        tree: AST tree
-        file_path: Path to source file
-        overlap_lines: Number of lines to overlap before/after (default: 5)
-
-    Returns:
-        List of chunk dictionaries with overlapping context
-    """
-    chunks = []
-    source_lines = source.splitlines()
-    total_lines = len(source_lines)
-
-    # Extract imports for context
-    imports = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            module = node.module or ""
-            for alias in node.names:
-                imports.append(f"{module}.{alias.name}")
-
-    imports_context = "Imports: " + ", ".join(imports[:10]) if imports else ""
-
-    # Module-level docstring + imports (full file overview)
-    if (
-        isinstance(tree, ast.Module)
-        and hasattr(tree, "body")
-        and tree.body
-        and isinstance(tree.body[0], ast.Expr)
-        and isinstance(tree.body[0].value, ast.Constant)
-    ):
-        docstring = tree.body[0].value.value
-        if isinstance(docstring, str):
-            chunks.append(
-                {
-                    "file_path": str(file_path),
-                    "type": "module",
-                    "name": file_path.stem,
-                    "line_start": 1,
-                    "line_end": len(docstring.split("\n")),
-                    "content": f"{docstring}\n\n{imports_context}",
-                    "imports": imports,
-                }
-            )
-
-    # Find all top-level classes for context
-    classes_info = {}
-    if isinstance(tree, ast.Module) and hasattr(tree, "body"):
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                classes_info[node.name] = {
-                    "line_start": node.lineno,
-                    "line_end": node.end_lineno or node.lineno,
-                    "docstring": ast.get_docstring(node) or "",
-                }
-
-    # Functions and classes with overlap
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            # Function/method
-            func_name = node.name
-            line_start = node.lineno
-            line_end = node.end_lineno or line_start
-
-            # Add overlap context
-            overlap_start = max(1, line_start - overlap_lines)
-            overlap_end = min(total_lines, line_end + overlap_lines)
-
-            # Extract function with overlap
-            func_source_with_overlap = "\n".join(
-                source_lines[overlap_start - 1 : overlap_end]
-            )
-
-            # Get docstring
-            docstring = ast.get_docstring(node) or ""
-
-            # Find parent class if method
-            parent_class = None
-            for class_name, class_info in classes_info.items():
-                if (
-                    line_start >= class_info["line_start"]
-                    and line_end <= class_info["line_end"]
-                ):
-                    parent_class = class_name
-                    break
-
-            context = f"Function: {func_name}"
-            if parent_class:
-                context = f"Class: {parent_class}, Method: {func_name}"
-
-            chunks.append(
-                {
-                    "file_path": str(file_path),
-                    "type": "function" if not parent_class else "method",
-                    "name": func_name,
-                    "line_start": line_start,
-                    "line_end": line_end,
-                    "content": (
-                        f"{context}\n"
-                        f"{imports_context}\n\n"
-                        f"Code (with {overlap_lines}-line overlap):\n"
-                        f"{func_source_with_overlap}\n\n"
-                        f"Docstring:\n{docstring}"
-                    ),
-                    "parent_class": parent_class,
-                    "imports": imports,
-                }
-            )
-
-        elif isinstance(node, ast.ClassDef):
-            # Class definition with all methods
-            class_name = node.name
-            line_start = node.lineno
-            line_end = node.end_lineno or line_start
-
-            # Add overlap
-            overlap_start = max(1, line_start - overlap_lines)
-            overlap_end = min(total_lines, line_end + overlap_lines)
-
-            # Extract class source with overlap
-            class_source = "\n".join(source_lines[overlap_start - 1 : overlap_end])
-
-            # Get docstring
-            docstring = ast.get_docstring(node) or ""
-
-            # List methods with signatures
-            methods = []
-            for m in node.body:
-                if isinstance(m, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Get method signature
-                    args = [a.arg for a in m.args.args]
-                    methods.append(f"{m.name}({', '.join(args)})")
-
-            chunks.append(
-                {
-                    "file_path": str(file_path),
-                    "type": "class",
-                    "name": class_name,
-                    "line_start": line_start,
-                    "line_end": line_end,
-                    "content": (
-                        f"Class: {class_name}\n"
-                        f"{imports_context}\n\n"
-                        f"Code (with {overlap_lines}-line overlap):\n"
-                        f"{class_source}\n\n"
-                        f"Docstring:\n{docstring}\n\n"
-                        f"Methods ({len(methods)}):\n"
-                        + "\n".join(f"- {m}" for m in methods)
-                    ),
-                    "methods": methods,
-                    "imports": imports,
-                }
-            )
-
-    return chunks
+# Backward-compatible alias (chunk extraction moved to kagura.core.memory)
+_extract_code_chunks = extract_code_chunks
 
 
 @tool
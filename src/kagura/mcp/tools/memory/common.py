@@ -59,5 +59,26 @@ def get_memory_manager(
     return _memory_cache[cache_key]
 
 
+def get_search_memory_manager(user_id: str, agent_name: str) -> MemoryManager:
+    """Get a MemoryManager for search tools without waiting for models
+
+    While the server is still prewarming memory models and no RAG manager
+    exists yet for this user/agent, returns the lexical-only (RAG disabled)
+    manager instead of blocking until the models are loaded.
+
+    Args:
+        user_id: User identifier (memory owner)
+        agent_name: Name of the agent
+
+    Returns:
+        RAG-enabled MemoryManager, or a RAG-disabled one while warming
+    """
+    from kagura.core.memory.prewarm import memory_warming
+
+    if memory_warming() and f"{user_id}:{agent_name}:rag=True" not in _memory_cache:
+        return get_memory_manager(user_id, agent_name, enable_rag=False)
+    return get_memory_manager(user_id, agent_name, enable_rag=True)
+
+
 # Backward compatibility alias for tests and legacy code
 _get_memory_manager = get_memory_manager
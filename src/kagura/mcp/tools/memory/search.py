@@ -8,8 +8,9 @@ from __future__ import annotations
 import json
 
 from kagura import tool
+from kagura.core.memory.prewarm import memory_warming
 from kagura.mcp.builtin.common import to_int
-from kagura.mcp.tools.memory.common import _memory_cache, get_memory_manager
+from kagura.mcp.tools.memory.common import _memory_cache, get_search_memory_manager
 from kagura.mcp.tools.memory.storage import memory_recall
 
 
@@ -44,8 +45,9 @@ async def memory_search(
     k = to_int(k, default=5, min_val=1, max_val=100, param_name="k")
 
     try:
-        # Use cached MemoryManager with RAG enabled
-        memory = get_memory_manager(user_id, agent_name, enable_rag=True)
+        # Use cached MemoryManager with RAG enabled (lexical-only while the
+        # server is still prewarming models)
+        memory = get_search_memory_manager(user_id, agent_name)
     except ImportError:
         # If RAG dependencies not available, get from cache with consistent key
         from kagura.core.memory import MemoryManager
@@ -65,6 +67,11 @@ async def memory_search(
             # Add source indicator to RAG results
             for result in rag_results:
                 result["source"] = "rag"
+        elif memory_warming() and scope in ("all", "persistent"):
+            # Models still loading: keyword matches instead of waiting
+            rag_results = memory.recall_lexical(query, top_k=k)
+            for result in rag_results:
+                result["source"] = "lexical"
 
         # Search working memory for matching keys (only if scope includes working)
         working_results = []
@@ -167,7 +174,7 @@ async def memory_search_ids(
     k = to_int(k, default=10, min_val=1, max_val=100, param_name="k")
 
     try:
-        memory = get_memory_manager(user_id, agent_name, enable_rag=True)
+        memory = get_search_memory_manager(user_id, agent_name)
     except ImportError:
         from kagura.core.memory import MemoryManager
 
@@ -183,6 +190,10 @@ async def memory_search_ids(
         rag_results = []
         if memory.rag or memory.persistent_rag:
             rag_results = memory.recall_semantic(query, top_k=k, scope=scope)
+        elif memory_warming() and scope in ("all", "persistent"):
+            rag_results = memory.recall_lexical(query, top_k=k)
+            for result in rag_results:
+                result["source"] = "lexical"
 
         working_results = []
         if scope in ("all", "working"):
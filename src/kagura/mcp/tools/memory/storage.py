@@ -320,9 +320,7 @@ async def memory_delete(
                 where_filter: dict[str, str] = {"key": key}
                 if agent_name:
                     where_filter["agent_name"] = agent_name
-                results = memory.rag.collection.get(where=where_filter)  # type: ignore[arg-type]
-                if results["ids"]:
-                    memory.rag.collection.delete(ids=results["ids"])
+                memory.rag.delete_matching(where_filter)
             except Exception:
                 pass  # Silently fail
 
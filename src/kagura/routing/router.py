@@ -4,14 +4,20 @@ This module provides intent-based routing to automatically select
 the most appropriate agent based on user input.
 """
 
+import logging
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from .exceptions import (
     InvalidRouterStrategyError,
     NoAgentFoundError,
 )
 
+if TYPE_CHECKING:
+    from .semantic import SemanticIndex
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class RegisteredAgent:
@@ -77,7 +83,8 @@ class AgentRouter:
         strategy: str = "intent",
         fallback_agent: Callable | None = None,
         confidence_threshold: float = 0.3,
-        encoder: str = "openai",
+        encoder: str | Callable[[list[str]], Any] = "openai",
+        cache_size: int = 256,
     ) -> None:
         """Initialize agent router.
 
@@ -86,8 +93,13 @@ class AgentRouter:
                 "semantic" for embedding-based routing)
             fallback_agent: Default agent to use when no match is found
             confidence_threshold: Minimum confidence score (0.0-1.0) required
-                for routing. Lower values are more lenient.
-            encoder: Encoder to use for semantic routing ("openai" or "cohere")
+                for routing. Lower values are more lenient. With the semantic
+                strategy the score is a cosine similarity, so thresholds
+                depend on the encoder.
+            encoder: Encoder for semantic routing: "openai", "cohere",
+                "local" (sentence-transformers Embedder) or a callable
+                embedding a list of texts
+            cache_size: Recent input embeddings cached by semantic routing
 
         Raises:
             InvalidRouterStrategyError: If strategy is not valid
@@ -98,9 +110,14 @@ class AgentRouter:
         self.strategy = strategy
         self.fallback_agent = fallback_agent
         self.confidence_threshold = confidence_threshold
-        self.encoder_type = encoder
+        self.encoder_type = encoder if isinstance(encoder, str) else "custom"
+        self.cache_size = cache_size
+        self._encoder: Callable[[list[str]], Any] | None = (
+            None if isinstance(encoder, str) else encoder
+        )
         self._agents: dict[str, RegisteredAgent] = {}
-        self._semantic_router: Any | None = None
+        self._semantic_index: "SemanticIndex | None" = None
+        self._index_stale = True
 
     def register(
         self,
@@ -147,9 +164,9 @@ class AgentRouter:
             description=description,
         )
 
-        # Reset semantic router to rebuild with new agent
+        # Re-embed samples on next route (the input cache stays valid)
         if self.strategy == "semantic":
-            self._semantic_router = None
+            self._index_stale = True
 
     async def route(
         self,
@@ -229,6 +246,15 @@ class AgentRouter:
         """
         scores: list[tuple[Callable, float]] = []
 
+        if self.strategy == "semantic":
+            # One input embedding and one matrix product for all agents
+            semantic_scores = self._semantic_scores(user_input)
+            for name, score in semantic_scores.items():
+                if score > 0:
+                    scores.append((self._agents[name].agent, score))
+            scores.sort(key=lambda x: x[1], reverse=True)
+            return scores[:top_k]
+
         for agent_data in self._agents.values():
             score = self._calculate_score(user_input, agent_data)
             if score > 0:  # Only include agents with non-zero scores
@@ -360,7 +386,7 @@ class AgentRouter:
         return max_score
 
     def _semantic_score(self, user_input: str, agent_name: str) -> float:
-        """Calculate semantic similarity score using semantic-router.
+        """Calculate semantic similarity score for one agent.
 
         Args:
             user_input: User input string
@@ -369,80 +395,53 @@ class AgentRouter:
         Returns:
             Score between 0.0 and 1.0
         """
-        # Initialize semantic router if not already done
-        if self._semantic_router is None:
-            self._init_semantic_router()
+        return self._semantic_scores(user_input).get(agent_name, 0.0)
 
-        if self._semantic_router is None:
-            # Fallback if semantic router initialization failed
-            return 0.0
+    def _semantic_scores(self, user_input: str) -> dict[str, float]:
+        """Score all agents with samples against the input.
 
-        try:
-            # Route the input
-            result = self._semantic_router(user_input)
-
-            # Check if result matches this agent
-            if result and hasattr(result, "name") and result.name == agent_name:
-                # semantic-router doesn't provide score directly,
-                # so we use 1.0 for matches
-                return 1.0
-        except (ValueError, Exception):
-            # Index not ready or other errors
-            return 0.0
+        Args:
+            user_input: User input string
 
-        return 0.0
+        Returns:
+            Agent name -> score between 0.0 and 1.0 (empty if the encoder is
+            unavailable or fails)
+        """
+        index = self._get_semantic_index()
+        if index is None:
+            return {}
 
-    def _init_semantic_router(self) -> None:
-        """Initialize semantic-router with registered agents."""
         try:
-            from semantic_router import Route  # type: ignore
-            from semantic_router import (  # type: ignore
-                SemanticRouter as _SemanticRouter,
-            )
+            return index.scores(user_input)
+        except Exception as e:
+            # Encoder/API errors: treat as no match
+            logger.debug(f"Semantic routing failed: {e}")
+            return {}
 
-            # Create encoder
-            encoder = self._create_encoder()
-            if encoder is None:
-                return
-
-            # Create routes from registered agents
-            routes = []
-            for agent_data in self._agents.values():
-                if agent_data.samples:
-                    route = Route(
-                        name=agent_data.name,
-                        utterances=agent_data.samples,
-                    )
-                    routes.append(route)
-
-            if not routes:
-                return
-
-            # Create semantic router
-            self._semantic_router = _SemanticRouter(encoder=encoder, routes=routes)
-        except (ImportError, ValueError, Exception):
-            # ImportError: semantic-router not installed
-            # ValueError: API key missing or invalid configuration
-            # Exception: Any other initialization errors
-            return
-
-    def _create_encoder(self) -> Any | None:
-        """Create encoder for semantic routing."""
-        try:
-            if self.encoder_type == "openai":
-                from semantic_router.encoders import OpenAIEncoder  # type: ignore
+    def _get_semantic_index(self) -> "SemanticIndex | None":
+        """Return the sample index, (re)building it after registrations."""
+        if not self._index_stale:
+            return self._semantic_index
 
-                return OpenAIEncoder()
-            elif self.encoder_type == "cohere":
-                from semantic_router.encoders import CohereEncoder  # type: ignore
+        try:
+            from .semantic import SemanticIndex, create_encoder
+        except ImportError:
+            # numpy not installed
+            return None
 
-                return CohereEncoder()
-            else:
-                # Default to OpenAI
-                from semantic_router.encoders import OpenAIEncoder  # type: ignore
+        if self._encoder is None:
+            self._encoder = create_encoder(self.encoder_type)
+            if self._encoder is None:
+                return None
 
-                return OpenAIEncoder()
-        except (ImportError, ValueError):
-            # ImportError: semantic-router not installed
-            # ValueError: API key missing
+        if self._semantic_index is None:
+            self._semantic_index = SemanticIndex(self._encoder, self.cache_size)
+        try:
+            self._semantic_index.build(
+                {name: data.samples for name, data in self._agents.items()}
+            )
+        except Exception as e:
+            logger.debug(f"Failed to build semantic routing index: {e}")
             return None
+        self._index_stale = False
+        return self._semantic_index
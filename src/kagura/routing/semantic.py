@@ -0,0 +1,140 @@
+"""Embedding index for semantic agent routing.
+
+All registered agents' sample utterances are embedded once (one encoder
+call) into a row-normalized sample matrix, grouped by agent. Routing an
+input embeds it once, scores every sample with one matrix-vector product
+and reduces to one cosine-similarity confidence per agent (best matching
+sample). Input embeddings are kept in a small LRU, so repeated inputs cost
+no encoder call at all.
+
+Encoders are plain callables ``list[str] -> vectors``: the local
+:class:`~kagura.core.memory.embeddings.Embedder`, a semantic-router encoder
+(OpenAI/Cohere) or any user function.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Encoder = Callable[[list[str]], Any]
+
+
+def _normalize(vectors: Any) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def create_encoder(encoder_type: str) -> Encoder | None:
+    """Create an encoder callable by name.
+
+    Args:
+        encoder_type: "local" (sentence-transformers Embedder), "openai" or
+            "cohere" (semantic-router encoders; other names use OpenAI)
+
+    Returns:
+        Encoder callable, or None if its dependencies/API key are missing
+    """
+    try:
+        if encoder_type == "local":
+            from kagura.core.memory.embeddings import Embedder
+
+            embedder = Embedder()
+            # Symmetric similarity: samples and inputs share the query prefix
+            return embedder.encode_queries
+        if encoder_type == "cohere":
+            from semantic_router.encoders import CohereEncoder  # type: ignore
+
+            return CohereEncoder()
+        from semantic_router.encoders import OpenAIEncoder  # type: ignore
+
+        return OpenAIEncoder()
+    except (ImportError, ValueError) as e:
+        # ImportError: encoder package not installed
+        # ValueError: API key missing
+        logger.debug(f"Semantic routing encoder '{encoder_type}' unavailable: {e}")
+        return None
+
+
+class SemanticIndex:
+    """Sample-utterance embeddings of all agents, scored in one pass.
+
+    Example:
+        >>> index = SemanticIndex(encoder)
+        >>> index.build({"translator": ["translate this", "翻訳して"]})
+        >>> index.scores("please translate")
+        {'translator': 0.83}
+    """
+
+    def __init__(self, encoder: Encoder, cache_size: int = 256) -> None:
+        """Initialize an empty index.
+
+        Args:
+            encoder: Callable embedding a list of texts
+            cache_size: Recent input embeddings kept (0 disables the cache)
+        """
+        self.encoder = encoder
+        self.cache_size = cache_size
+        self.names: list[str] = []
+        self._samples = np.zeros((0, 0), dtype=np.float32)
+        self._starts = np.zeros(0, dtype=np.int64)
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def build(self, samples: dict[str, Sequence[str]]) -> None:
+        """Embed all sample utterances with a single encoder call.
+
+        Args:
+            samples: Agent name -> sample utterances (agents without
+                samples are left out)
+        """
+        groups = [(name, list(texts)) for name, texts in samples.items() if texts]
+        self.names = [name for name, _ in groups]
+        texts = [text for _, group in groups for text in group]
+        lengths = [len(group) for _, group in groups]
+        self._starts = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int64)
+        self._samples = (
+            _normalize(self.encoder(texts))
+            if texts
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        logger.debug(
+            f"Built semantic routing index: {len(self.names)} agents, "
+            f"{len(texts)} samples"
+        )
+
+    def embed(self, text: str) -> np.ndarray:
+        """Embed an input (served from the LRU when seen recently)."""
+        vector = self._cache.get(text)
+        if vector is not None:
+            self._cache.move_to_end(text)
+            return vector
+        vector = _normalize(self.encoder([text]))[0]
+        if self.cache_size > 0:
+            self._cache[text] = vector
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return vector
+
+    def scores(self, text: str) -> dict[str, float]:
+        """Score every agent against an input.
+
+        Args:
+            text: User input
+
+        Returns:
+            Agent name -> confidence in [0, 1] (cosine similarity of the
+            best matching sample, negatives clipped to 0)
+        """
+        if not self.names:
+            return {}
+        similarities = self._samples @ self.embed(text)
+        best = np.maximum.reduceat(similarities, self._starts)
+        return dict(zip(self.names, np.clip(best, 0.0, 1.0).tolist()))
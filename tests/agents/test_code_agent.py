@@ -295,6 +295,24 @@ async def test_code_result_model():
     assert result.stderr == ""
 
 
+@pytest.mark.asyncio
+async def test_code_agent_execute_many():
+    """Test running several tasks concurrently"""
+    agent = CodeExecutionAgent()
+
+    with patch("kagura.agents.code_execution.agent") as mock_agent_decorator:
+
+        async def mock_generator(task_desc: str, feedback: str = ""):
+            return f"print({task_desc!r})\nresult = len({task_desc!r})"
+
+        mock_agent_decorator.return_value = lambda fn: mock_generator
+
+        results = await agent.execute_many(["a", "bb", "ccc"])
+
+        assert [r.result for r in results] == [1, 2, 3]
+        assert [r.stdout for r in results] == ["a\n", "bb\n", "ccc\n"]
+
+
 @pytest.mark.asyncio
 async def test_code_agent_custom_timeout():
     """Test code agent with custom timeout"""
@@ -1,8 +1,13 @@
 """Tests for Search & Recall endpoints (v4.0 REST API)."""
 
+import threading
+
+import pytest
 from fastapi.testclient import TestClient
 
+from kagura.api import dependencies
 from kagura.api.server import app
+from kagura.core.memory import prewarm
 
 client = TestClient(app)
 
@@ -152,3 +157,38 @@ class TestRecallEndpoint:
 
         assert response.status_code == 200
         # Should not crash, may return empty results
+
+
+@pytest.fixture
+def warming(monkeypatch):
+    """Startup prewarm still loading models for the whole test."""
+    release = threading.Event()
+    prewarmer = prewarm.Prewarmer()
+    prewarmer.add("embedding", release.wait)
+    monkeypatch.setattr(prewarm, "_prewarmer", prewarmer)
+    prewarmer.start()
+    yield prewarmer
+    release.set()
+    prewarmer.wait(timeout=5)
+    dependencies._lexical_managers.clear()
+
+
+class TestRecallWhileWarming:
+    """Test POST /api/v1/recall before models finished loading."""
+
+    def test_recall_degrades_to_lexical(self, warming):
+        """Recall answers with keyword matches instead of loading models."""
+        memory = dependencies.get_search_memory_manager("default_user")
+        assert memory.rag is None
+        memory.remember("warmup_rollout", "Blue green rollout checklist")
+
+        response = client.post(
+            "/api/v1/recall", json={"query": "rollout checklist", "k": 5}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["degraded"] is True
+        assert [r["key"] for r in data["results"]] == ["warmup_rollout"]
+        assert data["results"][0]["similarity"] == 1.0
+        assert "default_user" not in dependencies._memory_managers
@@ -1,8 +1,12 @@
 """Tests for System endpoints (v4.0 REST API)."""
 
+import threading
+
 from fastapi.testclient import TestClient
 
+from kagura.api import dependencies
 from kagura.api.server import app
+from kagura.core.memory import prewarm
 
 client = TestClient(app)
 
@@ -40,6 +44,32 @@ class TestHealthEndpoint:
             assert status in ["healthy", "unhealthy", "disabled"]
 
 
+class TestHealthWhileWarming:
+    """Test GET /api/v1/health during the startup prewarm."""
+
+    def test_health_reports_warming_stages(self, monkeypatch):
+        """Health answers immediately and reports each prewarm stage."""
+        release = threading.Event()
+        prewarmer = prewarm.Prewarmer()
+        prewarmer.add("vector_store", lambda: None)
+        prewarmer.add("embedding", release.wait)
+        monkeypatch.setattr(prewarm, "_prewarmer", prewarmer)
+        prewarmer.start()
+        try:
+            response = client.get("/api/v1/health")
+
+            assert response.status_code == 200
+            data = response.json()
+            assert data["status"] == "degraded"
+            assert data["services"]["database"] == "healthy"
+            assert data["services"]["vector_db"] == "warming"
+            assert data["services"]["embedding"] == "warming"
+        finally:
+            release.set()
+            prewarmer.wait(timeout=5)
+            dependencies._lexical_managers.clear()
+
+
 class TestMetricsEndpoint:
     """Test GET /api/v1/metrics - System metrics."""
 
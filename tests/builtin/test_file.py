@@ -2,7 +2,7 @@
 
 import pytest
 
-from kagura.builtin.file import file_search, grep_content
+from kagura.builtin.file import file_search, grep_content, search_content
 
 
 class TestFileAgents:
@@ -48,6 +48,24 @@ class TestFileAgents:
         assert isinstance(result, list)
         assert len(result) >= 2
 
+    @pytest.mark.asyncio
+    async def test_file_search_lists_hidden_and_ignored_files(self, tmp_path):
+        """Test file_search lists every file unless asked to respect ignores."""
+        (tmp_path / "keep.py").write_text("x = 1")
+        (tmp_path / "skip.py").write_text("x = 2")
+        (tmp_path / ".hidden.py").write_text("x = 3")
+        (tmp_path / ".gitignore").write_text("skip.py\n")
+
+        result = await file_search("*", directory=str(tmp_path), file_type="*.py")
+        assert sorted(result) == sorted(
+            str(tmp_path / name) for name in ("keep.py", "skip.py", ".hidden.py")
+        )
+
+        result = await file_search(
+            "*", directory=str(tmp_path), file_type="*.py", respect_gitignore=True
+        )
+        assert result == [str(tmp_path / "keep.py")]
+
     @pytest.mark.asyncio
     async def test_grep_content_finds_matches(self, tmp_path):
         """Test grep_content finds pattern in files."""
@@ -96,3 +114,14 @@ class TestFileAgents:
         # Should return empty dict (no matches)
         assert isinstance(result, dict)
         assert len(result) == 0
+
+    @pytest.mark.asyncio
+    async def test_search_content_respects_gitignore(self, tmp_path):
+        """Test search_content walks and greps, skipping ignored files."""
+        (tmp_path / "keep.py").write_text("x = 1\n# FIXME here\n")
+        (tmp_path / "skip.py").write_text("# FIXME ignored\n")
+        (tmp_path / ".gitignore").write_text("skip.py\n")
+
+        result = await search_content("FIXME", directory=str(tmp_path))
+
+        assert result == {str(tmp_path / "keep.py"): ["2:# FIXME here"]}
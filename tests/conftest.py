@@ -23,6 +23,9 @@ def isolate_test_database():
     # Override data directory for all tests
     os.environ["KAGURA_DATA_DIR"] = str(test_data_dir)
 
+    # Don't let cached tool results persist across test runs
+    os.environ["TOOL_CACHE_PERSIST"] = "false"
+
     yield test_data_dir
 
     # Cleanup after all tests
@@ -35,6 +38,7 @@ def isolate_test_database():
 
     # Restore original env (if any)
     os.environ.pop("KAGURA_DATA_DIR", None)
+    os.environ.pop("TOOL_CACHE_PERSIST", None)
 
 
 @pytest.fixture
@@ -511,6 +511,131 @@ class TestPersistence:
             assert graph2.graph.has_node("node_001")
 
 
+class TestIncrementalPersistence:
+    """Test append-only change log and compaction."""
+
+    def test_persist_appends_only_changes(self, tmp_path: Path) -> None:
+        """Saves after the first append changed elements to the log."""
+        persist_path = tmp_path / "graph.json"
+        graph = GraphMemory(persist_path=persist_path)
+        for i in range(50):
+            graph.add_node(f"mem_{i}", "memory")
+        graph.persist()
+        snapshot = persist_path.read_text()
+
+        interaction_id = graph.record_interaction("user_001", "q", "a")
+        graph.graph.nodes["mem_3"]["weight"] = 0.5  # Direct attribute edit
+        graph.graph.remove_node("mem_4")
+        graph.persist()
+
+        assert persist_path.read_text() == snapshot
+        log_lines = (tmp_path / "graph.json.log").read_text().splitlines()
+        assert len(log_lines) == 5  # del mem_4, 3 node upserts, 1 edge
+
+        loaded = GraphMemory(persist_path=persist_path)
+        assert loaded.graph.has_edge(interaction_id, "user_001")
+        assert loaded.get_node("mem_3")["weight"] == 0.5
+        assert not loaded.graph.has_node("mem_4")
+        assert loaded.graph.number_of_nodes() == 51
+
+    def test_compaction_truncates_log(self, tmp_path: Path, monkeypatch) -> None:
+        """A large log is folded back into the snapshot."""
+        from kagura.core.graph import store
+
+        monkeypatch.setattr(store, "_COMPACT_MIN_OPS", 5)
+        persist_path = tmp_path / "graph.json"
+        graph = GraphMemory(persist_path=persist_path)
+        graph.add_node("hub", "topic")
+        graph.persist()
+
+        for i in range(10):
+            graph.add_node(f"mem_{i}", "memory")
+            graph.add_edge(f"mem_{i}", "hub", "related_to")
+        graph.persist()
+
+        assert not (tmp_path / "graph.json.log").exists()
+        assert GraphMemory(persist_path=persist_path).graph.number_of_edges() == 10
+
+    def test_lazy_load_and_torn_log_line(self, tmp_path: Path) -> None:
+        """The graph is read on first access; a torn log line is skipped."""
+        persist_path = tmp_path / "graph.json"
+        graph = GraphMemory(persist_path=persist_path)
+        graph.add_node("a", "memory")
+        graph.persist()
+        graph.add_node("b", "memory")
+        graph.persist()
+        with open(tmp_path / "graph.json.log", "a") as f:
+            f.write('{"op": "node", "id": "c"')
+
+        loaded = GraphMemory(persist_path=persist_path)
+        assert loaded._graph is None
+        assert set(loaded.graph.nodes) == {"a", "b"}
+
+    def test_clear_rewrites_snapshot(self, tmp_path: Path) -> None:
+        """clear() is persisted as a fresh snapshot."""
+        persist_path = tmp_path / "graph.json"
+        graph = GraphMemory(persist_path=persist_path)
+        graph.add_node("a", "memory")
+        graph.persist()
+        graph.clear()
+        graph.persist()
+
+        assert GraphMemory(persist_path=persist_path).graph.number_of_nodes() == 0
+
+
+class TestGraphIndex:
+    """Test typed secondary indexes kept by the tracked graph."""
+
+    def test_index_follows_direct_mutations(self, graph_memory: GraphMemory) -> None:
+        """Retyping, relinking and removal through the raw graph are indexed."""
+        graph_memory.record_interaction("user_1", "q1", "a1")
+        graph_memory.add_node("topic_py", "topic", {"name": "Python"})
+        interaction = next(iter(graph_memory.graph.index.nodes_by_type["interaction"]))
+        graph_memory.add_edge(interaction, "topic_py", "related_to")
+
+        assert [t["id"] for t in graph_memory.get_user_topics("user_1")] == [
+            "topic_py"
+        ]
+
+        # Mutate attributes in place, as neural/coding memory do
+        graph_memory.graph.nodes["topic_py"]["type"] = "memory"
+        assert graph_memory.get_user_topics("user_1") == []
+        graph_memory.graph.nodes["topic_py"]["type"] = "topic"
+        graph_memory.graph.edges[interaction, "topic_py"]["type"] = "depends_on"
+        assert graph_memory.stats()["edge_counts"]["depends_on"] == 1
+
+        graph_memory.graph.remove_node(interaction)
+        index = graph_memory.graph.index
+        assert graph_memory.get_user_interactions("user_1") == []
+        assert "interaction" not in index.nodes_by_type
+        assert "depends_on" not in index.edges_by_type
+
+    def test_queries_match_full_scan(self) -> None:
+        """Indexed traversal returns the same subgraph as a brute-force scan."""
+        graph = GraphMemory()
+        for i in range(30):
+            graph.add_node(f"n{i}", "memory")
+        for i in range(30):
+            graph.add_edge(f"n{i}", f"n{(i * 7 + 3) % 30}", "related_to")
+            graph.add_edge(f"n{i}", f"n{(i + 1) % 30}", "depends_on")
+        graph.invalidate_edge("n0", "n3", datetime.now() - timedelta(days=1))
+
+        result = graph.query_graph_temporal(["n0"], hops=2, rel_filters=["related_to"])
+        nodes = {n["id"] for n in result["nodes"]}
+        expected_edges = {
+            (u, v)
+            for u in nodes
+            for v in nodes
+            if graph.graph.has_edge(u, v) and graph.is_edge_valid_at(u, v)
+        }
+        assert "n3" not in nodes
+        assert {(e["src"], e["dst"]) for e in result["edges"]} == expected_edges
+
+        result = graph.query_graph(["n0", "missing"], hops=1, rel_filters=["depends_on"])
+        assert {n["id"] for n in result["nodes"]} == {"n0", "n1", "n29"}
+        assert len(result["edges"]) == 2
+
+
 class TestStats:
     """Test graph statistics."""
 
@@ -0,0 +1,179 @@
+"""Tests for the CSR adjacency used by activation spreading and decay."""
+
+import random
+
+import pytest
+
+from kagura.core.graph.memory import GraphMemory
+from kagura.core.memory.neural import adjacency as adjacency_module
+from kagura.core.memory.neural.activation import ActivationSpreader
+from kagura.core.memory.neural.adjacency import SHARED_EDGES
+from kagura.core.memory.neural.config import NeuralMemoryConfig
+from kagura.core.memory.neural.decay import DecayManager
+from kagura.core.memory.neural.maintenance import MaintenanceScheduler
+
+
+def reference_spread(graph, config, seeds, hops, user_id):
+    """Straightforward dict-of-dicts spreading (the semantics to preserve)."""
+    g = graph.graph
+    activations = {n: a for n, a in seeds.items()}
+    layer = dict(seeds)
+    for _ in range(hops):
+        next_layer = {}
+        best = {}
+        for src, act in layer.items():
+            if src not in g:
+                continue
+            for dst, data in g[src].items():
+                owner = g.nodes[dst].get("user_id")
+                if user_id is not None and owner and owner != user_id:
+                    continue
+                value = act * config.spread_decay * data.get("weight", 0.0)
+                if value < config.spread_threshold:
+                    continue
+                next_layer[dst] = next_layer.get(dst, 0.0) + value
+                best[dst] = max(best.get(dst, 0.0), value)
+        for dst, value in best.items():
+            activations[dst] = max(activations.get(dst, 0.0), value)
+        if not next_layer:
+            break
+        layer = next_layer
+    return activations
+
+
+@pytest.fixture
+def random_graph():
+    """Two users plus shared nodes, randomly linked."""
+    rng = random.Random(7)
+    graph = GraphMemory()
+    for i in range(60):
+        owner = ("alice", "bob", None)[i % 3]
+        graph.add_node(f"n{i}", "memory", data={"user_id": owner} if owner else {})
+    for _ in range(300):
+        src, dst = rng.sample(range(60), 2)
+        graph.add_edge(f"n{src}", f"n{dst}", "related_to", weight=rng.random())
+    return graph
+
+
+def _assert_matches_reference(spreader, graph, config, user_id):
+    seeds = {"n0": 1.0, "n3": 0.7}
+    states = spreader.spread(seeds, max_hops=3, user_id=user_id)
+    expected = reference_spread(graph, config, seeds, 3, user_id)
+    assert {s.node_id: s.activation for s in states} == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("user_id", [None, "alice"])
+def test_spread_matches_reference_across_mutations(random_graph, user_id):
+    """Cached shards follow weight edits, removals, additions and re-owning."""
+    config = NeuralMemoryConfig(spread_hops=3, spread_decay=0.9, spread_threshold=0.05)
+    spreader = ActivationSpreader(random_graph, config)
+    g = random_graph.graph
+    _assert_matches_reference(spreader, random_graph, config, user_id)
+
+    src, dst = next(iter(g.edges()))
+    g[src][dst]["weight"] = 0.99
+    g.remove_edge(*list(g.edges())[5])
+    random_graph.add_edge("n0", "n59", "related_to", weight=0.8)
+    g.add_edge("n0", "new_node", type="related_to", weight=0.9)
+    _assert_matches_reference(spreader, random_graph, config, user_id)
+
+    g.nodes["new_node"]["user_id"] = "bob"
+    g.remove_node("n3")
+    _assert_matches_reference(spreader, random_graph, config, user_id)
+
+
+def test_overlay_growth_triggers_rebuild(random_graph, monkeypatch):
+    """Past the staleness limit the shard is dropped and rebuilt."""
+    monkeypatch.setattr(adjacency_module, "_MIN_STALE_EDGES", 2)
+    monkeypatch.setattr(adjacency_module, "_STALE_RATIO", 0.0)
+    adjacency = adjacency_module.NeuralAdjacency(random_graph)
+    shard = adjacency.shard("alice")
+
+    for i in range(5):
+        random_graph.graph.add_edge("n0", f"extra{i}", weight=0.5)
+
+    rebuilt = adjacency.shard("alice")
+    assert rebuilt is not shard
+    assert rebuilt.stale == 0
+    assert ("n0", "extra4") in rebuilt.edge_pos
+
+
+def test_decay_and_prune_only_touch_user_edges():
+    """Decay/pruning are scoped to edges with an endpoint owned by the user."""
+    graph = GraphMemory()
+    graph.add_node("a1", "memory", data={"user_id": "alice"})
+    graph.add_node("a2", "memory", data={"user_id": "alice"})
+    graph.add_node("b1", "memory", data={"user_id": "bob"})
+    graph.add_node("b2", "memory", data={"user_id": "bob"})
+    graph.add_edge("a1", "a2", "related_to", weight=0.5)
+    graph.add_edge("a2", "a1", "related_to", weight=0.051)
+    graph.add_edge("b1", "b2", "related_to", weight=0.5)
+    graph.add_edge("b2", "b1", "related_to", weight=0.01)
+
+    config = NeuralMemoryConfig(decay_rate=0.0001, prune_threshold=0.05)
+    manager = DecayManager(graph, config)
+
+    stats = manager.apply_decay("alice")
+
+    assert stats == {
+        "edges_decayed": 1,
+        "edges_pruned": 1,
+        "delta_seconds": config.decay_background_interval,
+    }
+    assert graph.graph["a1"]["a2"]["weight"] < 0.5
+    assert not graph.graph.has_edge("a2", "a1")
+    assert graph.graph["b1"]["b2"]["weight"] == 0.5
+
+    assert manager.prune_weak_edges("bob") == 1
+    assert not graph.graph.has_edge("b2", "b1")
+    assert graph.graph.has_edge("b1", "b2")
+
+
+def test_shard_reads_only_the_users_adjacency(random_graph):
+    """A user's shard is built from the user's and unowned nodes only."""
+    graph = random_graph.graph
+    adjacency = adjacency_module.NeuralAdjacency(random_graph)
+
+    def expected_edges():
+        owners = {n: graph.nodes[n].get("user_id") for n in graph}
+        return {
+            (src, dst)
+            for src, dst in graph.edges()
+            if owners[dst] in ("alice", None)
+            and (owners[src] in ("alice", None) or owners[dst] == "alice")
+        }
+
+    shard = adjacency.shard("alice")
+    assert set(shard.keys) == expected_edges()
+
+    # A node unknown to the shard joining alice brings its edges along
+    graph.add_node("loner", user_id="bob")
+    graph.add_edge("loner", "n2", weight=0.5)  # n2 has no owner
+    adjacency.shard("alice")
+    graph.nodes["loner"]["user_id"] = "alice"
+    assert set(adjacency.shard("alice", compact=True).keys) == expected_edges()
+
+
+def test_shared_edges_are_decayed():
+    """Edges between unowned nodes decay under the SHARED_EDGES key."""
+    graph = GraphMemory()
+    graph.add_node("a1", "memory", data={"user_id": "alice"})
+    graph.add_node("topic1", "topic")
+    graph.add_node("topic2", "topic")
+    graph.add_edge("a1", "topic1", "related_to", weight=0.5)
+    graph.add_edge("topic1", "topic2", "related_to", weight=0.5)
+
+    config = NeuralMemoryConfig(decay_rate=0.0001, prune_threshold=0.05)
+    DecayManager(graph, config).apply_decay("alice")
+    assert graph.graph["a1"]["topic1"]["weight"] < 0.5
+    assert graph.graph["topic1"]["topic2"]["weight"] == 0.5
+
+    stats = MaintenanceScheduler(graph, config).run_once([SHARED_EDGES])
+    assert stats.edges_decayed == 1
+    assert graph.graph["topic1"]["topic2"]["weight"] < 0.5
+
+    # The scheduler queues the shared edges alongside the users
+    scheduler = MaintenanceScheduler(graph, config)
+    assert scheduler.pending_users == 0
+    scheduler.enqueue_due()
+    assert scheduler.pending_users == 2
@@ -118,3 +118,78 @@ class TestCoActivationTracker:
 
         assert stats["total_pairs"] == 0
         assert stats["avg_count"] == 0.0
+
+
+def _acts(*node_ids):
+    return [ActivationState(node_id=n, activation=1.0) for n in node_ids]
+
+
+class TestBoundedCoActivation:
+    """Incremental counting, bounded storage and persistence."""
+
+    def test_pairs_counted_once_per_event(self, tracker):
+        """A new event only counts the pairs it creates."""
+        tracker.record_activation("user1", _acts("a", "b"))
+        tracker.record_activation("user1", _acts("c"))
+
+        assert tracker.get_co_activation_record("user1", "a", "b").count == 1
+        assert tracker.get_co_activation_record("user1", "a", "c").count == 1
+        assert tracker.get_co_activation_record("user1", "b", "c").count == 1
+
+        deltas = tracker.drain_pair_deltas("user1")
+        assert sorted((d.node_id_1, d.node_id_2, d.count) for d in deltas) == [
+            ("a", "b", 1),
+            ("a", "c", 1),
+            ("b", "c", 1),
+        ]
+        assert tracker.drain_pair_deltas("user1") == []
+
+    def test_window_and_pair_table_are_bounded(self):
+        """Ring buffer and top-K table never exceed their limits."""
+        config = NeuralMemoryConfig(co_activation_max_events=3, co_activation_max_pairs=5)
+        tracker = CoActivationTracker(config)
+        for _ in range(30):
+            tracker.record_activation("user1", _acts("hot_1", "hot_2"))
+        for i in range(20):
+            tracker.record_activation("user1", _acts(f"cold_{i}"))
+
+        assert len(tracker._activation_history["user1"]) == 3
+        assert len(tracker._co_activation_records["user1"]) <= 5
+        # Heavy hitter survives the stream of one-off pairs
+        assert tracker.get_co_activation_record("user1", "hot_1", "hot_2").count >= 30
+
+    def test_pair_statistics_survive_restart(self, config, tmp_path):
+        """Pair counts are written through to SQLite and reloaded."""
+        db_path = tmp_path / "co_activation.db"
+        tracker = CoActivationTracker(config, db_path=db_path)
+        tracker.record_activation("user1", _acts("a", "b"))
+        tracker.record_activation("user1", _acts("a", "b"))
+
+        reopened = CoActivationTracker(config, db_path=db_path)
+        assert reopened.get_co_activation_record("user1", "a", "b").count == 2
+
+        reopened.clear_user_data("user1")
+        again = CoActivationTracker(config, db_path=db_path)
+        assert again.get_statistics("user1")["total_pairs"] == 0
+
+
+def test_hebbian_consumes_pair_deltas():
+    """HebbianLearner queues updates straight from tracker deltas."""
+    from kagura.core.graph.memory import GraphMemory
+    from kagura.core.memory.neural.hebbian import HebbianLearner
+
+    config = NeuralMemoryConfig(learning_rate=0.5)
+
+    graph = GraphMemory()
+    graph.add_node("a", "memory", data={"confidence": 1.0})
+    graph.add_node("b", "memory", data={"confidence": 0.5})
+    tracker = CoActivationTracker(config)
+    learner = HebbianLearner(graph, config)
+
+    tracker.record_activation("user1", _acts("a", "b"))
+    learner.queue_co_activations("user1", tracker.drain_pair_deltas("user1"))
+
+    assert learner.apply_updates("user1") == 2
+    expected = config.learning_rate * 0.5
+    assert graph.graph["a"]["b"]["weight"] == pytest.approx(expected)
+    assert graph.graph["b"]["a"]["weight"] == pytest.approx(expected)
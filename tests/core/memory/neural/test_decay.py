@@ -117,6 +117,32 @@ class TestDecayManager:
         assert "delta_seconds" in stats
         assert stats["delta_seconds"] > 0
 
+    def test_apply_decay_measures_delta_from_persisted_timestamp(self, graph):
+        """A fresh manager decays by the time since each edge's last_decayed."""
+        import math
+        from datetime import timedelta
+
+        config = NeuralMemoryConfig(
+            enable_decay=True, decay_rate=1e-6, prune_threshold=0.05
+        )
+        graph.add_node("node_c", "memory", data={"user_id": "user1"})
+        graph.add_edge("node_a", "node_c", "related_to", weight=0.5)
+        day_ago = datetime.utcnow() - timedelta(days=1)
+        # Saved graphs store timestamps as strings
+        graph.graph["node_a"]["node_b"]["last_decayed"] = str(day_ago)
+
+        stats = DecayManager(graph, config).apply_decay("user1")
+
+        assert stats["delta_seconds"] == pytest.approx(86400, abs=60)
+        assert graph.graph["node_a"]["node_b"]["weight"] == pytest.approx(
+            0.5 * math.exp(-config.decay_rate * 86400), rel=1e-2
+        )
+        # Never decayed: one default interval, as before
+        assert graph.graph["node_a"]["node_c"]["weight"] == pytest.approx(
+            0.5 * math.exp(-config.decay_rate * config.decay_background_interval),
+            rel=1e-2,
+        )
+
     def test_prune_old_nodes(self, decay_manager, graph):
         """Test pruning old, low-importance nodes."""
         # Add old node
@@ -138,6 +138,27 @@ class TestNeuralMemoryEngine:
         # Task should be done (cancelled or finished)
         assert engine._decay_task.done() or engine._decay_task.cancelled()
 
+    @pytest.mark.asyncio
+    async def test_background_decay_runs_one_tick_per_wakeup(self, engine, monkeypatch):
+        """A persistent backlog is paced, not drained back to back."""
+        import asyncio
+
+        from kagura.core.memory.neural import engine as engine_module
+        from kagura.core.memory.neural.maintenance import MaintenanceStats
+
+        monkeypatch.setattr(engine_module, "_BACKLOG_TICK_INTERVAL", 0.02)
+        engine.config.decay_background_interval = 0.05
+        run_tick = AsyncMock(return_value=MaintenanceStats(users=1, pending_users=3))
+        monkeypatch.setattr(engine.maintenance, "run_tick", run_tick)
+
+        engine.start_background_decay()
+        await asyncio.sleep(0.13)
+        engine.stop_background_decay()
+        await asyncio.sleep(0.01)
+
+        # Wake-ups at ~0.05s, then every 0.02s while users stay pending
+        assert 2 <= run_tick.await_count <= 6
+
 
 class TestNeuralMemoryEngineIntegration:
     """Integration tests with real components (light mocking)."""
@@ -0,0 +1,92 @@
+"""Tests for the background maintenance scheduler."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from kagura.core.graph.memory import GraphMemory
+from kagura.core.memory.neural.config import NeuralMemoryConfig
+from kagura.core.memory.neural.maintenance import MaintenanceScheduler
+
+
+@pytest.fixture
+def graph():
+    """Two users with one strong and one weak association each."""
+    g = GraphMemory()
+    for user in ("alice", "bob"):
+        for i in range(3):
+            g.add_node(f"{user}{i}", "memory", data={"user_id": user})
+        g.add_edge(f"{user}0", f"{user}1", "related_to", weight=0.5)
+        g.add_edge(f"{user}1", f"{user}2", "related_to", weight=0.051)
+    return g
+
+
+@pytest.fixture
+def config():
+    """Decay that prunes the weak edges on the first run."""
+    return NeuralMemoryConfig(decay_rate=0.0001, prune_threshold=0.05)
+
+
+def test_run_once_maintains_every_user(graph, config):
+    """All users are decayed, pruned and consolidated; metrics add up."""
+    graph.graph.nodes["alice0"].update(use_count=5, importance=0.9)
+    scheduler = MaintenanceScheduler(graph, config)
+
+    stats = scheduler.run_once()
+
+    assert stats.users == 2
+    assert stats.edges_decayed == 2
+    assert stats.edges_pruned == 2
+    assert stats.nodes_consolidated == 1
+    assert stats.pending_users == 0
+    assert graph.graph.nodes["alice0"]["long_term"] is True
+    assert not graph.graph.has_edge("bob1", "bob2")
+    assert scheduler.totals.users == 2
+
+
+def test_queue_tracks_dirty_users(graph, config):
+    """Only users whose nodes/edges changed are queued again."""
+    scheduler = MaintenanceScheduler(graph, config)
+    scheduler.run_once()
+    # Maintenance writes of its own do not re-queue anyone
+    assert scheduler.pending_users == 0
+
+    graph.graph["bob0"]["bob1"]["weight"] = 0.9
+    assert scheduler.pending_users == 1
+
+    stats = scheduler.run_once(["bob"])
+    assert stats.users == 1
+    assert scheduler.pending_users == 0
+
+
+@pytest.mark.asyncio
+async def test_run_tick_respects_cpu_budget(graph, config, monkeypatch):
+    """A tick stops once the CPU budget is spent, leaving users queued."""
+    scheduler = MaintenanceScheduler(graph, config, cpu_budget_ms=1.0)
+    clock = iter(range(0, 1000, 5))
+    monkeypatch.setattr(
+        "kagura.core.memory.neural.maintenance.time.thread_time",
+        lambda: next(clock) / 1000.0,
+    )
+
+    first = await scheduler.run_tick()
+    assert first.users == 1
+    assert first.pending_users == 1
+
+    second = await scheduler.run_tick()
+    assert second.users == 1
+    assert second.pending_users == 0
+
+
+def test_prune_old_nodes_is_user_scoped(graph, config):
+    """Node pruning only removes the maintained user's stale nodes."""
+    old = (datetime.now() - timedelta(days=100)).isoformat()
+    for node in ("alice2", "bob2"):
+        graph.graph.nodes[node].update(created_at=old, importance=0.1)
+    scheduler = MaintenanceScheduler(graph, config, prune_node_age_days=30)
+
+    stats = scheduler.run_once(["alice"])
+
+    assert stats.nodes_pruned == 1
+    assert "alice2" not in graph.graph
+    assert "bob2" in graph.graph
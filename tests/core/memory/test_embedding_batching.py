@@ -0,0 +1,102 @@
+"""Tests for token-budgeted batching and throughput stats in Embedder.
+
+Uses a stand-in SentenceTransformer (one token per word) so no model is
+downloaded.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from kagura.config.memory_config import EmbeddingConfig
+from kagura.core.memory import model_cache
+from kagura.core.memory.embeddings import Embedder
+
+
+class FakeSentenceTransformer:
+    """Embeds a text as [word count, first word length]; records batches."""
+
+    max_seq_length = 6
+
+    def __init__(self, name):
+        self.name = name
+        self.batches = []
+
+    def tokenizer(self, texts, truncation=False, max_length=None, verbose=True):
+        ids = [[0] * len(text.split()) for text in texts]
+        if truncation:
+            ids = [i[:max_length] for i in ids]
+        return {"input_ids": ids}
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        self.batches.append(list(texts))
+        return np.array(
+            [[len(t.split()), len(t.split()[0])] for t in texts], dtype=np.float32
+        ).reshape(len(texts), 2)
+
+
+@pytest.fixture
+def make_embedder(monkeypatch):
+    """Build Embedders backed by FakeSentenceTransformer."""
+    module = types.ModuleType("sentence_transformers")
+    module.SentenceTransformer = FakeSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    model_cache.clear_model_cache()
+
+    def make(**config):
+        return Embedder(EmbeddingConfig(model="fake-e5", use_prefix=False, **config))
+
+    yield make
+    model_cache.clear_model_cache()
+
+
+def test_batches_respect_token_budget_and_restore_order(make_embedder):
+    """Texts are grouped by length under the budget; output keeps input order."""
+    embedder = make_embedder(max_batch_tokens=6)
+    texts = ["a", "bb bb bb", "c", "dd dd dd", "e e"]
+
+    embeddings = embedder.encode_passages(texts)
+
+    assert embeddings[:, 0].tolist() == [1, 3, 1, 3, 2]
+    assert embeddings[:, 1].tolist() == [1, 2, 1, 2, 1]
+    for batch in embedder.model.batches:
+        longest = max(len(t.split()) for t in batch)
+        assert len(batch) * longest <= 6
+    assert embedder.model.batches[0] == ["bb bb bb", "dd dd dd"]
+
+
+def test_long_texts_are_truncated_to_model_max_length(make_embedder):
+    """Token counts stop at the smaller of config and model max length."""
+    embedder = make_embedder(max_tokens=512, max_batch_tokens=12)
+    assert embedder.max_length == 6
+
+    embedder.encode_passages(["w " * 20, "w " * 20, "x"])
+
+    # Two truncated texts (6 tokens each) fill one batch
+    assert [len(b) for b in embedder.model.batches] == [2, 1]
+    assert embedder.stats()["tokens"] == 13
+
+
+def test_stats_report_throughput(make_embedder):
+    """stats() exposes texts/sec, tokens/sec and the padding share."""
+    embedder = make_embedder(max_batch_tokens=100)
+    embedder.encode_queries(["one", "two words here"])
+
+    stats = embedder.stats()
+    assert stats["calls"] == 1
+    assert stats["texts"] == 2
+    assert stats["tokens"] == 4
+    assert stats["padded_tokens"] == 6
+    assert stats["batches"] == 1
+    assert stats["padding_ratio"] == pytest.approx(1 / 3)
+    assert stats["texts_per_second"] > 0
+    assert stats["tokens_per_second"] > 0
+
+
+def test_empty_input_skips_batching(make_embedder):
+    """An empty list goes straight to the model."""
+    embedder = make_embedder()
+    assert embedder.encode_passages([]).shape[0] == 0
+    assert embedder.stats()["calls"] == 0
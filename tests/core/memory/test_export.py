@@ -3,6 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -222,3 +223,172 @@ class TestExportImportRoundtrip:
             # Verify data matches
             assert manager2.working.get("work_key1") == "work_value1"
             assert manager2.working.get("work_key2") == "work_value2"
+
+
+class TestStreamingExportImport:
+    """Test batched, compressed export/import of persistent memory."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """Create MemoryManager with an isolated database."""
+        return MemoryManager(
+            user_id="stream_user",
+            agent_name="stream_agent",
+            persist_dir=tmp_path / "src",
+            enable_rag=False,
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    async def test_roundtrip_persistent_in_batches(
+        self, manager, tmp_path, compression
+    ):
+        """Persistent memories survive a batched (compressed) roundtrip."""
+        for i in range(5):
+            manager.remember(f"key{i}", {"n": i, "text": "é"}, {"tag": i % 2})
+
+        progress = []
+        exporter = MemoryExporter(manager, batch_size=2)
+        export_stats = await exporter.export_all(
+            tmp_path / "out",
+            include_working=False,
+            include_graph=False,
+            compression=compression,
+            progress=progress.append,
+        )
+        assert export_stats["memories"] == 5
+        assert progress[-1] == 5
+
+        manager2 = MemoryManager(
+            user_id="stream_user",
+            agent_name="stream_agent",
+            persist_dir=tmp_path / "dst",
+            enable_rag=False,
+        )
+        importer = MemoryImporter(manager2, batch_size=2)
+        with patch.object(
+            manager2, "remember_many", wraps=manager2.remember_many
+        ) as remember_many:
+            import_stats = await importer.import_all(tmp_path / "out")
+
+        assert import_stats["memories"] == 5
+        assert remember_many.call_count == 3
+        assert manager2.recall("key3", include_metadata=True) == (
+            {"n": 3, "text": "é"},
+            {"tag": 1},
+        )
+        if manager2.lexical_searcher:
+            assert manager2.lexical_searcher.count() == 5
+
+    @pytest.mark.asyncio
+    async def test_export_rejects_unknown_compression(self, manager, tmp_path):
+        """Unknown compression names fail before writing anything."""
+        with pytest.raises(ValueError, match="Unsupported compression"):
+            await MemoryExporter(manager).export_all(tmp_path, compression="lz4")
+
+
+class CountingEmbedding:
+    """Deterministic embeddings that record how many texts were embedded."""
+
+    calls = 0
+
+    def __call__(self, input):
+        import numpy as np
+
+        CountingEmbedding.calls += len(input)
+        return [
+            np.random.default_rng(sum(map(ord, text))).standard_normal(16)
+            for text in input
+        ]
+
+
+class TestVectorExport:
+    """Test exporting vectors so imports can skip re-embedding."""
+
+    @pytest.fixture
+    def make_manager(self, tmp_path, monkeypatch):
+        """Build managers on the flat vector backend with counted embeddings."""
+        pytest.importorskip("numpy")
+        from kagura.config.memory_config import MemorySystemConfig, VectorStoreConfig
+        from kagura.core.memory import rag as rag_module
+
+        monkeypatch.setattr(
+            rag_module, "_default_embedding_function", CountingEmbedding
+        )
+        CountingEmbedding.calls = 0
+
+        def make(name, agent_name="vector_agent"):
+            return MemoryManager(
+                user_id="vector_user",
+                agent_name=agent_name,
+                persist_dir=tmp_path / name,
+                enable_rag=True,
+                memory_config=MemorySystemConfig(
+                    vector_store=VectorStoreConfig(backend="flat")
+                ),
+            )
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_import_reuses_vectors_for_same_model(self, make_manager, tmp_path):
+        """Vectors are inserted directly; nothing is embedded again."""
+        source = make_manager("src")
+        source.working.set("scratch", "not indexed")
+        source.remember_many([(f"key{i}", f"value {i}", None) for i in range(4)])
+
+        stats = await MemoryExporter(source).export_all(
+            tmp_path / "out", include_graph=False, include_vectors=True
+        )
+        metadata = json.loads((tmp_path / "out" / "metadata.json").read_text())
+        assert stats["vectors"] == 4
+        assert metadata["vectors"]["dimension"] == 16
+        assert metadata["vectors"]["rows"] == 5
+
+        target = make_manager("dst")
+        CountingEmbedding.calls = 0
+        import_stats = await MemoryImporter(target).import_all(tmp_path / "out")
+
+        assert import_stats["vectors_reused"] == 4
+        assert CountingEmbedding.calls == 0
+        assert target.persistent_rag.count() == 4
+        assert target.semantic_embeddings([("key2", "value 2")])[0] == pytest.approx(
+            source.semantic_embeddings([("key2", "value 2")])[0], abs=1e-2
+        )
+
+    @pytest.mark.asyncio
+    async def test_import_reembeds_on_model_mismatch(self, make_manager, tmp_path):
+        """Vectors from another embedding model are ignored."""
+        source = make_manager("src")
+        source.remember_many([(f"key{i}", f"value {i}", None) for i in range(3)])
+        await MemoryExporter(source).export_all(
+            tmp_path / "out", include_graph=False, include_vectors=True
+        )
+
+        target = make_manager("dst")
+        target.persistent_rag.embedding_space = "kagura-embedder-other-model"
+        CountingEmbedding.calls = 0
+        import_stats = await MemoryImporter(target).import_all(tmp_path / "out")
+
+        assert import_stats["vectors_reused"] == 0
+        assert CountingEmbedding.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_import_repeated_memory(self, make_manager, tmp_path):
+        """The same memory under two agents is imported without ID clashes."""
+        source = make_manager("src")
+        source.remember_many([("deploy", "blue-green", None), ("db", "sqlite", None)])
+        make_manager("src", agent_name="other_agent").remember_many(
+            [("deploy", "blue-green", None)]
+        )
+        stats = await MemoryExporter(source).export_all(
+            tmp_path / "out", include_graph=False, include_vectors=True
+        )
+        assert stats["memories"] == 3
+
+        target = make_manager("dst")
+        import_stats = await MemoryImporter(target).import_all(tmp_path / "out")
+
+        assert import_stats["memories"] == 3
+        assert import_stats["vectors_reused"] == 3
+        assert target.persistent_rag.count() == 2
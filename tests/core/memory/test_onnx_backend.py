@@ -0,0 +1,209 @@
+"""Tests for the ONNX Runtime embedding and reranking backend.
+
+The unit tests run a real ``tokenizers`` tokenizer against a stand-in
+inference session, so no model is downloaded. The parity test compares the
+quantized ONNX embedder against sentence-transformers and is skipped unless
+both stacks are installed.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+pytest.importorskip("tokenizers")
+
+from tokenizers import Tokenizer  # noqa: E402
+from tokenizers.models import WordLevel  # noqa: E402
+from tokenizers.pre_tokenizers import Whitespace  # noqa: E402
+
+from kagura.config.memory_config import EmbeddingConfig, RerankConfig  # noqa: E402
+from kagura.core.memory import model_cache, onnx_backend  # noqa: E402
+from kagura.core.memory.embeddings import Embedder  # noqa: E402
+from kagura.core.memory.onnx_backend import (  # noqa: E402
+    OnnxCrossEncoder,
+    OnnxEmbedder,
+)
+
+VOCAB = {"[PAD]": 0, "[UNK]": 1, "python": 2, "asyncio": 3, "java": 4}
+
+
+class FakeSession:
+    """Returns one-hot token embeddings (or python-count logits)."""
+
+    def __init__(self, output="tokens", inputs=("input_ids", "attention_mask")):
+        self.output = output
+        self.inputs = inputs
+        self.feeds = []
+
+    def get_inputs(self):
+        return [SimpleNamespace(name=name) for name in self.inputs]
+
+    def run(self, output_names, feeds):
+        self.feeds.append(feeds)
+        ids = feeds["input_ids"]
+        if self.output == "logits":
+            return [(ids == VOCAB["python"]).sum(axis=1, keepdims=True).astype(float)]
+        return [np.eye(len(VOCAB), dtype=np.float32)[ids]]
+
+
+def _tokenizer(tmp_path):
+    tokenizer = Tokenizer(WordLevel(VOCAB, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = Whitespace()
+    tokenizer.save(str(tmp_path / "tokenizer.json"))
+    return onnx_backend.load_tokenizer(tmp_path, max_length=8)
+
+
+def test_embedder_mean_pools_over_attention_mask(tmp_path):
+    """Padding tokens do not contribute to the pooled embedding."""
+    session = FakeSession()
+    model = OnnxEmbedder(session, _tokenizer(tmp_path))
+
+    embeddings = model.encode(
+        ["python", "python asyncio java"], batch_size=2, normalize_embeddings=True
+    )
+
+    assert embeddings.shape == (2, len(VOCAB))
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(embeddings[0, VOCAB["python"]], 1.0)
+    np.testing.assert_allclose(np.linalg.norm(embeddings, axis=1), 1.0, rtol=1e-6)
+    assert embeddings[0, VOCAB["[PAD]"]] == 0.0
+    # Only the inputs the graph declares are fed
+    assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+
+
+def test_cross_encoder_scores_pairs_with_activation(tmp_path):
+    """Single-label logits are flattened and passed through the activation."""
+    session = FakeSession(
+        output="logits", inputs=("input_ids", "attention_mask", "token_type_ids")
+    )
+    tokenizer = _tokenizer(tmp_path)
+
+    scores = OnnxCrossEncoder(session, tokenizer).predict(
+        [("python", "python asyncio"), ("python", "java")], batch_size=1
+    )
+    assert scores.tolist() == [2.0, 1.0]
+    assert len(session.feeds) == 2
+    assert "token_type_ids" in session.feeds[0]
+
+    sigmoid = OnnxCrossEncoder(session, tokenizer, activation="sigmoid")
+    assert sigmoid.predict([("java", "java")])[0] == pytest.approx(0.5)
+
+
+def test_activation_follows_sentence_transformers_config(tmp_path):
+    """Cross-encoder activation is read from the model's config.json."""
+    assert onnx_backend._activation(tmp_path) == "sigmoid"
+
+    (tmp_path / "config.json").write_text(
+        '{"sbert_ce_default_activation_function": "torch.nn.modules.linear.Identity"}'
+    )
+    assert onnx_backend._activation(tmp_path) == "identity"
+
+
+def test_session_uses_configured_intra_op_threads(tmp_path, monkeypatch):
+    """intra_op_threads sizes the onnxruntime thread pool."""
+    ort = pytest.importorskip("onnxruntime")
+    created = {}
+
+    def fake_session(path, sess_options, providers):
+        created.update(path=path, options=sess_options, providers=providers)
+        return SimpleNamespace()
+
+    monkeypatch.setattr(ort, "InferenceSession", fake_session)
+    onnx_backend.create_session(tmp_path / "model.onnx", intra_op_threads=3)
+
+    assert created["options"].intra_op_num_threads == 3
+    assert created["providers"] == ["CPUExecutionProvider"]
+
+
+def test_embedder_selects_onnx_backend(tmp_path, monkeypatch):
+    """EmbeddingConfig.backend="onnx" loads one shared onnxruntime model."""
+    pytest.importorskip("onnxruntime")
+    loads = []
+
+    def fake_load(name, task, quantize, intra_op_threads, max_length):
+        loads.append((name, task, quantize, intra_op_threads, max_length))
+        return tmp_path, FakeSession(), _tokenizer(tmp_path)
+
+    monkeypatch.setattr(onnx_backend, "_load", fake_load)
+    model_cache.clear_model_cache()
+    try:
+        config = EmbeddingConfig(
+            model="fake-e5", backend="onnx", intra_op_threads=2, max_tokens=8
+        )
+        embedder = Embedder(config)
+        assert Embedder(config).model is embedder.model
+        assert loads == [("fake-e5", "feature-extraction", True, 2, 8)]
+
+        # The tokenizer truncates at max_length, so it is part of the cache key
+        longer = Embedder(config.model_copy(update={"max_tokens": 16}))
+        assert longer.model is not embedder.model
+        assert loads[-1] == ("fake-e5", "feature-extraction", True, 2, 16)
+
+        embedding = embedder.encode_queries(["python"])
+        assert embedding.shape == (1, len(VOCAB))
+        assert np.linalg.norm(embedding[0]) == pytest.approx(1.0)
+        assert "backend=onnx" in repr(embedder)
+    finally:
+        model_cache.clear_model_cache()
+
+
+def test_token_lengths_ignore_tokenizer_padding(tmp_path, monkeypatch):
+    """Batch padding of the ONNX tokenizer does not inflate token counts."""
+    monkeypatch.setattr(
+        onnx_backend,
+        "_load",
+        lambda *args: (tmp_path, FakeSession(), _tokenizer(tmp_path)),
+    )
+    model_cache.clear_model_cache()
+    try:
+        embedder = Embedder(
+            EmbeddingConfig(
+                model="fake-e5", backend="onnx", use_prefix=False, max_tokens=8
+            )
+        )
+        texts = ["python", "python asyncio java"]
+        assert embedder.model.tokenizer.padding is not None
+        assert embedder._token_lengths(texts) == [1, 3]
+
+        embedder.encode_passages(texts)
+        stats = embedder.stats()
+        # One batch padded to its longest text: 2 * 3 tokens
+        assert stats["tokens"] == 4
+        assert stats["padded_tokens"] == 6
+    finally:
+        model_cache.clear_model_cache()
+
+
+def test_rerank_config_backend_defaults():
+    """The PyTorch backend stays the default; ONNX quantizes by default."""
+    config = RerankConfig()
+    assert config.backend == "torch"
+    assert config.quantize is True
+    assert config.intra_op_threads is None
+
+
+@pytest.mark.slow
+def test_quantized_onnx_embeddings_match_sentence_transformers():
+    """int8 ONNX embeddings stay within cosine 0.98 of the PyTorch model."""
+    pytest.importorskip("sentence_transformers")
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("onnx")
+
+    model_name = "sentence-transformers/all-MiniLM-L6-v2"
+    texts = [
+        "Python memory search implementation using ChromaDB",
+        "Cross-encoder reranking improves search precision",
+        "日本語の自然言語処理",
+    ]
+    torch_embedder = Embedder(EmbeddingConfig(model=model_name, use_prefix=False))
+    onnx_embedder = Embedder(
+        EmbeddingConfig(model=model_name, use_prefix=False, backend="onnx")
+    )
+
+    expected = torch_embedder.encode_passages(texts)
+    actual = onnx_embedder.encode_passages(texts)
+
+    assert actual.shape == expected.shape
+    cosine = (expected * actual).sum(axis=1)
+    assert cosine.min() >= 0.98
@@ -0,0 +1,138 @@
+"""Tests for background memory prewarming and the shared model cache."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from kagura.core.memory import MemoryManager, model_cache, prewarm
+from kagura.core.memory.prewarm import Prewarmer, memory_warming
+
+
+@pytest.fixture
+def warming(monkeypatch):
+    """Process-wide prewarmer stuck in a loading stage until the test ends."""
+    release = threading.Event()
+    prewarmer = Prewarmer()
+    prewarmer.add("embedding", release.wait)
+    monkeypatch.setattr(prewarm, "_prewarmer", prewarmer)
+    prewarmer.start()
+    yield prewarmer
+    release.set()
+    prewarmer.wait(timeout=5)
+
+
+def test_prewarmer_runs_stages_in_order_and_reports_state():
+    """Stages run once in the background; failures are reported, not raised."""
+    release = threading.Event()
+    calls = []
+    prewarmer = Prewarmer()
+    prewarmer.add("embedding", lambda: (calls.append("embedding"), release.wait()))
+    prewarmer.add("reranker", lambda: 1 / 0)
+    prewarmer.add("embedding", lambda: calls.append("duplicate"))
+
+    assert prewarmer.status() == {"embedding": "pending", "reranker": "pending"}
+    assert not prewarmer.warming
+
+    prewarmer.start()
+    deadline = time.monotonic() + 5
+    while prewarmer.status()["embedding"] != "warming" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert prewarmer.warming
+    assert prewarmer.wait(timeout=0.05) is False
+
+    release.set()
+    assert prewarmer.wait(timeout=5)
+    assert not prewarmer.warming
+    assert prewarmer.status() == {"embedding": "ready", "reranker": "failed"}
+    assert prewarmer.is_ready("embedding") and not prewarmer.is_ready("reranker")
+    assert calls == ["embedding"]
+
+
+def test_prewarmer_restarts_for_stages_added_later():
+    """Stages added after a finished run are loaded by the next start()."""
+    prewarmer = Prewarmer()
+    prewarmer.add("embedding", lambda: None)
+    prewarmer.start().wait(timeout=5)
+
+    prewarmer.add("memory_store", lambda: None)
+    prewarmer.start().wait(timeout=5)
+    assert prewarmer.status() == {"embedding": "ready", "memory_store": "ready"}
+
+
+def test_memory_warming_is_false_without_prewarm(monkeypatch):
+    """Without a started prewarm, callers keep the blocking semantic path."""
+    monkeypatch.setattr(prewarm, "_prewarmer", Prewarmer())
+    assert memory_warming() is False
+
+
+def test_model_cache_loads_each_model_once():
+    """Concurrent callers share one load of a model."""
+    loads = []
+
+    def loader():
+        loads.append(1)
+        time.sleep(0.05)
+        return object()
+
+    try:
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    model_cache.get_model("test", "probe", loader)
+                )
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert all(model is results[0] for model in results)
+        assert model_cache.is_model_loaded("test", "probe")
+    finally:
+        model_cache.clear_model_cache()
+
+
+def test_recall_lexical_without_rag(tmp_path):
+    """Keyword search works on a RAG-disabled manager."""
+    memory = MemoryManager(
+        user_id="prewarm_user",
+        agent_name="prewarm",
+        persist_dir=tmp_path,
+        enable_rag=False,
+        enable_compression=False,
+    )
+    memory.remember("python_tips", "Use asyncio for concurrent IO")
+    memory.remember("cooking", "Boil pasta for ten minutes")
+
+    results = memory.recall_lexical("asyncio", top_k=5)
+    assert [r["key"] for r in results] == ["python_tips"]
+    assert results[0]["scope"] == "persistent"
+
+
+@pytest.mark.asyncio
+async def test_mcp_memory_search_degrades_while_warming(warming):
+    """memory_search returns lexical results instead of loading models."""
+    from kagura.mcp.tools.memory.common import _memory_cache, get_memory_manager
+    from kagura.mcp.tools.memory.search import memory_search
+
+    user_id, agent_name = "prewarm_mcp_user", "global"
+    get_memory_manager(user_id, agent_name).remember(
+        "deploy_notes", "Deploy with blue green rollout"
+    )
+    try:
+        output = await memory_search(user_id, agent_name, "rollout", k=3)
+        results = json.loads(output)
+
+        assert [(r["key"], r["source"]) for r in results] == [
+            ("deploy_notes", "lexical")
+        ]
+        assert f"{user_id}:{agent_name}:rag=True" not in _memory_cache
+    finally:
+        for key in [k for k in _memory_cache if k.startswith(user_id)]:
+            _memory_cache.pop(key)
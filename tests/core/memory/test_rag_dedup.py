@@ -0,0 +1,147 @@
+"""Tests for content-hash and SimHash write deduplication in MemoryRAG.
+
+Uses the embedded flat vector store and a recording embedding function, so
+neither chromadb nor a model is needed.
+"""
+
+import numpy as np
+import pytest
+
+from kagura.config.memory_config import DedupConfig, VectorStoreConfig
+from kagura.core.memory import rag as rag_module
+from kagura.core.memory.dedup import (
+    content_hash,
+    hamming_distance,
+    simhash,
+    simhash_bands,
+)
+
+ARTICLE = (
+    "Blue-green deployments keep two production environments. The idle one "
+    "receives the new release, smoke tests run against it, and the router then "
+    "switches traffic over in one step. Rolling back is a second switch, so a "
+    "bad release costs minutes instead of a redeploy. Database migrations must "
+    "stay backward compatible while both environments share the same schema."
+)
+
+
+class RecordingEmbedding:
+    """Deterministic embeddings; records every embedded text."""
+
+    texts: list[str] = []
+
+    def __call__(self, input):
+        RecordingEmbedding.texts.extend(input)
+        return [
+            np.random.default_rng(sum(map(ord, text))).standard_normal(16)
+            for text in input
+        ]
+
+
+@pytest.fixture
+def make_rag(tmp_path, monkeypatch):
+    monkeypatch.setattr(rag_module, "_default_embedding_function", RecordingEmbedding)
+    RecordingEmbedding.texts = []
+
+    def make(collection_name="dedup", **dedup):
+        return rag_module.MemoryRAG(
+            collection_name=collection_name,
+            persist_dir=tmp_path,
+            vector_store_config=VectorStoreConfig(backend="flat"),
+            dedup_config=DedupConfig(**dedup),
+        )
+
+    return make
+
+
+def test_simhash_is_close_for_small_edits():
+    """One edited word moves few bits; unrelated text moves about half."""
+    edited = ARTICLE.replace("minutes", "seconds")
+    unrelated = "Sourdough needs a mature starter, time, and a hot oven. " * 6
+
+    assert simhash(ARTICLE) == simhash(ARTICLE.upper().replace(" ", "  "))
+    assert hamming_distance(simhash(ARTICLE), simhash(edited)) <= 8
+    assert hamming_distance(simhash(ARTICLE), simhash(unrelated)) > 16
+    assert simhash("") == 0
+
+    bands = simhash_bands(simhash(ARTICLE))
+    assert len(bands) == 4
+    assert sum(band << (16 * i) for i, band in enumerate(bands)) == simhash(ARTICLE)
+
+
+def test_unchanged_content_is_not_re_embedded(make_rag):
+    """Re-storing identical content returns the same ID without embedding."""
+    rag = make_rag()
+    doc_id = rag.store(ARTICLE, user_id="alice")
+    embedded = len(RecordingEmbedding.texts)
+
+    assert rag.store(ARTICLE, user_id="alice") == doc_id
+    assert rag.store_batch([ARTICLE, "short note"], user_id="alice")[0] == doc_id
+    assert RecordingEmbedding.texts[embedded:] == ["short note"]
+
+    stored = rag.collection.get(ids=[doc_id], include=["metadatas"])
+    assert stored["metadatas"][0]["content_hash"] == content_hash(ARTICLE)
+    assert rag.count() == 2
+
+
+def test_shared_prefix_no_longer_collides(make_rag):
+    """Documents that differ after the first 100 characters get distinct IDs."""
+    rag = make_rag(near_duplicates="off")
+    first = rag.store(ARTICLE, user_id="alice")
+    second = rag.store(ARTICLE[:150] + " Feature flags are the other option.", "alice")
+
+    assert first != second
+    assert rag.count() == 2
+
+
+def test_legacy_prefix_ids_are_recognized(make_rag):
+    """Documents stored under the old prefix-hash ID count as unchanged."""
+    rag = make_rag()
+    legacy_id = rag._legacy_document_id("alice", ARTICLE)
+    rag.collection.add(
+        ids=[legacy_id], documents=[ARTICLE], metadatas=[{"user_id": "alice"}]
+    )
+    RecordingEmbedding.texts = []
+
+    assert rag.store(ARTICLE, user_id="alice") == legacy_id
+    assert RecordingEmbedding.texts == []
+
+
+def test_near_duplicates_are_flagged_or_skipped(make_rag):
+    """A one-word edit is linked to the original, or not written at all."""
+    edited = ARTICLE.replace("minutes", "moments")
+    assert hamming_distance(simhash(ARTICLE), simhash(edited)) <= 3
+
+    rag = make_rag(near_duplicates="flag")
+    original = rag.store(ARTICLE, user_id="alice")
+    flagged = rag.store(edited, user_id="alice")
+    metadata = rag.collection.get(ids=[flagged], include=["metadatas"])["metadatas"]
+    assert metadata[0]["near_duplicate_of"] == original
+    # Other users' memories are never matched
+    other = rag.store(edited, user_id="bob")
+    other_meta = rag.collection.get(ids=[other], include=["metadatas"])["metadatas"]
+    assert "near_duplicate_of" not in other_meta[0]
+
+    rag = make_rag("dedup_skip", near_duplicates="skip")
+    original = rag.store(ARTICLE, user_id="alice")
+    embedded = len(RecordingEmbedding.texts)
+    assert rag.store(edited, user_id="alice") == original
+    assert len(RecordingEmbedding.texts) == embedded
+
+
+def test_precomputed_embeddings_are_fingerprinted(make_rag):
+    """Documents stored with their own vectors take part in deduplication."""
+    rag = make_rag(near_duplicates="flag")
+    vector = RecordingEmbedding()([ARTICLE])[0].tolist()
+    RecordingEmbedding.texts = []
+    (doc_id,) = rag.store_batch([ARTICLE], user_id="alice", embeddings=[vector])
+
+    stored = rag.collection.get(ids=[doc_id], include=["metadatas"])["metadatas"]
+    assert stored[0]["content_hash"] == content_hash(ARTICLE)
+    assert stored[0]["simhash"] == f"{simhash(ARTICLE):016x}"
+
+    assert rag.store(ARTICLE, user_id="alice") == doc_id
+    assert RecordingEmbedding.texts == []
+    edited = rag.store(ARTICLE.replace("minutes", "moments"), user_id="alice")
+    metadata = rag.collection.get(ids=[edited], include=["metadatas"])["metadatas"]
+    assert metadata[0]["near_duplicate_of"] == doc_id
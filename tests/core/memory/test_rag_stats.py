@@ -0,0 +1,120 @@
+"""Tests for the RAG count sidecar."""
+
+import pytest
+
+from kagura.core.memory.rag import MemoryRAG
+from kagura.core.memory.rag_stats import RAGStatsStore
+
+
+def _matches(metadata, where):
+    if "$and" in where:
+        return all(_matches(metadata, cond) for cond in where["$and"])
+    return all(metadata.get(field) == value for field, value in where.items())
+
+
+class FakeCollection:
+    """In-memory stand-in for a ChromaDB collection."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict] = {}
+        self.get_calls: list[dict] = []
+
+    def add(self, ids, documents, metadatas=None):
+        for i, doc_id in enumerate(ids):
+            if doc_id not in self.docs:
+                self.docs[doc_id] = (metadatas or [{}] * len(ids))[i] or {}
+
+    def upsert(self, ids, documents, metadatas=None):
+        for i, doc_id in enumerate(ids):
+            self.docs[doc_id] = (metadatas or [{}] * len(ids))[i] or {}
+
+    def delete(self, ids):
+        for doc_id in ids:
+            self.docs.pop(doc_id, None)
+
+    def count(self):
+        return len(self.docs)
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=0):
+        self.get_calls.append({"ids": ids, "where": where, "include": include})
+        items = [
+            (doc_id, metadata)
+            for doc_id, metadata in self.docs.items()
+            if (ids is None or doc_id in ids)
+            and (where is None or _matches(metadata, where))
+        ]
+        if limit is not None:
+            items = items[offset : offset + limit]
+        result = {"ids": [doc_id for doc_id, _ in items]}
+        if include and "metadatas" in include:
+            result["metadatas"] = [metadata for _, metadata in items]
+        return result
+
+
+@pytest.fixture
+def rag(tmp_path):
+    rag = object.__new__(MemoryRAG)
+    rag.collection = FakeCollection()
+    rag._chunking_config = None
+    rag._chunker = None
+    rag._stats = RAGStatsStore(tmp_path / "rag_stats.db", "fake")
+    return rag
+
+
+def test_count_served_from_sidecar(rag):
+    """Filtered counts do not fetch documents or metadata."""
+    rag.store("alpha", "alice", agent_name="a1")
+    rag.store("beta", "alice", agent_name="a2")
+    rag.store("gamma", "bob", agent_name="a1")
+    rag.store("alpha", "alice", agent_name="a1")  # Same ID, not re-counted
+    rag.collection.get_calls.clear()
+
+    assert rag.count() == 3
+    assert rag.count("a1") == 2
+    assert rag.count("a1", user_id="alice") == 1
+    assert rag.count(user_id="bob") == 1
+    assert rag.collection.get_calls == []
+
+    stats = rag.stats()
+    assert stats.total == 3
+    assert stats.by_user == {"alice": 2, "bob": 1}
+    assert stats.by_agent == {"a1": 2, "a2": 1}
+
+
+def test_upsert_and_delete_update_counts(rag):
+    """Upserts move documents between buckets; deletes decrement them."""
+    rag.store_batch(["x", "y"], "alice", agent_name="a1", ids=["1", "2"])
+    rag.store_batch(["x"], "bob", agent_name="a1", ids=["1"])
+    assert rag.stats().by_user == {"alice": 1, "bob": 1}
+
+    assert rag.delete(["1", "missing"]) == 1
+    assert rag.count(user_id="bob") == 0
+
+    rag.store("z", "alice", metadata={"key": "k"}, agent_name="a2")
+    assert rag.delete_matching({"key": "k", "agent_name": "a2"}) == 1
+    assert rag.collection.get_calls[-1]["where"] == {
+        "$and": [{"key": "k"}, {"agent_name": "a2"}]
+    }
+
+    rag.delete_all("a1")
+    assert rag.count() == 0
+    assert rag.stats().by_agent == {}
+
+
+def test_sidecar_rebuilt_when_out_of_sync(rag):
+    """Documents written behind the sidecar's back are picked up once."""
+    rag.collection.add(
+        ids=["a", "b"],
+        documents=["a", "b"],
+        metadatas=[{"user_id": "u", "agent_name": "x"}, {"user_id": "u"}],
+    )
+
+    assert rag.count("x") == 1
+    assert rag.count(user_id="u") == 2
+    assert all(call["include"] == ["metadatas"] for call in rag.collection.get_calls)
+
+    rag.collection.get_calls.clear()
+    assert rag.count("x") == 1
+    assert rag.collection.get_calls == []
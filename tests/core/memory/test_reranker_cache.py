@@ -0,0 +1,152 @@
+"""Tests for reranker score caching, budgets and adaptive reranking.
+
+Uses a stand-in CrossEncoder (scores by word overlap) so no model is
+downloaded.
+"""
+
+import sys
+import types
+
+import pytest
+
+from kagura.config.memory_config import RerankConfig
+from kagura.core.memory import model_cache
+from kagura.core.memory.reranker import MemoryReranker
+
+
+class FakeCrossEncoder:
+    """Scores a pair by the number of query words in the document."""
+
+    def __init__(self, name):
+        self.name = name
+        self.predicted = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        self.predicted.extend(tuple(pair) for pair in pairs)
+        return [
+            float(len(set(query.split()) & set(doc.split()))) for query, doc in pairs
+        ]
+
+
+@pytest.fixture
+def make_reranker(monkeypatch):
+    """Build MemoryRerankers backed by FakeCrossEncoder."""
+    module = types.ModuleType("sentence_transformers")
+    module.CrossEncoder = FakeCrossEncoder
+    monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+    model_cache.clear_model_cache()
+
+    def make(**config):
+        return MemoryReranker(RerankConfig(model="fake-reranker", **config))
+
+    yield make
+    model_cache.clear_model_cache()
+
+
+def _candidates():
+    return [
+        {"id": "a", "content": "java threads", "distance": 0.1},
+        {"id": "b", "content": "python asyncio tutorial", "distance": 0.2},
+        {"id": "c", "content": "python basics", "distance": 0.3},
+    ]
+
+
+def test_repeated_query_served_from_cache(make_reranker):
+    """A repeated query over unchanged candidates skips the model."""
+    reranker = make_reranker()
+
+    first = reranker.rerank("python asyncio", _candidates(), top_k=2)
+    assert [c["id"] for c in first] == ["b", "c"]
+    assert len(reranker.model.predicted) == 3
+
+    second = reranker.rerank("python asyncio", _candidates(), top_k=2)
+    assert [c["id"] for c in second] == ["b", "c"]
+    assert len(reranker.model.predicted) == 3
+
+    stats = reranker.stats()
+    assert stats["scored"] == 3
+    assert stats["cache_hits"] == 3
+    assert stats["hit_rate"] == 0.5
+    assert stats["model_seconds"] >= 0.0
+
+
+def test_changed_content_is_rescored(make_reranker):
+    """The cache key includes the document content (its version)."""
+    reranker = make_reranker()
+    reranker.rerank("python", _candidates())
+
+    updated = _candidates()
+    updated[0]["content"] = "python threads"
+    reranked = reranker.rerank("python", updated, top_k=3)
+
+    assert reranker.model.predicted[-1] == ("python", "python threads")
+    assert reranker.stats()["scored"] == 4
+    assert reranked[0]["rerank_score"] == 1.0
+
+
+def test_cache_evicts_least_recently_used(make_reranker):
+    """The cache never exceeds cache_size entries."""
+    reranker = make_reranker(cache_size=2)
+    reranker.rerank("python", _candidates())
+    assert reranker.stats()["cache_size"] == 2
+
+    reranker.clear_cache()
+    assert reranker.stats()["cache_size"] == 0
+
+
+def test_max_candidates_budget(make_reranker):
+    """Only the best first-stage candidates are scored; the rest follow."""
+    reranker = make_reranker(max_candidates=2)
+    reranked = reranker.rerank("python basics", list(reversed(_candidates())), top_k=3)
+
+    assert [c["id"] for c in reranked] == ["b", "a", "c"]
+    assert "rerank_score" not in reranked[2]
+    assert len(reranker.model.predicted) == 2
+    assert reranker.stats()["truncated"] == 1
+
+
+def test_adaptive_skips_well_separated_results(make_reranker):
+    """Adaptive mode keeps first-stage order when top results stand out."""
+    reranker = make_reranker(adaptive=True, adaptive_margin=0.3)
+    candidates = [
+        {"id": "a", "content": "java threads", "distance": 0.1},
+        {"id": "b", "content": "python asyncio", "distance": 0.9},
+        {"id": "c", "content": "python basics", "distance": 0.95},
+    ]
+
+    reranked = reranker.rerank("python", candidates, top_k=1)
+
+    assert [c["id"] for c in reranked] == ["a"]
+    assert reranker.model.predicted == []
+    assert reranker.stats()["skipped"] == 1
+
+
+def test_adaptive_truncates_candidates_far_below_top_k(make_reranker):
+    """Close contenders are reranked; distant ones are not scored."""
+    reranker = make_reranker(adaptive=True, adaptive_margin=0.3)
+    candidates = [
+        {"id": "a", "content": "java threads", "distance": 0.1},
+        {"id": "b", "content": "python asyncio", "distance": 0.15},
+        {"id": "c", "content": "python basics", "distance": 0.9},
+    ]
+
+    reranked = reranker.rerank("python asyncio", candidates, top_k=1)
+
+    assert [c["id"] for c in reranked] == ["b"]
+    assert {doc for _, doc in reranker.model.predicted} == {
+        "java threads",
+        "python asyncio",
+    }
+    assert reranker.stats()["truncated"] == 1
+
+
+def test_rerank_batch_scores_uncached_pairs_once(make_reranker):
+    """Duplicate pairs across queries are predicted once."""
+    reranker = make_reranker()
+    results = reranker.rerank_batch(
+        ["python", "python"], [_candidates(), _candidates()], top_k=1
+    )
+
+    assert [r[0]["id"] for r in results] == ["b", "b"]
+    assert len(reranker.model.predicted) == 3
+    assert reranker.score_pair("python", "python basics") == 1.0
@@ -0,0 +1,280 @@
+"""Tests for incremental source code indexing."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from kagura.core.memory.source_indexer import SourceCodeIndexer, extract_code_chunks
+
+
+class FakeRAG:
+    """Minimal MemoryRAG stand-in recording batch writes and deletes."""
+
+    def __init__(self) -> None:
+        self.docs: dict[str, dict] = {}
+        self.batch_calls = 0
+
+    def store_batch(self, contents, user_id, metadatas=None, agent_name=None, ids=None):
+        self.batch_calls += 1
+        for doc_id, content, metadata in zip(ids, contents, metadatas):
+            self.docs[doc_id] = {"content": content, "metadata": metadata}
+        return ids
+
+    def delete(self, ids):
+        return sum(self.docs.pop(doc_id, None) is not None for doc_id in ids)
+
+    def delete_matching(self, filters):
+        def accepts(metadata):
+            for field, value in filters.items():
+                if isinstance(value, dict):
+                    if metadata.get(field) not in value["$in"]:
+                        return False
+                elif metadata.get(field) != value:
+                    return False
+            return True
+
+        return self.delete(
+            [i for i, d in list(self.docs.items()) if accepts(d["metadata"])]
+        )
+
+
+def _write(path: Path, source: str) -> None:
+    path.write_text(source, encoding="utf-8")
+    # Ensure mtime changes even on coarse-grained filesystems
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    _write(src / "a.py", '"""Module a."""\n\n\ndef foo():\n    return 1\n')
+    _write(src / "b.py", "class Bar:\n    def baz(self):\n        pass\n")
+    return tmp_path
+
+
+def _indexer(rag, project, **kwargs):
+    return SourceCodeIndexer(
+        rag=rag,
+        manifest_path=project / "memory.db",
+        user_id="dev",
+        project_id="proj",
+        **kwargs,
+    )
+
+
+def test_extract_code_chunks_types():
+    """Module, function, class and method chunks are extracted."""
+    import ast
+
+    source = '"""Doc."""\n\nclass A:\n    def m(self):\n        pass\n\ndef f():\n    pass\n'
+    chunks = extract_code_chunks(source, ast.parse(source), Path("x.py"))
+    assert {c["type"] for c in chunks} == {"module", "class", "method", "function"}
+
+
+@pytest.mark.asyncio
+async def test_index_skips_unchanged_files(project):
+    """Second run over an unchanged tree writes nothing."""
+    rag = FakeRAG()
+    src = project / "src"
+    files = sorted(src.glob("*.py"))
+
+    first = await _indexer(rag, project).index_files(files, root=src)
+    assert first.files_indexed == 2
+    assert first.chunks_written == len(rag.docs) == 4
+    assert all(d["metadata"]["project_id"] == "proj" for d in rag.docs.values())
+
+    second = await _indexer(rag, project).index_files(files, root=src)
+    assert second.files_indexed == 0
+    assert second.files_unchanged == 2
+    assert second.chunks_written == 0
+    assert rag.batch_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_index_replaces_chunks_of_modified_file(project):
+    """Modified files have their stale chunks deleted and re-written."""
+    rag = FakeRAG()
+    src = project / "src"
+    await _indexer(rag, project).index_files(sorted(src.glob("*.py")), root=src)
+
+    _write(src / "a.py", "def only():\n    pass\n")
+    stats = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+
+    assert stats.files_indexed == 1
+    assert stats.files_unchanged == 1
+    assert stats.chunks_deleted == 2
+    names = {d["metadata"]["name"] for d in rag.docs.values()}
+    assert names == {"only", "Bar", "baz"}
+
+
+@pytest.mark.asyncio
+async def test_index_touch_without_content_change(project):
+    """A new mtime with identical content is not re-embedded."""
+    rag = FakeRAG()
+    src = project / "src"
+    await _indexer(rag, project).index_files(sorted(src.glob("*.py")), root=src)
+
+    _write(src / "a.py", (src / "a.py").read_text())
+    stats = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert stats.files_indexed == 0
+    assert stats.files_unchanged == 2
+
+
+@pytest.mark.asyncio
+async def test_index_removes_deleted_files(project):
+    """Chunks of files deleted under the root are removed."""
+    rag = FakeRAG()
+    src = project / "src"
+    await _indexer(rag, project).index_files(sorted(src.glob("*.py")), root=src)
+
+    (src / "b.py").unlink()
+    stats = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert stats.files_removed == 1
+    assert {d["metadata"]["name"] for d in rag.docs.values()} == {"a", "foo"}
+
+
+@pytest.mark.asyncio
+async def test_index_with_narrower_pattern_keeps_other_files(project):
+    """Files outside a narrower re-scan still exist and keep their chunks."""
+    rag = FakeRAG()
+    src = project / "src"
+    await _indexer(rag, project).index_files(sorted(src.glob("*.py")), root=src)
+
+    stats = await _indexer(rag, project).index_files([src / "a.py"], root=src)
+    assert stats.files_removed == 0
+    assert stats.chunks_deleted == 0
+    assert {d["metadata"]["name"] for d in rag.docs.values()} == {
+        "a",
+        "foo",
+        "Bar",
+        "baz",
+    }
+
+    # Unchanged b.py is still tracked by the manifest on the next full scan
+    again = await _indexer(rag, project).index_files(sorted(src.glob("*.py")), root=src)
+    assert again.files_unchanged == 2
+    assert again.chunks_written == 0
+
+    # A file the current pattern set covers but did not list is stale
+    stats = await _indexer(rag, project).index_files(
+        [src / "a.py"], root=src, matches=lambda path: path.suffix == ".py"
+    )
+    assert stats.files_removed == 1
+    assert {d["metadata"]["name"] for d in rag.docs.values()} == {"a", "foo"}
+
+
+@pytest.mark.asyncio
+async def test_index_replaces_pre_manifest_chunks(project):
+    """Chunks stored before the manifest existed are not duplicated."""
+    rag = FakeRAG()
+    src = project / "src"
+    for name, path in [("foo", src / "a.py"), ("other", project / "other.py")]:
+        rag.docs[f"legacy-{name}"] = {
+            "content": name,
+            "metadata": {
+                "type": "source_code",
+                "file_path": str(path),
+                "name": name,
+                "user_id": "dev",
+            },
+        }
+
+    stats = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert stats.chunks_deleted == 1
+    assert "legacy-foo" not in rag.docs
+    # Files outside the scan keep their chunks
+    assert "legacy-other" in rag.docs
+    assert len(rag.docs) == 5
+
+
+@pytest.mark.asyncio
+async def test_index_tool_removes_newly_excluded_files(project, monkeypatch):
+    """Files excluded since the last run lose their chunks."""
+    from types import SimpleNamespace
+
+    from kagura.mcp.tools.coding import source_indexing
+
+    rag = FakeRAG()
+    memory = SimpleNamespace(
+        rag=rag,
+        persistent=SimpleNamespace(db_path=project / "memory.db"),
+        user_id="dev",
+        agent_name=None,
+    )
+    monkeypatch.setattr(source_indexing, "get_coding_memory", lambda *args: memory)
+    src = project / "src"
+
+    # (The default excludes would match pytest's test_* tmp_path)
+    await source_indexing.coding_index_source_code(
+        "dev", "proj", str(src), exclude_patterns="[]"
+    )
+    assert len(rag.docs) == 4
+
+    result = await source_indexing.coding_index_source_code(
+        "dev", "proj", str(src), exclude_patterns='["**/b.py"]'
+    )
+    assert "Files removed:** 1" in result
+    assert {d["metadata"]["name"] for d in rag.docs.values()} == {"a", "foo"}
+
+
+@pytest.mark.asyncio
+async def test_index_syntax_error_is_retried(project):
+    """Files that fail to parse are reported and not recorded in the manifest."""
+    rag = FakeRAG()
+    src = project / "src"
+    _write(src / "broken.py", "def broken(:\n")
+
+    stats = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert stats.files_indexed == 2
+    assert any("Syntax error" in e for e in stats.errors)
+
+    again = await _indexer(rag, project).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert any("Syntax error" in e for e in again.errors)
+
+
+@pytest.mark.asyncio
+async def test_index_parallel_batches(project):
+    """Large change sets are parsed in a pool and written in batches."""
+    rag = FakeRAG()
+    src = project / "src"
+    for i in range(20):
+        _write(src / f"mod_{i}.py", f"def func_{i}():\n    return {i}\n")
+
+    stats = await _indexer(rag, project, batch_size=8, max_workers=2).index_files(
+        sorted(src.glob("*.py")), root=src
+    )
+    assert stats.files_indexed == 22
+    assert stats.chunks_written == 24
+    assert rag.batch_calls > 1
+
+
+@pytest.mark.asyncio
+async def test_manifest_paths_feed_content_search(project):
+    """Indexed paths can be searched without walking the tree."""
+    from kagura.core.content_search import ContentSearcher
+
+    src = project / "src"
+    indexer = _indexer(FakeRAG(), project)
+    await indexer.index_files(sorted(src.glob("*.py")), root=src)
+
+    paths = indexer.manifest.paths("dev", "proj", root=src)
+    assert paths == [str(src / "a.py"), str(src / "b.py")]
+    assert indexer.manifest.paths("dev", "proj", root=project / "other") == []
+
+    matches = await ContentSearcher("def baz").search(paths)
+    assert [(m.path, m.line_number) for m in matches] == [(str(src / "b.py"), 2)]
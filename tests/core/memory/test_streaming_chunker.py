@@ -0,0 +1,143 @@
+"""Tests for streaming chunking, windowed chunk writes and offset slicing.
+
+Uses a stand-in RecursiveCharacterTextSplitter (greedy word packing) and the
+embedded flat vector store, so neither langchain nor chromadb is needed.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from kagura.config.memory_config import ChunkingConfig, VectorStoreConfig
+from kagura.core.memory import rag as rag_module
+from kagura.core.memory.semantic_chunker import SemanticChunker
+
+
+class FakeSplitter:
+    """Packs words into chunks; the next chunk repeats the last word."""
+
+    segments: list[str] = []
+
+    def __init__(self, chunk_size, chunk_overlap, **kwargs):
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def split_text(self, text):
+        FakeSplitter.segments.append(text)
+        chunks, current = [], []
+        for word in text.split():
+            if current and len(" ".join(current + [word])) > self.chunk_size:
+                chunks.append(" ".join(current))
+                current = current[-1:] if self.chunk_overlap else []
+            current.append(word)
+        if current:
+            chunks.append(" ".join(current))
+        return chunks
+
+
+class RecordingEmbedding:
+    """Deterministic embeddings; records the size of every embedding call."""
+
+    calls: list[int] = []
+
+    def __call__(self, input):
+        RecordingEmbedding.calls.append(len(input))
+        return [
+            np.random.default_rng(sum(map(ord, text))).standard_normal(16)
+            for text in input
+        ]
+
+
+@pytest.fixture(autouse=True)
+def fake_splitter(monkeypatch):
+    module = types.ModuleType("langchain_text_splitters")
+    module.RecursiveCharacterTextSplitter = FakeSplitter
+    monkeypatch.setitem(sys.modules, "langchain_text_splitters", module)
+    FakeSplitter.segments = []
+    RecordingEmbedding.calls = []
+
+
+def _document(words=400):
+    return " ".join(f"word{i}" for i in range(words))
+
+
+def test_iter_chunks_streams_bounded_segments_with_exact_offsets():
+    """Chunks come from bounded segments and index the original text."""
+    text = _document()
+    chunker = SemanticChunker(max_chunk_size=100, overlap=10, segment_size=500)
+
+    chunks = list(chunker.iter_chunks(text, source="big.log"))
+
+    assert max(len(segment) for segment in FakeSplitter.segments) <= 500
+    assert all(text[c.start_char : c.end_char] == c.content for c in chunks)
+    assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+    assert {c.total_chunks for c in chunks} == {len(chunks)}
+    assert chunker.chunk_with_metadata(text, source="big.log") == chunks
+
+
+@pytest.mark.parametrize("overlap", [0, 10])
+def test_offsets_of_repeated_text(overlap):
+    """Identical chunks of repetitive text get their own offsets."""
+    text = "ERROR x " * 60
+    chunker = SemanticChunker(max_chunk_size=15, overlap=overlap)
+
+    chunks = chunker.chunk_with_metadata(text)
+
+    assert all(text[c.start_char : c.end_char] == c.content for c in chunks)
+    # Consecutive chunks neither skip text nor overlap by more than `overlap`
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert previous.end_char - overlap <= chunk.start_char <= previous.end_char + 1
+    assert chunks[-1].end_char == len(text.rstrip())
+
+
+@pytest.fixture
+def chunking_rag(tmp_path, monkeypatch):
+    monkeypatch.setattr(rag_module, "_default_embedding_function", RecordingEmbedding)
+    return rag_module.MemoryRAG(
+        collection_name="stream",
+        persist_dir=tmp_path,
+        chunking_config=ChunkingConfig(
+            max_chunk_size=100, overlap=10, min_chunk_size=50, write_batch_size=4
+        ),
+        vector_store_config=VectorStoreConfig(backend="flat"),
+    )
+
+
+def test_store_writes_chunks_in_bounded_windows(chunking_rag):
+    """A long document is embedded and written a window at a time."""
+    text = _document()
+    parent_id = chunking_rag.store(text, user_id="alice")
+
+    chunks = chunking_rag.get_chunk_metadata(parent_id)
+    assert len(chunks) > 8
+    assert max(RecordingEmbedding.calls) <= 4
+    assert chunking_rag.count() == len(chunks)
+    assert chunking_rag.get_full_document(parent_id)["full_content"] == text
+
+
+def test_full_document_of_repeated_lines(chunking_rag):
+    """Repeated log lines are reassembled without losing text."""
+    text = " ".join(["ERROR connection reset by peer"] * 40)
+    parent_id = chunking_rag.store(text, user_id="alice")
+
+    assert len(chunking_rag.get_chunk_metadata(parent_id)) > 8
+    assert chunking_rag.get_full_document(parent_id)["full_content"] == text
+
+
+def test_ranges_are_sliced_from_covering_chunks(chunking_rag):
+    """Offsets let callers read a range or context without the whole parent."""
+    text = _document()
+    parent_id = chunking_rag.store(text, user_id="alice")
+
+    assert chunking_rag.get_text_range(parent_id, 1000, 1300) == text[1000:1300]
+
+    target = chunking_rag.get_chunk_context(parent_id, 5, context_size=0)[0]
+    context = chunking_rag.get_chunk_context(parent_id, 5, context_chars=150)
+    starts = [c["metadata"]["start_char"] for c in context]
+    ends = [c["metadata"]["end_char"] for c in context]
+    assert 5 in [c["chunk_index"] for c in context]
+    assert min(starts) <= target["metadata"]["start_char"] - 150
+    assert max(ends) >= target["metadata"]["end_char"] + 150
+    assert len(context) < len(chunking_rag.get_chunk_metadata(parent_id))
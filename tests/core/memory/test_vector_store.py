@@ -0,0 +1,247 @@
+"""Tests for the embedded flat vector store backend."""
+
+import sqlite3
+import threading
+
+import numpy as np
+import pytest
+
+from kagura.core.memory import vector_store
+from kagura.core.memory.vector_store import FlatVectorClient, match_where
+
+
+class HashEmbedding:
+    """Deterministic pseudo-random embeddings keyed on the text."""
+
+    def __init__(self, dim: int = 32) -> None:
+        self.dim = dim
+
+    def __call__(self, input):
+        return [
+            np.random.default_rng(sum(map(ord, text))).standard_normal(self.dim)
+            for text in input
+        ]
+
+
+@pytest.fixture
+def client(tmp_path):
+    return FlatVectorClient(tmp_path / "flat", embedding_function=HashEmbedding())
+
+
+def _add_users(collection, n=20):
+    collection.add(
+        ids=[f"id{i}" for i in range(n)],
+        documents=[f"document number {i}" for i in range(n)],
+        metadatas=[
+            {"user_id": "alice" if i % 2 else "bob", "agent_name": "a", "i": i}
+            for i in range(n)
+        ],
+    )
+
+
+def test_match_where_operators():
+    """ChromaDB-style filters are evaluated on metadata."""
+    meta = {"user_id": "u", "chunk_index": 3, "tag": "x"}
+    assert match_where(meta, {"$and": [{"user_id": "u"}, {"chunk_index": {"$gte": 3}}]})
+    assert not match_where(meta, {"chunk_index": {"$lt": 3}})
+    assert match_where(meta, {"$or": [{"tag": "y"}, {"tag": {"$in": ["x"]}}]})
+    assert not match_where(None, {"user_id": "u"})
+
+
+@pytest.mark.parametrize("quantization", ["float16", "int8"])
+def test_query_returns_exact_match_within_user(tmp_path, quantization):
+    """A document's own text is its nearest neighbour, scoped to the user."""
+    client = FlatVectorClient(
+        tmp_path / "flat", embedding_function=HashEmbedding(), quantization=quantization
+    )
+    collection = client.get_or_create_collection("memories")
+    _add_users(collection)
+
+    results = collection.query(
+        query_texts=["document number 7"],
+        n_results=3,
+        where={"$and": [{"user_id": "alice"}, {"agent_name": "a"}]},
+    )
+
+    assert results["ids"][0][0] == "id7"
+    assert results["documents"][0][0] == "document number 7"
+    assert results["distances"][0][0] == pytest.approx(0.0, abs=1e-2)
+    assert results["distances"][0] == sorted(results["distances"][0])
+    assert all(m["user_id"] == "alice" for m in results["metadatas"][0])
+
+
+def test_add_ignores_existing_ids_and_upsert_replaces(client):
+    """add() keeps existing documents; upsert() replaces them."""
+    collection = client.get_or_create_collection("memories")
+    collection.add(ids=["1"], documents=["first"], metadatas=[{"user_id": "u"}])
+    collection.add(ids=["1"], documents=["second"], metadatas=[{"user_id": "u"}])
+    assert collection.get(ids=["1"])["documents"] == ["first"]
+
+    collection.upsert(ids=["1"], documents=["third"], metadatas=[{"user_id": "v"}])
+    assert collection.count() == 1
+    assert collection.get(ids=["1"])["metadatas"] == [{"user_id": "v"}]
+    hits = collection.query(query_texts=["third"], n_results=5, where={"user_id": "u"})
+    assert hits["ids"] == [[]]
+
+
+def test_delete_compacts_and_persists(tmp_path, monkeypatch):
+    """Dead rows are compacted away and data survives reopening."""
+    monkeypatch.setattr(vector_store, "_COMPACT_MIN_DEAD_ROWS", 4)
+    client = FlatVectorClient(tmp_path / "flat", embedding_function=HashEmbedding())
+    collection = client.get_or_create_collection("memories")
+    _add_users(collection)
+
+    collection.delete(where={"$and": [{"user_id": "bob"}, {"i": {"$lt": 16}}]})
+    assert collection.count() == 12
+    assert (tmp_path / "flat" / "memories").exists()
+
+    reopened = FlatVectorClient(
+        tmp_path / "flat", embedding_function=HashEmbedding()
+    ).get_collection("memories")
+    assert reopened.count() == 12
+    hits = reopened.query(query_texts=["document number 18"], n_results=1)
+    assert hits["ids"] == [["id18"]]
+    assert len(reopened.peek(limit=2)["embeddings"][0]) == 32
+
+
+def test_compaction_is_crash_safe(tmp_path, monkeypatch):
+    """A compaction that never commits leaves every document on its vector."""
+    monkeypatch.setattr(vector_store, "_COMPACT_MIN_DEAD_ROWS", 4)
+    path = tmp_path / "flat" / "memories"
+    embed = HashEmbedding()
+    collection = vector_store.FlatVectorCollection(path, "memories", embed, "int8")
+    _add_users(collection)
+
+    def crash(conn, touched):
+        raise RuntimeError("crash before commit")
+
+    monkeypatch.setattr(collection, "_bump_version", crash)
+    with pytest.raises(RuntimeError):
+        collection.delete(where={"$and": [{"user_id": "bob"}, {"i": {"$lt": 16}}]})
+
+    reopened = vector_store.FlatVectorCollection(path, "memories", embed)
+    stored = reopened.get(include=["documents", "embeddings"])
+    assert len(stored["ids"]) == 20
+    expected = vector_store._normalize(np.asarray(embed(stored["documents"])))
+    np.testing.assert_allclose(stored["embeddings"], expected, atol=2e-2)
+
+    # A committed compaction switches generations and drops the old files
+    reopened.delete(where={"$and": [{"user_id": "bob"}, {"i": {"$lt": 16}}]})
+    stored = reopened.get(include=["documents", "embeddings"])
+    expected = vector_store._normalize(np.asarray(embed(stored["documents"])))
+    np.testing.assert_allclose(stored["embeddings"], expected, atol=2e-2)
+    bob = vector_store._partition_name("bob")
+    assert sorted(p.name for p in path.glob(f"{bob}*")) == [
+        f"{bob}.1.scale",
+        f"{bob}.1.vec",
+    ]
+
+
+def test_concurrent_writers_do_not_overwrite_rows(tmp_path):
+    """Writers that share only the database file get distinct rows."""
+    path = tmp_path / "flat" / "memories"
+    embed = HashEmbedding()
+    writers = [vector_store.FlatVectorCollection(path, "memories", embed) for _ in "ab"]
+
+    def write(collection, prefix):
+        for i in range(20):
+            collection.add(
+                ids=[f"{prefix}{i}"],
+                documents=[f"{prefix} document {i}"],
+                metadatas=[{"user_id": "u"}],
+            )
+
+    threads = [
+        threading.Thread(target=write, args=(collection, prefix))
+        for collection, prefix in zip(writers, "ab")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    reader = vector_store.FlatVectorCollection(path, "memories", embed)
+    stored = reader.get(include=["documents", "embeddings"])
+    assert len(stored["ids"]) == 40
+    # Each document still has its own vector
+    expected = vector_store._normalize(np.asarray(embed(stored["documents"])))
+    np.testing.assert_allclose(stored["embeddings"], expected, atol=1e-2)
+
+
+def test_get_where_selects_candidates_in_sql(client, monkeypatch):
+    """Partition and indexed-field filters are applied before match_where."""
+    collection = client.get_or_create_collection("memories")
+    collection.add(
+        ids=[f"c{i}" for i in range(12)],
+        documents=[f"chunk {i}" for i in range(12)],
+        metadatas=[
+            {
+                "user_id": "alice" if i < 6 else "bob",
+                "parent_id": f"p{i % 3}",
+                "simhash_b0": i,
+                "chunk_index": i,
+            }
+            for i in range(12)
+        ],
+    )
+    checked = []
+
+    def counting_match_where(metadata, where):
+        checked.append(metadata["chunk_index"])
+        return match_where(metadata, where)
+
+    monkeypatch.setattr(vector_store, "match_where", counting_match_where)
+
+    where = {"$and": [{"user_id": "alice"}, {"parent_id": "p1"}]}
+    assert collection.get(where=where)["ids"] == ["c1", "c4"]
+    assert set(checked) == {1, 4}
+
+    checked.clear()
+    bands = {"$or": [{"simhash_b0": 7}, {"simhash_b0": 9}, {"simhash_b0": "7"}]}
+    assert collection.get(where=bands, include=[])["ids"] == ["c7", "c9"]
+    assert set(checked) == {7, 9}
+
+    # Filters that cannot be looked up fall back to a full scan
+    where = {"$or": [{"parent_id": "p2"}, {"chunk_index": {"$lt": 1}}]}
+    assert collection.get(where=where)["ids"] == ["c0", "c2", "c5", "c8", "c11"]
+
+    collection.delete(ids=["c4"])
+    where = {"$and": [{"user_id": "alice"}, {"parent_id": "p1"}]}
+    assert collection.get(where=where)["ids"] == ["c1"]
+
+    # Collections written before the term index are indexed on open
+    with sqlite3.connect(collection.path / "collection.db") as conn:
+        conn.execute("DELETE FROM document_terms")
+        conn.execute("DELETE FROM info WHERE key = 'terms'")
+    reopened = vector_store.FlatVectorCollection(collection.path, "memories")
+    assert reopened.get(where=where)["ids"] == ["c1"]
+
+
+def test_dimension_mismatch_raises(client):
+    """Embeddings of a different dimension are rejected like in ChromaDB."""
+    collection = client.get_or_create_collection("memories")
+    collection.add(ids=["a"], embeddings=[[1.0, 0.0, 0.0]])
+    with pytest.raises(ValueError):
+        collection.add(ids=["b"], embeddings=[[1.0, 0.0]])
+
+
+def test_memory_rag_flat_backend(tmp_path, monkeypatch):
+    """MemoryRAG stores and recalls through the flat backend."""
+    from kagura.config.memory_config import VectorStoreConfig
+    from kagura.core.memory import rag as rag_module
+
+    monkeypatch.setattr(rag_module, "_default_embedding_function", HashEmbedding)
+    rag = rag_module.MemoryRAG(
+        collection_name="test",
+        persist_dir=tmp_path,
+        vector_store_config=VectorStoreConfig(backend="flat", quantization="int8"),
+    )
+    rag.store("Python is a programming language", "alice", agent_name="a")
+    rag.store("Bananas are yellow", "bob", agent_name="a")
+
+    results = rag.recall("Python is a programming language", "alice", top_k=5)
+    assert [r["content"] for r in results] == ["Python is a programming language"]
+    assert rag.count("a") == 2
+
+    rag.delete_all()
+    assert rag.count() == 0
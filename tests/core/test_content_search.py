@@ -0,0 +1,118 @@
+"""Tests for the in-process content search engine."""
+
+import pytest
+
+from kagura.core import content_search
+from kagura.core.content_search import ContentSearcher, walk_files
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small project with ignored, hidden and binary files."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "build").mkdir()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src" / "a.py").write_text("import os\n# TODO: one\nx = 1\n")
+    (tmp_path / "src" / "b.py").write_text("# todo lower\n# TODO: two\n# TODO: three")
+    (tmp_path / "src" / "notes.txt").write_text("TODO: txt\n")
+    (tmp_path / "src" / "blob.bin").write_bytes(b"TODO\0binary")
+    (tmp_path / "build" / "gen.py").write_text("# TODO: generated\n")
+    (tmp_path / ".git" / "config").write_text("TODO\n")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    return tmp_path
+
+
+def test_walk_files_prunes_ignored_paths(tree):
+    """Ignored and hidden directories are skipped; name filter applies."""
+    files = list(walk_files(tree, "*.py"))
+    assert files == [str(tree / "src" / "a.py"), str(tree / "src" / "b.py")]
+
+    everything = list(walk_files(tree, respect_gitignore=False))
+    assert str(tree / "build" / "gen.py") in everything
+    assert str(tree / ".git" / "config") in everything
+
+
+def test_search_reports_line_numbers_in_file_order(tree):
+    """Matches carry 1-based line numbers; binary files are skipped."""
+    searcher = ContentSearcher("TODO", literal=True)
+    matches = list(searcher.iter_search(walk_files(tree)))
+
+    assert [(m.path.rsplit("/", 1)[-1], m.line_number, m.line) for m in matches] == [
+        ("a.py", 2, "# TODO: one"),
+        ("b.py", 2, "# TODO: two"),
+        ("b.py", 3, "# TODO: three"),
+        ("notes.txt", 1, "TODO: txt"),
+    ]
+
+
+def test_regex_ignore_case_and_one_match_per_line(tree):
+    """Regex patterns match once per line, optionally case-insensitively."""
+    searcher = ContentSearcher(r"t(o)d", ignore_case=True)
+    matches = searcher.search_file(tree / "src" / "b.py")
+    assert [m.line_number for m in matches] == [1, 2, 3]
+
+    assert ContentSearcher(r"^x = \d$").search_file(tree / "src" / "a.py")[0].line == (
+        "x = 1"
+    )
+
+
+def test_non_ascii_ignore_case(tmp_path):
+    """Non-ASCII case folding works (files are decoded for such patterns)."""
+    path = tmp_path / "greek.txt"
+    path.write_text("alpha\nΣΙΓΜΑ\n", encoding="utf-8")
+
+    matches = ContentSearcher("σιγμα", ignore_case=True).search_file(path)
+    assert [(m.line_number, m.line) for m in matches] == [(2, "ΣΙΓΜΑ")]
+
+
+@pytest.mark.parametrize("large", [False, True])
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("[本]", ["日本"]),
+        (r"^.{2}$", ["日本", "日あ"]),
+        (r"\w+本", ["日本"]),
+        ("日", ["日本", "日あ"]),
+    ],
+)
+def test_case_sensitive_patterns_match_characters(
+    tmp_path, monkeypatch, large, pattern, expected
+):
+    """Classes, "." and \\w see characters, not UTF-8 bytes."""
+    if large:
+        monkeypatch.setattr(content_search, "_MMAP_THRESHOLD", 1)
+    path = tmp_path / "ja.txt"
+    path.write_text("日本\n日あ\n", encoding="utf-8")
+
+    assert [m.line for m in ContentSearcher(pattern).search_file(path)] == expected
+
+
+def test_ascii_files_keep_the_bytes_fast_path(tmp_path):
+    """ASCII patterns on ASCII files give the same results as on text."""
+    path = tmp_path / "a.txt"
+    path.write_text("ab\nabc\n", encoding="utf-8")
+    assert [m.line for m in ContentSearcher(r"^.{2}$").search_file(path)] == ["ab"]
+
+
+def test_max_results_caps_across_files(tree):
+    """Streaming stops once max_results lines were returned."""
+    searcher = ContentSearcher("TODO", max_results=2, max_workers=2)
+    matches = list(searcher.iter_search(walk_files(tree)))
+    assert [m.line for m in matches] == ["# TODO: one", "# TODO: two"]
+
+
+def test_mmap_path_matches_read_path(tree, monkeypatch):
+    """Large files are mmap'd with identical results."""
+    searcher = ContentSearcher("TODO")
+    expected = searcher.search_file(tree / "src" / "b.py")
+
+    monkeypatch.setattr(content_search, "_MMAP_THRESHOLD", 1)
+    assert searcher.search_file(tree / "src" / "b.py") == expected
+
+
+@pytest.mark.asyncio
+async def test_async_search_skips_missing_files(tree):
+    """Unreadable paths are skipped."""
+    searcher = ContentSearcher("TODO")
+    matches = await searcher.search(["/nonexistent/file", str(tree / "src" / "a.py")])
+    assert [m.line_number for m in matches] == [2]
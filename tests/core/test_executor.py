@@ -1,5 +1,7 @@
 """Tests for code executor"""
 
+import sys
+
 import pytest
 
 from kagura.core.executor import (
@@ -331,9 +333,6 @@ result = "should not reach here"
 
 
 @pytest.mark.asyncio
-@pytest.mark.skip(
-    reason="This test causes pytest-asyncio event loop cleanup to hang - known issue"
-)
 async def test_infinite_loop_timeout():
     """Test timeout on infinite loop"""
     executor = CodeExecutor(timeout=1.0)
@@ -459,3 +458,99 @@ result = calculate_stats(data)
     assert result.success is True
     assert result.result["mean"] == 3.0
     assert result.result["median"] == 3
+
+
+# Process isolation tests
+@pytest.mark.asyncio
+async def test_concurrent_executions_capture_own_stdout():
+    """Concurrent runs execute in parallel workers with separate stdout"""
+    executor = CodeExecutor(pool_size=4)
+    codes = [
+        f"""
+import time
+for _ in range(3):
+    print("task {i}")
+    time.sleep(0.1)
+result = {i}
+"""
+        for i in range(4)
+    ]
+
+    results = await executor.execute_many(codes)
+
+    assert [r.result for r in results] == [0, 1, 2, 3]
+    for i, r in enumerate(results):
+        assert r.stdout == f"task {i}\n" * 3
+    # 4 x 0.3s of sleeping, run side by side
+    assert max(r.execution_time for r in results) < 1.0
+
+
+@pytest.mark.asyncio
+async def test_worker_respawned_after_timeout():
+    """A timed-out worker is killed and replaced by a fresh one"""
+    executor = CodeExecutor(timeout=0.5, pool_size=1)
+    pool = executor.pool
+    respawns = pool.stats.respawns
+
+    result = await executor.execute("while True:\n    pass")
+    assert "TimeoutError" in result.error
+    assert pool.stats.respawns == respawns + 1
+
+    result = await executor.execute("result = 6 * 7")
+    assert result.success is True
+    assert result.result == 42
+
+
+def test_worker_start_while_another_thread_imports(tmp_path, monkeypatch):
+    """Workers do not inherit import locks held by other host threads"""
+    import threading
+    import time
+
+    from kagura.core.executor_pool import WorkerPool
+
+    (tmp_path / "slow_module.py").write_text(
+        "import time\ntime.sleep(0.5)\nVALUE = 42\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importer = threading.Thread(target=__import__, args=("slow_module",))
+    importer.start()
+    time.sleep(0.1)  # slow_module's import lock is held by importer
+
+    with WorkerPool(size=1, allowed_imports={"slow_module"}) as pool:
+        importer.join()
+        result = pool.run("import slow_module\nresult = slow_module.VALUE", 5.0)
+
+    assert result.success is True
+    assert result.result == 42
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_result_returned_as_repr():
+    """Results that cannot leave the worker are returned as their repr"""
+    executor = CodeExecutor()
+    result = await executor.execute("result = (x for x in range(3))")
+
+    assert result.success is True
+    assert result.result.startswith("<generator object")
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sys.platform != "linux", reason="RLIMIT_AS enforced on Linux")
+async def test_memory_limit():
+    """Allocations beyond memory_limit_mb fail inside the worker"""
+    executor = CodeExecutor(memory_limit_mb=64, pool_size=1)
+    result = await executor.execute("data = bytearray(512 * 1024 * 1024)")
+
+    assert result.success is False
+    assert "MemoryError" in result.error
+
+
+@pytest.mark.asyncio
+async def test_thread_isolation():
+    """Thread isolation runs code in-process"""
+    executor = CodeExecutor(isolation="thread")
+    result = await executor.execute("print('hi')\nresult = 1")
+
+    assert result.success is True
+    assert result.result == 1
+    assert result.stdout == "hi\n"
@@ -0,0 +1,182 @@
+"""Tests for tool result caching"""
+
+import asyncio
+
+import pytest
+
+from kagura import tool
+from kagura.core import tool_cache as tool_cache_module
+from kagura.core.tool_cache import ToolResultCache, is_cacheable_result
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    """Use a fresh in-memory cache for decorated tools"""
+    cache = ToolResultCache(max_size=10)
+    monkeypatch.setattr(tool_cache_module, "_tool_cache", cache)
+    monkeypatch.delenv("ENABLE_TOOL_CACHE", raising=False)
+    return cache
+
+
+def test_key_normalizes_arguments():
+    """Whitespace and integral floats do not change the key"""
+    cache = ToolResultCache()
+    key1 = cache.make_key("search", {"query": "python  tutorial ", "count": 5.0})
+    key2 = cache.make_key("search", {"query": "python tutorial", "count": 5})
+    assert key1 == key2
+    assert key1 != cache.make_key("search", {"query": "python tutorial", "count": 6})
+    assert key1 != cache.make_key(
+        "search", {"query": "python tutorial", "count": 5}, scope="/repo"
+    )
+
+
+def test_key_keeps_numeric_looking_strings():
+    """Strings are never converted to numbers"""
+    cache = ToolResultCache()
+    assert cache.make_key("lookup", {"id": "007"}) != cache.make_key(
+        "lookup", {"id": "7"}
+    )
+    assert cache.make_key("lookup", {"id": "1.0"}) != cache.make_key(
+        "lookup", {"id": "1"}
+    )
+    assert cache.make_key("lookup", {"id": "7"}) != cache.make_key("lookup", {"id": 7})
+
+
+def test_error_results_not_cacheable():
+    """Error strings and JSON error objects are never cached"""
+    assert is_cacheable_result("1. Result")
+    assert is_cacheable_result('{"results": []}')
+    assert not is_cacheable_result("Error: GITHUB_TOKEN environment variable not set")
+    assert not is_cacheable_result('{\n  "error": "yt-dlp is required"\n}')
+    assert not is_cacheable_result(None)
+
+
+@pytest.mark.asyncio
+async def test_get_or_call_caches_result():
+    """Second identical call is served from cache"""
+    cache = ToolResultCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return "result"
+
+    for _ in range(3):
+        assert await cache.get_or_call("t", {"q": "x"}, 60, fetch) == "result"
+
+    assert calls == 1
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["per_tool"]["t"]["stores"] == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    """Concurrent identical calls execute the tool once"""
+    cache = ToolResultCache()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(
+        *(cache.get_or_call("t", {"q": "x"}, 60, fetch) for _ in range(5))
+    )
+    assert results == ["result"] * 5
+    assert calls == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_and_lru_eviction(monkeypatch):
+    """Expired entries are refetched and the least recently used is evicted"""
+    cache = ToolResultCache(max_size=2)
+    now = [1000.0]
+    monkeypatch.setattr(tool_cache_module.time, "time", lambda: now[0])
+
+    async def fetch_a():
+        return "a"
+
+    async def fetch_b():
+        return "b"
+
+    async def fetch_c():
+        return "c"
+
+    await cache.get_or_call("t", {"k": "a"}, 10, fetch_a)
+    await cache.get_or_call("t", {"k": "b"}, 10, fetch_b)
+    await cache.get_or_call("t", {"k": "a"}, 10, fetch_a)  # a is most recent
+    await cache.get_or_call("t", {"k": "c"}, 10, fetch_c)  # evicts b
+
+    assert cache.get(cache.make_key("t", {"k": "b"}))[0] is False
+    assert cache.get(cache.make_key("t", {"k": "a"}))[0] is True
+
+    now[0] += 11
+    assert cache.get(cache.make_key("t", {"k": "a"}))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_disk_persistence(tmp_path):
+    """Results survive a new cache instance backed by the same file"""
+    db_path = tmp_path / "tool_results.db"
+    first = ToolResultCache(db_path=db_path)
+
+    async def fetch():
+        return "persisted"
+
+    await first.get_or_call("t", {"q": "x"}, 60, fetch)
+
+    second = ToolResultCache(db_path=db_path)
+    found, value = second.get(second.make_key("t", {"q": "x"}), "t")
+    assert found
+    assert value == "persisted"
+    assert second.stats()["disk_hits"] == 1
+
+    second.invalidate("t")
+    assert ToolResultCache(db_path=db_path).get(first.make_key("t", {"q": "x"}))[0] is False
+
+
+@pytest.mark.asyncio
+async def test_tool_decorator_cache_ttl(fresh_cache):
+    """@tool(cache_ttl=...) caches results of equivalent calls"""
+    calls = []
+
+    @tool(name="cached_lookup_tool", cache_ttl=60)
+    async def cached_lookup(query: str, count: str | int = 5) -> str:
+        """Cached lookup"""
+        calls.append((query, count))
+        return f"{query}:{count}"
+
+    assert await cached_lookup("rag") == "rag:5"
+    assert await cached_lookup(" rag", count=5) == "rag:5"
+    assert await cached_lookup("rag", count=3) == "rag:3"
+    assert await cached_lookup("rag", count="5") == "rag:5"
+    assert len(calls) == 3
+    assert fresh_cache.stats()["per_tool"]["cached_lookup_tool"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_decorator_skips_errors_and_disabled(fresh_cache, monkeypatch):
+    """Error results are not cached; ENABLE_TOOL_CACHE=false bypasses the cache"""
+    calls = 0
+
+    @tool(name="flaky_lookup_tool", cache_ttl=60)
+    async def flaky_lookup(query: str) -> str:
+        """Flaky lookup"""
+        nonlocal calls
+        calls += 1
+        return "Error: upstream unavailable" if calls == 1 else "ok"
+
+    assert await flaky_lookup("x") == "Error: upstream unavailable"
+    assert await flaky_lookup("x") == "ok"
+    assert await flaky_lookup("x") == "ok"
+    assert calls == 2
+
+    monkeypatch.setenv("ENABLE_TOOL_CACHE", "false")
+    assert await flaky_lookup("x") == "ok"
+    assert calls == 3
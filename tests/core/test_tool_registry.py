@@ -149,3 +149,25 @@ def test_global_tool_registry():
 
     # Clean up
     tool_registry.clear()
+
+
+def test_version_changes_on_mutation():
+    """Test version counter increments on register/unregister/clear"""
+    registry = ToolRegistry()
+    assert registry.version == 0
+
+    def my_tool():
+        pass
+
+    registry.register("my_tool", my_tool)
+    assert registry.version == 1
+
+    registry.get("my_tool")
+    registry.get_all()
+    assert registry.version == 1
+
+    registry.unregister("my_tool")
+    assert registry.version == 2
+
+    registry.clear()
+    assert registry.version == 3
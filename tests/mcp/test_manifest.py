@@ -0,0 +1,102 @@
+"""Tests for the builtin MCP tool manifest and lazy tool registration"""
+
+import json
+import subprocess
+import sys
+
+from kagura.core.tool_registry import tool_registry
+from kagura.mcp.manifest import load_manifest
+from kagura.mcp.server import _ToolCatalog
+
+
+def test_manifest_is_current():
+    """The committed manifest matches the registered builtin tools"""
+    result = subprocess.run(
+        [sys.executable, "-m", "kagura.mcp.manifest", "--check"],
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+
+
+def test_lazy_startup_imports_no_tool_modules():
+    """tools/list is served from the manifest without importing tool modules"""
+    script = (
+        "import json, sys\n"
+        "from kagura.mcp.manifest import register_builtin_tools\n"
+        "from kagura.mcp.server import _tool_catalog\n"
+        "count = register_builtin_tools()\n"
+        "tools = _tool_catalog.list_tools()\n"
+        "memory = _tool_catalog.list_tools(categories={'memory'})\n"
+        "print(json.dumps({\n"
+        "    'count': count,\n"
+        "    'listed': len(tools),\n"
+        "    'memory': [t.name for t in memory],\n"
+        "    'imported': sorted(m for m in sys.modules if m == 'litellm'\n"
+        "        or m.startswith(('kagura.mcp.builtin', 'kagura.mcp.tools'))),\n"
+        "}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, timeout=120
+    )
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert data["count"] == data["listed"] == len(load_manifest()) > 0
+    assert data["imported"] == []
+    assert data["memory"]
+    assert all(name.startswith("kagura_tool_memory_") for name in data["memory"])
+
+
+def test_lazy_tool_module_imported_on_first_call(tmp_path, monkeypatch):
+    """Resolving a lazy tool imports its module and returns the real tool"""
+    (tmp_path / "lazy_probe_module.py").write_text(
+        "from kagura import tool\n\n\n"
+        "@tool\n"
+        "async def lazy_probe(text: str) -> str:\n"
+        '    """Echo text"""\n'
+        "    return text\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    catalog = _ToolCatalog()
+    catalog.add_lazy_tools(
+        [
+            {
+                "name": "lazy_probe",
+                "module": "lazy_probe_module",
+                "description": "Echo text",
+                "input_schema": {"type": "object", "properties": {}},
+            }
+        ]
+    )
+
+    try:
+        tools = {t.name: t for t in catalog.list_tools()}
+        assert tools["kagura_tool_lazy_probe"].description == "Echo text"
+        assert "lazy_probe_module" not in sys.modules
+
+        entry = catalog.resolve("kagura_tool_lazy_probe")
+        assert "lazy_probe_module" in sys.modules
+        assert entry is not None
+        assert entry.func is tool_registry.get("lazy_probe")
+        assert entry.is_async is True
+    finally:
+        tool_registry.unregister("lazy_probe")
+        sys.modules.pop("lazy_probe_module", None)
+
+
+def test_lazy_tool_missing_from_module_is_not_found():
+    """A manifest entry whose module does not register the tool resolves to None"""
+    catalog = _ToolCatalog()
+    catalog.add_lazy_tools(
+        [
+            {
+                "name": "ghost_tool",
+                "module": "json",
+                "description": "Ghost",
+                "input_schema": {"type": "object", "properties": {}},
+            }
+        ]
+    )
+    assert catalog.resolve("kagura_tool_ghost_tool") is None
@@ -3,12 +3,17 @@
 Related: Issue #400 - Auto-remember MCP tool requests and results
 """
 
+import asyncio
 import os
+import threading
 
 import pytest
 
+from kagura.mcp import middleware
 from kagura.mcp.middleware import (
     EXCLUDED_TOOLS,
+    ToolCallJournal,
+    _JournalEntry,
     is_auto_logging_enabled,
     log_tool_call_to_memory,
     should_log_tool,
@@ -103,11 +108,11 @@ class TestLogToolCallToMemory:
         arguments = {"query": "test", "count": 5}
         result = "Test search results..."
 
-        # Log tool call (now fire-and-forget with create_task)
+        # Log tool call (queued on the write-behind journal)
         await log_tool_call_to_memory(user_id, tool_name, arguments, result)
 
-        # Wait for async task to complete (fire-and-forget means we need to wait)
-        await asyncio.sleep(0.5)
+        # Wait for the journal to write the entry
+        await asyncio.wait_for(middleware.get_tool_call_journal().flush(), 30)
 
         # Verify stored in memory
         from kagura.mcp.builtin.memory import memory_get_tool_history
@@ -142,8 +147,8 @@ class TestLogToolCallToMemory:
             result=long_result,
         )
 
-        # Wait for async task to complete
-        await asyncio.sleep(0.5)
+        # Wait for the journal to write the entry
+        await asyncio.wait_for(middleware.get_tool_call_journal().flush(), 30)
 
         # Verify truncated in storage
         from kagura.mcp.builtin.memory import memory_get_tool_history
@@ -209,6 +214,151 @@ class TestLogToolCallToMemory:
             pytest.fail(f"Logging should be non-blocking, but raised: {e}")
 
 
+class FakeHistoryMemory:
+    """Records batched writes made by the journal."""
+
+    def __init__(self, block: threading.Event | None = None) -> None:
+        self.batches: list[list] = []
+        self.embedded: list = []
+        self.embed_flags: list[bool] = []
+        self.persistent_rag = object()
+        self._block = block
+
+    def remember_many(self, items, embed=True):
+        if self._block is not None:
+            self._block.wait(timeout=5)
+        self.batches.append(list(items))
+        self.embed_flags.append(embed)
+
+    def index_semantic_many(self, items):
+        self.embedded.extend(items)
+
+
+def _entry(i: int, user_id: str = "journal_user") -> _JournalEntry:
+    return _JournalEntry(
+        user_id=user_id, key=f"tool_{i}", value=f"value_{i}", metadata={}
+    )
+
+
+class TestToolCallJournal:
+    """Tests for the write-behind ToolCallJournal"""
+
+    @pytest.fixture
+    def fake_memory(self, monkeypatch):
+        memories: dict[str, FakeHistoryMemory] = {}
+
+        def _get(user_id):
+            return memories.setdefault(user_id, FakeHistoryMemory())
+
+        monkeypatch.setattr(middleware, "_get_history_memory", _get)
+        return memories
+
+    @pytest.mark.asyncio
+    async def test_batches_entries(self, fake_memory):
+        """Many calls are written in a few batches grouped by user."""
+        journal = ToolCallJournal(batch_size=32, flush_interval=0.05)
+
+        for i in range(40):
+            await journal.enqueue(_entry(i))
+        await journal.enqueue(_entry(99, user_id="other_user"))
+        await journal.flush()
+
+        written = fake_memory["journal_user"].batches
+        assert sum(len(b) for b in written) == 40
+        assert len(written) <= 2
+        stats = journal.stats()
+        assert stats.written == 41
+        assert stats.queue_depth == 0
+        assert stats.dropped == 0
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_drops_when_queue_full(self, monkeypatch):
+        """A full queue drops entries instead of blocking the caller."""
+        release = threading.Event()
+        memory = FakeHistoryMemory(block=release)
+        monkeypatch.setattr(middleware, "_get_history_memory", lambda _: memory)
+        journal = ToolCallJournal(
+            max_queue_size=1, batch_size=1, flush_interval=0, enqueue_timeout=0.01
+        )
+
+        assert await journal.enqueue(_entry(0))
+        await asyncio.sleep(0.05)  # writer picks up entry 0 and blocks
+        assert await journal.enqueue(_entry(1))
+        assert not await journal.enqueue(_entry(2))
+
+        release.set()
+        await journal.flush()
+        stats = journal.stats()
+        assert stats.written == 2
+        assert stats.dropped == 1
+        await journal.close()
+
+    @pytest.mark.asyncio
+    async def test_close_on_shutdown_writes_queued_entries(
+        self, fake_memory, monkeypatch
+    ):
+        """Server shutdown writes queued calls and embeds deferred ones."""
+        journal = ToolCallJournal(flush_interval=0.01, defer_embedding=True)
+        monkeypatch.setattr(middleware, "_journal", journal)
+        for i in range(3):
+            await journal.enqueue(_entry(i))
+
+        await middleware.close_tool_call_journal()
+
+        memory = fake_memory["journal_user"]
+        assert sum(len(b) for b in memory.batches) == 3
+        assert len(memory.embedded) == 3
+        assert middleware._journal is None
+        # No journal yet: nothing to close
+        await middleware.close_tool_call_journal()
+
+    @pytest.mark.asyncio
+    async def test_deferred_embedding(self, fake_memory):
+        """Deferred entries are stored without embedding and indexed on flush."""
+        journal = ToolCallJournal(flush_interval=0.01, defer_embedding=True)
+
+        for i in range(3):
+            await journal.enqueue(_entry(i))
+        await asyncio.sleep(0.1)
+
+        memory = fake_memory["journal_user"]
+        assert memory.embed_flags == [False]
+        assert journal.stats().deferred_pending == 3
+
+        await journal.flush()
+        assert len(memory.embedded) == 3
+        assert journal.stats().deferred_pending == 0
+        await journal.close()
+
+    def test_deferred_entries_survive_concurrent_flush(self, fake_memory):
+        """Entries deferred while flush() swaps the pending set are kept."""
+        import sys
+
+        journal = ToolCallJournal(defer_embedding=True)
+        journal.DEFERRED_EMBED_BATCH_SIZE = 10**9
+        done = threading.Event()
+
+        def flush_repeatedly():
+            while not done.is_set():
+                journal._embed_deferred()
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        flusher = threading.Thread(target=flush_repeatedly)
+        flusher.start()
+        try:
+            for i in range(5000):
+                journal._write_batch([_entry(i)])
+        finally:
+            done.set()
+            flusher.join()
+            sys.setswitchinterval(interval)
+        journal._embed_deferred()
+
+        assert len(fake_memory["journal_user"].embedded) == 5000
+
+
 class TestExcludedToolsComprehensive:
     """Comprehensive test of excluded tools list"""
 
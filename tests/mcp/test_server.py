@@ -119,6 +119,74 @@ def test_async_tool_detection():
     tool_registry.clear()
 
 
+def test_tool_catalog_caches_schemas(monkeypatch):
+    """Schemas are generated once and rebuilt only when a registry changes"""
+    from kagura.mcp import server as server_module
+
+    calls = []
+    original = server_module.generate_json_schema
+
+    def counting_schema(func):
+        calls.append(func)
+        return original(func)
+
+    monkeypatch.setattr(server_module, "generate_json_schema", counting_schema)
+    catalog = server_module._ToolCatalog()
+
+    first = catalog.list_tools()
+    built = len(calls)
+    assert built == len(first)
+
+    second = catalog.list_tools()
+    assert len(calls) == built
+    assert [t.name for t in second] == [t.name for t in first]
+    assert second is not first
+
+    @agent
+    async def catalog_agent(query: str) -> str:
+        """Catalog test agent"""
+        return query
+
+    names = [t.name for t in catalog.list_tools()]
+    assert "kagura_catalog_agent" in names
+    assert len(calls) > built
+
+
+def test_tool_catalog_resolve():
+    """Dispatch map resolves MCP names to registered callables"""
+    from kagura.mcp.server import _split_mcp_name, _ToolCatalog
+
+    @agent
+    async def resolve_agent(query: str) -> str:
+        """Resolve test agent"""
+        return query
+
+    catalog = _ToolCatalog()
+    entry = catalog.resolve("kagura_resolve_agent")
+    assert entry is not None
+    assert entry.item_type == "agent"
+    assert entry.is_async is True
+    assert entry.func is agent_registry.get("resolve_agent")
+    assert catalog.resolve("kagura_missing_agent") is None
+
+    assert _split_mcp_name("kagura_tool_x") == ("tool", "x")
+    assert _split_mcp_name("kagura_workflow_x") == ("workflow", "x")
+    assert _split_mcp_name("kagura_x") == ("agent", "x")
+
+
+def test_tool_catalog_views_memoized_per_context():
+    """Remote view filters dangerous tools and is memoized"""
+    from kagura.mcp.server import _ToolCatalog
+
+    catalog = _ToolCatalog()
+    local = catalog.list_tools("local")
+    remote = catalog.list_tools("remote")
+
+    assert len(remote) <= len(local)
+    assert ("remote", None) in catalog._views
+    assert catalog.list_tools("remote") == remote
+
+
 # NOTE: Testing MCP server's handle_call_tool directly requires accessing internal MCP server APIs
 # which are not part of the public API. The fix for Issue #327 (async tool support) is verified
 # by the test_async_tool_detection above (ensuring async tools are correctly detected) and by
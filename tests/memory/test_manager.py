@@ -308,3 +308,100 @@ def test_manager_user_id_normalization_in_persistent_memory(temp_dir):
 
     # Should retrieve the same value
     assert result == "pref_value"
+
+
+class _CountingEmbedding:
+    """Embedding function stub counting embedded queries."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def __call__(self, input):
+        return [[float(len(text)), 1.0] for text in input]
+
+    def embed_query(self, input):
+        self.calls.append(list(input))
+        return [[float(len(text)), 0.0] for text in input]
+
+
+class _FakeCollection:
+    """ChromaDB collection stub returning one document per query."""
+
+    def __init__(self, name: str, distance: float) -> None:
+        self.name = name
+        self.distance = distance
+        self.queries: list[dict] = []
+
+    def query(self, n_results, where, query_texts=None, query_embeddings=None):
+        self.queries.append(
+            {"query_texts": query_texts, "query_embeddings": query_embeddings}
+        )
+        count = len(query_embeddings or query_texts)
+        return {
+            "ids": [[f"{self.name}-{i}"] for i in range(count)],
+            "documents": [[f"{self.name} doc {i}"] for i in range(count)],
+            "distances": [[self.distance + i] for i in range(count)],
+            "metadatas": [[{"n": i}] for i in range(count)],
+        }
+
+
+def _fake_rag(embedding, collection, space="kagura-embedder-test"):
+    from kagura.core.memory.rag import MemoryRAG
+
+    rag = object.__new__(MemoryRAG)
+    rag._embedding_function = embedding
+    rag.embedding_space = space
+    rag.collection = collection
+    return rag
+
+
+def test_manager_recall_semantic_embeds_query_once(temp_dir):
+    """Query is embedded once and both collections get query_embeddings."""
+    manager = MemoryManager(user_id="test_user", persist_dir=temp_dir, enable_rag=False)
+    embedding = _CountingEmbedding()
+    working = _FakeCollection("working", 0.3)
+    persistent = _FakeCollection("persistent", 0.1)
+    manager.rag = _fake_rag(embedding, working)
+    manager.persistent_rag = _fake_rag(embedding, persistent)
+
+    results = manager.recall_semantic("python", top_k=5)
+
+    assert embedding.calls == [["python"]]
+    for collection in (working, persistent):
+        assert collection.queries[0]["query_texts"] is None
+        assert collection.queries[0]["query_embeddings"] == [[6.0, 0.0]]
+    assert [r["scope"] for r in results] == ["persistent", "working"]
+
+
+def test_manager_recall_semantic_many(temp_dir):
+    """Batch recall issues one collection query for all queries."""
+    manager = MemoryManager(user_id="test_user", persist_dir=temp_dir, enable_rag=False)
+    embedding = _CountingEmbedding()
+    persistent = _FakeCollection("persistent", 0.1)
+    manager.persistent_rag = _fake_rag(embedding, persistent)
+
+    results = manager.recall_semantic_many(["a", "bb", "ccc"], top_k=1)
+
+    assert embedding.calls == [["a", "bb", "ccc"]]
+    assert len(persistent.queries) == 1
+    assert [r[0]["content"] for r in results] == [
+        "persistent doc 0",
+        "persistent doc 1",
+        "persistent doc 2",
+    ]
+
+
+def test_manager_recall_semantic_separate_embedding_spaces(temp_dir):
+    """Collections with different embedding models are embedded separately."""
+    manager = MemoryManager(user_id="test_user", persist_dir=temp_dir, enable_rag=False)
+    working_embedding = _CountingEmbedding()
+    persistent_embedding = _CountingEmbedding()
+    manager.rag = _fake_rag(working_embedding, _FakeCollection("w", 0.2), "a")
+    manager.persistent_rag = _fake_rag(
+        persistent_embedding, _FakeCollection("p", 0.1), "b"
+    )
+
+    manager.recall_semantic("query", top_k=2)
+
+    assert working_embedding.calls == [["query"]]
+    assert persistent_embedding.calls == [["query"]]
@@ -206,6 +206,34 @@ def test_persistent_memory_recall_with_metadata(temp_db):
     assert returned_metadata == metadata
 
 
+def test_persistent_memory_store_many(temp_db):
+    """store_many inserts new keys and updates existing ones."""
+    memory = PersistentMemory(db_path=temp_db)
+    memory.store("key1", "old", user_id="test_user", agent_name="agent")
+
+    memory.store_many(
+        [
+            ("key1", "new", None),
+            ("key2", {"a": 1}, {"source": "batch"}),
+            ("project:p:session:s1", {"end_time": None}, None),
+        ],
+        user_id="test_user",
+        agent_name="agent",
+    )
+
+    assert memory.count(user_id="test_user", agent_name="agent") == 3
+    assert memory.recall("key1", user_id="test_user", agent_name="agent") == "new"
+    value, metadata = memory.recall(
+        "key2", user_id="test_user", agent_name="agent", include_metadata=True
+    )
+    assert value == {"a": 1}
+    assert metadata == {"source": "batch"}
+    open_sessions = memory.fetch_project_records(
+        user_id="test_user", project_id="p", record_type="session", open_only=True
+    )
+    assert [r["key"] for r in open_sessions] == ["project:p:session:s1"]
+
+
 def test_persistent_memory_prune(temp_db):
     """Test pruning old memories."""
     memory = PersistentMemory(db_path=temp_db)
@@ -234,6 +262,120 @@ def test_persistent_memory_persistence(temp_db):
     assert memory2.recall("key1", user_id="test_user") == "value1"
 
 
+def test_persistent_memory_fetch_project_records_by_session(temp_db):
+    """Session lookups return every matching record, not just the first 1000."""
+    memory = PersistentMemory(db_path=temp_db)
+
+    for i in range(1100):
+        memory.store(
+            f"project:proj:file_change:change_{i}",
+            {"file_path": f"f{i}.py", "session_id": "session_a"},
+            user_id="test_user",
+        )
+    memory.store(
+        "project:proj:file_change:change_other",
+        {"file_path": "other.py", "session_id": "session_b"},
+        user_id="test_user",
+    )
+    memory.store(
+        "project:other:file_change:change_x",
+        {"file_path": "x.py", "session_id": "session_a"},
+        user_id="test_user",
+    )
+
+    records = memory.fetch_project_records(
+        user_id="test_user",
+        project_id="proj",
+        record_type="file_change",
+        session_id="session_a",
+    )
+    assert len(records) == 1100
+    assert records[0]["value"]["file_path"] == "f0.py"
+
+    other = memory.fetch_project_records(
+        user_id="test_user",
+        project_id="proj",
+        record_type="file_change",
+        session_id="session_b",
+    )
+    assert [r["key"] for r in other] == ["project:proj:file_change:change_other"]
+
+
+def test_persistent_memory_fetch_open_sessions(temp_db):
+    """open_only filters on end_time and tracks updates."""
+    memory = PersistentMemory(db_path=temp_db)
+
+    memory.store(
+        "project:proj:session:session_a",
+        {"session_id": "session_a", "end_time": None},
+        user_id="test_user",
+    )
+    memory.store(
+        "project:proj:session:session_b",
+        {"session_id": "session_b", "end_time": "2025-01-01T00:00:00"},
+        user_id="test_user",
+    )
+
+    open_sessions = memory.fetch_project_records(
+        user_id="test_user", project_id="proj", record_type="session", open_only=True
+    )
+    assert [s["key"] for s in open_sessions] == ["project:proj:session:session_a"]
+
+    # Ending the session updates the indexed column
+    memory.store(
+        "project:proj:session:session_a",
+        {"session_id": "session_a", "end_time": "2025-01-02T00:00:00"},
+        user_id="test_user",
+    )
+    assert (
+        memory.fetch_project_records(
+            user_id="test_user",
+            project_id="proj",
+            record_type="session",
+            open_only=True,
+        )
+        == []
+    )
+
+
+def test_persistent_memory_backfills_project_records(temp_db):
+    """Databases created before the record columns existed are backfilled."""
+    import json
+    import sqlite3
+
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("""
+            CREATE TABLE memories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                user_id TEXT NOT NULL DEFAULT 'default_user',
+                agent_name TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                metadata TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO memories (key, value, user_id) VALUES (?, ?, ?)",
+            (
+                "project:proj:error:error_1",
+                json.dumps({"message": "boom", "session_id": "session_a"}),
+                "test_user",
+            ),
+        )
+
+    memory = PersistentMemory(db_path=temp_db)
+    records = memory.fetch_project_records(
+        user_id="test_user",
+        project_id="proj",
+        record_type="error",
+        session_id="session_a",
+    )
+    assert len(records) == 1
+    assert records[0]["value"]["message"] == "boom"
+
+
 def test_persistent_memory_repr(temp_db):
     """Test string representation."""
     memory = PersistentMemory(db_path=temp_db)
@@ -531,3 +531,77 @@ class TestSemanticRouting:
         # Should use fallback if semantic router fails (e.g., no API key)
         result = await router.route("test query")
         assert result is not None
+
+
+class BagOfWordsEncoder:
+    """Local test encoder: word-count vectors over a fixed vocabulary."""
+
+    VOCAB = ["review", "code", "check", "translate", "text", "japanese", "data"]
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [
+            [text.lower().split().count(word) for word in self.VOCAB]
+            for text in texts
+        ]
+
+
+class TestSemanticIndexRouting:
+    """Semantic routing with a local encoder (no API calls)."""
+
+    @pytest.fixture
+    def encoder(self):
+        pytest.importorskip("numpy")
+        return BagOfWordsEncoder()
+
+    @pytest.fixture
+    def router(self, encoder):
+        router = AgentRouter(
+            strategy="semantic", encoder=encoder, fallback_agent=fallback_agent
+        )
+        router.register(code_reviewer, samples=["review code", "check code"])
+        router.register(translator, samples=["translate text", "japanese text"])
+        router.register(data_analyzer)  # no samples: never matched
+        return router
+
+    def test_scores_all_agents_with_one_input_embedding(self, router, encoder):
+        """Samples are embedded in one call, the input in one more."""
+        matches = router.get_matched_agents("please review my code", top_k=3)
+
+        assert [agent for agent, _ in matches] == [code_reviewer]
+        assert matches[0][1] == pytest.approx(1.0)
+        assert encoder.calls == [
+            ["review code", "check code", "translate text", "japanese text"],
+            ["please review my code"],
+        ]
+
+    def test_confidence_is_graded(self, router):
+        """Scores are cosine similarities, not a 0/1 match."""
+        (agent, score), *_ = router.get_matched_agents("translate code", top_k=1)
+        assert 0.0 < score < 1.0
+
+    def test_input_cache_survives_registration(self, router, encoder):
+        """Repeated inputs hit the LRU; new agents only re-embed samples."""
+        router.get_matched_agents("check code")
+        router.register(data_analyzer, samples=["data"], name="data_analyzer")
+        matches = router.get_matched_agents("check code")
+
+        assert len(encoder.calls) == 3
+        assert encoder.calls[-1][-1] == "data"
+        assert matches[0][0] is code_reviewer
+
+    @pytest.mark.asyncio
+    async def test_route_below_threshold_uses_fallback(self, encoder):
+        """Low similarity falls back like the intent strategy."""
+        router = AgentRouter(
+            strategy="semantic",
+            encoder=encoder,
+            fallback_agent=fallback_agent,
+            confidence_threshold=0.9,
+        )
+        router.register(translator, samples=["translate text"])
+
+        assert await router.route("translate code") == "Fallback: translate code"